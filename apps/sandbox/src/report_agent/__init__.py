@@ -1,11 +1,22 @@
-from .outline_parser import Section, parse_outline, slugify, parse_review_block
-from .orchestrator import ReportOrchestrator, GenerationResult
+from .outline_parser import Section, iter_outline, iter_sections, parse_outline, slugify, parse_review_block
 
 __all__ = [
     "Section",
     "parse_outline",
+    "iter_outline",
+    "iter_sections",
     "slugify",
     "parse_review_block",
     "ReportOrchestrator",
     "GenerationResult",
 ]
+
+
+def __getattr__(name: str):
+    # The orchestrator pulls in the data stack; load it on first use so that
+    # importing the package (e.g. for `report-agent --help`) stays fast.
+    if name in ("ReportOrchestrator", "GenerationResult"):
+        from . import orchestrator
+
+        return getattr(orchestrator, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
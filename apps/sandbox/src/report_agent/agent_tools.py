@@ -1,29 +1,62 @@
 """LLM agent tools for the Report Agent with OpenAI-compatible function calling schemas."""
 
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict
 from pathlib import Path
 from typing import Any
 
+import pandas as pd
+
+from report_agent.chart_query import DEFAULT_PAGE_SIZE, encode_page, select_rows
 from report_agent.chart_reader import ChartReader
 from report_agent.data_catalog import DataCatalog
-from report_agent.outline_parser import Section, parse_outline
+from report_agent.outline_cache import OutlineIndex, load_outline
+from report_agent.outline_parser import Section
+
+
+# Tools whose result depends only on their arguments and the data catalog
+PURE_TOOLS = frozenset({
+    "list_sections",
+    "list_chart_categories",
+    "list_charts",
+    "get_chart_metadata",
+    "get_chart_data",
+    "query_timeseries",
+})
 
 
 class ReportAgentTools:
-    """Holds all tool definitions and handlers for the Report Agent."""
+    """Holds all tool definitions and handlers for the Report Agent.
 
-    def __init__(self, outline_path: Path, data_root: Path):
+    Results of PURE_TOOLS are memoized per arguments until the data catalog
+    changes on disk (see DataCatalog.signature). Cached results are shared
+    between callers and must be treated as read-only.
+    """
+
+    def __init__(self, outline_path: Path, data_root: Path, max_workers: int = 8):
         self.outline_path = Path(outline_path)
         self.data_root = Path(data_root)
+        self.max_workers = max_workers
         
-        self._sections: list[Section] = []
+        self._outline = OutlineIndex([])
         if self.outline_path.exists():
-            self._sections = parse_outline(self.outline_path)
+            self._outline = load_outline(self.outline_path)
+        self._sections: list[Section] = self._outline.sections
         
         self._catalog = DataCatalog(self.data_root)
         self._chart_reader = ChartReader(self._catalog)
+        self._catalog_signature = self._catalog.signature()
         
         self._drafts: dict[str, str] = {}
+        self._results: dict[tuple[str, str], dict | list] = {}
+        self._cache_lock = threading.Lock()
+        # Bumped by refresh_catalog; a result computed under an older
+        # generation may come from the previous data and is not memoized
+        self._cache_generation = 0
+        self._cache_hits = 0
+        self._cache_misses = 0
         
         self._tool_handlers = {
             "get_section_context": self._get_section_context,
@@ -33,6 +66,7 @@ class ReportAgentTools:
             "list_charts": self._list_charts,
             "get_chart_metadata": self._get_chart_metadata,
             "get_chart_data": self._get_chart_data,
+            "query_timeseries": self._query_timeseries,
             "get_chart_image": self._get_chart_image,
         }
 
@@ -139,7 +173,12 @@ class ReportAgentTools:
                 "type": "function",
                 "function": {
                     "name": "get_chart_data",
-                    "description": "Get chart data with pre-computed summary and insights",
+                    "description": (
+                        "Get chart data with pre-computed summary and insights. With include_rows, also "
+                        "returns one page of rows in columnar form (columns plus one value list per column), "
+                        "optionally filtered, aggregated and projected. Pass next_cursor back as cursor to "
+                        "get the following page (later pages omit the summary)."
+                    ),
                     "parameters": {
                         "type": "object",
                         "properties": {
@@ -150,6 +189,90 @@ class ReportAgentTools:
                             "include_rows": {
                                 "type": "boolean",
                                 "description": "Whether to include raw data rows"
+                            },
+                            "columns": {
+                                "type": "array",
+                                "items": {"type": "string"},
+                                "description": "Columns to return (default: all)"
+                            },
+                            "scenarios": {
+                                "type": "array",
+                                "items": {"type": "string"},
+                                "description": "Only rows for these scenarios"
+                            },
+                            "start_year": {
+                                "type": "integer",
+                                "description": "First year to include (filters rows or year columns)"
+                            },
+                            "end_year": {
+                                "type": "integer",
+                                "description": "Last year to include (filters rows or year columns)"
+                            },
+                            "filters": {
+                                "type": "object",
+                                "additionalProperties": {"type": "array", "items": {"type": "string"}},
+                                "description": "Dimension column -> allowed values, e.g. {\"sector\": [\"Power\"]}"
+                            },
+                            "group_by": {
+                                "type": "array",
+                                "items": {"type": "string"},
+                                "description": "Dimension columns to aggregate by (with aggregate)"
+                            },
+                            "aggregate": {
+                                "type": "string",
+                                "enum": ["sum", "mean"],
+                                "description": "Aggregate numeric columns over group_by"
+                            },
+                            "cursor": {
+                                "type": "string",
+                                "description": "next_cursor from the previous page"
+                            },
+                            "limit": {
+                                "type": "integer",
+                                "description": "Rows per page (default 100, max 1000)"
+                            }
+                        },
+                        "required": ["chart_id"]
+                    }
+                }
+            },
+            {
+                "type": "function",
+                "function": {
+                    "name": "query_timeseries",
+                    "description": (
+                        "Analyse a year-column chart: totals by year, start/end values, percent change, "
+                        "CAGR and peak year per scenario, the gap between scenarios, and the dimensions "
+                        "that changed most. Optionally restrict scenarios, dimensions and years."
+                    ),
+                    "parameters": {
+                        "type": "object",
+                        "properties": {
+                            "chart_id": {
+                                "type": "string",
+                                "description": "The chart identifier"
+                            },
+                            "scenarios": {
+                                "type": "array",
+                                "items": {"type": "string"},
+                                "description": "Scenarios to include (default: all)"
+                            },
+                            "dimensions": {
+                                "type": "array",
+                                "items": {"type": "string"},
+                                "description": "Dimension labels to include, as listed in the result (default: all)"
+                            },
+                            "start_year": {
+                                "type": "integer",
+                                "description": "First year to include"
+                            },
+                            "end_year": {
+                                "type": "integer",
+                                "description": "Last year to include"
+                            },
+                            "top_dimensions": {
+                                "type": "integer",
+                                "description": "How many largest-changing dimensions to list per scenario (default 3)"
                             }
                         },
                         "required": ["chart_id"]
@@ -177,21 +300,89 @@ class ReportAgentTools:
 
     def execute_tool(self, tool_name: str, arguments: dict) -> dict:
         """Execute a tool and return the result."""
+        self.refresh_catalog()
+        return self._execute(tool_name, arguments)
+
+    def execute_tools(self, calls: list[tuple[str, dict]]) -> list[dict]:
+        """Execute independent tool calls concurrently.
+
+        Args:
+            calls: (tool_name, arguments) pairs, e.g. one model turn's
+                parallel tool calls
+
+        Returns:
+            Results in the order of calls. Identical calls in one batch run once.
+        """
+        self.refresh_catalog()
+        keys = [(name, self._arguments_key(arguments)) for name, arguments in calls]
+        unique: dict[tuple[str, str], tuple[str, dict]] = {}
+        for key, call in zip(keys, calls):
+            unique.setdefault(key, call)
+        if len(unique) <= 1 or self.max_workers <= 1:
+            results = {key: self._execute(*call) for key, call in unique.items()}
+        else:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(unique))) as pool:
+                futures = {key: pool.submit(self._execute, *call) for key, call in unique.items()}
+                results = {key: future.result() for key, future in futures.items()}
+        return [results[key] for key in keys]
+
+    def refresh_catalog(self) -> bool:
+        """Rebuild the catalog and drop memoized results if the data changed on disk.
+
+        Returns:
+            Whether the catalog was rebuilt.
+        """
+        signature = self._catalog.signature()
+        if signature == self._catalog_signature:
+            return False
+        with self._cache_lock:
+            self._catalog = DataCatalog(self.data_root)
+            self._chart_reader = ChartReader(self._catalog)
+            self._catalog_signature = signature
+            self._results.clear()
+            self._cache_generation += 1
+        return True
+
+    def cache_info(self) -> dict:
+        """Memoization counters for pure tool results."""
+        with self._cache_lock:
+            return {"hits": self._cache_hits, "misses": self._cache_misses, "size": len(self._results)}
+
+    @staticmethod
+    def _arguments_key(arguments: dict) -> str:
+        return json.dumps(arguments, sort_keys=True, default=str)
+
+    def _execute(self, tool_name: str, arguments: dict) -> dict:
+        """Run one tool, serving pure tools from the memo when possible."""
         handler = self._tool_handlers.get(tool_name)
         if handler is None:
             return {"error": f"Unknown tool: {tool_name}"}
         
+        key = (tool_name, self._arguments_key(arguments))
+        generation = None
+        if tool_name in PURE_TOOLS:
+            with self._cache_lock:
+                if key in self._results:
+                    self._cache_hits += 1
+                    return self._results[key]
+                self._cache_misses += 1
+                generation = self._cache_generation
+        
         try:
-            return handler(**arguments)
+            result = handler(**arguments)
         except Exception as e:
             return {"error": str(e)}
+        
+        # Errors are not memoized: a retry may follow a data fix
+        if generation is not None and not (isinstance(result, dict) and "error" in result):
+            with self._cache_lock:
+                if generation == self._cache_generation:
+                    self._results[key] = result
+        return result
 
     def _find_section(self, section_id: str) -> Section | None:
         """Find a section by ID."""
-        for section in self._sections:
-            if section.id == section_id:
-                return section
-        return None
+        return self._outline.get(section_id)
 
     def _get_section_context(self, section_id: str) -> dict:
         """Get full context for a section."""
@@ -277,40 +468,98 @@ class ReportAgentTools:
             "scenarios": chart.scenarios,
         }
 
-    def _get_chart_data(self, chart_id: str, include_rows: bool = False) -> dict:
-        """Get chart data with pre-computed summary."""
+    def _get_chart_data(
+        self,
+        chart_id: str,
+        include_rows: bool = False,
+        columns: list[str] | None = None,
+        scenarios: list[str] | None = None,
+        start_year: int | None = None,
+        end_year: int | None = None,
+        filters: dict[str, list] | None = None,
+        group_by: list[str] | None = None,
+        aggregate: str | None = None,
+        cursor: str | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+    ) -> dict:
+        """Get chart data with pre-computed summary and, optionally, a page of rows."""
         chart = self._catalog.get_chart(chart_id)
         if chart is None:
             return {"error": f"Chart not found: {chart_id}"}
         
-        try:
-            summary = self._chart_reader.get_summary(chart_id)
-        except ValueError as e:
-            return {"error": str(e)}
-        
-        result = {
-            "chart_id": summary.chart_id,
-            "title": summary.title,
-            "dimensions": summary.dimensions,
-            "measure": summary.measure,
-            "measure_type": summary.measure_type,
-            "units": summary.units,
-            "scenarios": summary.scenarios,
-            "years": summary.years,
-            "row_count": summary.row_count,
-            "by_scenario": summary.by_scenario,
-            "key_insights": summary.key_insights,
-        }
+        result: dict[str, Any] = {"chart_id": chart_id}
+        # Later pages only carry rows; the summary came with the first one
+        if not cursor:
+            try:
+                summary = self._chart_reader.get_summary(chart_id)
+            except ValueError as e:
+                return {"error": str(e)}
+            
+            result.update({
+                "chart_id": summary.chart_id,
+                "title": summary.title,
+                "dimensions": summary.dimensions,
+                "measure": summary.measure,
+                "measure_type": summary.measure_type,
+                "units": summary.units,
+                "scenarios": summary.scenarios,
+                "years": summary.years,
+                "row_count": summary.row_count,
+                "by_scenario": summary.by_scenario,
+                "key_insights": summary.key_insights,
+            })
         
-        if include_rows:
+        if include_rows or cursor:
             try:
                 df = self._chart_reader.load_data(chart_id)
-                result["rows"] = df.to_dict(orient="records")
             except ValueError:
-                result["rows"] = []
+                df = pd.DataFrame()
+            selected = select_rows(
+                df,
+                columns=columns,
+                scenarios=scenarios,
+                start_year=start_year,
+                end_year=end_year,
+                filters=filters,
+                group_by=group_by,
+                aggregate=aggregate,
+            )
+            result["rows"] = encode_page(selected, cursor, limit)
         
         return result
 
+    def _query_timeseries(
+        self,
+        chart_id: str,
+        scenarios: list[str] | None = None,
+        dimensions: list[str] | None = None,
+        start_year: int | None = None,
+        end_year: int | None = None,
+        top_dimensions: int = 3,
+    ) -> dict:
+        """Analyse a year-column chart with the timeseries engine."""
+        chart = self._catalog.get_chart(chart_id)
+        if chart is None:
+            return {"error": f"Chart not found: {chart_id}"}
+
+        try:
+            ts = self._chart_reader.get_timeseries(chart_id)
+        except ValueError as e:
+            return {"error": str(e)}
+        if ts is None:
+            return {"error": f"Chart has no year columns: {chart_id}"}
+
+        selected = ts.subset(scenarios, dimensions, start_year, end_year)
+        if not selected.scenarios or not selected.dimensions or not selected.years:
+            return {"error": "No data matches the requested scenarios, dimensions and years"}
+
+        return {
+            "chart_id": chart_id,
+            "units": chart.units,
+            "dimensions": selected.dimensions,
+            **selected.query(top_dimensions),
+        }
+
     def _get_chart_image(self, chart_id: str) -> dict:
         """Get chart image as base64."""
         chart = self._catalog.get_chart(chart_id)
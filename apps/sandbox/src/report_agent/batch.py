@@ -0,0 +1,280 @@
+"""Provider batch jobs for whole-report generation.
+
+A batch run sends every section prompt as a single asynchronous job, polls until
+the provider reports it finished, and then returns the per-request results. This
+trades latency for the batch discount and keeps long runs clear of per-minute
+rate limits.
+
+Backends:
+- OpenAIBatchBackend: /v1/batches over a JSONL input file
+- AnthropicBatchBackend: Message Batches API
+- LocalBatchBackend: directory of JSONL files, for tests and offline runs
+
+All of them normalise results to BatchResult so the orchestrator treats every
+provider the same way.
+"""
+
+import json
+import time
+import uuid
+from abc import ABC, abstractmethod
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+# Providers bill batch jobs at half the synchronous price
+BATCH_COST_FACTOR = 0.5
+DEFAULT_POLL_SECONDS = 60.0
+
+STATUS_IN_PROGRESS = "in_progress"
+STATUS_COMPLETED = "completed"
+STATUS_FAILED = "failed"
+
+
+@dataclass
+class BatchRequest:
+    """One request in a batch: provider-specific create() params."""
+
+    custom_id: str
+    params: dict[str, Any]
+
+
+@dataclass
+class BatchResult:
+    """Normalised outcome of one batch request."""
+
+    custom_id: str
+    text: str = ""
+    input_tokens: int = 0
+    output_tokens: int = 0
+    reasoning_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
+    finish_reason: str | None = None
+    error: str | None = None
+
+
+class BatchBackend(ABC):
+    """Interface for submitting and collecting batch jobs."""
+
+    name = "batch"
+
+    @abstractmethod
+    def submit(self, requests: list[BatchRequest]) -> str:
+        """Submit requests as one job. Returns the batch ID."""
+
+    @abstractmethod
+    def status(self, batch_id: str) -> str:
+        """Return STATUS_IN_PROGRESS, STATUS_COMPLETED or STATUS_FAILED."""
+
+    @abstractmethod
+    def results(self, batch_id: str) -> list[BatchResult]:
+        """Fetch results of a completed job."""
+
+
+class OpenAIBatchBackend(BatchBackend):
+    """OpenAI Batch API for chat completions."""
+
+    name = "openai"
+    endpoint = "/v1/chat/completions"
+
+    def __init__(self, client=None):
+        if client is None:
+            from openai import OpenAI
+
+            client = OpenAI()
+        self._client = client
+
+    def submit(self, requests: list[BatchRequest]) -> str:
+        lines = [
+            json.dumps({
+                "custom_id": r.custom_id,
+                "method": "POST",
+                "url": self.endpoint,
+                "body": r.params,
+            })
+            for r in requests
+        ]
+        payload = ("\n".join(lines) + "\n").encode("utf-8")
+        input_file = self._client.files.create(file=("batch.jsonl", payload), purpose="batch")
+        batch = self._client.batches.create(
+            input_file_id=input_file.id,
+            endpoint=self.endpoint,
+            completion_window="24h",
+        )
+        return batch.id
+
+    def status(self, batch_id: str) -> str:
+        batch = self._client.batches.retrieve(batch_id)
+        # An expired batch still has output for the requests that finished
+        if batch.status in ("completed", "expired"):
+            return STATUS_COMPLETED
+        if batch.status in ("failed", "cancelled", "cancelling"):
+            return STATUS_FAILED
+        return STATUS_IN_PROGRESS
+
+    def results(self, batch_id: str) -> list[BatchResult]:
+        batch = self._client.batches.retrieve(batch_id)
+        results: list[BatchResult] = []
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if not file_id:
+                continue
+            for line in self._client.files.content(file_id).text.splitlines():
+                if line.strip():
+                    results.append(self._parse_line(json.loads(line)))
+        return results
+
+    @staticmethod
+    def _parse_line(data: dict[str, Any]) -> BatchResult:
+        custom_id = data.get("custom_id", "")
+        if data.get("error"):
+            return BatchResult(custom_id=custom_id, error=str(data["error"]))
+        response = data.get("response") or {}
+        body = response.get("body") or {}
+        if response.get("status_code") != 200:
+            error = body.get("error") or f"HTTP {response.get('status_code')}"
+            return BatchResult(custom_id=custom_id, error=str(error))
+        choices = body.get("choices") or []
+        if not choices:
+            return BatchResult(custom_id=custom_id, error="no choices returned")
+        usage = body.get("usage") or {}
+        details = usage.get("completion_tokens_details") or {}
+        prompt_details = usage.get("prompt_tokens_details") or {}
+        return BatchResult(
+            custom_id=custom_id,
+            text=choices[0].get("message", {}).get("content") or "",
+            input_tokens=usage.get("prompt_tokens", 0),
+            output_tokens=usage.get("completion_tokens", 0),
+            reasoning_tokens=details.get("reasoning_tokens") or 0,
+            cache_read_tokens=prompt_details.get("cached_tokens") or 0,
+            finish_reason=choices[0].get("finish_reason"),
+        )
+
+
+class AnthropicBatchBackend(BatchBackend):
+    """Anthropic Message Batches API."""
+
+    name = "anthropic"
+
+    def __init__(self, client=None):
+        if client is None:
+            from anthropic import Anthropic
+
+            client = Anthropic()
+        self._client = client
+
+    def submit(self, requests: list[BatchRequest]) -> str:
+        batch = self._client.messages.batches.create(
+            requests=[{"custom_id": r.custom_id, "params": r.params} for r in requests]
+        )
+        return batch.id
+
+    def status(self, batch_id: str) -> str:
+        batch = self._client.messages.batches.retrieve(batch_id)
+        if batch.processing_status == "ended":
+            return STATUS_COMPLETED
+        return STATUS_IN_PROGRESS
+
+    def results(self, batch_id: str) -> list[BatchResult]:
+        results: list[BatchResult] = []
+        for entry in self._client.messages.batches.results(batch_id):
+            if entry.result.type != "succeeded":
+                results.append(BatchResult(custom_id=entry.custom_id, error=entry.result.type))
+                continue
+            message = entry.result.message
+            text = "".join(
+                block.text for block in message.content if getattr(block, "type", "") == "text"
+            )
+            cache_read = getattr(message.usage, "cache_read_input_tokens", 0) or 0
+            cache_write = getattr(message.usage, "cache_creation_input_tokens", 0) or 0
+            results.append(BatchResult(
+                custom_id=entry.custom_id,
+                text=text,
+                # input_tokens excludes cached tokens on Anthropic; report the whole prompt
+                input_tokens=message.usage.input_tokens + cache_read + cache_write,
+                output_tokens=message.usage.output_tokens,
+                cache_read_tokens=cache_read,
+                cache_write_tokens=cache_write,
+                finish_reason=message.stop_reason,
+            ))
+        return results
+
+
+class LocalBatchBackend(BatchBackend):
+    """File-based stand-in for a provider batch endpoint.
+
+    submit() writes ``<root>/<batch_id>/requests.jsonl``. The job is complete
+    once ``results.jsonl`` (one BatchResult per line) exists beside it. With a
+    responder, results are written straight away; without one, another
+    process is expected to write them.
+    """
+
+    name = "local"
+
+    def __init__(self, root: Path, responder: Callable[[BatchRequest], BatchResult] | None = None):
+        self.root = Path(root)
+        self._responder = responder
+
+    def submit(self, requests: list[BatchRequest]) -> str:
+        batch_id = f"batch_{uuid.uuid4().hex[:12]}"
+        batch_dir = self.root / batch_id
+        batch_dir.mkdir(parents=True)
+        (batch_dir / "requests.jsonl").write_text(
+            "".join(json.dumps(asdict(r), default=str) + "\n" for r in requests),
+            encoding="utf-8",
+        )
+        if self._responder is not None:
+            (batch_dir / "results.jsonl").write_text(
+                "".join(json.dumps(asdict(self._responder(r))) + "\n" for r in requests),
+                encoding="utf-8",
+            )
+        return batch_id
+
+    def status(self, batch_id: str) -> str:
+        batch_dir = self.root / batch_id
+        if not batch_dir.exists():
+            return STATUS_FAILED
+        if (batch_dir / "results.jsonl").exists():
+            return STATUS_COMPLETED
+        return STATUS_IN_PROGRESS
+
+    def results(self, batch_id: str) -> list[BatchResult]:
+        lines = (self.root / batch_id / "results.jsonl").read_text(encoding="utf-8").splitlines()
+        return [BatchResult(**json.loads(line)) for line in lines if line.strip()]
+
+
+def get_batch_backend(model: str) -> BatchBackend:
+    """Pick the provider batch backend for a model name."""
+    if model.startswith("gpt"):
+        return OpenAIBatchBackend()
+    if model.startswith("claude"):
+        return AnthropicBatchBackend()
+    raise ValueError(f"Unsupported model for batch mode: {model}")
+
+
+def wait_for_batch(
+    backend: BatchBackend,
+    batch_id: str,
+    poll_interval: float = DEFAULT_POLL_SECONDS,
+    timeout: float | None = None,
+    on_progress: Callable[[str], None] | None = None,
+    sleep: Callable[[float], None] = time.sleep,
+) -> dict[str, BatchResult]:
+    """Poll a batch until it finishes and return its results by custom_id.
+
+    Raises:
+        RuntimeError: If the provider reports the batch failed
+        TimeoutError: If timeout seconds pass before it finishes
+    """
+    start = time.monotonic()
+    while True:
+        status = backend.status(batch_id)
+        if status == STATUS_COMPLETED:
+            return {r.custom_id: r for r in backend.results(batch_id)}
+        if status == STATUS_FAILED:
+            raise RuntimeError(f"Batch {batch_id} failed on {backend.name}")
+        if timeout is not None and time.monotonic() - start >= timeout:
+            raise TimeoutError(f"Batch {batch_id} still {status} after {timeout:.0f}s")
+        if on_progress:
+            on_progress(f"Batch {batch_id} {status}; checking again in {poll_interval:.0f}s")
+        sleep(poll_interval)
@@ -3,14 +3,29 @@ Change journal system for tracking CLI operations with full traceability.
 
 Logs every CLI operation BEFORE git commit, so commits can reference
 journal entries and we maintain rich operation history.
+
+Two storage backends share the same API:
+
+- files (default): one JSON file per operation in _report_log/
+- sqlite: a single _report_log/journal.sqlite3 database, indexed by
+  timestamp, command and section. A project switches to it once the
+  database exists (see import_json_entries / `report-agent journal-import`).
+  The database is a local index and is not committed; every save also
+  appends the entry to _report_log/journal.jsonl, which is.
 """
 
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timezone
 from pathlib import Path
 import json
+import sqlite3
 import uuid
 
+JOURNAL_DB_FILENAME = "journal.sqlite3"
+JOURNAL_EXPORT_FILENAME = "journal.jsonl"
+
+COST_PERIODS = ("day", "week", "month")
+
 
 @dataclass
 class JournalEntry:
@@ -62,16 +77,46 @@ def create_entry(
     )
 
 
-def save_entry(output_root: Path, entry: JournalEntry) -> Path:
-    """Save entry to journal directory. Returns the path."""
-    journal_dir = get_journal_dir(output_root)
-
+def entry_filename(entry: JournalEntry) -> str:
+    """Filename used for an entry in the files backend."""
     ts = datetime.fromisoformat(entry.timestamp)
     ts_str = ts.strftime("%Y%m%d_%H%M%S")
     short_id = entry.id[:8]
-    filename = f"{ts_str}_{entry.command}_{short_id}.json"
+    return f"{ts_str}_{entry.command}_{short_id}.json"
+
+
+def get_journal_db_path(output_root: Path) -> Path:
+    """Returns the SQLite journal path (which may not exist yet)."""
+    return output_root / "_report_log" / JOURNAL_DB_FILENAME
+
+
+def get_journal_export_path(output_root: Path) -> Path:
+    """Returns the JSONL export kept alongside the SQLite journal."""
+    return output_root / "_report_log" / JOURNAL_EXPORT_FILENAME
+
 
-    path = journal_dir / filename
+def uses_sqlite_journal(output_root: Path) -> bool:
+    """True if the project has been switched to the SQLite backend."""
+    return get_journal_db_path(output_root).exists()
+
+
+def save_entry(output_root: Path, entry: JournalEntry) -> Path:
+    """Save entry to the journal. Returns the path to commit.
+
+    With the SQLite backend that is the JSONL export: the entry is upserted
+    into the database and appended to journal.jsonl, where a later line for
+    the same ID supersedes earlier ones.
+    """
+    if uses_sqlite_journal(output_root):
+        with JournalDB(get_journal_db_path(output_root)) as db:
+            db.upsert(entry)
+        export_path = get_journal_export_path(output_root)
+        with export_path.open("a", encoding="utf-8") as f:
+            f.write(json.dumps(asdict(entry)) + "\n")
+        return export_path
+
+    journal_dir = get_journal_dir(output_root)
+    path = journal_dir / entry_filename(entry)
     path.write_text(json.dumps(asdict(entry), indent=2))
     return path
 
@@ -103,6 +148,10 @@ def load_entry(path: Path) -> JournalEntry:
 
 def list_entries(output_root: Path, limit: int = 50) -> list[JournalEntry]:
     """List recent entries, most recent first."""
+    if uses_sqlite_journal(output_root):
+        with JournalDB(get_journal_db_path(output_root)) as db:
+            return db.query(limit=limit)
+
     journal_dir = get_journal_dir(output_root)
 
     json_files = sorted(journal_dir.glob("*.json"), reverse=True)
@@ -117,6 +166,246 @@ def list_entries(output_root: Path, limit: int = 50) -> list[JournalEntry]:
     return entries
 
 
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    id TEXT PRIMARY KEY,
+    timestamp TEXT NOT NULL,
+    command TEXT NOT NULL,
+    arguments TEXT NOT NULL,
+    model TEXT,
+    thinking_level TEXT,
+    cost_usd REAL,
+    review_notes TEXT,
+    review_author TEXT,
+    success INTEGER NOT NULL,
+    error_message TEXT,
+    duration_seconds REAL
+);
+CREATE TABLE IF NOT EXISTS entry_sections (
+    entry_id TEXT NOT NULL REFERENCES entries(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    section_id TEXT NOT NULL,
+    PRIMARY KEY (entry_id, position)
+);
+CREATE INDEX IF NOT EXISTS idx_entries_timestamp ON entries(timestamp);
+CREATE INDEX IF NOT EXISTS idx_entries_command ON entries(command, timestamp);
+CREATE INDEX IF NOT EXISTS idx_entry_sections_section ON entry_sections(section_id);
+"""
+
+# SQLite expressions mapping an ISO timestamp to the start of its period
+_PERIOD_EXPRESSIONS = {
+    "day": "date(timestamp)",
+    "week": "date(timestamp, 'weekday 0', '-6 days')",
+    "month": "strftime('%Y-%m-01', timestamp)",
+}
+
+
+class JournalDB:
+    """SQLite journal backend.
+
+    Usable as a context manager; writes are committed on exit.
+    """
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.db_path)
+        self._conn.execute("PRAGMA foreign_keys = ON")
+        self._conn.executescript(_SCHEMA)
+
+    def __enter__(self) -> "JournalDB":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self._conn.commit()
+        else:
+            self._conn.rollback()
+        self.close()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def upsert(self, entry: JournalEntry) -> None:
+        """Insert an entry, or replace it if the ID already exists."""
+        self._conn.execute(
+            "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                entry.id,
+                entry.timestamp,
+                entry.command,
+                json.dumps(entry.arguments),
+                entry.model,
+                entry.thinking_level,
+                entry.cost_usd,
+                entry.review_notes,
+                entry.review_author,
+                int(entry.success),
+                entry.error_message,
+                entry.duration_seconds,
+            ),
+        )
+        self._conn.execute("DELETE FROM entry_sections WHERE entry_id = ?", (entry.id,))
+        self._conn.executemany(
+            "INSERT INTO entry_sections VALUES (?, ?, ?)",
+            [(entry.id, i, section_id) for i, section_id in enumerate(entry.sections_affected)],
+        )
+
+    def get(self, entry_id: str) -> JournalEntry | None:
+        """Get an entry by ID (full UUID)."""
+        rows = self._select("WHERE e.id = ?", (entry_id,))
+        return rows[0] if rows else None
+
+    def query(
+        self,
+        *,
+        command: str | None = None,
+        section: str | None = None,
+        since: str | None = None,
+        until: str | None = None,
+        limit: int | None = 50,
+    ) -> list[JournalEntry]:
+        """Entries matching all given filters, most recent first.
+
+        Args:
+            command: Only entries for this CLI command
+            section: Only entries that affected this section ID
+            since: ISO timestamp lower bound (inclusive)
+            until: ISO timestamp upper bound (exclusive)
+            limit: Maximum number of entries (None for all)
+        """
+        clauses = []
+        params: list = []
+        if command is not None:
+            clauses.append("e.command = ?")
+            params.append(command)
+        if section is not None:
+            clauses.append(
+                "e.id IN (SELECT entry_id FROM entry_sections WHERE section_id = ?)"
+            )
+            params.append(section)
+        if since is not None:
+            clauses.append("e.timestamp >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("e.timestamp < ?")
+            params.append(until)
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        order = "ORDER BY e.timestamp DESC, e.id DESC"
+        if limit is not None:
+            order += " LIMIT ?"
+            params.append(limit)
+        return self._select(f"{where} {order}", tuple(params))
+
+    def cost_by_period(self, period: str = "week") -> list[tuple[str, float, int]]:
+        """Total cost and operation count per period, oldest first.
+
+        Returns:
+            List of (period_start_date, cost_usd, operation_count)
+        """
+        if period not in _PERIOD_EXPRESSIONS:
+            raise ValueError(f"period must be one of {COST_PERIODS}, got {period!r}")
+        expr = _PERIOD_EXPRESSIONS[period]
+        rows = self._conn.execute(
+            f"SELECT {expr} AS period, COALESCE(SUM(cost_usd), 0), COUNT(*) "
+            "FROM entries GROUP BY period ORDER BY period"
+        ).fetchall()
+        return [(row[0], row[1], row[2]) for row in rows]
+
+    def count(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def _select(self, suffix: str, params: tuple) -> list[JournalEntry]:
+        rows = self._conn.execute(
+            "SELECT e.id, e.timestamp, e.command, e.arguments, e.model, e.thinking_level, "
+            "e.cost_usd, e.review_notes, e.review_author, e.success, e.error_message, "
+            f"e.duration_seconds FROM entries e {suffix}",
+            params,
+        ).fetchall()
+        if not rows:
+            return []
+
+        ids = [row[0] for row in rows]
+        sections: dict[str, list[str]] = {entry_id: [] for entry_id in ids}
+        # Chunked to stay under SQLite's bound-parameter limit
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            for entry_id, section_id in self._conn.execute(
+                "SELECT entry_id, section_id FROM entry_sections "
+                f"WHERE entry_id IN ({placeholders}) ORDER BY entry_id, position",
+                chunk,
+            ):
+                sections[entry_id].append(section_id)
+
+        return [
+            JournalEntry(
+                id=row[0],
+                timestamp=row[1],
+                command=row[2],
+                arguments=json.loads(row[3]),
+                model=row[4],
+                thinking_level=row[5],
+                cost_usd=row[6],
+                sections_affected=sections[row[0]],
+                review_notes=row[7],
+                review_author=row[8],
+                success=bool(row[9]),
+                error_message=row[10],
+                duration_seconds=row[11],
+            )
+            for row in rows
+        ]
+
+
+def import_json_entries(output_root: Path, remove_json: bool = False) -> int:
+    """Import _report_log/*.json into the SQLite journal, switching the project to it.
+
+    Existing database rows with the same ID are replaced, so the import can be
+    re-run safely. Unreadable files are skipped and left in place. The JSONL
+    export is rewritten from the database afterwards.
+
+    Returns:
+        Number of entries imported.
+    """
+    journal_dir = get_journal_dir(output_root)
+    imported: list[Path] = []
+    with JournalDB(get_journal_db_path(output_root)) as db:
+        for path in sorted(journal_dir.glob("*.json")):
+            try:
+                db.upsert(load_entry(path))
+            except (json.JSONDecodeError, TypeError, KeyError):
+                continue
+            imported.append(path)
+        entries = db.query(limit=None)
+
+    lines = [json.dumps(asdict(entry)) + "\n" for entry in reversed(entries)]
+    get_journal_export_path(output_root).write_text("".join(lines), encoding="utf-8")
+    if remove_json:
+        for path in imported:
+            path.unlink()
+    return len(imported)
+
+
+def export_json_entries(output_root: Path, dest_dir: Path) -> list[Path]:
+    """Write every SQLite journal entry as a JSON file, as the files backend would.
+
+    Returns:
+        Paths written, oldest first.
+    """
+    dest_dir.mkdir(parents=True, exist_ok=True)
+    with JournalDB(get_journal_db_path(output_root)) as db:
+        entries = db.query(limit=None)
+
+    paths = []
+    for entry in reversed(entries):
+        path = dest_dir / entry_filename(entry)
+        path.write_text(json.dumps(asdict(entry), indent=2))
+        paths.append(path)
+    return paths
+
+
 def format_entry_for_commit(entry: JournalEntry) -> str:
     """Format entry into a readable commit message body."""
     lines = []
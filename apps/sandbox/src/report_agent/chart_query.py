@@ -0,0 +1,117 @@
+"""Row selection for agent chart-data queries.
+
+Agents ask for chart rows through ReportAgentTools.get_chart_data. Rather
+than returning a whole CSV as one dict per row, queries are answered with
+vectorized pandas operations and a page of the result in columnar form:
+
+- filtering by scenario, year range and dimension values
+- aggregation (sum or mean) grouped by dimension columns
+- projection to the requested columns
+- cursor pagination, where the cursor is the offset of the next row
+"""
+
+import pandas as pd
+
+from .timeseries import SCENARIO_COLUMN, year_columns
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+AGGREGATES = ("sum", "mean")
+
+
+def _check_columns(df: pd.DataFrame, columns: list[str], what: str) -> None:
+    missing = [c for c in columns if c not in df.columns]
+    if missing:
+        raise ValueError(
+            f"Unknown {what} column(s): {', '.join(missing)}. Available: {', '.join(map(str, df.columns))}"
+        )
+
+
+def select_rows(
+    df: pd.DataFrame,
+    columns: list[str] | None = None,
+    scenarios: list[str] | None = None,
+    start_year: int | None = None,
+    end_year: int | None = None,
+    filters: dict[str, list] | None = None,
+    group_by: list[str] | None = None,
+    aggregate: str | None = None,
+) -> pd.DataFrame:
+    """Filter, aggregate and project chart rows.
+
+    Year ranges filter rows of long-format data (a "year" column) and drop
+    year columns outside the range in wide-format data.
+
+    Raises:
+        ValueError: On unknown columns or aggregate functions.
+    """
+    if scenarios:
+        if SCENARIO_COLUMN not in df.columns:
+            raise ValueError("Chart has no scenario column")
+        df = df[df[SCENARIO_COLUMN].astype(str).isin([str(s) for s in scenarios])]
+
+    if start_year is not None or end_year is not None:
+        low = start_year if start_year is not None else float("-inf")
+        high = end_year if end_year is not None else float("inf")
+        if "year" in df.columns:
+            years = pd.to_numeric(df["year"], errors="coerce")
+            df = df[(years >= low) & (years <= high)]
+        else:
+            df = df.drop(columns=[c for c in year_columns(df.columns) if not low <= int(c) <= high])
+
+    if filters:
+        _check_columns(df, list(filters), "filter")
+        for column, values in filters.items():
+            allowed = values if isinstance(values, list) else [values]
+            df = df[df[column].astype(str).isin([str(v) for v in allowed])]
+
+    if group_by or aggregate:
+        if aggregate not in AGGREGATES:
+            raise ValueError(f"aggregate must be one of: {', '.join(AGGREGATES)}")
+        group_by = group_by or []
+        _check_columns(df, group_by, "group_by")
+        measures = [
+            c for c in df.select_dtypes(include="number").columns
+            if c not in group_by and c != "year"
+        ]
+        if group_by:
+            df = df.groupby(group_by, sort=False, dropna=False)[measures].agg(aggregate).reset_index()
+        else:
+            df = df[measures].agg(aggregate).to_frame().T
+
+    if columns:
+        _check_columns(df, columns, "projected")
+        df = df[columns]
+
+    return df
+
+
+def encode_page(df: pd.DataFrame, cursor: str | None = None, limit: int = DEFAULT_PAGE_SIZE) -> dict:
+    """One page of rows as columns plus per-column value lists.
+
+    Returns:
+        {"columns", "data", "total", "offset", "next_cursor"}, where data[i]
+        holds the values of columns[i] and next_cursor is None on the last page.
+
+    Raises:
+        ValueError: On a malformed cursor.
+    """
+    try:
+        offset = int(cursor) if cursor else 0
+    except ValueError:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from None
+    if offset < 0:
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+    limit = max(1, min(int(limit), MAX_PAGE_SIZE))
+
+    page = df.iloc[offset:offset + limit]
+    # Only the page is converted to Python objects; NaN becomes null
+    page = page.astype(object).where(page.notna(), None)
+    end = offset + len(page)
+    return {
+        "columns": [str(c) for c in page.columns],
+        "data": [page[c].tolist() for c in page.columns],
+        "total": len(df),
+        "offset": offset,
+        "next_cursor": str(end) if end < len(df) else None,
+    }
@@ -2,12 +2,14 @@
 
 import base64
 import json
+import math
 from dataclasses import dataclass, field
 from pathlib import Path
 
 import pandas as pd
 
 from report_agent.data_catalog import ChartMeta, DataCatalog
+from report_agent.timeseries import WideTimeseries, year_columns
 
 
 @dataclass
@@ -33,6 +35,7 @@ class ChartReader:
     def __init__(self, catalog: DataCatalog):
         self.catalog = catalog
         self._df_cache: dict[str, pd.DataFrame] = {}
+        self._ts_cache: dict[str, WideTimeseries | None] = {}
 
     def load_data(self, chart_id: str) -> pd.DataFrame:
         """Load CSV data into a DataFrame."""
@@ -47,6 +50,17 @@ class ChartReader:
         self._df_cache[chart_id] = df
         return df
 
+    def get_timeseries(self, chart_id: str) -> WideTimeseries | None:
+        """Year-column data as a (scenario, dimension, year) array, built once per chart.
+
+        Returns None for charts without year columns (long format with a
+        "year" column, or no time axis).
+        """
+        if chart_id not in self._ts_cache:
+            df = self.load_data(chart_id)
+            self._ts_cache[chart_id] = None if "val" in df.columns else WideTimeseries.from_frame(df)
+        return self._ts_cache[chart_id]
+
     def get_summary(self, chart_id: str) -> ChartSummary:
         """Compute a comprehensive summary of the chart data."""
         chart = self.catalog.get_chart(chart_id)
@@ -54,6 +68,7 @@ class ChartReader:
             raise ValueError(f"Chart not found: {chart_id}")
 
         df = self.load_data(chart_id)
+        ts = self.get_timeseries(chart_id)
 
         scenarios = self._extract_scenarios(df)
         years = self._extract_years(df)
@@ -63,9 +78,9 @@ class ChartReader:
 
         by_scenario = {}
         for scenario in scenarios:
-            by_scenario[scenario] = self._compute_scenario_summary(df, scenario)
+            by_scenario[scenario] = self._compute_scenario_summary(df, scenario, ts)
 
-        key_insights = self._generate_insights(df, chart)
+        key_insights = self._generate_insights(df, chart, ts)
 
         return ChartSummary(
             chart_id=chart_id,
@@ -116,9 +131,9 @@ class ChartReader:
         if "year" in df.columns:
             return sorted(int(y) for y in df["year"].dropna().unique())
 
-        year_cols = [c for c in df.columns if c.isdigit() and 2000 <= int(c) <= 2100]
+        year_cols = year_columns(df.columns)
         if year_cols:
-            return sorted(int(c) for c in year_cols)
+            return [int(c) for c in year_cols]
 
         return []
 
@@ -144,8 +159,7 @@ class ChartReader:
         if "val" in df.columns:
             return "val"
 
-        year_cols = [c for c in df.columns if c.isdigit() and 2000 <= int(c) <= 2100]
-        if year_cols:
+        if year_columns(df.columns):
             return "year_values"
 
         numeric_cols = df.select_dtypes(include=["number"]).columns.tolist()
@@ -163,7 +177,9 @@ class ChartReader:
             return ", ".join(str(m) for m in measures)
         return "value"
 
-    def _compute_scenario_summary(self, df: pd.DataFrame, scenario: str) -> dict:
+    def _compute_scenario_summary(
+        self, df: pd.DataFrame, scenario: str, ts: WideTimeseries | None = None
+    ) -> dict:
         """Compute per-scenario summary statistics."""
         if "scen" not in df.columns:
             return {}
@@ -196,26 +212,15 @@ class ChartReader:
                     {"sector": row[dim_col], "value": round(float(row["val"]), 2)} for _, row in increases.iterrows()
                 ]
         else:
-            year_cols = [c for c in scen_df.columns if c.isdigit() and 2000 <= int(c) <= 2100]
-            if year_cols:
-                first_year = min(year_cols, key=int)
-                last_year = max(year_cols, key=int)
-
-                start_total = scen_df[first_year].sum()
-                end_total = scen_df[last_year].sum()
-
-                result["start_year"] = int(first_year)
-                result["end_year"] = int(last_year)
-                result["start_value"] = round(float(start_total), 2)
-                result["end_value"] = round(float(end_total), 2)
-
-                if start_total != 0:
-                    pct_change = ((end_total - start_total) / abs(start_total)) * 100
-                    result["percent_change"] = round(float(pct_change), 1)
+            ts = ts or WideTimeseries.from_frame(df)
+            if ts is not None and str(scenario) in ts.scenario_index:
+                result.update(ts.subset(scenarios=[str(scenario)]).scenario_stats()[str(scenario)])
 
         return result
 
-    def _generate_insights(self, df: pd.DataFrame, chart_meta: ChartMeta) -> list[str]:
+    def _generate_insights(
+        self, df: pd.DataFrame, chart_meta: ChartMeta, ts: WideTimeseries | None = None
+    ) -> list[str]:
         """Auto-generate key insights from the data."""
         insights = []
         scenarios = self._extract_scenarios(df)
@@ -223,9 +228,9 @@ class ChartReader:
         if "val" in df.columns:
             self._add_emissions_insights(df, scenarios, chart_meta, insights)
         else:
-            year_cols = [c for c in df.columns if c.isdigit() and 2000 <= int(c) <= 2100]
-            if year_cols:
-                self._add_timeseries_insights(df, year_cols, scenarios, chart_meta, insights)
+            ts = ts or WideTimeseries.from_frame(df)
+            if ts is not None:
+                self._add_timeseries_insights(ts, scenarios, chart_meta, insights)
 
         return insights
 
@@ -272,37 +277,24 @@ class ChartReader:
 
     def _add_timeseries_insights(
         self,
-        df: pd.DataFrame,
-        year_cols: list[str],
+        ts: WideTimeseries,
         scenarios: list[str],
         chart_meta: ChartMeta,
         insights: list[str],
     ) -> None:
         """Add insights for time series type charts."""
         units = chart_meta.units or "units"
-        first_year = min(year_cols, key=int)
-        last_year = max(year_cols, key=int)
-
-        for scen in scenarios[:2]:
-            scen_df = df[df["scen"] == scen] if "scen" in df.columns else df
-
-            start_total = scen_df[first_year].sum()
-            end_total = scen_df[last_year].sum()
+        first_year, last_year = ts.years[0], ts.years[-1]
+        named = ts.subset(scenarios=[str(s) for s in scenarios])
+        if not named.scenarios:
+            return
 
-            if start_total != 0:
-                pct_change = ((end_total - start_total) / abs(start_total)) * 100
+        for scen, pct_change in zip(named.scenarios[:2], named.percent_change()[:2]):
+            if not math.isnan(pct_change):  # NaN when the start total is 0
                 direction = "increases" if pct_change > 0 else "decreases"
                 insights.append(f"{scen}: Total {direction} {abs(pct_change):.1f}% from {first_year} to {last_year}")
 
-        if len(scenarios) > 1 and "scen" in df.columns:
-            final_totals = {}
-            for scen in scenarios:
-                scen_df = df[df["scen"] == scen]
-                final_totals[scen] = scen_df[last_year].sum()
-
-            max_scen = max(final_totals, key=lambda k: final_totals[k])
-            min_scen = min(final_totals, key=lambda k: final_totals[k])
-
-            if max_scen != min_scen:
-                diff = final_totals[max_scen] - final_totals[min_scen]
-                insights.append(f"By {last_year}, {max_scen} is {diff:.1f} {units} higher than {min_scen}")
+        gap = named.scenario_gap()
+        if gap is not None and gap[0] != gap[1]:
+            max_scen, min_scen, diff = gap
+            insights.append(f"By {last_year}, {max_scen} is {diff:.1f} {units} higher than {min_scen}")
@@ -1,4 +1,9 @@
-"""CLI for the Report Agent."""
+"""CLI for the Report Agent.
+
+Heavy dependencies (pandas via chart_reader, markdown, the LLM SDKs) are
+imported inside the commands that use them so that `--help` and the
+inspection commands start quickly. tests/test_import_time.py enforces this.
+"""
 
 import json
 import re
@@ -7,24 +12,39 @@ from enum import Enum
 from pathlib import Path
 from typing import Optional
 
-import markdown
 import typer
 from rich.console import Console
 from rich.table import Table
 
 from .data_catalog import DataCatalog
 from .orchestrator import DEFAULT_MODEL, DEFAULT_THINKING_LEVEL, ReportOrchestrator, UsageCost
-from .outline_parser import parse_outline
+from .outline_cache import load_outline
 from .git_integration import (
     require_executable,
     ensure_report_project,
     init_repo,
     auto_commit,
+    CommitScheduler,
     REPORT_META_FILENAME,
     GITHUB_ORG,
+    DEFAULT_COMMIT_INTERVAL_SECONDS,
+)
+from .change_journal import (
+    create_entry,
+    save_entry,
+    update_entry,
+    format_entry_for_commit,
+    get_journal_db_path,
+    uses_sqlite_journal,
+    import_json_entries,
+    export_json_entries,
+    JournalDB,
+    COST_PERIODS,
 )
-from .change_journal import create_entry, save_entry, update_entry, format_entry_for_commit
-from .editor_log import update_readme_with_note
+from .editor_log import queue_editor_note, flush_editorial_queue
+from .llm_log import new_run_id
+from .run_manifest import RunManifest
+from .tool_loop import ToolLoopBudget
 
 OUTLINE_FILENAME = "outline.md"
 
@@ -94,6 +114,12 @@ class OutputFormat(str, Enum):
     json = "json"
 
 
+class CommitStrategy(str, Enum):
+    per_section = "per-section"
+    per_run = "per-run"
+    interval = "interval"
+
+
 @app.command("init-report")
 def init_report(
     report_name: str = typer.Option(..., "--report-name", "-n", help="Human-readable report name"),
@@ -155,6 +181,81 @@ def _make_progress_callback(status_obj=None):
     return callback
 
 
+def _make_stream_echo(show_section: bool = False):
+    """Create a stream callback that echoes section text to the console.
+
+    Text is printed a whole line at a time, so it composes with the status
+    spinner and, with show_section, with several sections streaming at once.
+    """
+    import threading
+
+    from rich.markup import escape
+
+    buffers: dict[str, str] = {}
+    lock = threading.Lock()
+
+    def echo(section_id: str, text: str) -> None:
+        with lock:
+            pending = buffers.pop(section_id, "") + text
+            if text:
+                *lines, rest = pending.split("\n")
+                buffers[section_id] = rest
+            else:
+                # End of this section's stream: flush the last partial line
+                lines = [pending] if pending else []
+            prefix = f"[cyan]{escape(section_id)}[/cyan] │ " if show_section else ""
+            for line in lines:
+                console.print(f"{prefix}[dim]{escape(line)}[/dim]", highlight=False)
+
+    return echo
+
+
+def _changed_paths(
+    output_root: Path,
+    journal_path: Path,
+    orchestrator: "ReportOrchestrator | None",
+    *extra: Path | None,
+) -> list[Path]:
+    """Collect the files a command changed, for targeted staging.
+    
+    Includes the project files every command may rewrite (outline copy,
+    report.md, README.md editorial log, the command's journal entry), every
+    file the orchestrator wrote, and any extra paths. Missing files are
+    skipped when staging.
+    """
+    paths = [
+        output_root / OUTLINE_FILENAME,
+        output_root / "report.md",
+        output_root / "README.md",
+        journal_path,
+    ]
+    if orchestrator is not None:
+        paths.extend(orchestrator.consume_written_paths())
+    paths.extend(p for p in extra if p is not None)
+    return paths
+
+
+def _commit_partial_run(
+    committer: CommitScheduler,
+    command: str,
+    meta: dict,
+    model: str,
+    paths: list[Path],
+) -> None:
+    """After a failed run, commit the sections batching held back, then stop pushing."""
+    count = len(committer.pending_messages)
+    message = _build_commit_message(
+        f"chore: partial {command} ({count} section(s) completed before failure)",
+        meta,
+        model=model,
+    )
+    try:
+        if committer.abort(message, paths=paths):
+            console.print(f"[green]✓[/green] Committed {count} section(s) completed before the failure")
+    except RuntimeError as e:
+        console.print(f"[yellow]Warning:[/yellow] Git commit failed: {e}")
+
+
 def _extract_chart_references(content: str, available_chart_ids: list[str]) -> list[str]:
     """Extract which chart IDs are referenced in the generated content."""
     referenced = []
@@ -316,6 +417,10 @@ def generate_section(
     dry_run: bool = typer.Option(False, "--dry-run", help="Show what would be sent without calling LLM"),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Show detailed progress"),
     force: bool = typer.Option(False, "--force", "-f", help="Overwrite existing section file"),
+    stream: bool = typer.Option(False, "--stream", help="Show section text as it is generated (also kept in _sections/*.md.partial)"),
+    tool_loop: bool = typer.Option(False, "--tool-loop", help="Let the model fetch chart data through tools instead of preloading every mapped chart"),
+    max_tool_steps: int = typer.Option(8, "--max-tool-steps", min=1, help="Max model turns per section (with --tool-loop)"),
+    tool_token_budget: int = typer.Option(150_000, "--tool-token-budget", min=1, help="Max input+output tokens per section (with --tool-loop)"),
 ) -> None:
     """Generate a single section draft."""
     import time
@@ -342,6 +447,10 @@ def generate_section(
         console.print(f"[red]Error:[/red] Data root not found: {data_root}")
         raise typer.Exit(1)
 
+    if tool_loop and stream:
+        console.print("[red]Error:[/red] --tool-loop cannot be combined with --stream")
+        raise typer.Exit(1)
+
     if get_outline_in_output(output_root) is None:
         copy_outline_to_output(outline, output_root)
         console.print(f"[dim]Copied outline to {output_root / OUTLINE_FILENAME}[/dim]")
@@ -357,6 +466,8 @@ def generate_section(
             dry_run=dry_run,
             on_progress=_make_progress_callback() if verbose else None,
             output_dir=output_root,
+            tool_loop=tool_loop,
+            tool_budget=ToolLoopBudget(max_steps=max_tool_steps, max_tokens=tool_token_budget),
         )
     else:
         with console.status("[bold blue]Initializing...[/bold blue]", spinner="dots") as status:
@@ -368,6 +479,10 @@ def generate_section(
                 dry_run=dry_run,
                 on_progress=_make_progress_callback(status),
                 output_dir=output_root,
+                tool_loop=tool_loop,
+                tool_budget=ToolLoopBudget(max_steps=max_tool_steps, max_tokens=tool_token_budget),
+                stream=stream,
+                on_stream=_make_stream_echo() if stream else None,
             )
 
     section_obj = orchestrator.get_section(section)
@@ -426,7 +541,7 @@ def generate_section(
             thinking_level=thinking,
             sections_affected=[section],
         )
-        save_entry(output_root, journal_entry)
+        journal_path = save_entry(output_root, journal_entry)
         
         try:
             with console.status(f"[bold blue]Generating section '{section}'...[/bold blue]", spinner="dots") as status:
@@ -435,6 +550,7 @@ def generate_section(
 
             # Write the section file
             orchestrator._write_section_file(result)
+            orchestrator.checkpoint_report_state()
 
             charts_referenced = _extract_chart_references(result.content, chart_ids)
 
@@ -466,7 +582,7 @@ def generate_section(
             )
             
             try:
-                auto_commit(output_root, commit_msg)
+                auto_commit(output_root, commit_msg, paths=_changed_paths(output_root, journal_path, orchestrator))
                 console.print("[green]✓[/green] Changes committed and pushed to GitHub")
             except RuntimeError as e:
                 console.print(f"[red]Error:[/red] Git commit failed: {e}")
@@ -487,6 +603,10 @@ def update_section(
     revision_notes: Optional[Path] = typer.Option(None, "--revision-notes", "-R", help="Additional revision instructions (markdown file)"),
     dry_run: bool = typer.Option(False, "--dry-run", help="Show what would be sent without calling LLM"),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Show detailed progress"),
+    stream: bool = typer.Option(False, "--stream", help="Show section text as it is generated (also kept in _sections/*.md.partial)"),
+    tool_loop: bool = typer.Option(False, "--tool-loop", help="Let the model fetch chart data through tools instead of preloading every mapped chart"),
+    max_tool_steps: int = typer.Option(8, "--max-tool-steps", min=1, help="Max model turns per section (with --tool-loop)"),
+    tool_token_budget: int = typer.Option(150_000, "--tool-token-budget", min=1, help="Max input+output tokens per section (with --tool-loop)"),
 ) -> None:
     """Update a section based on review comments."""
     import time
@@ -518,6 +638,10 @@ def update_section(
         console.print(f"[red]Error:[/red] Data root not found: {data_root}")
         raise typer.Exit(1)
 
+    if tool_loop and stream:
+        console.print("[red]Error:[/red] --tool-loop cannot be combined with --stream")
+        raise typer.Exit(1)
+
     # Load extra revision notes if provided
     extra_notes = None
     if revision_notes:
@@ -535,6 +659,8 @@ def update_section(
             dry_run=dry_run,
             on_progress=_make_progress_callback() if verbose else None,
             output_dir=output_root,
+            tool_loop=tool_loop,
+            tool_budget=ToolLoopBudget(max_steps=max_tool_steps, max_tokens=tool_token_budget),
         )
     else:
         with console.status("[bold blue]Initializing...[/bold blue]", spinner="dots") as status:
@@ -546,6 +672,10 @@ def update_section(
                 dry_run=dry_run,
                 on_progress=_make_progress_callback(status),
                 output_dir=output_root,
+                tool_loop=tool_loop,
+                tool_budget=ToolLoopBudget(max_steps=max_tool_steps, max_tokens=tool_token_budget),
+                stream=stream,
+                on_stream=_make_stream_echo() if stream else None,
             )
 
     section_obj = orchestrator.get_section(section)
@@ -623,7 +753,7 @@ def update_section(
             sections_affected=[section],
             review_notes=extra_notes_text,
         )
-        save_entry(output_root, journal_entry)
+        journal_path = save_entry(output_root, journal_entry)
         
         try:
             with console.status(f"[bold blue]Updating section '{section}'...[/bold blue]", spinner="dots") as status:
@@ -651,8 +781,8 @@ def update_section(
             duration = time.time() - start_time
             update_entry(output_root, journal_entry, success=True, cost_usd=result.usage.cost_usd, duration_seconds=duration)
             
-            # Generate editorial note for README
-            note = update_readme_with_note(
+            # Queue editorial note for README (generated in the background)
+            queue_editor_note(
                 output_root,
                 journal_entry,
                 extra_context={
@@ -662,8 +792,7 @@ def update_section(
                     "review_author": section_obj.review_author,
                 },
             )
-            if note:
-                console.print(f"[green]✓[/green] Updated README editorial log")
+            console.print("[dim]Editorial note queued for README[/dim]")
             
             # Build commit message with review feedback context
             commit_msg = _build_commit_message_for_update_section(
@@ -677,7 +806,7 @@ def update_section(
             )
             
             try:
-                auto_commit(output_root, commit_msg)
+                auto_commit(output_root, commit_msg, paths=_changed_paths(output_root, journal_path, orchestrator))
                 console.print("[green]✓[/green] Changes committed and pushed to GitHub")
             except RuntimeError as e:
                 console.print(f"[red]Error:[/red] Git commit failed: {e}")
@@ -699,6 +828,16 @@ def generate_report(
     force: bool = typer.Option(False, "--force", "-f", help="Overwrite existing sections"),
     integrate: bool = typer.Option(False, "--integrate", "-I", help="Run integration pass after generation"),
     max_change_ratio: float = typer.Option(0.3, "--max-change", help="Max change ratio for integration (with --integrate)"),
+    commit_strategy: CommitStrategy = typer.Option(CommitStrategy.per_section, "--commit-strategy", help="When to commit: per-section, per-run, or interval"),
+    commit_interval: float = typer.Option(DEFAULT_COMMIT_INTERVAL_SECONDS, "--commit-interval", help="Seconds between commits (with --commit-strategy interval)"),
+    batch: bool = typer.Option(False, "--batch", help="Submit all sections as one provider batch job (cheaper, slower)"),
+    batch_poll: float = typer.Option(60.0, "--batch-poll", help="Seconds between batch status checks (with --batch)"),
+    workers: int = typer.Option(4, "--workers", "-j", min=1, help="Sections generated concurrently (dependents wait for their inputs)"),
+    stream: bool = typer.Option(False, "--stream", help="Show section text as it is generated (also kept in _sections/*.md.partial)"),
+    tool_loop: bool = typer.Option(False, "--tool-loop", help="Let the model fetch chart data through tools instead of preloading every mapped chart"),
+    max_tool_steps: int = typer.Option(8, "--max-tool-steps", min=1, help="Max model turns per section (with --tool-loop)"),
+    tool_token_budget: int = typer.Option(150_000, "--tool-token-budget", min=1, help="Max input+output tokens per section (with --tool-loop)"),
+    resume: Optional[str] = typer.Option(None, "--resume", help="Resume run RUN_ID, skipping sections it completed whose inputs are unchanged"),
 ) -> None:
     """Generate full report (all sections)."""
     import time
@@ -725,13 +864,37 @@ def generate_report(
         console.print(f"[red]Error:[/red] Data root not found: {data_root}")
         raise typer.Exit(1)
 
-    if has_existing_project(output_root) and not force:
+    if tool_loop and batch:
+        console.print("[red]Error:[/red] --tool-loop cannot be combined with --batch")
+        raise typer.Exit(1)
+
+    if tool_loop and stream:
+        console.print("[red]Error:[/red] --tool-loop cannot be combined with --stream")
+        raise typer.Exit(1)
+
+    if stream and batch:
+        console.print("[red]Error:[/red] --stream cannot be combined with --batch")
+        raise typer.Exit(1)
+
+    manifest = None
+    if resume:
+        try:
+            manifest = RunManifest.load(output_root, resume)
+        except (FileNotFoundError, ValueError) as e:
+            console.print(f"[red]Error:[/red] {e}")
+            raise typer.Exit(1)
+        console.print(
+            f"[dim]Resuming run {manifest.run_id}: "
+            f"{len(manifest.completed_ids())} section(s) completed so far[/dim]"
+        )
+    elif has_existing_project(output_root) and not force:
         console.print(f"[red]Error:[/red] Output directory already contains generated content.")
         console.print(f"[dim]Found existing sections in {output_root}[/dim]")
         console.print()
         console.print("Options:")
         console.print("  • Use [cyan]update-section[/cyan] to revise specific sections")
         console.print("  • Use [cyan]--force[/cyan] to regenerate all sections")
+        console.print("  • Use [cyan]--resume RUN_ID[/cyan] to finish an interrupted run")
         raise typer.Exit(1)
 
     if get_outline_in_output(output_root) is None:
@@ -747,6 +910,8 @@ def generate_report(
             dry_run=dry_run,
             on_progress=_make_progress_callback() if verbose else None,
             output_dir=output_root,
+            tool_loop=tool_loop,
+            tool_budget=ToolLoopBudget(max_steps=max_tool_steps, max_tokens=tool_token_budget),
         )
 
         section_count = len(orchestrator.sections)
@@ -764,11 +929,16 @@ def generate_report(
         console.print(f"[dim]Thinking: {thinking}[/dim]")
         console.print(f"[dim]Output: {output_root / 'report.md'}[/dim]")
         console.print(f"[dim]Figures: {output_root / 'figures'}[/dim]")
+        if batch:
+            console.print("[dim]Batch: all sections in one provider batch job[/dim]")
     else:
         start_time = time.time()
+        committer = CommitScheduler(output_root, commit_strategy.value, commit_interval)
+        if manifest is None:
+            manifest = RunManifest.create(output_root, new_run_id(), "generate-report", model)
         
         def on_section_complete(result, action: str) -> None:
-            """Commit and push after each section is generated."""
+            """Commit (or queue a commit) after each section is generated."""
             commit_msg = _build_commit_message_for_generate_section(
                 meta=meta,
                 section_id=result.section_id,
@@ -778,8 +948,10 @@ def generate_report(
             )
             
             try:
-                auto_commit(output_root, commit_msg)
-                console.print(f"  [green]✓[/green] Committed section {result.section_id}")
+                if committer.section_complete(commit_msg, paths=orchestrator.consume_written_paths()):
+                    console.print(f"  [green]✓[/green] Committed section {result.section_id}")
+                else:
+                    console.print(f"  [dim]Queued commit for section {result.section_id}[/dim]")
             except RuntimeError as e:
                 console.print(f"  [yellow]Warning:[/yellow] Git commit failed for {result.section_id}: {e}")
         
@@ -793,34 +965,57 @@ def generate_report(
                 on_progress=_make_progress_callback(status),
                 on_section_complete=on_section_complete,
                 output_dir=output_root,
+                tool_loop=tool_loop,
+                tool_budget=ToolLoopBudget(max_steps=max_tool_steps, max_tokens=tool_token_budget),
+                batch_poll_interval=batch_poll,
+                max_workers=workers,
+                stream=stream,
+                on_stream=_make_stream_echo(show_section=workers > 1) if stream else None,
+                run_manifest=manifest,
             )
 
         section_count = len(orchestrator.sections)
         console.print(f"[bold]Generating report with {section_count} sections...[/bold]")
+        console.print(f"[dim]Run ID: {manifest.run_id}[/dim]")
 
         # Get section IDs for journal
         section_ids = [s.id for s in orchestrator.sections]
         
         journal_entry = create_entry(
             command="generate-report",
-            arguments={"model": model, "thinking": thinking, "force": force, "integrate": integrate},
+            arguments={
+                "model": model,
+                "thinking": thinking,
+                "force": force,
+                "integrate": integrate,
+                "batch": batch,
+                "tool_loop": tool_loop,
+                "run_id": manifest.run_id,
+                "resume": bool(resume),
+            },
             model=model,
             thinking_level=thinking,
             sections_affected=section_ids,
         )
-        save_entry(output_root, journal_entry)
+        journal_path = save_entry(output_root, journal_entry)
+        manifest.journal_entries.append(journal_entry.id)
+        manifest.save()
 
         try:
             def section_progress(message: str) -> None:
-                if message.startswith("Generating section"):
+                if message.startswith(("Generating section", "Submitting batch", "Batch ")):
                     console.print(f"[bold blue]→ {message}[/bold blue]")
+                elif message.startswith("Skipping "):
+                    console.print(f"[dim]→ {message}[/dim]")
                 elif message.startswith("LLM response"):
                     console.print(f"  [green]✓[/green] {message}")
+                elif message.startswith("Tool loop finished"):
+                    console.print(f"  [dim]{message}[/dim]")
                 elif verbose:
                     console.print(f"  [dim]{message}[/dim]")
 
             orchestrator._on_progress = section_progress
-            report_content, total_usage = orchestrator.generate_report()
+            report_content, total_usage = orchestrator.generate_report(batch=batch)
 
             report_path = output_root / "report.md"
             report_path.write_text(report_content)
@@ -839,6 +1034,8 @@ def generate_report(
             console.print(f"[dim]Tokens: {total_usage.input_tokens:,} in / {total_usage.output_tokens:,} out[/dim]")
             if total_usage.reasoning_tokens > 0:
                 console.print(f"[dim]Reasoning tokens: {total_usage.reasoning_tokens:,}[/dim]")
+            if total_usage.cache_read_tokens > 0:
+                console.print(f"[dim]Cached input tokens: {total_usage.cache_read_tokens:,} ({total_usage.cache_read_tokens / total_usage.input_tokens:.0%} of input)[/dim]")
 
             if integrate:
                 console.print()
@@ -861,10 +1058,10 @@ def generate_report(
             duration = time.time() - start_time
             update_entry(output_root, journal_entry, success=True, cost_usd=total_usage.cost_usd, duration_seconds=duration)
             
-            # Generate editorial note for README
+            # Queue editorial note for README (generated in the background)
             figures_dir = output_root / "figures"
             figure_count = len(list(figures_dir.glob("*.png"))) if figures_dir.exists() else 0
-            note = update_readme_with_note(
+            queue_editor_note(
                 output_root,
                 journal_entry,
                 extra_context={
@@ -874,8 +1071,7 @@ def generate_report(
                     "integrate_requested": integrate,
                 },
             )
-            if note:
-                console.print(f"[green]✓[/green] Updated README editorial log")
+            console.print("[dim]Editorial note queued for README[/dim]")
             
             # Final commit for report.md assembly and journal update
             commit_msg = _build_commit_message(
@@ -886,7 +1082,9 @@ def generate_report(
             )
             
             try:
-                auto_commit(output_root, commit_msg)
+                committer.finalize(
+                    commit_msg, paths=_changed_paths(output_root, journal_path, orchestrator, manifest.path)
+                )
                 console.print("[green]✓[/green] Report finalized and pushed to GitHub")
             except RuntimeError as e:
                 console.print(f"[red]Error:[/red] Git commit failed: {e}")
@@ -901,7 +1099,20 @@ def generate_report(
         except Exception as e:
             if 'journal_entry' in locals():
                 update_entry(output_root, journal_entry, success=False, error_message=str(e))
+            _commit_partial_run(
+                committer, "generate-report", meta, model,
+                _changed_paths(output_root, journal_path, orchestrator, manifest.path),
+            )
+            console.print(
+                f"[yellow]Run {manifest.run_id} stopped.[/yellow] Finish it with "
+                f"[cyan]--resume {manifest.run_id}[/cyan] (completed sections are kept)"
+            )
             raise
+        finally:
+            try:
+                committer.close()
+            except RuntimeError as e:
+                console.print(f"[yellow]Warning:[/yellow] Git push failed: {e}")
 
 
 @app.command("update-report")
@@ -916,6 +1127,16 @@ def update_report(
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Show detailed progress"),
     integrate: bool = typer.Option(False, "--integrate", "-I", help="Run integration pass after update"),
     max_change_ratio: float = typer.Option(0.3, "--max-change", help="Max change ratio for integration (with --integrate)"),
+    commit_strategy: CommitStrategy = typer.Option(CommitStrategy.per_section, "--commit-strategy", help="When to commit: per-section, per-run, or interval"),
+    commit_interval: float = typer.Option(DEFAULT_COMMIT_INTERVAL_SECONDS, "--commit-interval", help="Seconds between commits (with --commit-strategy interval)"),
+    batch: bool = typer.Option(False, "--batch", help="Submit all sections as one provider batch job (cheaper, slower)"),
+    batch_poll: float = typer.Option(60.0, "--batch-poll", help="Seconds between batch status checks (with --batch)"),
+    workers: int = typer.Option(4, "--workers", "-j", min=1, help="Sections generated concurrently (dependents wait for their inputs)"),
+    stream: bool = typer.Option(False, "--stream", help="Show section text as it is generated (also kept in _sections/*.md.partial)"),
+    tool_loop: bool = typer.Option(False, "--tool-loop", help="Let the model fetch chart data through tools instead of preloading every mapped chart"),
+    max_tool_steps: int = typer.Option(8, "--max-tool-steps", min=1, help="Max model turns per section (with --tool-loop)"),
+    tool_token_budget: int = typer.Option(150_000, "--tool-token-budget", min=1, help="Max input+output tokens per section (with --tool-loop)"),
+    all_sections: bool = typer.Option(False, "--all", help="Revise every section, even those whose inputs are unchanged"),
 ) -> None:
     """Update existing sections and generate missing ones.
     
@@ -923,6 +1144,10 @@ def update_report(
     - If section file exists: update it based on review feedback
     - If section file doesn't exist: generate fresh content
     
+    Sections whose instructions, review comments, chart data, dependencies,
+    prompt templates and model are unchanged since their file was last
+    written are skipped (use --all or --revision-notes to revise them anyway).
+    
     This is useful when you have partially generated a report and want to
     continue generation while also incorporating review feedback on existing sections.
     """
@@ -955,6 +1180,18 @@ def update_report(
         console.print(f"[red]Error:[/red] Data root not found: {data_root}")
         raise typer.Exit(1)
 
+    if tool_loop and batch:
+        console.print("[red]Error:[/red] --tool-loop cannot be combined with --batch")
+        raise typer.Exit(1)
+
+    if tool_loop and stream:
+        console.print("[red]Error:[/red] --tool-loop cannot be combined with --stream")
+        raise typer.Exit(1)
+
+    if stream and batch:
+        console.print("[red]Error:[/red] --stream cannot be combined with --batch")
+        raise typer.Exit(1)
+
     extra_notes = None
     if revision_notes:
         if not revision_notes.exists():
@@ -971,6 +1208,8 @@ def update_report(
             dry_run=dry_run,
             on_progress=_make_progress_callback() if verbose else None,
             output_dir=output_root,
+            tool_loop=tool_loop,
+            tool_budget=ToolLoopBudget(max_steps=max_tool_steps, max_tokens=tool_token_budget),
         )
 
         console.print("[yellow]DRY RUN:[/yellow] Showing what would be done")
@@ -1000,11 +1239,14 @@ def update_report(
         console.print(f"[dim]Thinking: {thinking}[/dim]")
         if extra_notes:
             console.print(f"[dim]Revision notes: {len(extra_notes)} chars[/dim]")
+        if batch:
+            console.print("[dim]Batch: all sections in one provider batch job[/dim]")
     else:
         start_time = time.time()
+        committer = CommitScheduler(output_root, commit_strategy.value, commit_interval)
         
         def on_section_complete(result, action: str) -> None:
-            """Commit and push after each section is processed."""
+            """Commit (or queue a commit) after each section is processed."""
             section_obj = orchestrator.get_section(result.section_id)
             
             if action == "updated":
@@ -1027,8 +1269,10 @@ def update_report(
                 )
             
             try:
-                auto_commit(output_root, commit_msg)
-                console.print(f"  [green]✓[/green] Committed section {result.section_id} ({action})")
+                if committer.section_complete(commit_msg, paths=orchestrator.consume_written_paths()):
+                    console.print(f"  [green]✓[/green] Committed section {result.section_id} ({action})")
+                else:
+                    console.print(f"  [dim]Queued commit for section {result.section_id} ({action})[/dim]")
             except RuntimeError as e:
                 console.print(f"  [yellow]Warning:[/yellow] Git commit failed for {result.section_id}: {e}")
         
@@ -1042,6 +1286,12 @@ def update_report(
                 on_progress=_make_progress_callback(status),
                 on_section_complete=on_section_complete,
                 output_dir=output_root,
+                tool_loop=tool_loop,
+                tool_budget=ToolLoopBudget(max_steps=max_tool_steps, max_tokens=tool_token_budget),
+                batch_poll_interval=batch_poll,
+                max_workers=workers,
+                stream=stream,
+                on_stream=_make_stream_echo(show_section=workers > 1) if stream else None,
             )
 
         section_count = len(orchestrator.sections)
@@ -1052,24 +1302,38 @@ def update_report(
         
         journal_entry = create_entry(
             command="update-report",
-            arguments={"model": model, "thinking": thinking, "integrate": integrate},
+            arguments={
+                "model": model, "thinking": thinking, "integrate": integrate, "batch": batch,
+                "tool_loop": tool_loop,
+                "all": all_sections,
+            },
             model=model,
             thinking_level=thinking,
             sections_affected=section_ids,
             review_notes=extra_notes[:200] if extra_notes else None,
         )
-        save_entry(output_root, journal_entry)
+        journal_path = save_entry(output_root, journal_entry)
 
         def section_progress(message: str) -> None:
-            if message.startswith("Updating section") or message.startswith("Generating section"):
+            if message.startswith(("Updating section", "Generating section", "Skipping ", "Submitting batch", "Batch ")):
                 console.print(f"[bold blue]→ {message}[/bold blue]")
             elif message.startswith("LLM response"):
                 console.print(f"  [green]✓[/green] {message}")
+            elif message.startswith("Tool loop finished"):
+                console.print(f"  [dim]{message}[/dim]")
             elif verbose:
                 console.print(f"  [dim]{message}[/dim]")
 
         orchestrator._on_progress = section_progress
-        report_content, total_usage, action_map = orchestrator.update_report(extra_notes)
+        try:
+            report_content, total_usage, action_map = orchestrator.update_report(
+                extra_notes, batch=batch, skip_unchanged=not all_sections
+            )
+        except Exception:
+            _commit_partial_run(
+                committer, "update-report", meta, model, _changed_paths(output_root, journal_path, orchestrator)
+            )
+            raise
 
         report_path = output_root / "report.md"
         report_path.write_text(report_content)
@@ -1087,12 +1351,18 @@ def update_report(
 
         generated = sum(1 for v in action_map.values() if v == "generated")
         updated = sum(1 for v in action_map.values() if v == "updated")
+        skipped = sum(1 for v in action_map.values() if v == "skipped")
         console.print()
-        console.print(f"[dim]Generated: {generated} sections, Updated: {updated} sections[/dim]")
+        console.print(
+            f"[dim]Generated: {generated} sections, Updated: {updated} sections, "
+            f"Skipped (unchanged): {skipped} sections[/dim]"
+        )
         console.print(f"[bold cyan]Total Cost: ${total_usage.cost_usd:.2f}[/bold cyan]")
         console.print(f"[dim]Tokens: {total_usage.input_tokens:,} in / {total_usage.output_tokens:,} out[/dim]")
         if total_usage.reasoning_tokens > 0:
             console.print(f"[dim]Reasoning tokens: {total_usage.reasoning_tokens:,}[/dim]")
+        if total_usage.cache_read_tokens > 0:
+            console.print(f"[dim]Cached input tokens: {total_usage.cache_read_tokens:,} ({total_usage.cache_read_tokens / total_usage.input_tokens:.0%} of input)[/dim]")
 
         if integrate:
             console.print()
@@ -1115,8 +1385,8 @@ def update_report(
         duration = time.time() - start_time
         update_entry(output_root, journal_entry, success=True, cost_usd=total_usage.cost_usd, duration_seconds=duration)
         
-        # Generate editorial note for README
-        note = update_readme_with_note(
+        # Queue editorial note for README (generated in the background)
+        queue_editor_note(
             output_root,
             journal_entry,
             extra_context={
@@ -1127,8 +1397,7 @@ def update_report(
                 "integrate_requested": integrate,
             },
         )
-        if note:
-            console.print(f"[green]✓[/green] Updated README editorial log")
+        console.print("[dim]Editorial note queued for README[/dim]")
         
         # Final commit for report.md assembly
         commit_msg = _build_commit_message(
@@ -1139,7 +1408,7 @@ def update_report(
         )
         
         try:
-            auto_commit(output_root, commit_msg)
+            committer.finalize(commit_msg, paths=_changed_paths(output_root, journal_path, orchestrator))
             console.print("[green]✓[/green] Report finalized and pushed to GitHub")
         except RuntimeError as e:
             console.print(f"[red]Error:[/red] Git commit failed: {e}")
@@ -1259,7 +1528,7 @@ def integrate_report(
         model=model,
         thinking_level=thinking,
     )
-    save_entry(output_root, journal_entry)
+    journal_path = save_entry(output_root, journal_entry)
     
     try:
         # Run integration
@@ -1318,8 +1587,8 @@ def integrate_report(
             journal_entry.sections_affected = result.sections_modified
             save_entry(output_root, journal_entry)
             
-            # Generate editorial note for README
-            note = update_readme_with_note(
+            # Queue editorial note for README (generated in the background)
+            queue_editor_note(
                 output_root,
                 journal_entry,
                 extra_context={
@@ -1329,8 +1598,7 @@ def integrate_report(
                     "validation_passed": result.validation_passed,
                 },
             )
-            if note:
-                console.print(f"[green]✓[/green] Updated README editorial log")
+            console.print("[dim]Editorial note queued for README[/dim]")
             
             # Build commit message
             commit_msg = _build_commit_message_for_integrate_report(
@@ -1342,7 +1610,18 @@ def integrate_report(
             )
             
             try:
-                auto_commit(output_root, commit_msg)
+                auto_commit(
+                    output_root,
+                    commit_msg,
+                    paths=_changed_paths(
+                        output_root,
+                        journal_path,
+                        None,
+                        result.before_path,
+                        result.after_path,
+                        *integrator.log_paths,
+                    ),
+                )
                 console.print("[green]✓[/green] Changes committed and pushed to GitHub")
             except RuntimeError as e:
                 console.print(f"[red]Error:[/red] Git commit failed: {e}")
@@ -1431,6 +1710,52 @@ def inspect_charts(
         console.print(f"\n[dim]Total: {len(charts)} charts[/dim]")
 
 
+@app.command("index-data")
+def index_data(
+    data_root: Path = typer.Option(..., "--data-root", "-d", help="Path to data directory"),
+    workers: int = typer.Option(4, "--workers", "-j", min=1, help="Processes computing chart summaries"),
+    force: bool = typer.Option(False, "--force", help="Recompute summaries that are already current"),
+) -> None:
+    """Precompute chart summaries so report runs skip CSV parsing.
+
+    Summaries and their prompt fragments are written to the data export's
+    summary store (.chart_summaries/), where generate-* and update-* commands
+    pick them up. Charts whose files are unchanged since the last index are
+    skipped unless --force is given.
+    """
+    from .summary_store import index_charts, summary_store_dir
+
+    if not data_root.exists():
+        console.print(f"[red]Error:[/red] Data root not found: {data_root}")
+        raise typer.Exit(1)
+
+    with console.status("[bold blue]Indexing charts...[/bold blue]", spinner="dots") as status:
+        catalog = DataCatalog(data_root)
+        console.print(f"[green]✓[/green] Catalog: {len(catalog.list_charts())} charts in {catalog.data_root}")
+
+        def on_progress(done: int, total: int) -> None:
+            status.update(f"[bold blue]Summarizing charts ({done}/{total})...[/bold blue]")
+
+        stats = index_charts(catalog, workers=workers, force=force, on_progress=on_progress)
+
+    for chart_id, error in sorted(stats.failed.items()):
+        console.print(f"  [yellow]Warning:[/yellow] {chart_id}: {error}")
+    console.print(
+        f"[green]✓[/green] Summaries written to {summary_store_dir(catalog.data_root)}"
+    )
+    console.print(
+        f"[dim]Computed: {stats.computed}, Already current: {stats.current}, "
+        f"No CSV: {stats.no_data}, Failed: {len(stats.failed)}[/dim]"
+    )
+    console.print(
+        f"[bold cyan]{stats.computed} of {stats.charts} charts computed in {stats.seconds:.2f}s "
+        f"({stats.charts_per_second:.1f} charts/sec, {workers} worker(s)); "
+        f"{stats.skipped} skipped[/bold cyan]"
+    )
+    if stats.failed:
+        raise typer.Exit(1)
+
+
 @app.command("inspect-sections")
 def inspect_sections(
     outline: Path = typer.Option(..., "--outline", "-o", help="Path to report outline markdown"),
@@ -1442,7 +1767,7 @@ def inspect_sections(
         console.print(f"[red]Error:[/red] Outline file not found: {outline}")
         raise typer.Exit(1)
 
-    sections = parse_outline(outline)
+    sections = load_outline(outline).sections
 
     catalog = None
     mapper = None
@@ -1502,7 +1827,7 @@ def run_eval(
         console.print(f"[red]Error:[/red] Outline file not found: {outline}")
         raise typer.Exit(1)
 
-    sections = parse_outline(outline)
+    sections = load_outline(outline).sections
 
     eval_results = {
         "run_id": run_id,
@@ -1556,144 +1881,123 @@ def run_eval(
     console.print(table)
 
 
-HTML_TEMPLATE = """<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{title}</title>
-    <style>
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            line-height: 1.6;
-            max-width: 900px;
-            margin: 0 auto;
-            padding: 2rem;
-            color: #333;
-        }}
-        h1, h2, h3, h4, h5, h6 {{
-            margin-top: 1.5em;
-            margin-bottom: 0.5em;
-            color: #1a1a1a;
-        }}
-        h1 {{ border-bottom: 2px solid #eee; padding-bottom: 0.3em; }}
-        h2 {{ border-bottom: 1px solid #eee; padding-bottom: 0.2em; }}
-        img {{
-            max-width: 100%;
-            height: auto;
-            display: block;
-            margin: 1em 0;
-            border: 1px solid #ddd;
-            border-radius: 4px;
-        }}
-        table {{
-            border-collapse: collapse;
-            width: 100%;
-            margin: 1em 0;
-        }}
-        th, td {{
-            border: 1px solid #ddd;
-            padding: 8px;
-            text-align: left;
-        }}
-        th {{
-            background-color: #f5f5f5;
-        }}
-        code {{
-            background-color: #f5f5f5;
-            padding: 0.2em 0.4em;
-            border-radius: 3px;
-            font-size: 0.9em;
-        }}
-        pre {{
-            background-color: #f5f5f5;
-            padding: 1em;
-            border-radius: 4px;
-            overflow-x: auto;
-        }}
-        pre code {{
-            background: none;
-            padding: 0;
-        }}
-        blockquote {{
-            border-left: 4px solid #ddd;
-            margin: 1em 0;
-            padding-left: 1em;
-            color: #666;
-        }}
-    </style>
-</head>
-<body>
-{content}
-</body>
-</html>"""
-
-
-def _adjust_figure_paths(content: str, source_file: Path, output_root: Path) -> str:
-    """Adjust figure paths in markdown to be relative to the HTML output location.
-    
-    For files in output_root (like report.md), figures/ paths work as-is.
-    For files in _sections/, we need ../figures/ paths.
-    """
-    source_dir = source_file.parent.resolve()
-    root_dir = output_root.resolve()
-    
-    # Determine if source is in a subdirectory
+@app.command("editorial-flush")
+def editorial_flush(
+    output_root: Path = typer.Option(..., "--output-root", "-r", help="Report project directory"),
+) -> None:
+    """Write queued editorial notes to README.md now (normally done in the background)."""
     try:
-        rel_path = source_dir.relative_to(root_dir)
-        depth = len(rel_path.parts)
-    except ValueError:
-        depth = 0
-    
-    prefix = "../" * depth if depth > 0 else ""
-    
-    # Replace figures/ paths with adjusted relative paths
-    # Handle both markdown image syntax and raw paths
-    patterns = [
-        (r'!\[([^\]]*)\]\(figures/', rf'![\1]({prefix}figures/'),
-        (r'src="figures/', f'src="{prefix}figures/'),
-        (r"src='figures/", f"src='{prefix}figures/"),
-    ]
-    
-    for pattern, replacement in patterns:
-        content = re.sub(pattern, replacement, content)
+        notes = flush_editorial_queue(output_root)
+    except Exception as e:
+        console.print(f"[red]Error:[/red] Failed to update editorial log: {e}")
+        raise typer.Exit(1)
+
+    if not notes:
+        console.print("[dim]No queued editorial notes (or a background flush is running)[/dim]")
+        return
+    for note in notes:
+        console.print(f"[green]✓[/green] {note}")
+
+
+@app.command("journal-import")
+def journal_import(
+    output_root: Path = typer.Option(..., "--output-root", "-r", help="Report project directory"),
+    remove_json: bool = typer.Option(False, "--remove-json", help="Delete the JSON files after importing them"),
+) -> None:
+    """Move the change journal into SQLite (_report_log/journal.sqlite3).
     
-    return content
+    After import, new entries are written to the database instead of one
+    JSON file per operation. Safe to re-run.
+    """
+    if not output_root.exists():
+        console.print(f"[red]Error:[/red] Directory not found: {output_root}")
+        raise typer.Exit(1)
 
+    count = import_json_entries(output_root, remove_json=remove_json)
+    console.print(f"[green]✓[/green] Imported {count} journal entries into {get_journal_db_path(output_root)}")
+    if remove_json:
+        console.print(f"[dim]Removed {count} JSON file(s)[/dim]")
 
-def _strip_html_comments(content: str) -> str:
-    """Remove HTML comments from markdown content."""
-    return re.sub(r'<!--.*?-->', '', content, flags=re.DOTALL)
 
+@app.command("journal-export")
+def journal_export(
+    output_root: Path = typer.Option(..., "--output-root", "-r", help="Report project directory"),
+    dest: Path = typer.Option(..., "--dest", help="Directory to write JSON entries to"),
+) -> None:
+    """Export the SQLite journal as one JSON file per entry (files backend layout)."""
+    if not uses_sqlite_journal(output_root):
+        console.print(f"[red]Error:[/red] No SQLite journal in {output_root}")
+        raise typer.Exit(1)
 
-def _render_single_file(
-    input_file: Path,
-    output_root: Path,
-    output_file: Path | None,
-    strip_comments: bool,
-    title: str | None,
+    paths = export_json_entries(output_root, dest)
+    console.print(f"[green]✓[/green] Exported {len(paths)} journal entries to {dest}")
+
+
+@app.command("journal-query")
+def journal_query(
+    output_root: Path = typer.Option(..., "--output-root", "-r", help="Report project directory"),
+    section: Optional[str] = typer.Option(None, "--section", "-s", help="Only operations that touched this section"),
+    command: Optional[str] = typer.Option(None, "--command", "-c", help="Only operations of this CLI command"),
+    since: Optional[str] = typer.Option(None, "--since", help="ISO date/time lower bound"),
+    until: Optional[str] = typer.Option(None, "--until", help="ISO date/time upper bound (exclusive)"),
+    limit: int = typer.Option(50, "--limit", "-n", help="Maximum entries to show"),
+    cost_by: Optional[str] = typer.Option(None, "--cost-by", help=f"Summarize cost per period ({', '.join(COST_PERIODS)})"),
+    format: OutputFormat = typer.Option(OutputFormat.table, "--format", "-f", help="Output format"),
 ) -> None:
-    """Render a single markdown file to HTML."""
-    content = input_file.read_text()
-    
-    if strip_comments:
-        content = _strip_html_comments(content)
-    
-    content = _adjust_figure_paths(content, input_file, output_root)
-    
-    md = markdown.Markdown(extensions=['tables', 'fenced_code', 'toc'])
-    html_content = md.convert(content)
-    
-    if title is None:
-        title = input_file.stem.replace("_", " ").replace("-", " ").title()
-    
-    final_html = HTML_TEMPLATE.format(title=title, content=html_content)
-    
-    if output_file is None:
-        output_file = input_file.with_suffix(".html")
-    
-    output_file.write_text(final_html)
-    return output_file
+    """Query the SQLite change journal."""
+    if not uses_sqlite_journal(output_root):
+        console.print(f"[red]Error:[/red] No SQLite journal in {output_root}")
+        console.print("[dim]Run 'report-agent journal-import' first[/dim]")
+        raise typer.Exit(1)
+
+    with JournalDB(get_journal_db_path(output_root)) as db:
+        if cost_by:
+            try:
+                rows = db.cost_by_period(cost_by)
+            except ValueError as e:
+                console.print(f"[red]Error:[/red] {e}")
+                raise typer.Exit(1)
+            if format == OutputFormat.json:
+                console.print(json.dumps(
+                    [{"period": p, "cost_usd": c, "operations": n} for p, c, n in rows], indent=2
+                ))
+                return
+            table = Table(title=f"Cost by {cost_by}")
+            table.add_column("Period start", style="cyan")
+            table.add_column("Operations", justify="right")
+            table.add_column("Cost", justify="right", style="green")
+            for period, cost, count in rows:
+                table.add_row(period, str(count), f"${cost:.4f}")
+            console.print(table)
+            return
+
+        entries = db.query(command=command, section=section, since=since, until=until, limit=limit)
+
+    if format == OutputFormat.json:
+        from dataclasses import asdict
+
+        console.print(json.dumps([asdict(e) for e in entries], indent=2))
+        return
+
+    if not entries:
+        console.print("[dim]No matching journal entries[/dim]")
+        return
+
+    table = Table(title="Journal entries")
+    table.add_column("Timestamp", style="cyan")
+    table.add_column("Command", style="green")
+    table.add_column("Sections")
+    table.add_column("Cost", justify="right")
+    table.add_column("Status")
+    for entry in entries:
+        table.add_row(
+            entry.timestamp[:19].replace("T", " "),
+            entry.command,
+            ", ".join(entry.sections_affected) or "-",
+            f"${entry.cost_usd:.4f}" if entry.cost_usd is not None else "-",
+            "ok" if entry.success else "[red]failed[/red]",
+        )
+    console.print(table)
 
 
 @app.command("render-html")
@@ -1702,12 +2006,17 @@ def render_html(
     output_file: Path = typer.Option(None, "--output", "-o", help="Output HTML file (only for single file input)"),
     strip_comments: bool = typer.Option(True, "--strip-comments/--keep-comments", help="Remove HTML comments from output"),
     title: Optional[str] = typer.Option(None, "--title", "-t", help="HTML page title (only for single file input)"),
+    workers: Optional[int] = typer.Option(None, "--workers", "-j", min=1, help="Parallel render processes (default: CPU count)"),
+    force: bool = typer.Option(False, "--force", help="Re-render all files, ignoring the render manifest"),
 ) -> None:
     """Render markdown to HTML with relative figure paths.
     
     If INPUT_PATH is a directory, renders report.md and all section files.
+    Files unchanged since the last render (per .render-manifest.json) are skipped.
     If INPUT_PATH is a file, renders just that file.
     """
+    from .html_render import RenderJob, default_title, render_job, render_project, source_depth
+
     if not input_path.exists():
         console.print(f"[red]Error:[/red] Path not found: {input_path}")
         raise typer.Exit(1)
@@ -1715,27 +2024,18 @@ def render_html(
     # Directory mode: render all markdown files
     if input_path.is_dir():
         output_root = input_path
-        rendered_count = 0
-        
-        # Render main report.md
-        report_md = output_root / "report.md"
-        if report_md.exists():
-            out = _render_single_file(report_md, output_root, None, strip_comments, "Report")
-            console.print(f"[green]✓[/green] {out.name}")
-            rendered_count += 1
+        summary = render_project(output_root, strip_comments=strip_comments, workers=workers, force=force)
         
-        # Render section files
-        sections_dir = output_root / "_sections"
-        if sections_dir.exists():
-            for section_file in sorted(sections_dir.glob("*.md")):
-                out = _render_single_file(section_file, output_root, None, strip_comments, None)
-                console.print(f"[green]✓[/green] _sections/{out.name}")
-                rendered_count += 1
+        for out in summary.rendered:
+            console.print(f"[green]✓[/green] {out.relative_to(output_root).as_posix()}")
         
-        if rendered_count == 0:
+        if not summary.rendered and not summary.skipped:
             console.print("[yellow]Warning:[/yellow] No markdown files found to render")
         else:
-            console.print(f"\n[dim]Rendered {rendered_count} file(s)[/dim]")
+            console.print(
+                f"\n[dim]Rendered {len(summary.rendered)} file(s), "
+                f"{len(summary.skipped)} unchanged[/dim]"
+            )
     
     # File mode: render single file
     else:
@@ -1745,7 +2045,14 @@ def render_html(
         else:
             output_root = input_path.parent
         
-        out = _render_single_file(input_path, output_root, output_file, strip_comments, title)
+        job = RenderJob(
+            source=input_path,
+            output=output_file or input_path.with_suffix(".html"),
+            depth=source_depth(input_path, output_root),
+            strip_comments=strip_comments,
+            title=title or default_title(input_path),
+        )
+        out = render_job(job)
         console.print(f"[green]✓[/green] Rendered HTML to {out}")
 
 
@@ -2,7 +2,9 @@
 
 from dataclasses import dataclass, field
 from pathlib import Path
+import hashlib
 import json
+import os
 import re
 
 
@@ -155,6 +157,30 @@ class DataCatalog:
         """Normalize a title for comparison."""
         return re.sub(r"[^a-z0-9]", "", title.lower())
 
+    def signature(self) -> str:
+        """Digest of the files the catalog is built from, as they are on disk now.
+
+        Covers plot_specs.json and the name, size and mtime of every file in
+        each category folder, so adding, removing or rewriting a chart
+        changes it. Only stats files; nothing is read.
+        """
+        digest = hashlib.sha256()
+        if not self.data_root.exists():
+            return digest.hexdigest()
+        with os.scandir(self.data_root) as entries:
+            for entry in sorted(entries, key=lambda e: e.name):
+                if entry.name == "plot_specs.json":
+                    stat = entry.stat()
+                    digest.update(f"{entry.name}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode())
+                elif entry.is_dir() and not entry.name.startswith("."):
+                    with os.scandir(entry.path) as files:
+                        for file in sorted(files, key=lambda f: f.name):
+                            stat = file.stat()
+                            digest.update(
+                                f"{entry.name}/{file.name}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode()
+                            )
+        return digest.hexdigest()
+
     def list_categories(self) -> list[str]:
         """Return category folder names."""
         return self._categories.copy()
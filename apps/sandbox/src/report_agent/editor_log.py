@@ -1,12 +1,26 @@
 """Editorial log system for human-readable README.md commentary.
 
-Generates concise, editor-style notes after each CLI operation and appends
+Generates concise, editor-style notes after each CLI operation and adds
 them to a dedicated section in README.md. Uses a cheap LLM model for speed.
+
+Notes are cosmetic, so commands never wait for them: queue_editor_note()
+drops the operation into _report_log/editorial_queue/ and starts a detached
+worker. The worker drains up to MAX_FLUSH_BATCH queued operations with one
+batched LLM call and one README write. The README change is then picked up
+by the next command's commit, or by `report-agent editorial-flush`.
+
+A failed LLM call leaves the batch queued with its attempt count bumped;
+after MAX_NOTE_ATTEMPTS failures an operation gets a static note instead.
 """
 
 from __future__ import annotations
 
-import re
+import json
+import os
+import subprocess
+import sys
+import time
+from dataclasses import asdict
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -19,6 +33,15 @@ QUIP_MODEL = "gpt-5-nano-2025-08-07"
 EDITORIAL_START = "<!-- REPORT-AGENT:EDITORIAL-LOG-START -->"
 EDITORIAL_END = "<!-- REPORT-AGENT:EDITORIAL-LOG-END -->"
 
+EDITORIAL_QUEUE_DIRNAME = "editorial_queue"
+_LOCK_FILENAME = ".lock"
+# A worker holding the lock longer than this is assumed dead
+_LOCK_STALE_SECONDS = 600
+# Queued operations noted per flush (bounds prompt and completion size)
+MAX_FLUSH_BATCH = 10
+# Failed LLM attempts before an operation falls back to a static note
+MAX_NOTE_ATTEMPTS = 3
+
 MODEL_PRICING: dict[str, dict[str, float]] = {
     "gpt-5-nano-2025-08-07": {"input": 0.10, "output": 0.40},
 }
@@ -100,16 +123,25 @@ def generate_editor_note(
     return note.strip()
 
 
-def _call_llm(prompt: str) -> str:
+def _call_llm(prompt: str, max_completion_tokens: int = 100) -> str:
     """Call the cheap LLM model for commentary generation."""
     from openai import OpenAI
     
-    client = OpenAI()
+    from .llm_scheduler import estimate_tokens, get_scheduler
     
-    response = client.chat.completions.create(
-        model=QUIP_MODEL,
-        messages=[{"role": "user", "content": prompt}],
-        max_completion_tokens=100,
+    # Retries are handled by the scheduler, not the SDK
+    client = OpenAI(max_retries=0)
+    params = {
+        "model": QUIP_MODEL,
+        "messages": [{"role": "user", "content": prompt}],
+        "max_completion_tokens": max_completion_tokens,
+    }
+    # Notes are best-effort (the caller falls back), so give up sooner
+    response = get_scheduler().call(
+        QUIP_MODEL,
+        lambda: client.chat.completions.create(**params),
+        estimated_tokens=estimate_tokens(params),
+        max_attempts=3,
     )
     
     if not response.choices:
@@ -118,6 +150,21 @@ def _call_llm(prompt: str) -> str:
     return response.choices[0].message.content or ""
 
 
+def static_editor_note(entry: JournalEntry) -> str:
+    """Plain note for an operation, used when no LLM note could be generated."""
+    status = "completed" if entry.success else "failed"
+    note = f"`{entry.command}` {status}"
+    if entry.sections_affected:
+        note += f" for {', '.join(entry.sections_affected)}"
+    return note + "."
+
+
+def _write_text_atomic(path: Path, text: str) -> None:
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(text)
+    os.replace(tmp_path, path)
+
+
 def _ensure_editorial_section(content: str) -> str:
     """Ensure the README content has the editorial log section."""
     if EDITORIAL_START in content:
@@ -156,6 +203,19 @@ def append_note_to_readme(
         note: The editorial note text
         entry: The journal entry for metadata (timestamp, command)
     """
+    append_notes_to_readme(output_root, [(note, entry)])
+
+
+def append_notes_to_readme(
+    output_root: Path,
+    notes: list[tuple[str, JournalEntry]],
+) -> None:
+    """Add several editorial notes to README.md in a single write.
+    
+    Notes are placed at the top of the editorial log, most recent first.
+    """
+    if not notes:
+        return
     readme_path = output_root / "README.md"
     
     if readme_path.exists():
@@ -165,14 +225,183 @@ def append_note_to_readme(
     
     content = _ensure_editorial_section(content)
     
-    formatted_entry = _format_entry(note, entry)
+    ordered = sorted(notes, key=lambda item: item[1].timestamp, reverse=True)
+    block = "".join(_format_entry(note, entry) for note, entry in ordered)
+    
+    insert_at = content.index(EDITORIAL_START) + len(EDITORIAL_START) + 1
+    rest = content[insert_at:]
+    if rest.startswith("<!-- Entries"):
+        rest = rest[rest.index("-->") + 4:]
+    
+    _write_text_atomic(readme_path, content[:insert_at] + block + rest)
+
+
+def get_editorial_queue_dir(output_root: Path) -> Path:
+    """Directory holding operations waiting for an editorial note."""
+    return output_root / "_report_log" / EDITORIAL_QUEUE_DIRNAME
+
+
+def queue_editor_note(
+    output_root: Path,
+    entry: JournalEntry,
+    extra_context: dict[str, Any] | None = None,
+    background: bool = True,
+) -> Path:
+    """Queue an operation for an editorial note and return immediately.
+    
+    Each queued operation is its own file, so producers never contend with a
+    worker that is draining the queue.
     
-    pattern = rf"({re.escape(EDITORIAL_START)}\n)(<!-- Entries.*?-->\n)?"
-    replacement = rf"\1{formatted_entry}"
+    Args:
+        output_root: The report project directory
+        entry: The journal entry for the operation
+        extra_context: Additional operation-specific context
+        background: Start a detached worker to drain the queue
+        
+    Returns:
+        Path of the queued item
+    """
+    queue_dir = get_editorial_queue_dir(output_root)
+    queue_dir.mkdir(parents=True, exist_ok=True)
     
-    new_content = re.sub(pattern, replacement, content)
+    ts = datetime.fromisoformat(entry.timestamp).strftime("%Y%m%d_%H%M%S")
+    path = queue_dir / f"{ts}_{entry.id[:8]}.json"
+    payload = {"entry": asdict(entry), "extra_context": extra_context or {}, "attempts": 0}
+    _write_text_atomic(path, json.dumps(payload, default=str))
     
-    readme_path.write_text(new_content)
+    if background:
+        start_background_flush(output_root)
+    return path
+
+
+def start_background_flush(output_root: Path) -> subprocess.Popen | None:
+    """Start a detached process that drains the editorial queue."""
+    try:
+        return subprocess.Popen(
+            [sys.executable, "-m", "report_agent.editor_log", str(output_root)],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+    except OSError as e:
+        print(f"Warning: Could not start editorial log worker: {e}", file=sys.stderr)
+        return None
+
+
+def _acquire_lock(queue_dir: Path) -> bool:
+    lock_path = queue_dir / _LOCK_FILENAME
+    for _ in range(2):
+        try:
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            try:
+                age = time.time() - lock_path.stat().st_mtime
+            except FileNotFoundError:
+                continue
+            if age < _LOCK_STALE_SECONDS:
+                return False
+            lock_path.unlink(missing_ok=True)
+            continue
+        os.write(fd, str(os.getpid()).encode())
+        os.close(fd)
+        return True
+    return False
+
+
+def _release_lock(queue_dir: Path) -> None:
+    (queue_dir / _LOCK_FILENAME).unlink(missing_ok=True)
+
+
+def generate_editor_notes(
+    items: list[tuple[JournalEntry, dict[str, Any]]],
+) -> list[str]:
+    """Generate notes for several operations with a single LLM call.
+    
+    Falls back to one call per operation if the batched reply can't be
+    matched up with the operations.
+    """
+    if len(items) == 1:
+        entry, extra_context = items[0]
+        return [generate_editor_note(entry, extra_context)]
+    
+    summaries = "\n\n".join(
+        f"Operation {i}:\n{_build_operation_summary(entry, extra_context)}"
+        for i, (entry, extra_context) in enumerate(items, 1)
+    )
+    template = load_prompt("editor_notes_batch")
+    prompt = template.format(operation_summaries=summaries, count=len(items))
+    
+    reply = _call_llm(prompt, max_completion_tokens=100 * len(items)).strip()
+    if reply.startswith("```"):
+        reply = reply.strip("`").removeprefix("json").strip()
+    try:
+        notes = json.loads(reply)
+    except json.JSONDecodeError:
+        notes = None
+    if isinstance(notes, list) and len(notes) == len(items) and all(isinstance(n, str) for n in notes):
+        return [n.strip() for n in notes]
+    
+    return [generate_editor_note(entry, extra_context) for entry, extra_context in items]
+
+
+def flush_editorial_queue(output_root: Path, max_items: int = MAX_FLUSH_BATCH) -> list[str]:
+    """Turn the oldest queued operations into README notes.
+    
+    Only one flush runs at a time; a concurrent call returns immediately.
+    At most max_items operations are taken per flush. Queue items are
+    removed only after README.md has been written. If the LLM call fails,
+    each item's attempt count is bumped and it stays queued; items that
+    have used up MAX_NOTE_ATTEMPTS get a static note instead.
+    
+    Returns:
+        The notes added (empty if nothing was queued, the LLM call failed,
+        or another flush holds the lock).
+    """
+    queue_dir = get_editorial_queue_dir(output_root)
+    if not queue_dir.exists() or not _acquire_lock(queue_dir):
+        return []
+    try:
+        taken: list[tuple[Path, dict[str, Any], JournalEntry]] = []
+        for path in sorted(queue_dir.glob("*.json")):
+            if len(taken) >= max_items:
+                break
+            try:
+                payload = json.loads(path.read_text())
+                taken.append((path, payload, JournalEntry(**payload["entry"])))
+            except (json.JSONDecodeError, TypeError, KeyError):
+                path.unlink(missing_ok=True)
+        
+        fresh = [item for item in taken if item[1].get("attempts", 0) < MAX_NOTE_ATTEMPTS]
+        # Operations whose LLM note keeps failing get a static note instead
+        noted = [
+            (static_editor_note(entry), entry, path)
+            for path, payload, entry in taken
+            if payload.get("attempts", 0) >= MAX_NOTE_ATTEMPTS
+        ]
+        if fresh:
+            try:
+                notes = generate_editor_notes(
+                    [(entry, payload.get("extra_context") or {}) for _, payload, entry in fresh]
+                )
+            except Exception as e:
+                print(f"Warning: Failed to generate editorial notes: {e}", file=sys.stderr)
+                for path, payload, _ in fresh:
+                    payload["attempts"] = payload.get("attempts", 0) + 1
+                    _write_text_atomic(path, json.dumps(payload, default=str))
+            else:
+                noted += [(note, entry, path) for note, (path, _, entry) in zip(notes, fresh)]
+        if not noted:
+            return []
+        
+        noted.sort(key=lambda item: item[2])
+        append_notes_to_readme(output_root, [(note, entry) for note, entry, _ in noted])
+        for _, _, path in noted:
+            path.unlink(missing_ok=True)
+        notes = [note for note, _, _ in noted]
+        return notes
+    finally:
+        _release_lock(queue_dir)
 
 
 def update_readme_with_note(
@@ -180,11 +409,9 @@ def update_readme_with_note(
     entry: JournalEntry,
     extra_context: dict[str, Any] | None = None,
 ) -> str | None:
-    """Generate and append an editorial note to README.md.
+    """Generate and append an editorial note to README.md synchronously.
     
-    This is the main entry point for CLI commands. It handles the full flow:
-    1. Generate note via LLM
-    2. Append to README.md
+    Prefer queue_editor_note() from CLI commands; this blocks on the LLM.
     
     Returns the generated note, or None if generation failed.
     Failures are logged but don't raise exceptions.
@@ -194,6 +421,14 @@ def update_readme_with_note(
         append_note_to_readme(output_root, note, entry)
         return note
     except Exception as e:
-        import sys
         print(f"Warning: Failed to update editorial log: {e}", file=sys.stderr)
         return None
+
+
+if __name__ == "__main__":
+    # Detached worker started by start_background_flush()
+    try:
+        flush_editorial_queue(Path(sys.argv[1]))
+    except Exception as e:
+        print(f"Warning: Failed to update editorial log: {e}", file=sys.stderr)
+        sys.exit(1)
@@ -3,7 +3,8 @@ from dataclasses import dataclass, field, asdict
 from datetime import datetime, timezone
 from pathlib import Path
 
-from .outline_parser import parse_outline, Section
+from .outline_cache import load_outline
+from .outline_parser import Section
 
 
 @dataclass
@@ -38,7 +39,7 @@ class EvalRunner:
     @property
     def sections(self) -> list[Section]:
         if self._sections is None:
-            self._sections = parse_outline(self.outline_path)
+            self._sections = load_outline(self.outline_path).sections
         return self._sections
 
     def parse_reviews(self) -> list[SectionEval]:
@@ -10,12 +10,18 @@ import json
 import re
 import shutil
 import subprocess
+import threading
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 
 REPORT_META_FILENAME = ".report-agent.json"
 GITHUB_ORG = "austimes"
 
+COMMIT_STRATEGIES = ("per-section", "per-run", "interval")
+DEFAULT_COMMIT_STRATEGY = "per-section"
+DEFAULT_COMMIT_INTERVAL_SECONDS = 300.0
+
 
 def require_executable(name: str) -> None:
     """Check if executable exists on PATH, raise RuntimeError if not."""
@@ -26,14 +32,18 @@ def require_executable(name: str) -> None:
         )
 
 
-def run_git(args: list[str], cwd: Path, desc: str) -> str:
-    """Run git command, return stdout. Raise RuntimeError with full stderr on failure."""
+def run_git(args: list[str], cwd: Path, desc: str, input: str | None = None) -> str:
+    """Run git command, return stdout. Raise RuntimeError with full stderr on failure.
+    
+    If input is given it is written to the command's stdin.
+    """
     require_executable("git")
     cmd = ["git"] + args
     try:
         result = subprocess.run(
             cmd,
             cwd=cwd,
+            input=input,
             capture_output=True,
             text=True,
             check=True,
@@ -127,15 +137,73 @@ def ensure_report_project(output_root: Path) -> dict:
     return load_report_meta(output_root)
 
 
-def auto_commit(output_root: Path, commit_message: str) -> None:
-    """Stage ALL files, commit with message, and push to origin.
+def stage_paths(output_root: Path, paths: list[Path]) -> list[str]:
+    """Stage only the given paths, using a single `git add` invocation.
+    
+    Paths may be absolute or relative to output_root; directories stage their
+    contents. A path that no longer exists on disk is staged as a removal if
+    git tracks it (e.g. a section file renamed after an outline reorder) and
+    skipped otherwise. Pathspecs are passed NUL-separated on stdin and matched
+    literally, so no glob expansion happens and the repo's other files are
+    never stat'ed.
     
-    Uses git add -A and --allow-empty for the commit.
-    All steps must succeed or raise RuntimeError.
+    Returns the list of pathspecs that were staged (relative, POSIX style).
+    """
+    root = output_root.resolve()
+    specs: set[str] = set()
+    missing: set[str] = set()
+    for path in paths:
+        path = Path(path)
+        full = path if path.is_absolute() else root / path
+        try:
+            rel = full.resolve().relative_to(root)
+        except ValueError:
+            raise RuntimeError(
+                f"Cannot stage path outside report project: {path}\n"
+                f"Report project root: {root}"
+            )
+        (specs if full.exists() else missing).add(rel.as_posix())
+    
+    if missing:
+        # Only tracked paths can be removed; git add rejects unknown pathspecs
+        tracked = run_git(
+            ["--literal-pathspecs", "ls-files", "-z", "--"] + sorted(missing),
+            cwd=output_root,
+            desc=f"checking {len(missing)} missing path(s)",
+        )
+        specs.update(p for p in tracked.split("\0") if p)
+    
+    if not specs:
+        return []
+    
+    ordered = sorted(specs)
+    run_git(
+        ["--literal-pathspecs", "add", "--pathspec-from-file=-", "--pathspec-file-nul"],
+        cwd=output_root,
+        desc=f"staging {len(ordered)} path(s)",
+        input="\0".join(ordered),
+    )
+    return ordered
+
+
+def auto_commit(
+    output_root: Path,
+    commit_message: str,
+    push: bool = True,
+    paths: list[Path] | None = None,
+) -> None:
+    """Stage files, commit with message, and optionally push to origin.
+    
+    If paths is given, only those paths are staged (see stage_paths). If paths
+    is None, falls back to staging the whole working tree with git add -A.
+    Uses --allow-empty for the commit. All steps must succeed or raise RuntimeError.
     """
     ensure_report_project(output_root)
     
-    run_git(["add", "-A"], cwd=output_root, desc="staging all files")
+    if paths is None:
+        run_git(["add", "-A"], cwd=output_root, desc="staging all files")
+    else:
+        stage_paths(output_root, paths)
     
     run_git(
         ["commit", "--allow-empty", "-m", commit_message],
@@ -143,9 +211,221 @@ def auto_commit(output_root: Path, commit_message: str) -> None:
         desc="committing changes",
     )
     
+    if push:
+        push_to_origin(output_root)
+
+
+def push_to_origin(output_root: Path) -> None:
+    """Push the main branch to origin. Raises RuntimeError on failure."""
     run_git(["push", "origin", "main"], cwd=output_root, desc="pushing to origin")
 
 
+def combine_commit_messages(messages: list[str]) -> str:
+    """Combine several commit messages into one, preserving each in the body.
+    
+    The first message's subject line is kept as the subject; every message is
+    then included in full so per-section journal details survive batching.
+    """
+    if not messages:
+        return ""
+    if len(messages) == 1:
+        return messages[0]
+    
+    subject = messages[0].split("\n", 1)[0]
+    lines = [f"{subject} (+{len(messages) - 1} more)", ""]
+    for message in messages:
+        lines.append("---")
+        lines.append(message.strip())
+        lines.append("")
+    return "\n".join(lines).rstrip() + "\n"
+
+
+class PushQueue:
+    """Background worker that pushes a report repo to origin.
+    
+    Push requests are coalesced: any number of requests made while a push is
+    in flight result in at most one further push, since a single push of
+    main carries every commit made so far. Callers never wait on the remote
+    except in wait()/close().
+    """
+    
+    def __init__(self, output_root: Path):
+        self.output_root = output_root
+        self.push_count = 0
+        self.last_error: RuntimeError | None = None
+        self._cond = threading.Condition()
+        self._pending = False
+        self._busy = False
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run, name="report-agent-push", daemon=True
+        )
+        self._thread.start()
+    
+    def request_push(self) -> None:
+        """Schedule a push; returns immediately."""
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Push queue is closed")
+            self._pending = True
+            self._cond.notify_all()
+    
+    def wait(self) -> None:
+        """Block until no push is pending or in flight.
+        
+        Raises the last push error, if any, so failures are not lost.
+        """
+        with self._cond:
+            while self._pending or self._busy:
+                self._cond.wait()
+            error, self.last_error = self.last_error, None
+        if error is not None:
+            raise error
+    
+    def close(self) -> None:
+        """Flush outstanding pushes and stop the worker."""
+        try:
+            self.wait()
+        finally:
+            with self._cond:
+                self._closed = True
+                self._cond.notify_all()
+            self._thread.join()
+    
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if not self._pending:
+                    return
+                self._pending = False
+                self._busy = True
+            
+            error = None
+            try:
+                push_to_origin(self.output_root)
+            except RuntimeError as e:
+                error = e
+            
+            with self._cond:
+                self._busy = False
+                if error is None:
+                    self.push_count += 1
+                else:
+                    self.last_error = error
+                self._cond.notify_all()
+
+
+class CommitScheduler:
+    """Decides when to commit during multi-section runs and pushes in the background.
+    
+    Strategies:
+    - per-section: commit after every section (push is queued, not awaited)
+    - per-run: hold section messages and make a single commit at finalize()
+    - interval: commit at most once every ``interval_seconds``
+    
+    Section commit messages held back by batching are folded into the next
+    commit's body via combine_commit_messages(), so no journal detail is lost.
+    Changed paths passed alongside each message are accumulated and staged
+    together; if any caller passes paths=None the commit falls back to git add -A.
+    """
+    
+    def __init__(
+        self,
+        output_root: Path,
+        strategy: str = DEFAULT_COMMIT_STRATEGY,
+        interval_seconds: float = DEFAULT_COMMIT_INTERVAL_SECONDS,
+        push: bool = True,
+        clock=time.monotonic,
+    ):
+        if strategy not in COMMIT_STRATEGIES:
+            raise ValueError(
+                f"Unknown commit strategy: {strategy!r}. "
+                f"Expected one of: {', '.join(COMMIT_STRATEGIES)}"
+            )
+        self.output_root = output_root
+        self.strategy = strategy
+        self.interval_seconds = interval_seconds
+        self._clock = clock
+        self._pending_messages: list[str] = []
+        self._pending_paths: list[Path] | None = []
+        self._last_commit_at = clock()
+        self._push_queue = PushQueue(output_root) if push else None
+        self.commit_count = 0
+    
+    @property
+    def pending_messages(self) -> list[str]:
+        """Section messages not yet committed."""
+        return list(self._pending_messages)
+    
+    def section_complete(self, commit_message: str, paths: list[Path] | None = None) -> bool:
+        """Record a finished section. Returns True if a commit was made now."""
+        self._pending_messages.append(commit_message)
+        self._add_pending_paths(paths)
+        
+        if self.strategy == "per-run":
+            return False
+        if self.strategy == "interval":
+            if self._clock() - self._last_commit_at < self.interval_seconds:
+                return False
+        
+        self._commit_pending()
+        return True
+    
+    def finalize(self, commit_message: str, paths: list[Path] | None = None) -> None:
+        """Commit everything outstanding with the run's final message and push.
+        
+        Blocks until the final push has completed; raises RuntimeError if the
+        commit or any outstanding push failed.
+        """
+        self._pending_messages.insert(0, commit_message)
+        self._add_pending_paths(paths)
+        try:
+            self._commit_pending()
+        finally:
+            self.close()
+    
+    def abort(self, commit_message: str, paths: list[Path] | None = None) -> bool:
+        """Commit sections held back by batching when a run fails, then close.
+
+        The pending section messages are kept in the body of a partial-run
+        commit headed by commit_message, so sections completed before the
+        failure are never lost. Returns True if a commit was made.
+        """
+        try:
+            if not self._pending_messages:
+                return False
+            self._pending_messages.insert(0, commit_message)
+            self._add_pending_paths(paths)
+            self._commit_pending()
+            return True
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Wait for queued pushes and stop the push worker."""
+        if self._push_queue is not None:
+            queue, self._push_queue = self._push_queue, None
+            queue.close()
+    
+    def _add_pending_paths(self, paths: list[Path] | None) -> None:
+        if paths is None:
+            self._pending_paths = None
+        elif self._pending_paths is not None:
+            self._pending_paths.extend(paths)
+    
+    def _commit_pending(self) -> None:
+        message = combine_commit_messages(self._pending_messages)
+        auto_commit(self.output_root, message, push=False, paths=self._pending_paths)
+        self._pending_messages = []
+        self._pending_paths = []
+        self._last_commit_at = self._clock()
+        self.commit_count += 1
+        if self._push_queue is not None:
+            self._push_queue.request_push()
+
+
 def _slugify(name: str) -> str:
     """Convert a report name to a valid GitHub repo slug."""
     slug = name.lower()
@@ -198,6 +478,11 @@ def init_repo(output_root: Path, report_name: str, private: bool = True) -> dict
     gitignore_content = """__pycache__/
 *.pyc
 .venv/
+report_state.json.wal
+_report_log/editorial_queue/
+_report_log/cache/
+_report_log/journal.sqlite3
+_sections/*.partial
 """
     gitignore_path = output_root / ".gitignore"
     gitignore_path.write_text(gitignore_content, encoding="utf-8")
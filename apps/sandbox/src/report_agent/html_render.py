@@ -0,0 +1,275 @@
+"""Markdown-to-HTML rendering for report projects.
+
+Directory renders are incremental: each source's content hash (plus the render
+options) is recorded in a manifest, and files whose hash is unchanged and whose
+HTML still exists are skipped. Stale files are rendered in a process pool.
+"""
+
+import hashlib
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+RENDER_MANIFEST_FILENAME = ".render-manifest.json"
+MANIFEST_VERSION = 1
+
+# Below this many stale files, rendering in-process beats pool startup.
+MIN_PARALLEL_FILES = 4
+
+MARKDOWN_EXTENSIONS = ["tables", "fenced_code", "toc"]
+
+HTML_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{title}</title>
+    <style>
+        body {{
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+            line-height: 1.6;
+            max-width: 900px;
+            margin: 0 auto;
+            padding: 2rem;
+            color: #333;
+        }}
+        h1, h2, h3, h4, h5, h6 {{
+            margin-top: 1.5em;
+            margin-bottom: 0.5em;
+            color: #1a1a1a;
+        }}
+        h1 {{ border-bottom: 2px solid #eee; padding-bottom: 0.3em; }}
+        h2 {{ border-bottom: 1px solid #eee; padding-bottom: 0.2em; }}
+        img {{
+            max-width: 100%;
+            height: auto;
+            display: block;
+            margin: 1em 0;
+            border: 1px solid #ddd;
+            border-radius: 4px;
+        }}
+        table {{
+            border-collapse: collapse;
+            width: 100%;
+            margin: 1em 0;
+        }}
+        th, td {{
+            border: 1px solid #ddd;
+            padding: 8px;
+            text-align: left;
+        }}
+        th {{
+            background-color: #f5f5f5;
+        }}
+        code {{
+            background-color: #f5f5f5;
+            padding: 0.2em 0.4em;
+            border-radius: 3px;
+            font-size: 0.9em;
+        }}
+        pre {{
+            background-color: #f5f5f5;
+            padding: 1em;
+            border-radius: 4px;
+            overflow-x: auto;
+        }}
+        pre code {{
+            background: none;
+            padding: 0;
+        }}
+        blockquote {{
+            border-left: 4px solid #ddd;
+            margin: 1em 0;
+            padding-left: 1em;
+            color: #666;
+        }}
+    </style>
+</head>
+<body>
+{content}
+</body>
+</html>"""
+
+# Changing the template or extensions invalidates every manifest entry.
+_RENDER_FINGERPRINT = hashlib.sha256(
+    (HTML_TEMPLATE + "|" + ",".join(MARKDOWN_EXTENSIONS)).encode("utf-8")
+).hexdigest()[:16]
+
+# Figure references in markdown image syntax and raw <img> tags.
+_MD_FIGURE_RE = re.compile(r'!\[([^\]]*)\]\(figures/')
+_SRC_DQ_FIGURE_RE = re.compile(r'src="figures/')
+_SRC_SQ_FIGURE_RE = re.compile(r"src='figures/")
+_HTML_COMMENT_RE = re.compile(r'<!--.*?-->', re.DOTALL)
+
+# One Markdown instance per process, reset between documents.
+_markdown_converter = None
+
+
+@dataclass
+class RenderJob:
+    """A single markdown file to render."""
+    source: Path
+    output: Path
+    depth: int
+    strip_comments: bool
+    title: str
+
+
+@dataclass
+class RenderSummary:
+    """Outcome of a directory render."""
+    rendered: list[Path]
+    skipped: list[Path]
+
+
+def adjust_figure_paths(content: str, depth: int) -> str:
+    """Rewrite figures/ references for an HTML file `depth` levels below the project root.
+
+    For files in output_root (like report.md), figures/ paths work as-is.
+    For files in _sections/, we need ../figures/ paths.
+    """
+    if depth <= 0:
+        return content
+    prefix = "../" * depth
+    content = _MD_FIGURE_RE.sub(rf'![\1]({prefix}figures/', content)
+    content = _SRC_DQ_FIGURE_RE.sub(f'src="{prefix}figures/', content)
+    content = _SRC_SQ_FIGURE_RE.sub(f"src='{prefix}figures/", content)
+    return content
+
+
+def strip_html_comments(content: str) -> str:
+    """Remove HTML comments from markdown content."""
+    return _HTML_COMMENT_RE.sub('', content)
+
+
+def source_depth(source_file: Path, output_root: Path) -> int:
+    """Number of directories between output_root and source_file."""
+    try:
+        rel_path = source_file.parent.resolve().relative_to(output_root.resolve())
+    except ValueError:
+        return 0
+    return len(rel_path.parts)
+
+
+def default_title(source_file: Path) -> str:
+    """Derive a page title from a markdown filename."""
+    return source_file.stem.replace("_", " ").replace("-", " ").title()
+
+
+def render_markdown(content: str, job: RenderJob) -> str:
+    """Convert markdown content to a complete HTML page."""
+    global _markdown_converter
+    if _markdown_converter is None:
+        import markdown
+
+        _markdown_converter = markdown.Markdown(extensions=MARKDOWN_EXTENSIONS)
+    else:
+        _markdown_converter.reset()
+
+    if job.strip_comments:
+        content = strip_html_comments(content)
+    content = adjust_figure_paths(content, job.depth)
+    html_content = _markdown_converter.convert(content)
+    return HTML_TEMPLATE.format(title=job.title, content=html_content)
+
+
+def render_job(job: RenderJob) -> Path:
+    """Render one job to disk. Module-level so it can run in a worker process."""
+    content = job.source.read_text()
+    job.output.write_text(render_markdown(content, job))
+    return job.output
+
+
+def job_hash(job: RenderJob, content: bytes) -> str:
+    """Hash the source content together with every option that affects the output."""
+    digest = hashlib.sha256()
+    digest.update(content)
+    options = f"{_RENDER_FINGERPRINT}|{job.depth}|{job.strip_comments}|{job.title}"
+    digest.update(options.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def load_render_manifest(output_root: Path) -> dict[str, str]:
+    """Load {relative source path: hash} from the render manifest, if present."""
+    path = output_root / RENDER_MANIFEST_FILENAME
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if data.get("version") != MANIFEST_VERSION:
+        return {}
+    return dict(data.get("files", {}))
+
+
+def save_render_manifest(output_root: Path, files: dict[str, str]) -> None:
+    """Write the render manifest atomically."""
+    path = output_root / RENDER_MANIFEST_FILENAME
+    tmp_path = path.with_suffix(".tmp")
+    payload = {"version": MANIFEST_VERSION, "files": dict(sorted(files.items()))}
+    tmp_path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def project_render_jobs(output_root: Path, strip_comments: bool) -> list[RenderJob]:
+    """Collect report.md and all _sections/*.md files of a project."""
+    jobs = []
+    report_md = output_root / "report.md"
+    if report_md.exists():
+        jobs.append(RenderJob(report_md, report_md.with_suffix(".html"), 0, strip_comments, "Report"))
+
+    sections_dir = output_root / "_sections"
+    if sections_dir.exists():
+        for section_file in sorted(sections_dir.glob("*.md")):
+            jobs.append(RenderJob(
+                section_file,
+                section_file.with_suffix(".html"),
+                1,
+                strip_comments,
+                default_title(section_file),
+            ))
+    return jobs
+
+
+def render_project(
+    output_root: Path,
+    strip_comments: bool = True,
+    workers: int | None = None,
+    force: bool = False,
+) -> RenderSummary:
+    """Render a project directory, skipping files unchanged since the last render.
+
+    Args:
+        output_root: Project directory containing report.md and _sections/.
+        strip_comments: Remove HTML comments before converting.
+        workers: Process pool size (default: CPU count). 1 renders in-process.
+        force: Ignore the manifest and re-render everything.
+    """
+    jobs = project_render_jobs(output_root, strip_comments)
+    previous = {} if force else load_render_manifest(output_root)
+
+    manifest: dict[str, str] = {}
+    stale: list[RenderJob] = []
+    skipped: list[Path] = []
+    for job in jobs:
+        key = job.source.relative_to(output_root).as_posix()
+        digest = job_hash(job, job.source.read_bytes())
+        manifest[key] = digest
+        if previous.get(key) == digest and job.output.exists():
+            skipped.append(job.output)
+        else:
+            stale.append(job)
+
+    workers = workers or os.cpu_count() or 1
+    if workers > 1 and len(stale) >= MIN_PARALLEL_FILES:
+        with ProcessPoolExecutor(max_workers=min(workers, len(stale))) as pool:
+            rendered = list(pool.map(render_job, stale))
+    else:
+        rendered = [render_job(job) for job in stale]
+
+    if rendered or manifest != previous:
+        save_render_manifest(output_root, manifest)
+
+    return RenderSummary(rendered=rendered, skipped=skipped)
@@ -16,6 +16,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Callable
 
+from .llm_log import LLMCallLog, new_run_id
+from .llm_scheduler import estimate_tokens, get_scheduler
 from .outline_parser import Section
 from .prompts import load_prompt
 from .report_state import ReportState, CanonicalFigure, CanonicalTable, SectionStateMeta
@@ -49,6 +51,8 @@ class UsageCost:
     output_tokens: int = 0
     reasoning_tokens: int = 0
     cost_usd: float = 0.0
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
 
     def __add__(self, other: "UsageCost") -> "UsageCost":
         return UsageCost(
@@ -56,6 +60,8 @@ class UsageCost:
             output_tokens=self.output_tokens + other.output_tokens,
             reasoning_tokens=self.reasoning_tokens + other.reasoning_tokens,
             cost_usd=self.cost_usd + other.cost_usd,
+            cache_read_tokens=self.cache_read_tokens + other.cache_read_tokens,
+            cache_write_tokens=self.cache_write_tokens + other.cache_write_tokens,
         )
 
 
@@ -93,12 +99,16 @@ class ReportIntegrator:
         dry_run: bool = False,
         on_progress: ProgressCallback | None = None,
         llm_log_dir: Path | None = None,
+        run_id: str | None = None,
     ):
         self.model = model
         self.thinking_level = thinking_level
         self.dry_run = dry_run
         self._on_progress = on_progress
         self._llm_log_dir = llm_log_dir
+        self._llm_log = LLMCallLog(llm_log_dir) if llm_log_dir else None
+        self.run_id = run_id or new_run_id()
+        self.log_paths: list[Path] = []
     
     def _emit(self, message: str) -> None:
         """Emit a progress message if callback is set."""
@@ -114,6 +124,11 @@ class ReportIntegrator:
     ) -> IntegrationResult:
         """Run integration pass on assembled report.
         
+        When the changes pass validation, the state update is applied to
+        report_state in place (see ReportState.apply_update), so a state with
+        a WAL attached logs each change as it is made. A rejected pass leaves
+        report_state untouched.
+        
         Args:
             report_content: The full report markdown content
             report_state: Current ReportState tracking figures/tables
@@ -172,8 +187,11 @@ class ReportIntegrator:
         ))
         cross_refs_added = max(0, cross_refs_added)
         
-        for section_id in sections_modified:
-            updated_state.mark_section_integrated(section_id)
+        if is_valid:
+            report_state.apply_update(updated_state)
+            updated_state = report_state
+            for section_id in sections_modified:
+                updated_state.mark_section_integrated(section_id)
         
         return IntegrationResult(
             integrated_content=integrated_content,
@@ -301,7 +319,7 @@ class ReportIntegrator:
                 last_integrated_version=v.get("last_integrated_version", 0),
             )
         
-        return ReportState(
+        updated_state = ReportState(
             report_id=state_data.get("report_id", original_state.report_id),
             figures=figures,
             tables=tables,
@@ -309,6 +327,8 @@ class ReportIntegrator:
             created_at=original_state.created_at,
             updated_at=datetime.now().isoformat(),
         )
+        updated_state.inherit_counters(original_state)
+        return updated_state
     
     def _validate_changes(
         self,
@@ -385,24 +405,31 @@ class ReportIntegrator:
         output_cost = (output_tokens / 1_000_000) * pricing["output"]
         return input_cost + output_cost
     
+    def _scheduled(self, params: dict[str, Any], fn: Callable[[], Any]) -> Any:
+        """Run a provider call through the shared rate limiter with retries."""
+        def on_retry(attempt: int, error: BaseException, delay: float) -> None:
+            self._emit(f"{type(error).__name__} from {self.model}; retry {attempt} in {delay:.1f}s")
+
+        return get_scheduler().call(
+            self.model, fn, estimated_tokens=estimate_tokens(params), on_retry=on_retry
+        )
+    
     def _log_llm_call(
         self,
         request_data: dict[str, Any],
         response_text: str,
         provider: str,
     ) -> None:
-        """Log an LLM API call."""
-        if not self._llm_log_dir:
+        """Append an LLM API call to the rolling call log.
+
+        log_paths only gains the log directory when a segment was rotated,
+        since the active segment is not committed.
+        """
+        if not self._llm_log:
             return
         
-        self._llm_log_dir.mkdir(parents=True, exist_ok=True)
-        
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        log_filename = f"{timestamp}_integration_{provider}.json"
-        log_path = self._llm_log_dir / log_filename
-        
         log_entry = {
-            "timestamp": datetime.now().isoformat(),
+            "run_id": self.run_id,
             "operation": "integration",
             "provider": provider,
             "model": self.model,
@@ -410,8 +437,9 @@ class ReportIntegrator:
             "response_length": len(response_text),
         }
         
-        log_path.write_text(json.dumps(log_entry, indent=2, default=str))
-        self._emit(f"Logged LLM call to {log_path.name}")
+        if self._llm_log.append(log_entry) and self._llm_log_dir not in self.log_paths:
+            self.log_paths.append(self._llm_log_dir)
+        self._emit(f"Logged LLM call to {self._llm_log.current_path.name}")
     
     def _call_llm(self, prompt: str) -> tuple[str, UsageCost]:
         """Call the LLM to perform integration. Returns (content, usage_cost)."""
@@ -426,7 +454,8 @@ class ReportIntegrator:
         """Call OpenAI API for integration. Returns (content, usage_cost)."""
         from openai import OpenAI
         
-        client = OpenAI()
+        # Retries are handled by the scheduler, not the SDK
+        client = OpenAI(max_retries=0)
         
         system_prompt = load_prompt("integration_system")
         messages = [
@@ -447,12 +476,13 @@ class ReportIntegrator:
             "prompt_preview": prompt[:500] + "..." if len(prompt) > 500 else prompt,
         }
         
-        response = client.chat.completions.create(
-            model=self.model,
-            messages=messages,
-            max_completion_tokens=max_completion_tokens,
-            reasoning_effort=self.thinking_level,
-        )
+        params = {
+            "model": self.model,
+            "messages": messages,
+            "max_completion_tokens": max_completion_tokens,
+            "reasoning_effort": self.thinking_level,
+        }
+        response = self._scheduled(params, lambda: client.chat.completions.create(**params))
         
         if not response.choices:
             self._log_llm_call(request_data, "[ERROR: no choices]", "openai")
@@ -483,7 +513,7 @@ class ReportIntegrator:
         """Call Anthropic API for integration. Returns (content, usage_cost)."""
         from anthropic import Anthropic
         
-        client = Anthropic()
+        client = Anthropic(max_retries=0)
         
         system_prompt = load_prompt("integration_system")
         
@@ -498,13 +528,14 @@ class ReportIntegrator:
             "prompt_preview": prompt[:500] + "..." if len(prompt) > 500 else prompt,
         }
         
-        response = client.messages.create(
-            model=self.model,
-            max_tokens=8000 + thinking_budget,
-            messages=[{"role": "user", "content": prompt}],
-            system=system_prompt,
-            thinking={"type": "enabled", "budget_tokens": thinking_budget},
-        )
+        params = {
+            "model": self.model,
+            "max_tokens": 8000 + thinking_budget,
+            "messages": [{"role": "user", "content": prompt}],
+            "system": system_prompt,
+            "thinking": {"type": "enabled", "budget_tokens": thinking_budget},
+        }
+        response = self._scheduled(params, lambda: client.messages.create(**params))
         
         response_text = response.content[0].text if response.content else ""
         
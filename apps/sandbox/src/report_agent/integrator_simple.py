@@ -10,13 +10,13 @@ This module provides a streamlined ReportIntegrator that:
 from __future__ import annotations
 
 import difflib
-import json
 import re
 from dataclasses import dataclass, field
-from datetime import datetime
 from pathlib import Path
 from typing import Any, Callable
 
+from .llm_log import LLMCallLog, new_run_id
+from .llm_scheduler import estimate_tokens, get_scheduler
 from .prompts import load_prompt
 
 ProgressCallback = Callable[[str], None]
@@ -51,6 +51,8 @@ class UsageCost:
     output_tokens: int = 0
     reasoning_tokens: int = 0
     cost_usd: float = 0.0
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
 
 
 @dataclass
@@ -85,12 +87,16 @@ class SimpleReportIntegrator:
         dry_run: bool = False,
         on_progress: ProgressCallback | None = None,
         llm_log_dir: Path | None = None,
+        run_id: str | None = None,
     ):
         self.model = model
         self.thinking_level = thinking_level
         self.dry_run = dry_run
         self._on_progress = on_progress
         self._llm_log_dir = llm_log_dir
+        self._llm_log = LLMCallLog(llm_log_dir) if llm_log_dir else None
+        self.run_id = run_id or new_run_id()
+        self.log_paths: list[Path] = []
     
     def _emit(self, message: str) -> None:
         """Emit a progress message if callback is set."""
@@ -351,24 +357,31 @@ class SimpleReportIntegrator:
         output_cost = (output_tokens / 1_000_000) * pricing["output"]
         return input_cost + output_cost
     
+    def _scheduled(self, params: dict[str, Any], fn: Callable[[], Any]) -> Any:
+        """Run a provider call through the shared rate limiter with retries."""
+        def on_retry(attempt: int, error: BaseException, delay: float) -> None:
+            self._emit(f"{type(error).__name__} from {self.model}; retry {attempt} in {delay:.1f}s")
+
+        return get_scheduler().call(
+            self.model, fn, estimated_tokens=estimate_tokens(params), on_retry=on_retry
+        )
+    
     def _log_llm_call(
         self,
         request_data: dict[str, Any],
         response_text: str,
         provider: str,
     ) -> None:
-        """Log an LLM API call."""
-        if not self._llm_log_dir:
+        """Append an LLM API call to the rolling call log.
+
+        log_paths only gains the log directory when a segment was rotated,
+        since the active segment is not committed.
+        """
+        if not self._llm_log:
             return
         
-        self._llm_log_dir.mkdir(parents=True, exist_ok=True)
-        
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        log_filename = f"{timestamp}_integration_{provider}.json"
-        log_path = self._llm_log_dir / log_filename
-        
         log_entry = {
-            "timestamp": datetime.now().isoformat(),
+            "run_id": self.run_id,
             "operation": "integration",
             "provider": provider,
             "model": self.model,
@@ -376,8 +389,9 @@ class SimpleReportIntegrator:
             "response_length": len(response_text),
         }
         
-        log_path.write_text(json.dumps(log_entry, indent=2, default=str))
-        self._emit(f"Logged LLM call to {log_path.name}")
+        if self._llm_log.append(log_entry) and self._llm_log_dir not in self.log_paths:
+            self.log_paths.append(self._llm_log_dir)
+        self._emit(f"Logged LLM call to {self._llm_log.current_path.name}")
     
     def _call_llm(self, prompt: str) -> tuple[str, UsageCost]:
         """Call the LLM to perform integration."""
@@ -392,7 +406,8 @@ class SimpleReportIntegrator:
         """Call OpenAI API for integration."""
         from openai import OpenAI
         
-        client = OpenAI()
+        # Retries are handled by the scheduler, not the SDK
+        client = OpenAI(max_retries=0)
         
         system_prompt = load_prompt("integration_system")
         messages = [
@@ -413,12 +428,13 @@ class SimpleReportIntegrator:
             "prompt_preview": prompt[:500] + "..." if len(prompt) > 500 else prompt,
         }
         
-        response = client.chat.completions.create(
-            model=self.model,
-            messages=messages,
-            max_completion_tokens=max_completion_tokens,
-            reasoning_effort=self.thinking_level,
-        )
+        params = {
+            "model": self.model,
+            "messages": messages,
+            "max_completion_tokens": max_completion_tokens,
+            "reasoning_effort": self.thinking_level,
+        }
+        response = self._scheduled(params, lambda: client.chat.completions.create(**params))
         
         if not response.choices:
             self._log_llm_call(request_data, "[ERROR: no choices]", "openai")
@@ -449,7 +465,7 @@ class SimpleReportIntegrator:
         """Call Anthropic API for integration."""
         from anthropic import Anthropic
         
-        client = Anthropic()
+        client = Anthropic(max_retries=0)
         
         system_prompt = load_prompt("integration_system")
         
@@ -464,13 +480,14 @@ class SimpleReportIntegrator:
             "prompt_preview": prompt[:500] + "..." if len(prompt) > 500 else prompt,
         }
         
-        response = client.messages.create(
-            model=self.model,
-            max_tokens=16000 + thinking_budget,
-            messages=[{"role": "user", "content": prompt}],
-            system=system_prompt,
-            thinking={"type": "enabled", "budget_tokens": thinking_budget},
-        )
+        params = {
+            "model": self.model,
+            "max_tokens": 16000 + thinking_budget,
+            "messages": [{"role": "user", "content": prompt}],
+            "system": system_prompt,
+            "thinking": {"type": "enabled", "budget_tokens": thinking_budget},
+        }
+        response = self._scheduled(params, lambda: client.messages.create(**params))
         
         response_text = ""
         for block in response.content:
@@ -0,0 +1,274 @@
+"""Rolling, compressed log of LLM calls.
+
+Calls are appended as compact JSON lines to ``_llm_calls/current.jsonl``.
+When that segment grows past a size or age limit it is gzip-compressed into
+``_llm_calls/segments/`` and a small ``index.json`` records, per segment,
+the time range, call count and the run/section IDs it contains, so lookups
+only decompress the segments that can match. A retention policy drops the
+oldest segments once the total size or age limit is exceeded.
+
+Only rotated segments and the index are meant to be committed: the log
+directory carries its own .gitignore for the active segment, so staging the
+directory picks up new segments and retention deletions but not the file
+that changes on every call.
+"""
+
+import gzip
+import json
+import os
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Iterator
+
+CURRENT_SEGMENT = "current.jsonl"
+SEGMENTS_DIRNAME = "segments"
+INDEX_FILENAME = "index.json"
+INDEX_VERSION = 1
+
+DEFAULT_MAX_SEGMENT_BYTES = 8 * 1024 * 1024
+DEFAULT_MAX_SEGMENT_AGE = timedelta(days=1)
+DEFAULT_MAX_TOTAL_BYTES = 256 * 1024 * 1024
+DEFAULT_MAX_AGE = timedelta(days=90)
+
+_GITIGNORE = f"{CURRENT_SEGMENT}\n*.tmp\n"
+
+
+def new_run_id() -> str:
+    """Sortable, collision-free identifier for one CLI run."""
+    return f"{datetime.now().strftime('%Y%m%dT%H%M%S')}-{uuid.uuid4().hex[:8]}"
+
+
+class LLMCallLog:
+    """Append-only JSONL log with gzip rotation, retention and an index.
+
+    Args:
+        log_dir: Directory for the log (usually output_root/_llm_calls)
+        max_segment_bytes: Rotate the active segment beyond this size
+        max_segment_age: Rotate the active segment once its first call is this old
+        max_total_bytes: Drop oldest compressed segments beyond this total size
+        max_age: Drop compressed segments whose last call is older than this
+        clock: Returns the current datetime (injectable for tests)
+    """
+
+    def __init__(
+        self,
+        log_dir: Path,
+        max_segment_bytes: int = DEFAULT_MAX_SEGMENT_BYTES,
+        max_segment_age: timedelta = DEFAULT_MAX_SEGMENT_AGE,
+        max_total_bytes: int = DEFAULT_MAX_TOTAL_BYTES,
+        max_age: timedelta = DEFAULT_MAX_AGE,
+        clock=datetime.now,
+    ):
+        self.log_dir = Path(log_dir)
+        self.max_segment_bytes = max_segment_bytes
+        self.max_segment_age = max_segment_age
+        self.max_total_bytes = max_total_bytes
+        self.max_age = max_age
+        self._clock = clock
+        self._segment_started: datetime | None = None
+        # Sections may log from several worker threads
+        self._lock = threading.RLock()
+
+    @property
+    def current_path(self) -> Path:
+        return self.log_dir / CURRENT_SEGMENT
+
+    @property
+    def segments_dir(self) -> Path:
+        return self.log_dir / SEGMENTS_DIRNAME
+
+    @property
+    def index_path(self) -> Path:
+        return self.log_dir / INDEX_FILENAME
+
+    def append(self, record: dict[str, Any]) -> bool:
+        """Append one call record.
+
+        A ``call_id`` and ``timestamp`` are added if missing.
+
+        Returns:
+            True if committed files changed (a segment was rotated or
+            segments were dropped by retention).
+        """
+        with self._lock:
+            self._ensure_dir()
+            now = self._clock()
+            record = {"call_id": uuid.uuid4().hex, "timestamp": now.isoformat(), **record}
+            line = json.dumps(record, separators=(",", ":"), default=str) + "\n"
+
+            with open(self.current_path, "a", encoding="utf-8") as f:
+                f.write(line)
+            if self._segment_started is None:
+                self._segment_started = self._read_segment_start() or now
+
+            size = self.current_path.stat().st_size
+            if size >= self.max_segment_bytes or now - self._segment_started >= self.max_segment_age:
+                return self._rotate()
+            return False
+
+    def rotate(self) -> bool:
+        """Compress the active segment into segments/ and apply retention.
+
+        Returns:
+            True if anything was rotated or removed.
+        """
+        with self._lock:
+            return self._rotate()
+
+    def _rotate(self) -> bool:
+        if not self.current_path.exists() or self.current_path.stat().st_size == 0:
+            return self.apply_retention()
+
+        records = list(_read_jsonl(self.current_path.read_bytes()))
+        index = self._load_index()
+        if records:
+            first = records[0].get("timestamp", "")
+            name = f"{_compact_ts(first)}_{uuid.uuid4().hex[:8]}.jsonl.gz"
+            self.segments_dir.mkdir(parents=True, exist_ok=True)
+            segment_path = self.segments_dir / name
+            tmp_path = segment_path.with_name(name + ".tmp")
+            with open(self.current_path, "rb") as src, gzip.open(tmp_path, "wb") as dst:
+                dst.write(src.read())
+            os.replace(tmp_path, segment_path)
+            index[name] = _summarize(records, segment_path.stat().st_size)
+
+        self.current_path.unlink()
+        self._segment_started = None
+        self._apply_retention(index)
+        self._save_index(index)
+        return True
+
+    def apply_retention(self) -> bool:
+        """Drop compressed segments beyond the size/age limits."""
+        index = self._load_index()
+        if not self._apply_retention(index):
+            return False
+        self._save_index(index)
+        return True
+
+    def find(
+        self,
+        *,
+        section_id: str | None = None,
+        run_id: str | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield logged calls matching the filters, oldest first."""
+
+        def matches(record: dict) -> bool:
+            return (section_id is None or record.get("section_id") == section_id) and (
+                run_id is None or record.get("run_id") == run_id
+            )
+
+        for name, meta in _oldest_first(self._load_index()):
+            if section_id is not None and section_id not in meta.get("sections", []):
+                continue
+            if run_id is not None and run_id not in meta.get("runs", []):
+                continue
+            path = self.segments_dir / name
+            if not path.exists():
+                continue
+            with gzip.open(path, "rb") as f:
+                yield from (r for r in _read_jsonl(f.read()) if matches(r))
+
+        if self.current_path.exists():
+            yield from (r for r in _read_jsonl(self.current_path.read_bytes()) if matches(r))
+
+    def total_bytes(self) -> int:
+        """Bytes used by the active segment plus compressed segments."""
+        total = self.current_path.stat().st_size if self.current_path.exists() else 0
+        if self.segments_dir.exists():
+            total += sum(p.stat().st_size for p in self.segments_dir.glob("*.jsonl.gz"))
+        return total
+
+    def _ensure_dir(self) -> None:
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        gitignore = self.log_dir / ".gitignore"
+        if not gitignore.exists():
+            gitignore.write_text(_GITIGNORE)
+
+    def _read_segment_start(self) -> datetime | None:
+        try:
+            with open(self.current_path, encoding="utf-8") as f:
+                return datetime.fromisoformat(json.loads(f.readline())["timestamp"])
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def _apply_retention(self, index: dict[str, dict]) -> bool:
+        """Remove expired/oversized segments from disk and index. Returns True if any removed."""
+        removed = False
+        cutoff = (self._clock() - self.max_age).isoformat()
+        for name, meta in _oldest_first(index):
+            if meta.get("last", "") < cutoff:
+                (self.segments_dir / name).unlink(missing_ok=True)
+                del index[name]
+                removed = True
+
+        total = sum(meta.get("bytes", 0) for meta in index.values())
+        for name, meta in _oldest_first(index):
+            if total <= self.max_total_bytes:
+                break
+            total -= meta.get("bytes", 0)
+            (self.segments_dir / name).unlink(missing_ok=True)
+            del index[name]
+            removed = True
+        return removed
+
+    def _load_index(self) -> dict[str, dict]:
+        try:
+            data = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return self._rebuild_index()
+        if data.get("version") != INDEX_VERSION:
+            return self._rebuild_index()
+        return data.get("segments", {})
+
+    def _rebuild_index(self) -> dict[str, dict]:
+        index: dict[str, dict] = {}
+        if self.segments_dir.exists():
+            for path in sorted(self.segments_dir.glob("*.jsonl.gz")):
+                with gzip.open(path, "rb") as f:
+                    index[path.name] = _summarize(list(_read_jsonl(f.read())), path.stat().st_size)
+        return index
+
+    def _save_index(self, index: dict[str, dict]) -> None:
+        tmp_path = self.index_path.with_name(INDEX_FILENAME + ".tmp")
+        payload = {"version": INDEX_VERSION, "segments": dict(sorted(index.items()))}
+        tmp_path.write_text(json.dumps(payload, indent=1) + "\n", encoding="utf-8")
+        os.replace(tmp_path, self.index_path)
+
+
+def _read_jsonl(data: bytes) -> Iterator[dict[str, Any]]:
+    """Parse JSON lines, skipping a torn trailing line."""
+    for line in data.splitlines():
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError:
+            continue
+
+
+def _oldest_first(index: dict[str, dict]) -> list[tuple[str, dict]]:
+    return sorted(index.items(), key=lambda item: (item[1].get("first", ""), item[0]))
+
+
+def _summarize(records: list[dict[str, Any]], size: int) -> dict[str, Any]:
+    timestamps = [r.get("timestamp", "") for r in records]
+    return {
+        "first": min(timestamps, default=""),
+        "last": max(timestamps, default=""),
+        "count": len(records),
+        "bytes": size,
+        "runs": sorted({r["run_id"] for r in records if r.get("run_id")}),
+        "sections": sorted({r["section_id"] for r in records if r.get("section_id")}),
+    }
+
+
+def _compact_ts(timestamp: str) -> str:
+    try:
+        return datetime.fromisoformat(timestamp).strftime("%Y%m%dT%H%M%S")
+    except ValueError:
+        return time.strftime("%Y%m%dT%H%M%S")
@@ -0,0 +1,277 @@
+"""Shared retry, backoff and rate limiting for LLM calls.
+
+Every provider call goes through LLMScheduler.call(). Before a call it takes
+one request and the estimated tokens from two token buckets (requests/min and
+tokens/min) kept per provider/model, so concurrent callers in one process share
+the provider's ceiling instead of each discovering it through 429s. Transient
+failures (429, 408, 5xx, 529 overloaded, timeouts, dropped connections) are
+retried with capped exponential backoff and full jitter. A Retry-After hint
+from the provider takes precedence, and it also pauses the shared buckets so
+other callers back off too.
+"""
+
+import random
+import threading
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, TypeVar
+
+T = TypeVar("T")
+
+RETRYABLE_STATUS_CODES = frozenset({408, 409, 429, 500, 502, 503, 504, 529})
+RETRYABLE_ERROR_NAMES = frozenset({
+    "APIConnectionError",
+    "APITimeoutError",
+    "RateLimitError",
+    "InternalServerError",
+    "OverloadedError",
+})
+
+# Rough prompt-size estimate used for the tokens/min bucket
+CHARS_PER_TOKEN = 4
+IMAGE_TOKENS = 1_000
+
+
+@dataclass(frozen=True)
+class RateLimits:
+    """Per-minute ceilings for one provider/model."""
+
+    requests_per_minute: float
+    tokens_per_minute: float
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Backoff settings: delay = uniform(0, min(max_delay, base_delay * 2**attempt))."""
+
+    max_attempts: int = 6
+    base_delay: float = 2.0
+    max_delay: float = 60.0
+
+
+# Conservative defaults; per-model entries take precedence over the provider
+DEFAULT_LIMITS: dict[str, RateLimits] = {
+    "openai": RateLimits(requests_per_minute=500, tokens_per_minute=800_000),
+    "anthropic": RateLimits(requests_per_minute=50, tokens_per_minute=200_000),
+}
+
+
+def provider_for_model(model: str) -> str:
+    """Provider key for a model name."""
+    if model.startswith("claude"):
+        return "anthropic"
+    return "openai"
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled continuously at rate_per_minute."""
+
+    def __init__(
+        self,
+        rate_per_minute: float,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.capacity = float(rate_per_minute)
+        self.rate = rate_per_minute / 60.0
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, amount: float = 1.0) -> float:
+        """Block until amount is available, then take it. Returns seconds waited.
+
+        A request larger than the capacity waits for a full bucket and leaves it
+        in debt, so later requests wait for the overdraft to refill.
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._refill(now)
+                needed = min(amount, self.capacity)
+                if now >= self._paused_until and self._tokens >= needed:
+                    self._tokens -= amount
+                    return waited
+                delay = max(
+                    self._paused_until - now,
+                    (needed - self._tokens) / self.rate if self.rate else 0.0,
+                )
+            self._sleep(delay)
+            waited += delay
+
+    def pause(self, seconds: float) -> None:
+        """Hold all acquirers for at least `seconds` (e.g. after a Retry-After)."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, self._clock() + seconds)
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Whether an SDK/network error is worth retrying."""
+    if isinstance(error, (TimeoutError, ConnectionError)):
+        return True
+    status = getattr(error, "status_code", None)
+    if status is None:
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    if isinstance(status, int):
+        return status in RETRYABLE_STATUS_CODES
+    return any(cls.__name__ in RETRYABLE_ERROR_NAMES for cls in type(error).__mro__)
+
+
+def retry_after_seconds(error: BaseException) -> float | None:
+    """Read a Retry-After (or retry-after-ms) hint from an SDK error's response."""
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if not headers:
+        return None
+    value = headers.get("retry-after-ms")
+    if value is not None:
+        try:
+            return max(float(value) / 1000.0, 0.0)
+        except ValueError:
+            pass
+    value = headers.get("retry-after")
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+def estimate_tokens(params: dict[str, Any]) -> int:
+    """Estimate the tokens a chat/messages request counts against tokens/min.
+
+    Counts text at ~4 characters per token, a flat amount per image, and the
+    requested output ceiling (which providers reserve up front).
+    """
+    chars = 0
+    images = 0
+
+    def visit(content: Any) -> None:
+        nonlocal chars, images
+        if isinstance(content, str):
+            chars += len(content)
+        elif isinstance(content, list):
+            for block in content:
+                visit(block)
+        elif isinstance(content, dict):
+            if content.get("type") in ("image", "image_url"):
+                images += 1
+            elif "text" in content:
+                chars += len(content["text"])
+            elif "content" in content:
+                visit(content["content"])
+
+    visit(params.get("system", ""))
+    visit(params.get("messages", []))
+    output = params.get("max_completion_tokens") or params.get("max_tokens") or 0
+    return chars // CHARS_PER_TOKEN + images * IMAGE_TOKENS + output
+
+
+class LLMScheduler:
+    """Rate-limits and retries LLM calls, sharing buckets per provider/model."""
+
+    def __init__(
+        self,
+        limits: dict[str, RateLimits] | None = None,
+        policy: RetryPolicy | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+        rng: random.Random | None = None,
+    ):
+        self.limits = dict(DEFAULT_LIMITS if limits is None else limits)
+        self.policy = policy or RetryPolicy()
+        self._clock = clock
+        self._sleep = sleep
+        self._rng = rng or random.Random()
+        self._buckets: dict[str, tuple[TokenBucket, TokenBucket]] = {}
+        self._lock = threading.Lock()
+
+    def _limits_for(self, model: str) -> RateLimits:
+        provider = provider_for_model(model)
+        return self.limits.get(model) or self.limits.get(provider) or DEFAULT_LIMITS[provider]
+
+    def _buckets_for(self, model: str) -> tuple[TokenBucket, TokenBucket]:
+        key = model if model in self.limits else provider_for_model(model)
+        with self._lock:
+            if key not in self._buckets:
+                limits = self._limits_for(model)
+                self._buckets[key] = (
+                    TokenBucket(limits.requests_per_minute, self._clock, self._sleep),
+                    TokenBucket(limits.tokens_per_minute, self._clock, self._sleep),
+                )
+            return self._buckets[key]
+
+    def backoff_delay(self, attempt: int, error: BaseException) -> float:
+        """Delay before retry number `attempt` (0-based)."""
+        hinted = retry_after_seconds(error)
+        if hinted is not None:
+            return min(hinted, self.policy.max_delay)
+        cap = min(self.policy.max_delay, self.policy.base_delay * (2 ** attempt))
+        return self._rng.uniform(0, cap)
+
+    def call(
+        self,
+        model: str,
+        fn: Callable[[], T],
+        estimated_tokens: int = 0,
+        on_retry: Callable[[int, BaseException, float], None] | None = None,
+        max_attempts: int | None = None,
+    ) -> T:
+        """Run fn() under the model's rate limits, retrying transient failures.
+
+        Args:
+            model: Model name; selects the shared buckets
+            fn: The provider call
+            estimated_tokens: Tokens to reserve from the tokens/min bucket
+            on_retry: Called with (attempt, error, delay) before each retry
+            max_attempts: Override the policy (e.g. fewer tries for cosmetic calls)
+
+        Raises:
+            The last error once it is not retryable or attempts run out.
+        """
+        request_bucket, token_bucket = self._buckets_for(model)
+        max_attempts = max_attempts or self.policy.max_attempts
+        attempt = 0
+        while True:
+            request_bucket.acquire(1)
+            if estimated_tokens:
+                token_bucket.acquire(estimated_tokens)
+            try:
+                return fn()
+            except Exception as e:
+                if not is_retryable(e) or attempt + 1 >= max_attempts:
+                    raise
+                delay = self.backoff_delay(attempt, e)
+                if retry_after_seconds(e) is not None:
+                    request_bucket.pause(delay)
+                    token_bucket.pause(delay)
+                if on_retry:
+                    on_retry(attempt + 1, e, delay)
+                self._sleep(delay)
+                attempt += 1
+
+
+_default_scheduler: LLMScheduler | None = None
+_default_lock = threading.Lock()
+
+
+def get_scheduler() -> LLMScheduler:
+    """Process-wide scheduler shared by the orchestrator, integrators and editor log."""
+    global _default_scheduler
+    with _default_lock:
+        if _default_scheduler is None:
+            _default_scheduler = LLMScheduler()
+        return _default_scheduler
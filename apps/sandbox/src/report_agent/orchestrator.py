@@ -1,20 +1,44 @@
 """Report generation orchestrator."""
 
 import base64
+import hashlib
 import json
+import re
 import shutil
-from dataclasses import dataclass, field
-from datetime import datetime
+import threading
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Any, Callable
+from typing import TYPE_CHECKING, Any, Callable
 
-from .chart_reader import ChartReader, ChartSummary
 from .data_catalog import ChartMeta, DataCatalog
-from .outline_parser import Section, parse_outline
+from .llm_log import LLMCallLog, new_run_id
+from .llm_scheduler import LLMScheduler, estimate_tokens, get_scheduler, is_retryable
+from .outline_cache import OutlineIndex, load_outline, outline_cache_path
+from .outline_parser import Section
 from .prompts import get_system_prompt, load_prompt
 from .report_state import CanonicalFigure, ReportState
+from .run_manifest import RunManifest
+from .section_dag import build_dependencies, dependency_waves, dependents_of, run_dag
+from .section_fingerprint import FINGERPRINTS_FILENAME, FingerprintStore, section_fingerprint
 from .section_mapper import SectionMapper
 from .section_meta import IntegrationHints, parse_section_meta
+from .streaming import SectionStream, StreamCallback, write_atomic
+from .summary_store import ChartSummaryStore, render_chart_fragment, summary_store_dir
+from .tool_loop import (
+    SECTION_TOOLS,
+    AnthropicToolConversation,
+    OpenAIToolConversation,
+    ToolConversation,
+    ToolLoopBudget,
+    ToolStep,
+    run_tool_loop,
+)
+
+if TYPE_CHECKING:
+    # chart_reader imports pandas; it is loaded lazily in _load().
+    from .agent_tools import ReportAgentTools
+    from .batch import BatchBackend
+    from .chart_reader import ChartReader, ChartSummary
 
 ProgressCallback = Callable[[str], None]
 SectionCompleteCallback = Callable[["GenerationResult", str], None]  # (result, action)
@@ -23,23 +47,39 @@ DEFAULT_MODEL = "gpt-5.1-2025-11-13"
 DEFAULT_THINKING_LEVEL = "medium"
 QUIP_MODEL = "gpt-5-nano-2025-08-07"
 
+# Cached funny-reviewer examples, keyed by section ID (stored in output_dir)
+REVIEWER_EXAMPLES_FILENAME = "_reviewer_examples.json"
+FALLBACK_REVIEWER = (
+    "Skeptical Steve McDoubtface",
+    "I've seen better analysis on the back of a cereal box, but at least this one has charts.",
+)
+
+# Per-million-token prices. cache_read/cache_write apply to prompt-prefix cache
+# hits and (Anthropic only) cache writes; they default to the input price.
 MODEL_PRICING: dict[str, dict[str, float]] = {
-    "gpt-5.1-2025-11-13": {"input": 2.50, "output": 10.00},
-    "gpt-5.1-mini-2025-06-30": {"input": 0.40, "output": 1.60},
-    "gpt-5-nano-2025-08-07": {"input": 0.10, "output": 0.40},
-    "claude-sonnet-4-20250514": {"input": 3.00, "output": 15.00},
-    "claude-3-5-sonnet-20241022": {"input": 3.00, "output": 15.00},
+    "gpt-5.1-2025-11-13": {"input": 2.50, "output": 10.00, "cache_read": 0.25},
+    "gpt-5.1-mini-2025-06-30": {"input": 0.40, "output": 1.60, "cache_read": 0.04},
+    "gpt-5-nano-2025-08-07": {"input": 0.10, "output": 0.40, "cache_read": 0.01},
+    "claude-sonnet-4-20250514": {"input": 3.00, "output": 15.00, "cache_read": 0.30, "cache_write": 3.75},
+    "claude-3-5-sonnet-20241022": {"input": 3.00, "output": 15.00, "cache_read": 0.30, "cache_write": 3.75},
 }
 
 
 @dataclass
 class UsageCost:
-    """Token usage and cost for an LLM call."""
+    """Token usage and cost for an LLM call.
+
+    input_tokens counts the whole prompt; cache_read_tokens and
+    cache_write_tokens are the parts of it served from / written to the
+    provider's prompt-prefix cache.
+    """
 
     input_tokens: int = 0
     output_tokens: int = 0
     reasoning_tokens: int = 0
     cost_usd: float = 0.0
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
 
     def __add__(self, other: "UsageCost") -> "UsageCost":
         return UsageCost(
@@ -47,6 +87,8 @@ class UsageCost:
             output_tokens=self.output_tokens + other.output_tokens,
             reasoning_tokens=self.reasoning_tokens + other.reasoning_tokens,
             cost_usd=self.cost_usd + other.cost_usd,
+            cache_read_tokens=self.cache_read_tokens + other.cache_read_tokens,
+            cache_write_tokens=self.cache_write_tokens + other.cache_write_tokens,
         )
 
 
@@ -61,6 +103,8 @@ class GenerationResult:
     prompt: str = ""
     dry_run: bool = False
     usage: UsageCost = field(default_factory=UsageCost)
+    # Inputs the content was generated from; recorded when the file is written
+    fingerprint: str = ""
 
 
 class ReportOrchestrator:
@@ -77,6 +121,15 @@ class ReportOrchestrator:
         on_section_complete: SectionCompleteCallback | None = None,
         llm_log_dir: Path | None = None,
         output_dir: Path | None = None,
+        batch_backend: "BatchBackend | None" = None,
+        batch_poll_interval: float = 60.0,
+        scheduler: LLMScheduler | None = None,
+        max_workers: int = 1,
+        stream: bool = False,
+        on_stream: StreamCallback | None = None,
+        run_manifest: RunManifest | None = None,
+        tool_loop: bool = False,
+        tool_budget: ToolLoopBudget | None = None,
     ):
         self.outline_path = Path(outline_path)
         self.data_root = Path(data_root)
@@ -90,21 +143,86 @@ class ReportOrchestrator:
             Path(llm_log_dir) if llm_log_dir
             else (self._output_dir / "_llm_calls" if self._output_dir else self.data_root / "_llm_calls")
         )
+        self._llm_log = LLMCallLog(self._llm_log_dir)
+        self._batch_backend = batch_backend
+        self._batch_poll_interval = batch_poll_interval
+        self._scheduler = scheduler or get_scheduler()
+        self.max_workers = max_workers
+        self.stream = stream
+        self._on_stream = on_stream
+        # Sections fetch chart data through tools instead of a preloaded block
+        if tool_loop and stream:
+            raise ValueError("Streaming is not available in tool-loop mode")
+        self.tool_loop = tool_loop
+        self.tool_budget = tool_budget or ToolLoopBudget()
+        self._agent_tools: "ReportAgentTools | None" = None
+        # Sections completed in an earlier attempt of this run are skipped
+        self._manifest = run_manifest
+        self.run_id = run_manifest.run_id if run_manifest else new_run_id()
         self._figures_dir: Path | None = None
 
+        self._outline = OutlineIndex([])
         self._sections: list[Section] = []
         self._catalog: DataCatalog | None = None
         self._mapper: SectionMapper | None = None
-        self._chart_reader: ChartReader | None = None
-        self._current_section_id: str | None = None
+        self._chart_reader: "ChartReader | None" = None
+        self._summary_store: ChartSummaryStore | None = None
+        self._agent_tools_lock = threading.Lock()
+        # report_state.json with its WAL attached, opened on the first mutation
+        self._report_state: ReportState | None = None
+        self._report_state_lock = threading.Lock()
+        # Sections run on worker threads; each tracks its own current section
+        self._local = threading.local()
+        self._completion_lock = threading.Lock()
+        self._written_paths: list[Path] = []
+        self._reviewer_examples: dict[str, dict[str, str]] | None = None
+        # Sections format prompts on worker threads; guards the cache and its file
+        self._reviewer_examples_lock = threading.RLock()
+        self._reviewer_generation_failed = False
+        self._report_context: tuple[int | None, str] | None = None
+        self._dependencies: dict[str, list[str]] | None = None
+        self._fingerprints = (
+            FingerprintStore(self._output_dir / FINGERPRINTS_FILENAME) if self._output_dir else None
+        )
 
         self._load()
 
+    @property
+    def _current_section_id(self) -> str | None:
+        """Section whose LLM call is in progress on this thread (for the call log)."""
+        return getattr(self._local, "section_id", None)
+
+    @_current_section_id.setter
+    def _current_section_id(self, section_id: str | None) -> None:
+        self._local.section_id = section_id
+
     def _emit(self, message: str) -> None:
         """Emit a progress message if callback is set."""
         if self._on_progress:
             self._on_progress(message)
 
+    def _scheduled(self, model: str, params: dict[str, Any], fn: Callable[[], Any], **kwargs) -> Any:
+        """Run a provider call through the shared rate limiter with retries."""
+        def on_retry(attempt: int, error: BaseException, delay: float) -> None:
+            self._emit(f"{type(error).__name__} from {model}; retry {attempt} in {delay:.1f}s")
+
+        return self._scheduler.call(
+            model, fn, estimated_tokens=estimate_tokens(params), on_retry=on_retry, **kwargs
+        )
+
+    def _record_write(self, path: Path) -> None:
+        """Remember a file written under output_dir so it can be staged for commit."""
+        self._written_paths.append(path)
+
+    def consume_written_paths(self) -> list[Path]:
+        """Return paths written since the last call, in write order, and reset the list.
+        
+        Used by the CLI to stage exactly the files a command changed instead of
+        running git add -A over the whole report project.
+        """
+        paths, self._written_paths = self._written_paths, []
+        return list(dict.fromkeys(paths))
+
     def _setup_figures_dir(self) -> None:
         """Create figures directory if output_dir is set."""
         if self._output_dir:
@@ -122,12 +240,14 @@ class ReportOrchestrator:
                 dest_filename = f"{chart.id}.png"
                 dest_path = self._figures_dir / dest_filename
                 shutil.copy2(chart.path_png, dest_path)
+                self._record_write(dest_path)
                 copied.append(dest_filename)
                 self._emit(f"Copied figure: {dest_filename}")
             if chart.path_csv and chart.path_csv.exists():
                 csv_filename = f"{chart.id}.csv"
                 csv_dest_path = self._figures_dir / csv_filename
                 shutil.copy2(chart.path_csv, csv_dest_path)
+                self._record_write(csv_dest_path)
                 self._emit(f"Copied CSV: {csv_filename}")
         return copied
 
@@ -135,8 +255,16 @@ class ReportOrchestrator:
         """Load outline and data catalog."""
         self._emit(f"Loading outline from {self.outline_path}")
         if self.outline_path.exists():
-            self._sections = parse_outline(self.outline_path)
-            self._emit(f"Loaded {len(self._sections)} sections")
+            # Only runs that write to the project keep the parse cache there
+            cache_path = (
+                outline_cache_path(self._output_dir) if self._output_dir and not self.dry_run else None
+            )
+            self._outline = load_outline(self.outline_path, cache_path)
+            self._sections = self._outline.sections
+            self._emit(
+                f"Loaded {len(self._sections)} sections "
+                f"({self._outline.reparsed} parsed, rest from cache)"
+            )
 
         self._emit(f"Loading data catalog from {self.data_root}")
         if self.data_root.exists():
@@ -146,7 +274,10 @@ class ReportOrchestrator:
                 self._catalog,
                 mapping_path,
             )
+            from .chart_reader import ChartReader
+
             self._chart_reader = ChartReader(self._catalog)
+            self._summary_store = ChartSummaryStore(summary_store_dir(self._catalog.data_root))
             self._emit(f"Loaded {len(self._catalog.list_charts())} charts")
 
     def _find_mapping_file(self) -> Path | None:
@@ -166,7 +297,7 @@ class ReportOrchestrator:
 
     def _get_section_index(self, section: Section) -> int:
         """Get 1-based index of section in outline order."""
-        return self._sections.index(section) + 1
+        return self._outline.position(section) + 1
 
     def _get_section_path(self, section: Section) -> Path:
         """Get the canonical path for a section file in _sections/."""
@@ -178,6 +309,59 @@ class ReportOrchestrator:
         filename = f"{idx:02d}_{section.id}.md"
         return sections_dir / filename
 
+    def _write_section_text(self, section: Section, content: str, new_version: bool = True) -> Path:
+        """Write a section file atomically and record it for staging.
+
+        Files left for the same section under an older NN_ prefix (after an
+        outline reorder) are removed and recorded too, so the commit stages
+        the rename instead of keeping both copies. Unless new_version is False
+        (integration rewrites), the section's version in report_state is
+        bumped so the next integration pass sees it as stale. Projects that
+        have never been integrated have no report_state.json and are left
+        without one.
+        """
+        path = self._get_section_path(section)
+        write_atomic(path, content)
+        self._record_write(path)
+        for stale in path.parent.iterdir():
+            if stale != path and re.fullmatch(rf"\d+_{re.escape(section.id)}\.md", stale.name):
+                stale.unlink()
+                self._record_write(stale)
+        if new_version:
+            with self._report_state_lock:
+                if self._report_state is not None or self._report_state_path().exists():
+                    self._open_report_state().increment_section_version(section.id)
+        return path
+
+    def _report_state_path(self) -> Path:
+        return self._output_dir / "report_state.json"
+
+    def _open_report_state(self) -> ReportState:
+        """The run's report state, loaded with its WAL attached on first use.
+
+        Each mutation is appended to report_state.json.wal as it happens;
+        checkpoint_report_state() folds the log into the snapshot. Callers
+        hold _report_state_lock.
+        """
+        if self._report_state is None:
+            self._report_state = ReportState.open_with_wal(
+                self._report_state_path(), report_id=self._output_dir.name
+            )
+        return self._report_state
+
+    def checkpoint_report_state(self) -> None:
+        """Checkpoint logged report state mutations into report_state.json.
+
+        Detaches the WAL until the next mutation and records the snapshot for
+        staging. A no-op if the state was not opened.
+        """
+        with self._report_state_lock:
+            if self._report_state is None:
+                return
+            state, self._report_state = self._report_state, None
+            state.close()
+        self._record_write(self._report_state_path())
+
     def _load_existing_section_body(self, section: Section) -> str:
         """Load existing section content, preferring _sections/ file over outline.
         
@@ -209,10 +393,7 @@ class ReportOrchestrator:
 
     def get_section(self, section_id: str) -> Section | None:
         """Get a section by ID."""
-        for section in self._sections:
-            if section.id == section_id:
-                return section
-        return None
+        return self._outline.get(section_id)
 
     def get_charts_for_section(self, section: Section) -> list[ChartMeta]:
         """Get charts mapped to a section."""
@@ -220,21 +401,124 @@ class ReportOrchestrator:
             return []
         return self._mapper.get_charts_for_section_obj(section)
 
-    def get_chart_summary(self, chart_id: str) -> ChartSummary | None:
-        """Get summary for a chart."""
-        if self._chart_reader is None:
+    def section_dependencies(self) -> dict[str, list[str]]:
+        """Section IDs each section waits for, from the outline and mapping file.
+
+        Raises:
+            ValueError: On unknown section IDs or a dependency cycle.
+        """
+        if self._dependencies is None:
+            declared = self._mapper.get_declared_dependencies() if self._mapper else {}
+            self._dependencies = build_dependencies(self._sections, declared)
+        return self._dependencies
+
+    def _build_dependency_block(self, section: Section) -> str:
+        """Current text of the sections this one builds on (summary sections)."""
+        parts = []
+        for dep_id in self.section_dependencies().get(section.id, []):
+            dep = self.get_section(dep_id)
+            if dep is None:
+                continue
+            body = re.sub(r"<!--.*?-->", "", self._load_existing_section_body(dep), flags=re.DOTALL)
+            body = body.strip()
+            if body.startswith(f"{'#' * dep.level} {dep.title}"):
+                body = body[len(f"{'#' * dep.level} {dep.title}"):].strip()
+            if not body:
+                continue
+            if len(body) > 3000:
+                body = body[:3000] + "\n\n[...content truncated for length...]"
+            parts.append(f"### {dep.title}\n{body}")
+        if not parts:
+            return ""
+        return (
+            "## Sections This Builds On\n"
+            "These sections are already written. Draw on them rather than re-deriving their findings.\n\n"
+            + "\n\n".join(parts)
+        )
+
+    def get_chart_summary(self, chart_id: str) -> "ChartSummary | None":
+        """Get summary for a chart, from the summary store when its data is unchanged."""
+        if self._chart_reader is None or self._catalog is None:
             return None
+        chart = self._catalog.get_chart(chart_id)
+        if chart is not None and self._summary_store is not None:
+            summary = self._summary_store.get_summary(chart)
+            if summary is not None:
+                return summary
         try:
-            return self._chart_reader.get_summary(chart_id)
+            summary = self._chart_reader.get_summary(chart_id)
         except ValueError:
             return None
+        if chart is not None and self._summary_store is not None:
+            self._summary_store.put_summary(chart, summary)
+        return summary
+
+    def _chart_fragment(self, chart: ChartMeta) -> str:
+        """Prompt fragment for one chart, rendered once per chart version."""
+        if self._summary_store is not None:
+            fragment = self._summary_store.get_fragment(chart)
+            if fragment is not None:
+                return fragment
+        fragment = render_chart_fragment(chart, self.get_chart_summary(chart.id))
+        if self._summary_store is not None:
+            self._summary_store.put_fragment(chart, fragment)
+        return fragment
+
+    def build_report_context(self) -> str:
+        """Build the report-level context shared by every section prompt.
+
+        Holds the report outline and the canonical figure registry. It is sent
+        right after the system prompt, ahead of the per-section prompt, so the
+        provider can serve system prompt + context from its prefix cache for
+        every section after the first. Rebuilt only when report_state.json
+        changes.
+        """
+        state_path = self._output_dir / "report_state.json" if self._output_dir else None
+        try:
+            key = state_path.stat().st_mtime_ns if state_path else None
+        except FileNotFoundError:
+            key = None
+        if self._report_context is not None and self._report_context[0] == key:
+            return self._report_context[1]
+
+        outline_lines = [
+            f"{'  ' * (section.level - 1)}- {section.title} (`{section.id}`)"
+            for section in self._sections
+        ]
+
+        figure_registry_block = ""
+        if key is not None:
+            try:
+                figures = ReportState.load(state_path).figures
+            except (json.JSONDecodeError, FileNotFoundError):
+                figures = []
+            if figures:
+                registry_lines = [
+                    "## Canonical Figure Registry",
+                    "Figures already placed in the report (cite them by ID rather than recreating them):",
+                ]
+                for fig in figures:
+                    registry_lines.append(
+                        f'- **{fig.id}** ({fig.semantic_key}): "{fig.caption}" - owned by \'{fig.owner_section}\''
+                    )
+                figure_registry_block = "\n".join(registry_lines)
 
-    def build_section_prompt(self, section: Section, charts: list[ChartMeta]) -> str:
+        context = load_prompt("report_context").format(
+            outline_block="\n".join(outline_lines),
+            figure_registry_block=figure_registry_block,
+        ).strip()
+        self._report_context = (key, context)
+        return context
+
+    def build_section_prompt(
+        self, section: Section, charts: list[ChartMeta], include_existing: bool = True
+    ) -> str:
         """Build the prompt for generating a section.
         
         Uses the template from prompts/section_generation.md with dynamic blocks
         for parent section, instructions, existing content, chart data, and
-        integration hints.
+        integration hints. include_existing=False leaves out the section's own
+        current text (used for hashing the inputs it is generated from).
         """
         parent_section_line = ""
         if section.parent_id:
@@ -247,11 +531,13 @@ class ReportOrchestrator:
             instructions_block = f"## Instructions\n{section.instructions}"
 
         existing_content_block = ""
-        existing_body = self._load_existing_section_body(section)
+        existing_body = self._load_existing_section_body(section) if include_existing else ""
         if existing_body:
             truncated = existing_body[:2000] + ("..." if len(existing_body) > 2000 else "")
             existing_content_block = f"## Existing Content\nThe section currently contains:\n```\n{truncated}\n```"
 
+        dependency_block = self._build_dependency_block(section)
+
         available_data_block = self._build_available_data_block(charts)
 
         integration_hints_block, state_hints_block = self._load_integration_hints_for_section(
@@ -266,6 +552,7 @@ class ReportOrchestrator:
             parent_section_line=parent_section_line,
             instructions_block=instructions_block,
             existing_content_block=existing_content_block,
+            dependency_block=dependency_block,
             available_data_block=available_data_block,
             integration_hints_block=integration_hints_block,
             state_hints_block=state_hints_block,
@@ -275,6 +562,8 @@ class ReportOrchestrator:
         """Build the available data block for prompts."""
         if not charts:
             return ""
+        if self.tool_loop:
+            return self._build_chart_index_block(charts)
 
         lines = [
             "## Available Data",
@@ -282,36 +571,29 @@ class ReportOrchestrator:
             "",
         ]
         for chart in charts:
-            lines.append(f"### {chart.title}")
-            lines.append(f"- **ID**: {chart.id}")
-            lines.append(f"- **Category**: {chart.category}")
-            if chart.path_png and chart.path_png.exists():
-                lines.append(f"- **Figure Path**: `figures/{chart.id}.png`")
-            if chart.units:
-                lines.append(f"- **Units**: {chart.units}")
-            if chart.dimensions:
-                lines.append(f"- **Dimensions**: {', '.join(chart.dimensions)}")
-
-            summary = self.get_chart_summary(chart.id)
-            if summary:
-                lines.append(f"- **Scenarios**: {', '.join(summary.scenarios)}")
-                if summary.years:
-                    lines.append(f"- **Years**: {summary.years[0]} to {summary.years[-1]}")
-                lines.append(f"- **Rows**: {summary.row_count}")
-
-                if summary.key_insights:
-                    lines.append("- **Key Insights**:")
-                    for insight in summary.key_insights[:5]:
-                        lines.append(f"  - {insight}")
-
-                if summary.by_scenario:
-                    lines.append("- **Scenario Summaries**:")
-                    for scen, stats in list(summary.by_scenario.items())[:3]:
-                        lines.append(f"  - {scen}: {json.dumps(stats)}")
-
+            lines.append(self._chart_fragment(chart))
             lines.append("")
         return "\n".join(lines)
 
+    def _build_chart_index_block(self, charts: list[ChartMeta]) -> str:
+        """Build the tool-loop data block: one line per chart, no summaries."""
+        lines = [
+            "## Available Data",
+            f"The following {len(charts)} chart(s) are mapped to this section. Their data is not "
+            "included here: use the data tools to fetch only the charts you need "
+            "(get_chart_data for a summary and insights, query_timeseries for year-by-year "
+            "analysis) before writing.",
+            "",
+        ]
+        for chart in charts:
+            details = [chart.units] if chart.units else []
+            if chart.path_png and chart.path_png.exists():
+                details.append(f"figure: figures/{chart.path_png.name}")
+            suffix = f" ({'; '.join(details)})" if details else ""
+            lines.append(f"- `{chart.id}`: {chart.title}{suffix}")
+        lines.append("")
+        return "\n".join(lines)
+
     def _build_integration_hints_block(self, hints: IntegrationHints) -> str:
         """Build markdown block from IntegrationHints for section prompts."""
         lines: list[str] = []
@@ -440,6 +722,8 @@ class ReportOrchestrator:
             review_lines.append("(No specific feedback provided)")
         review_block = "\n".join(review_lines)
 
+        dependency_block = self._build_dependency_block(section)
+
         available_data_block = self._build_available_data_block(charts)
 
         integration_hints_block, state_hints_block = self._load_integration_hints_for_section(
@@ -454,11 +738,68 @@ class ReportOrchestrator:
             instructions_block=instructions_block,
             existing_content=existing_content,
             review_block=review_block,
+            dependency_block=dependency_block,
             available_data_block=available_data_block,
             integration_hints_block=integration_hints_block,
             state_hints_block=state_hints_block,
         )
 
+    def section_prompt_hash(self, section: Section) -> str:
+        """Hash of everything a fresh generation of the section depends on.
+
+        Covers the model and thinking level, the system prompt and the section
+        prompt without the section's own existing text (which a finished run
+        has just written), plus the charts sent as images.
+        """
+        charts = self.get_charts_for_section(section)
+        payload = json.dumps({
+            "model": self.model,
+            "thinking_level": self.thinking_level,
+            "system": get_system_prompt(),
+            "prompt": self.build_section_prompt(section, charts, include_existing=False),
+            "images": [c.id for c in charts if c.path_png and c.path_png.exists()],
+        }, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def section_fingerprint(self, section: Section) -> str:
+        """Fingerprint of the inputs a revision of the section depends on.
+
+        Covers the section's instructions, review block and dependencies, the
+        content of its mapped charts, the current text of the sections it
+        builds on, the prompt templates and the model settings, but not the
+        section's own text.
+        """
+        dependency_texts = {}
+        for dep_id in self.section_dependencies().get(section.id, []):
+            dep = self.get_section(dep_id)
+            if dep is not None:
+                dependency_texts[dep_id] = self._load_existing_section_body(dep)
+        templates = "\n".join([
+            get_system_prompt(), load_prompt("section_generation"), load_prompt("section_revision"),
+        ])
+        return section_fingerprint(
+            section,
+            self.get_charts_for_section(section),
+            dependency_texts,
+            hashlib.sha256(templates.encode("utf-8")).hexdigest(),
+            self.model,
+            self.thinking_level,
+        )
+
+    def _record_fingerprint(self, section_id: str, fingerprint: str) -> None:
+        if self._fingerprints is None:
+            return
+        self._fingerprints.set(section_id, fingerprint)
+        self._record_write(self._fingerprints.path)
+
+    def _is_unchanged(self, section: Section, fingerprint: str) -> bool:
+        """Whether a section's file was written from exactly these inputs."""
+        return (
+            self._fingerprints is not None
+            and self._fingerprints.get(section.id) == fingerprint
+            and self._get_section_path(section).exists()
+        )
+
     def generate_section(self, section_id: str) -> GenerationResult:
         """Generate content for a single section."""
         self._setup_figures_dir()
@@ -490,12 +831,14 @@ class ReportOrchestrator:
             )
 
         png_charts = [c for c in charts if c.path_png and c.path_png.exists()]
-        if png_charts:
+        if png_charts and not self.tool_loop:
             self._emit(f"Sending {len(png_charts)} PNG(s) to LLM:")
             for c in png_charts:
                 self._emit(f"  - {c.id}: {c.path_png}")
 
         self._copy_chart_figures(charts)
+        # Computed before the call: dependencies may change afterwards
+        fingerprint = self.section_fingerprint(section) if self._output_dir else ""
 
         self._emit(f"Calling {self.model} to generate content...")
         self._current_section_id = section.id
@@ -513,6 +856,7 @@ class ReportOrchestrator:
             prompt=prompt,
             dry_run=False,
             usage=usage,
+            fingerprint=fingerprint,
         )
 
     def update_section(
@@ -579,20 +923,23 @@ class ReportOrchestrator:
             )
 
         png_charts = [c for c in charts if c.path_png and c.path_png.exists()]
-        if png_charts:
+        if png_charts and not self.tool_loop:
             self._emit(f"Sending {len(png_charts)} PNG(s) to LLM:")
             for c in png_charts:
                 self._emit(f"  - {c.id}: {c.path_png}")
 
+        fingerprint = self.section_fingerprint(section)
+
         self._emit(f"Calling {self.model} to revise content...")
         raw_content, usage = self._call_llm(prompt, charts)
         self._emit(f"LLM response received (${usage.cost_usd:.4f})")
 
         formatted_content = self._format_section_output(section, raw_content)
 
-        section_path = self._get_section_path(section)
-        section_path.write_text(formatted_content)
+        section_path = self._write_section_text(section, formatted_content)
+        self._record_fingerprint(section.id, fingerprint)
         self._emit(f"Updated section file: {section_path.name}")
+        self.checkpoint_report_state()
 
         self._current_section_id = None
 
@@ -604,36 +951,119 @@ class ReportOrchestrator:
             prompt=prompt,
             dry_run=False,
             usage=usage,
+            fingerprint=fingerprint,
         )
 
-    def generate_report(self) -> tuple[str, UsageCost]:
-        """Generate content for all sections. Returns (report_content, total_usage)."""
+    def generate_report(self, batch: bool = False) -> tuple[str, UsageCost]:
+        """Generate content for all sections. Returns (report_content, total_usage).
+
+        With batch=True section prompts are sent as provider batch jobs, one
+        per dependency wave so that summary sections are prompted with the
+        text of the sections they build on; each wave's sections are written
+        and reported in outline order exactly as in the synchronous path.
+
+        With a run manifest, each section's outcome is recorded in it, and
+        sections it already lists as completed with unchanged inputs (see
+        section_prompt_hash) are skipped.
+        """
         self._setup_figures_dir()
         sections_dir = self._setup_sections_dir()
 
+        self.prepare_reviewer_examples()
+
         results: list[GenerationResult] = []
         total_usage = UsageCost()
         total = len(self._sections)
+        manifest = self._manifest if self._output_dir and not self.dry_run else None
+
+        if batch and not self.dry_run:
+            def generate_wave(wave: list[Section]) -> list[str]:
+                nonlocal total_usage
+                pending = wave
+                prompt_hashes: dict[str, str] = {}
+                if manifest:
+                    prompt_hashes = {s.id: self.section_prompt_hash(s) for s in wave}
+                    pending = [
+                        s for s in wave
+                        if not manifest.is_complete(s.id, prompt_hashes[s.id], self._get_section_path(s))
+                    ]
+                    if len(pending) < len(wave):
+                        self._emit(
+                            f"Skipping {len(wave) - len(pending)} section(s) completed in run {manifest.run_id}"
+                        )
+                fingerprints = {s.id: self.section_fingerprint(s) for s in pending} if self._output_dir else {}
+                batch_results, failed = self._generate_batch([(s, False) for s in pending])
+                for result in batch_results:
+                    results.append(result)
+                    total_usage = total_usage + result.usage
+                    if self._output_dir:
+                        self._write_section_file(result)
+                        self._record_fingerprint(result.section_id, fingerprints[result.section_id])
+                        if manifest:
+                            manifest.mark_completed(
+                                result.section_id,
+                                prompt_hashes[result.section_id],
+                                result.content,
+                                result.usage.cost_usd,
+                            )
+                            self._record_write(manifest.path)
+                        if self._on_section_complete:
+                            self._on_section_complete(result, "generated")
+                if manifest:
+                    for failure in failed:
+                        section_id, _, reason = failure.partition(": ")
+                        manifest.mark_failed(section_id, prompt_hashes[section_id], reason)
+                        self._record_write(manifest.path)
+                return failed
+
+            self._run_batch_waves(self._sections, generate_wave)
+        else:
+            def generate_one(i: int, section: Section) -> None:
+                nonlocal total_usage
+                prompt_hash = self.section_prompt_hash(section) if manifest else ""
+                if manifest and manifest.is_complete(section.id, prompt_hash, self._get_section_path(section)):
+                    self._emit(
+                        f"Skipping section {i}/{total}: {section.title} "
+                        f"(completed in run {manifest.run_id}, inputs unchanged)"
+                    )
+                    return
 
-        for i, section in enumerate(self._sections, 1):
-            self._emit(f"Generating section {i}/{total}: {section.title}")
-            result = self.generate_section(section.id)
-            results.append(result)
-            total_usage = total_usage + result.usage
+                self._emit(f"Generating section {i}/{total}: {section.title}")
+                try:
+                    result = self.generate_section(section.id)
+                except Exception as e:
+                    if manifest:
+                        manifest.mark_failed(section.id, prompt_hash, f"{type(e).__name__}: {e}")
+                        self._record_write(manifest.path)
+                    raise
 
-            if self._output_dir and not result.dry_run:
-                self._write_section_file(result)
-                
-                # Notify CLI layer to commit after each section
-                if self._on_section_complete:
-                    self._on_section_complete(result, "generated")
+                if self._output_dir and not result.dry_run:
+                    self._write_section_file(result)
+                    if manifest:
+                        manifest.mark_completed(section.id, prompt_hash, result.content, result.usage.cost_usd)
+                        self._record_write(manifest.path)
+
+                # Sections finish on worker threads; commit one at a time
+                with self._completion_lock:
+                    results.append(result)
+                    total_usage = total_usage + result.usage
+
+                    # Notify CLI layer to commit after each section
+                    if self._output_dir and not result.dry_run and self._on_section_complete:
+                        self._on_section_complete(result, "generated")
+
+            self._process_with_resume(self._sections, generate_one)
 
+        self.checkpoint_report_state()
         self._emit("Assembling final report from section files")
         report_content = self._build_report_from_sections()
         return report_content, total_usage
 
     def update_report(
-        self, extra_revision_notes: str | None = None
+        self,
+        extra_revision_notes: str | None = None,
+        batch: bool = False,
+        skip_unchanged: bool = True,
     ) -> tuple[str, UsageCost, dict[str, str]]:
         """Update existing sections and generate missing ones.
         
@@ -641,46 +1071,296 @@ class ReportOrchestrator:
         - If section file exists: update it (using review feedback if present)
         - If section file doesn't exist: generate fresh content
         
+        Sections whose inputs (see section_fingerprint) are unchanged since
+        their file was last written are skipped, unless skip_unchanged is
+        False or extra_revision_notes apply to every section.
+        
         Args:
             extra_revision_notes: Additional instructions for updating sections.
+            batch: Send revision/generation prompts as provider batch jobs,
+                one per dependency wave.
+            skip_unchanged: Skip sections whose inputs have not changed.
         
         Returns:
             Tuple of (report_content, total_usage, action_map) where action_map
-            is a dict mapping section_id to "generated" or "updated".
+            is a dict mapping section_id to "generated", "updated" or "skipped".
         """
         self._setup_figures_dir()
         self._setup_sections_dir()
 
+        self.prepare_reviewer_examples()
+
         results: list[GenerationResult] = []
         total_usage = UsageCost()
         action_map: dict[str, str] = {}
         total = len(self._sections)
-
-        for i, section in enumerate(self._sections, 1):
-            section_path = self._get_section_path(section)
-            
-            if section_path.exists():
-                self._emit(f"Updating section {i}/{total}: {section.title}")
-                result = self.update_section(section.id, extra_revision_notes)
-                action_map[section.id] = "updated"
-            else:
-                self._emit(f"Generating section {i}/{total}: {section.title}")
-                result = self.generate_section(section.id)
-                if self._output_dir and not result.dry_run:
-                    self._write_section_file(result)
-                action_map[section.id] = "generated"
-            
-            results.append(result)
-            total_usage = total_usage + result.usage
-            
-            # Notify CLI layer to commit after each section
-            if self._on_section_complete and not result.dry_run:
-                self._on_section_complete(result, action_map[section.id])
-
+        skip_unchanged = skip_unchanged and not extra_revision_notes
+
+        if batch and not self.dry_run:
+            def update_wave(wave: list[Section]) -> list[str]:
+                nonlocal total_usage
+                fingerprints = {s.id: self.section_fingerprint(s) for s in wave}
+                pending = []
+                for s in wave:
+                    if skip_unchanged and self._is_unchanged(s, fingerprints[s.id]):
+                        action_map[s.id] = "skipped"
+                    else:
+                        pending.append(s)
+                if len(pending) < len(wave):
+                    self._emit(f"Skipping {len(wave) - len(pending)} section(s) with unchanged inputs")
+                jobs = [(s, self._get_section_path(s).exists()) for s in pending]
+                batch_results, failed = self._generate_batch(jobs, extra_revision_notes)
+                revised = {s.id for s, revise in jobs if revise}
+                for result in batch_results:
+                    action_map[result.section_id] = "updated" if result.section_id in revised else "generated"
+                    results.append(result)
+                    total_usage = total_usage + result.usage
+                    if self._output_dir:
+                        self._write_section_file(result)
+                        self._record_fingerprint(result.section_id, fingerprints[result.section_id])
+                    if self._on_section_complete:
+                        self._on_section_complete(result, action_map[result.section_id])
+                return failed
+
+            self._run_batch_waves(self._sections, update_wave)
+        else:
+            def update_one(i: int, section: Section) -> None:
+                nonlocal total_usage
+                section_path = self._get_section_path(section)
+                if skip_unchanged and self._is_unchanged(section, self.section_fingerprint(section)):
+                    self._emit(f"Skipping section {i}/{total}: {section.title} (inputs unchanged)")
+                    with self._completion_lock:
+                        action_map[section.id] = "skipped"
+                    return
+                
+                if section_path.exists():
+                    self._emit(f"Updating section {i}/{total}: {section.title}")
+                    result = self.update_section(section.id, extra_revision_notes)
+                    action = "updated"
+                else:
+                    self._emit(f"Generating section {i}/{total}: {section.title}")
+                    result = self.generate_section(section.id)
+                    if self._output_dir and not result.dry_run:
+                        self._write_section_file(result)
+                    action = "generated"
+
+                # Sections finish on worker threads; commit one at a time
+                with self._completion_lock:
+                    action_map[section.id] = action
+                    results.append(result)
+                    total_usage = total_usage + result.usage
+
+                    # Notify CLI layer to commit after each section
+                    if self._on_section_complete and not result.dry_run:
+                        self._on_section_complete(result, action)
+
+            self._process_with_resume(self._sections, update_one)
+
+        self.checkpoint_report_state()
         self._emit("Assembling final report from section files")
         report_content = self._build_report_from_sections()
         return report_content, total_usage, action_map
 
+    def _run_batch_waves(
+        self,
+        sections: list[Section],
+        run_wave: Callable[[list[Section]], list[str]],
+    ) -> None:
+        """Send sections as one batch job per dependency wave (see dependency_waves()).
+
+        run_wave(sections) submits one wave, writes its results and returns
+        "section_id: reason" failures. A wave's prompts are only built once
+        the waves before it are written, so summary sections see the text of
+        the sections they build on. Sections waiting on a failed section are
+        not submitted; all failures are raised together at the end.
+        """
+        dependencies = self.section_dependencies()
+        waves = dependency_waves(sections, dependencies)
+        failures: list[str] = []
+        blocked: dict[str, str] = {}
+        for n, wave in enumerate(waves, 1):
+            wave = [s for s in wave if s.id not in blocked]
+            if len(waves) > 1:
+                self._emit(f"Batch wave {n}/{len(waves)}: {len(wave)} section(s)")
+            wave_failures = run_wave(wave)
+            failures.extend(wave_failures)
+            for failure in wave_failures:
+                section_id = failure.partition(": ")[0]
+                for dependent in dependents_of(dependencies, [section_id]):
+                    blocked.setdefault(dependent, section_id)
+        failures.extend(f"{s.id}: waiting on {blocked[s.id]}" for s in sections if s.id in blocked)
+        self._raise_section_failures(failures)
+
+    def _generate_batch(
+        self,
+        jobs: list[tuple[Section, bool]],
+        extra_revision_notes: str | None = None,
+    ) -> tuple[list[GenerationResult], list[str]]:
+        """Run section prompts as one provider batch job.
+
+        Args:
+            jobs: (section, revise) pairs in outline order; revise=True builds a
+                revision prompt from the existing section file.
+            extra_revision_notes: Extra instructions for revision prompts.
+
+        Returns:
+            (results, failed) where results are in job order and failed lists
+            "section_id: reason" for requests that returned no usable content.
+
+        Raises:
+            ValueError: In tool-loop mode, which needs several calls per section,
+                or with streaming, since batch results arrive all at once.
+        """
+        from .batch import BATCH_COST_FACTOR, BatchRequest, get_batch_backend, wait_for_batch
+
+        if self.tool_loop:
+            raise ValueError("Tool-loop generation is not available in batch mode")
+        if self.stream:
+            raise ValueError("Streaming is not available in batch mode")
+        if not jobs:
+            return [], []
+        backend = self._batch_backend or get_batch_backend(self.model)
+        provider = "openai" if self.model.startswith("gpt") else "anthropic"
+        build_request = self._openai_request if provider == "openai" else self._anthropic_request
+
+        prepared: list[tuple[str, Section, list[ChartMeta], str, dict[str, Any]]] = []
+        requests: list[BatchRequest] = []
+        for i, (section, revise) in enumerate(jobs):
+            charts = self.get_charts_for_section(section)
+            self._copy_chart_figures(charts)
+            if revise:
+                if not self._load_existing_section_body(section).strip():
+                    raise ValueError(
+                        f"No existing content for section '{section.id}'. "
+                        "Run generate-section first."
+                    )
+                prompt = self.build_section_revision_prompt(
+                    section=section,
+                    charts=charts,
+                    extra_revision_notes=extra_revision_notes,
+                )
+            else:
+                prompt = self.build_section_prompt(section, charts)
+            params, request_data = build_request(prompt, charts)
+            # Section IDs can contain characters providers reject in custom_id
+            custom_id = f"section-{i:04d}"
+            requests.append(BatchRequest(custom_id=custom_id, params=params))
+            prepared.append((custom_id, section, charts, prompt, request_data))
+
+        self._emit(f"Submitting batch of {len(requests)} section request(s) to {backend.name}")
+        batch_id = backend.submit(requests)
+        self._emit(f"Batch {batch_id} submitted")
+        outcomes = wait_for_batch(
+            backend,
+            batch_id,
+            poll_interval=self._batch_poll_interval,
+            on_progress=self._emit,
+        )
+
+        results: list[GenerationResult] = []
+        failed: list[str] = []
+        for custom_id, section, charts, prompt, request_data in prepared:
+            outcome = outcomes.get(custom_id)
+            request_data = {**request_data, "batch_id": batch_id, "custom_id": custom_id}
+            if outcome is None or outcome.error or not outcome.text.strip():
+                reason = "missing from results" if outcome is None else (outcome.error or "empty content")
+                self._log_llm_call(section.id, request_data, f"[ERROR: {reason}]", f"{provider}-batch")
+                failed.append(f"{section.id}: {reason}")
+                continue
+
+            request_data["usage_info"] = {
+                "input_tokens": outcome.input_tokens,
+                "output_tokens": outcome.output_tokens,
+                "reasoning_tokens": outcome.reasoning_tokens,
+                "cache_read_tokens": outcome.cache_read_tokens,
+                "cache_write_tokens": outcome.cache_write_tokens,
+                "finish_reason": outcome.finish_reason,
+            }
+            self._log_llm_call(section.id, request_data, outcome.text, f"{provider}-batch")
+            if outcome.finish_reason in ("length", "max_tokens"):
+                self._emit(f"Warning: response for {section.id} truncated ({outcome.finish_reason})")
+
+            usage = UsageCost(
+                input_tokens=outcome.input_tokens,
+                output_tokens=outcome.output_tokens,
+                reasoning_tokens=outcome.reasoning_tokens,
+                cost_usd=self._calculate_cost(
+                    self.model,
+                    outcome.input_tokens,
+                    outcome.output_tokens,
+                    outcome.cache_read_tokens,
+                    outcome.cache_write_tokens,
+                ) * BATCH_COST_FACTOR,
+                cache_read_tokens=outcome.cache_read_tokens,
+                cache_write_tokens=outcome.cache_write_tokens,
+            )
+            results.append(GenerationResult(
+                section_id=section.id,
+                section_title=section.title,
+                content=self._format_section_output(section, outcome.text),
+                charts_used=[c.id for c in charts],
+                prompt=prompt,
+                dry_run=False,
+                usage=usage,
+            ))
+            self._emit(f"LLM response received for {section.id} (${usage.cost_usd:.4f})")
+
+        return results, failed
+
+    def _raise_section_failures(self, failed: list[str]) -> None:
+        """Raise once the successful sections have been written."""
+        if failed:
+            raise RuntimeError(
+                f"{len(failed)} section(s) failed: " + "; ".join(failed)
+            )
+
+    def _process_with_resume(
+        self,
+        sections: list[Section],
+        process: Callable[[int, Section], None],
+    ) -> None:
+        """Run process(index, section) for each section, resuming transient failures.
+
+        Sections run in dependency order on up to max_workers threads: each
+        starts as soon as the sections it depends on (section_dependencies())
+        have been written, so independent sections run side by side.
+
+        Calls already retry with backoff inside the scheduler. A section that
+        still fails with a transient error (rate limit, timeout, overload) does
+        not abort the run: it and the sections waiting on it are retried once
+        more after the remaining sections, and only sections that fail again
+        are reported, after everything else has been written. Other errors
+        propagate once the sections already in flight finish.
+        """
+        dependencies = self.section_dependencies()
+        positions = {s.id: i for i, s in reversed(list(enumerate(sections, 1)))}
+        pending = list(sections)
+        failures: list[str] = []
+        for final_pass in (False, True):
+            failed, blocked = run_dag(
+                pending,
+                dependencies,
+                lambda section: process(positions[section.id], section),
+                max_workers=self.max_workers,
+                should_abort=lambda error: not is_retryable(error),
+            )
+            if not failed:
+                return
+            failures = []
+            for section in pending:
+                if section.id in failed:
+                    error = failed[section.id]
+                    failures.append(f"{section.id}: {type(error).__name__}: {error}")
+                    if not final_pass:
+                        self._emit(
+                            f"Section {section.id} failed ({type(error).__name__}); "
+                            "resuming it after the remaining sections"
+                        )
+                elif section.id in blocked:
+                    failures.append(f"{section.id}: waiting on {blocked[section.id]}")
+            pending = [s for s in pending if s.id in failed or s.id in blocked]
+        self._raise_section_failures(failures)
+
     def integrate_report(
         self,
         max_change_ratio: float = 0.3,
@@ -713,13 +1393,14 @@ class ReportOrchestrator:
         report_content = self._build_report_from_sections()
         
         state_path = self._output_dir / "report_state.json"
-        if state_path.exists():
-            self._emit(f"Loading report state from {state_path}")
-            report_state = ReportState.load(state_path)
+        if self.dry_run:
+            report_state = (
+                ReportState.load(state_path) if state_path.exists() else ReportState.new(self._output_dir.name)
+            )
         else:
-            report_id = self._output_dir.name
-            self._emit(f"Creating new report state for '{report_id}'")
-            report_state = ReportState.new(report_id)
+            self._emit(f"Opening report state at {state_path}")
+            with self._report_state_lock:
+                report_state = self._open_report_state()
         
         integrator = ReportIntegrator(
             model=self.model,
@@ -727,26 +1408,30 @@ class ReportOrchestrator:
             dry_run=self.dry_run,
             on_progress=self._on_progress,
             llm_log_dir=self._llm_log_dir,
+            run_id=self.run_id,
         )
         
-        result = integrator.integrate(
-            report_content=report_content,
-            report_state=report_state,
-            sections=self._sections,
-            max_change_ratio=max_change_ratio,
-        )
+        try:
+            result = integrator.integrate(
+                report_content=report_content,
+                report_state=report_state,
+                sections=self._sections,
+                max_change_ratio=max_change_ratio,
+            )
+        finally:
+            for log_path in integrator.log_paths:
+                self._record_write(log_path)
+            self.checkpoint_report_state()
         
         if not self.dry_run and result.validation_passed:
             self._emit("Writing integrated sections...")
             self._write_integrated_sections(result.integrated_content)
             
-            self._emit(f"Saving report state to {state_path}")
-            result.report_state.save(state_path)
-            
             self._emit("Rebuilding report.md...")
             final_content = self._build_report_from_sections()
             report_path = self._output_dir / "report.md"
             report_path.write_text(final_content)
+            self._record_write(report_path)
         
         return result
     
@@ -764,8 +1449,7 @@ class ReportOrchestrator:
             
             if match:
                 section_content = match.group(1).strip()
-                section_path = self._get_section_path(section)
-                section_path.write_text(section_content)
+                section_path = self._write_section_text(section, section_content, new_version=False)
                 self._emit(f"Updated section file: {section_path.name}")
 
     def _setup_sections_dir(self) -> Path | None:
@@ -782,8 +1466,9 @@ class ReportOrchestrator:
         if section is None:
             self._emit(f"Warning: Could not find section {result.section_id} to write")
             return
-        filepath = self._get_section_path(section)
-        filepath.write_text(result.content)
+        filepath = self._write_section_text(section, result.content)
+        if result.fingerprint:
+            self._record_fingerprint(result.section_id, result.fingerprint)
         self._emit(f"Wrote section file: {filepath.name}")
 
     def _build_report_from_sections(self) -> str:
@@ -832,6 +1517,10 @@ class ReportOrchestrator:
             lines.append(f"<!-- Section instructions: {section.instructions} -->")
             lines.append("")
 
+        if section.depends_on:
+            lines.append(f"<!-- Depends on: {', '.join(section.depends_on)} -->")
+            lines.append("")
+
         if section.review_comments:
             lines.append(f"<!-- Review comments:\n{section.review_comments}\n-->")
         else:
@@ -842,11 +1531,7 @@ NOTES:
 -->""")
             lines.append("")
             
-            try:
-                funny_name, funny_notes = self.generate_funny_reviewer_example(section.title)
-            except Exception:
-                funny_name = "Skeptical Steve McDoubtface"
-                funny_notes = "I've seen better analysis on the back of a cereal box, but at least this one has charts."
+            funny_name, funny_notes = self._get_reviewer_example(section)
             
             lines.append(f"""<!-- EXAMPLE - LLM IGNORE:
 AUTHOR: {funny_name}
@@ -879,6 +1564,8 @@ NOTES: {funny_notes}
 
     def _call_llm(self, prompt: str, charts: list[ChartMeta] | None = None) -> tuple[str, UsageCost]:
         """Call the LLM to generate content. Returns (content, usage_cost)."""
+        if self.tool_loop:
+            return self._call_llm_with_tools(prompt)
         if self.model.startswith("gpt"):
             return self._call_openai(prompt, charts or [])
         elif self.model.startswith("claude"):
@@ -886,10 +1573,130 @@ NOTES: {funny_notes}
         else:
             raise ValueError(f"Unsupported model: {self.model}")
 
-    def _calculate_cost(self, model: str, input_tokens: int, output_tokens: int) -> float:
-        """Calculate cost in USD for token usage."""
+    def _get_agent_tools(self) -> "ReportAgentTools":
+        """Data tools for the tool loop, shared by all sections of the run."""
+        with self._agent_tools_lock:
+            if self._agent_tools is None:
+                from .agent_tools import ReportAgentTools
+
+                self._agent_tools = ReportAgentTools(self.outline_path, self.data_root)
+            return self._agent_tools
+
+    def _execute_section_tools(self, calls: list[tuple[str, dict]]) -> list[dict]:
+        """Run one step's tool calls in parallel; tools outside SECTION_TOOLS are refused."""
+        tools = self._get_agent_tools()
+        results = iter(tools.execute_tools([(name, args) for name, args in calls if name in SECTION_TOOLS]))
+        return [
+            next(results) if name in SECTION_TOOLS else {"error": f"Tool not available: {name}"}
+            for name, _ in calls
+        ]
+
+    def _tool_conversation(self, prompt: str) -> tuple[ToolConversation, dict[str, Any], str]:
+        """Provider conversation for a section prompt. Returns (conversation, request_data, provider)."""
+        schemas = [
+            s for s in self._get_agent_tools().get_tool_schemas()
+            if s["function"]["name"] in SECTION_TOOLS
+        ]
+
+        def schedule(params: dict[str, Any], fn: Callable[[], Any]) -> Any:
+            return self._scheduled(self.model, params, fn)
+
+        # No images up front: the prompt lists figure paths and the model
+        # fetches the data behind them
+        if self.model.startswith("gpt"):
+            from openai import OpenAI
+
+            params, request_data = self._openai_request(prompt, [])
+            return OpenAIToolConversation(OpenAI(max_retries=0), params, schemas, schedule), request_data, "openai"
+        if self.model.startswith("claude"):
+            from anthropic import Anthropic
+
+            params, request_data = self._anthropic_request(prompt, [])
+            return (
+                AnthropicToolConversation(Anthropic(max_retries=0), params, schemas, schedule),
+                request_data,
+                "anthropic",
+            )
+        raise ValueError(f"Unsupported model: {self.model}")
+
+    def _call_llm_with_tools(self, prompt: str) -> tuple[str, UsageCost]:
+        """Run the section prompt as a tool loop. Returns (content, usage_cost)."""
+        conversation, request_data, provider = self._tool_conversation(prompt)
+        section_id = self._current_section_id or "unknown"
+
+        def on_step(step: ToolStep) -> None:
+            if step.tool_calls:
+                self._emit(
+                    f"Tool step {step.step}: {len(step.tool_calls)} call(s) ({', '.join(step.tool_calls)}) "
+                    f"- LLM {step.llm_seconds:.1f}s, tools {step.tool_seconds:.2f}s"
+                )
+            else:
+                self._emit(f"Tool step {step.step}: final answer - LLM {step.llm_seconds:.1f}s")
+
+        result = run_tool_loop(conversation, self._execute_section_tools, self.tool_budget, on_step)
+
+        usage = UsageCost()
+        for turn in result.turns:
+            usage = usage + UsageCost(
+                input_tokens=turn.input_tokens,
+                output_tokens=turn.output_tokens,
+                reasoning_tokens=turn.reasoning_tokens,
+                cost_usd=self._calculate_cost(
+                    self.model, turn.input_tokens, turn.output_tokens,
+                    turn.cache_read_tokens, turn.cache_write_tokens,
+                ),
+                cache_read_tokens=turn.cache_read_tokens,
+                cache_write_tokens=turn.cache_write_tokens,
+            )
+        request_data["tool_loop"] = {
+            "stop_reason": result.stop_reason,
+            "steps": [asdict(step) for step in result.steps],
+            "llm_seconds": round(result.llm_seconds, 3),
+            "tool_seconds": round(result.tool_seconds, 3),
+            "cache": self._get_agent_tools().cache_info(),
+        }
+        request_data["usage_info"] = {
+            "input_tokens": usage.input_tokens,
+            "output_tokens": usage.output_tokens,
+            "reasoning_tokens": usage.reasoning_tokens,
+            "cache_read_tokens": usage.cache_read_tokens,
+            "cache_write_tokens": usage.cache_write_tokens,
+        }
+
+        if not result.text.strip():
+            error_msg = (
+                f"[ERROR: tool loop ended without content; "
+                f"stop_reason={result.stop_reason}, steps={len(result.steps)}]"
+            )
+            self._log_llm_call(section_id, request_data, error_msg, provider)
+            raise RuntimeError(error_msg)
+
+        self._emit(
+            f"Tool loop finished in {len(result.steps)} step(s) ({result.stop_reason}): "
+            f"LLM {result.llm_seconds:.1f}s, tools {result.tool_seconds:.2f}s"
+        )
+        self._log_llm_call(section_id, request_data, result.text, provider)
+        return result.text, usage
+
+    def _calculate_cost(
+        self,
+        model: str,
+        input_tokens: int,
+        output_tokens: int,
+        cache_read_tokens: int = 0,
+        cache_write_tokens: int = 0,
+    ) -> float:
+        """Calculate cost in USD for token usage.
+
+        input_tokens is the whole prompt, including any cached portion.
+        """
         pricing = MODEL_PRICING.get(model, {"input": 0.0, "output": 0.0})
-        input_cost = (input_tokens / 1_000_000) * pricing["input"]
+        uncached = max(input_tokens - cache_read_tokens - cache_write_tokens, 0)
+        input_cost = (
+            uncached * pricing["input"]
+            + cache_read_tokens * pricing.get("cache_read", pricing["input"])
+            + cache_write_tokens * pricing.get("cache_write", pricing["input"])
+        ) / 1_000_000
         output_cost = (output_tokens / 1_000_000) * pricing["output"]
         return input_cost + output_cost
 
@@ -900,15 +1707,13 @@ NOTES: {funny_notes}
         response_text: str,
         provider: str,
     ) -> None:
-        """Log an LLM API call to the _llm_calls folder."""
-        self._llm_log_dir.mkdir(parents=True, exist_ok=True)
-
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        log_filename = f"{timestamp}_{section_id}_{provider}.json"
-        log_path = self._llm_log_dir / log_filename
+        """Append an LLM API call to the rolling log in the _llm_calls folder.
 
+        Only segment rotations touch committed files, so the log directory is
+        recorded for staging just when that happens.
+        """
         log_entry = {
-            "timestamp": datetime.now().isoformat(),
+            "run_id": self.run_id,
             "section_id": section_id,
             "provider": provider,
             "model": self.model,
@@ -916,8 +1721,9 @@ NOTES: {funny_notes}
             "response": response_text,
         }
 
-        log_path.write_text(json.dumps(log_entry, indent=2, default=str))
-        self._emit(f"Logged LLM call to {log_path.name}")
+        if self._llm_log.append(log_entry):
+            self._record_write(self._llm_log_dir)
+        self._emit(f"Logged LLM call for {section_id} to {self._llm_log.current_path.name}")
 
     def _encode_image(self, image_path: Path) -> str:
         """Encode an image file to base64."""
@@ -935,12 +1741,8 @@ NOTES: {funny_notes}
             ".webp": "image/webp",
         }.get(suffix, "image/png")
 
-    def _call_openai(self, prompt: str, charts: list[ChartMeta]) -> tuple[str, UsageCost]:
-        """Call OpenAI API with optional chart images. Returns (content, usage_cost)."""
-        from openai import OpenAI
-
-        client = OpenAI()
-
+    def _openai_request(self, prompt: str, charts: list[ChartMeta]) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Build chat.completions.create() params and the log summary for a prompt."""
         user_content: list[dict[str, Any]] = [{"type": "text", "text": prompt}]
 
         for chart in charts:
@@ -954,9 +1756,13 @@ NOTES: {funny_notes}
                     },
                 })
 
+        # Stable prefix first (system prompt, then report context) so OpenAI's
+        # automatic prefix caching covers it on every section after the first
         system_prompt = get_system_prompt()
+        report_context = self.build_report_context()
         messages = [
             {"role": "system", "content": system_prompt},
+            {"role": "system", "content": report_context},
             {"role": "user", "content": user_content},
         ]
 
@@ -969,6 +1775,7 @@ NOTES: {funny_notes}
             "model": self.model,
             "messages": [
                 {"role": "system", "content": system_prompt},
+                {"role": "system", "content": f"[report context, {len(report_context)} chars]"},
                 {"role": "user", "content": f"[text prompt, {image_count} images]"},
             ],
             "max_completion_tokens": max_completion_tokens,
@@ -978,38 +1785,58 @@ NOTES: {funny_notes}
             "prompt_preview": prompt[:500] + "..." if len(prompt) > 500 else prompt,
         }
 
-        response = client.chat.completions.create(
-            model=self.model,
-            messages=messages,
-            max_completion_tokens=max_completion_tokens,
-            reasoning_effort=self.thinking_level,
-        )
+        params = {
+            "model": self.model,
+            "messages": messages,
+            "max_completion_tokens": max_completion_tokens,
+            "reasoning_effort": self.thinking_level,
+        }
+        return params, request_data
 
-        if not response.choices:
-            self._log_llm_call(
-                section_id=self._current_section_id or "unknown",
-                request_data=request_data,
-                response_text="[ERROR: no choices returned from OpenAI]",
-                provider="openai",
-            )
-            raise RuntimeError("OpenAI returned no choices")
+    def _call_openai(self, prompt: str, charts: list[ChartMeta]) -> tuple[str, UsageCost]:
+        """Call OpenAI API with optional chart images. Returns (content, usage_cost)."""
+        from openai import OpenAI
 
-        choice = response.choices[0]
-        finish_reason = getattr(choice, "finish_reason", None)
-        response_text = choice.message.content or ""
+        # Retries are handled by the scheduler, not the SDK
+        client = OpenAI(max_retries=0)
+        params, request_data = self._openai_request(prompt, charts)
+
+        if self.stream:
+            response_text, finish_reason, response_usage = self._stream_openai(client, params)
+        else:
+            response = self._scheduled(self.model, params, lambda: client.chat.completions.create(**params))
+
+            if not response.choices:
+                self._log_llm_call(
+                    section_id=self._current_section_id or "unknown",
+                    request_data=request_data,
+                    response_text="[ERROR: no choices returned from OpenAI]",
+                    provider="openai",
+                )
+                raise RuntimeError("OpenAI returned no choices")
 
-        input_tokens = response.usage.prompt_tokens if response.usage else 0
-        output_tokens = response.usage.completion_tokens if response.usage else 0
+            choice = response.choices[0]
+            finish_reason = getattr(choice, "finish_reason", None)
+            response_text = choice.message.content or ""
+            response_usage = response.usage
+
+        input_tokens = response_usage.prompt_tokens if response_usage else 0
+        output_tokens = response_usage.completion_tokens if response_usage else 0
         reasoning_tokens = 0
-        if response.usage and hasattr(response.usage, "completion_tokens_details"):
-            details = response.usage.completion_tokens_details
+        if response_usage and hasattr(response_usage, "completion_tokens_details"):
+            details = response_usage.completion_tokens_details
             if details and hasattr(details, "reasoning_tokens"):
                 reasoning_tokens = details.reasoning_tokens or 0
+        cache_read_tokens = 0
+        prompt_details = getattr(response_usage, "prompt_tokens_details", None) if response_usage else None
+        if prompt_details is not None:
+            cache_read_tokens = getattr(prompt_details, "cached_tokens", 0) or 0
 
         usage_info = {
             "input_tokens": input_tokens,
             "output_tokens": output_tokens,
             "reasoning_tokens": reasoning_tokens,
+            "cache_read_tokens": cache_read_tokens,
             "finish_reason": finish_reason,
         }
         request_data["usage_info"] = usage_info
@@ -1034,7 +1861,10 @@ NOTES: {funny_notes}
             input_tokens=input_tokens,
             output_tokens=output_tokens,
             reasoning_tokens=reasoning_tokens,
-            cost_usd=self._calculate_cost(self.model, input_tokens, output_tokens),
+            cost_usd=self._calculate_cost(
+                self.model, input_tokens, output_tokens, cache_read_tokens=cache_read_tokens
+            ),
+            cache_read_tokens=cache_read_tokens,
         )
 
         self._log_llm_call(
@@ -1046,12 +1876,57 @@ NOTES: {funny_notes}
 
         return response_text, usage
 
-    def _call_anthropic(self, prompt: str, charts: list[ChartMeta]) -> tuple[str, UsageCost]:
-        """Call Anthropic API with optional chart images. Returns (content, usage_cost)."""
-        from anthropic import Anthropic
-
-        client = Anthropic()
+    def _open_stream(self) -> SectionStream:
+        """Stream sink for the current section: its .partial file plus on_stream."""
+        section_id = self._current_section_id or "unknown"
+        section = self.get_section(section_id)
+        if section is None or self._output_dir is None:
+            return SectionStream(section_id, on_text=self._on_stream)
+        return SectionStream(
+            section_id,
+            self._get_section_path(section),
+            on_text=self._on_stream,
+            header=f"{'#' * section.level} {section.title}\n\n",
+        )
 
+    def _stream_openai(self, client: Any, params: dict[str, Any]) -> tuple[str, str | None, Any]:
+        """Stream a chat completion into the section stream. Returns (text, finish_reason, usage)."""
+        params = {**params, "stream": True, "stream_options": {"include_usage": True}}
+        finish_reason: str | None = None
+        usage: Any = None
+
+        with self._open_stream() as stream:
+            def run() -> None:
+                nonlocal finish_reason, usage
+                # A retried request starts the section over
+                stream.start()
+                finish_reason = usage = None
+                for chunk in client.chat.completions.create(**params):
+                    if getattr(chunk, "usage", None):
+                        usage = chunk.usage
+                    if not chunk.choices:
+                        continue
+                    choice = chunk.choices[0]
+                    stream.write(choice.delta.content or "")
+                    finish_reason = choice.finish_reason or finish_reason
+
+            self._scheduled(self.model, params, run)
+            return stream.text, finish_reason, usage
+
+    def _stream_anthropic(self, client: Any, params: dict[str, Any]) -> Any:
+        """Stream a message into the section stream. Returns the final message."""
+        with self._open_stream() as stream:
+            def run() -> Any:
+                stream.start()
+                with client.messages.stream(**params) as response_stream:
+                    for text in response_stream.text_stream:
+                        stream.write(text)
+                    return response_stream.get_final_message()
+
+            return self._scheduled(self.model, params, run)
+
+    def _anthropic_request(self, prompt: str, charts: list[ChartMeta]) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Build messages.create() params and the log summary for a prompt."""
         user_content: list[dict[str, Any]] = []
 
         for chart in charts:
@@ -1071,34 +1946,75 @@ NOTES: {funny_notes}
 
         thinking_budget = {"low": 5000, "medium": 10000, "high": 20000}.get(self.thinking_level, 10000)
         system_prompt = get_system_prompt()
+        report_context = self.build_report_context()
+        # The breakpoint on the last system block caches system prompt + report
+        # context; everything per-section (images, prompt) comes after it
+        system_blocks = [
+            {"type": "text", "text": system_prompt},
+            {"type": "text", "text": report_context, "cache_control": {"type": "ephemeral"}},
+        ]
 
         request_data = {
             "model": self.model,
             "max_tokens": 4000 + thinking_budget,
             "system": system_prompt,
+            "report_context_chars": len(report_context),
             "thinking": {"type": "enabled", "budget_tokens": thinking_budget},
             "image_count": len([c for c in charts if c.path_png and c.path_png.exists()]),
             "chart_ids": [c.id for c in charts if c.path_png and c.path_png.exists()],
             "prompt_preview": prompt[:500] + "..." if len(prompt) > 500 else prompt,
         }
 
-        response = client.messages.create(
-            model=self.model,
-            max_tokens=4000 + thinking_budget,
-            messages=[{"role": "user", "content": user_content}],
-            system=system_prompt,
-            thinking={"type": "enabled", "budget_tokens": thinking_budget},
+        params = {
+            "model": self.model,
+            "max_tokens": 4000 + thinking_budget,
+            "messages": [{"role": "user", "content": user_content}],
+            "system": system_blocks,
+            "thinking": {"type": "enabled", "budget_tokens": thinking_budget},
+        }
+        return params, request_data
+
+    def _call_anthropic(self, prompt: str, charts: list[ChartMeta]) -> tuple[str, UsageCost]:
+        """Call Anthropic API with optional chart images. Returns (content, usage_cost)."""
+        from anthropic import Anthropic
+
+        client = Anthropic(max_retries=0)
+        params, request_data = self._anthropic_request(prompt, charts)
+
+        if self.stream:
+            response = self._stream_anthropic(client, params)
+        else:
+            response = self._scheduled(self.model, params, lambda: client.messages.create(**params))
+        # With extended thinking the first content block is the thinking block
+        response_text = "".join(
+            block.text for block in response.content if getattr(block, "type", "") == "text"
         )
-        response_text = response.content[0].text if response.content else ""
 
-        input_tokens = response.usage.input_tokens if response.usage else 0
+        # Anthropic reports cached prompt tokens separately from input_tokens
+        cache_read_tokens = getattr(response.usage, "cache_read_input_tokens", 0) or 0
+        cache_write_tokens = getattr(response.usage, "cache_creation_input_tokens", 0) or 0
+        input_tokens = (
+            (response.usage.input_tokens if response.usage else 0)
+            + cache_read_tokens
+            + cache_write_tokens
+        )
         output_tokens = response.usage.output_tokens if response.usage else 0
+        request_data["usage_info"] = {
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "cache_read_tokens": cache_read_tokens,
+            "cache_write_tokens": cache_write_tokens,
+        }
 
         usage = UsageCost(
             input_tokens=input_tokens,
             output_tokens=output_tokens,
             reasoning_tokens=0,
-            cost_usd=self._calculate_cost(self.model, input_tokens, output_tokens),
+            cost_usd=self._calculate_cost(
+                self.model, input_tokens, output_tokens, cache_read_tokens, cache_write_tokens
+            ),
+            cache_read_tokens=cache_read_tokens,
+            cache_write_tokens=cache_write_tokens,
         )
 
         self._log_llm_call(
@@ -1110,6 +2026,158 @@ NOTES: {funny_notes}
 
         return response_text, usage
 
+    def _reviewer_examples_path(self) -> Path | None:
+        if self._output_dir is None:
+            return None
+        return self._output_dir / REVIEWER_EXAMPLES_FILENAME
+
+    def _load_reviewer_examples(self) -> dict[str, dict[str, str]]:
+        """Load cached reviewer examples from the project (once per run).
+        
+        Callers must hold _reviewer_examples_lock.
+        """
+        if self._reviewer_examples is None:
+            self._reviewer_examples = {}
+            path = self._reviewer_examples_path()
+            if path is not None and path.exists():
+                try:
+                    self._reviewer_examples = json.loads(path.read_text())
+                except json.JSONDecodeError:
+                    pass
+        return self._reviewer_examples
+
+    def _save_reviewer_examples(self) -> None:
+        path = self._reviewer_examples_path()
+        with self._reviewer_examples_lock:
+            if path is None or self._reviewer_examples is None:
+                return
+            path.parent.mkdir(parents=True, exist_ok=True)
+            write_atomic(path, json.dumps(self._reviewer_examples, indent=2, sort_keys=True) + "\n")
+        self._record_write(path)
+
+    def _cached_reviewer_example(self, section: Section) -> tuple[str, str] | None:
+        with self._reviewer_examples_lock:
+            cached = self._load_reviewer_examples().get(section.id)
+        # A renamed section gets a fresh reviewer
+        if cached and cached.get("title") == section.title:
+            return cached["name"], cached["notes"]
+        return None
+
+    def _get_reviewer_example(self, section: Section) -> tuple[str, str]:
+        """Reviewer example for a section: cached, else generated (and cached), else fallback.
+        
+        Generation holds the lock, so concurrent sections never generate the
+        same example twice or write the cache file at the same time.
+        """
+        with self._reviewer_examples_lock:
+            cached = self._cached_reviewer_example(section)
+            if cached:
+                return cached
+            if self._reviewer_generation_failed:
+                return FALLBACK_REVIEWER
+            try:
+                name, notes = self.generate_funny_reviewer_example(section.title)
+            except Exception:
+                return FALLBACK_REVIEWER
+            self._load_reviewer_examples()[section.id] = {
+                "title": section.title, "name": name, "notes": notes,
+            }
+            self._save_reviewer_examples()
+        return name, notes
+
+    def prepare_reviewer_examples(self) -> int:
+        """Generate reviewer examples for all sections that need one in a single call.
+        
+        Sections with real review comments, or with a cached example for the
+        same title, are skipped. Results are cached in
+        output_dir/_reviewer_examples.json and reused by later runs.
+        
+        Returns:
+            Number of new examples generated.
+        """
+        if self.dry_run:
+            return 0
+        pending = [
+            s for s in self._sections
+            if not s.review_comments and self._cached_reviewer_example(s) is None
+        ]
+        if not pending:
+            return 0
+
+        self._emit(f"Generating reviewer examples for {len(pending)} section(s) in one call")
+        try:
+            examples = self.generate_funny_reviewer_examples(pending)
+        except Exception as e:
+            self._emit(f"Warning: batched reviewer examples failed ({e}); using fallbacks")
+            self._reviewer_generation_failed = True
+            return 0
+
+        titles = {s.id: s.title for s in pending}
+        with self._reviewer_examples_lock:
+            cache = self._load_reviewer_examples()
+            for section_id, (name, notes) in examples.items():
+                if section_id in titles:
+                    cache[section_id] = {"title": titles[section_id], "name": name, "notes": notes}
+            self._save_reviewer_examples()
+        return len(examples)
+
+    def generate_funny_reviewer_examples(
+        self, sections: list[Section]
+    ) -> dict[str, tuple[str, str]]:
+        """Generate funny reviewers for many sections with one structured-output call.
+        
+        Returns {section_id: (name, notes)}.
+        """
+        from openai import OpenAI
+
+        client = OpenAI(max_retries=0)
+
+        template = load_prompt("funny_reviewers_batch")
+        section_list = "\n".join(f"- section_id: {s.id} | title: {s.title}" for s in sections)
+        prompt = template.format(section_list=section_list)
+
+        schema = {
+            "type": "object",
+            "properties": {
+                "reviewers": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "section_id": {"type": "string"},
+                            "name": {"type": "string"},
+                            "notes": {"type": "string"},
+                        },
+                        "required": ["section_id", "name", "notes"],
+                        "additionalProperties": False,
+                    },
+                },
+            },
+            "required": ["reviewers"],
+            "additionalProperties": False,
+        }
+
+        params = {
+            "model": QUIP_MODEL,
+            "messages": [{"role": "user", "content": prompt}],
+            "max_completion_tokens": 150 * len(sections),
+            "temperature": 1.2,
+            "response_format": {
+                "type": "json_schema",
+                "json_schema": {"name": "funny_reviewers", "strict": True, "schema": schema},
+            },
+        }
+        response = self._scheduled(
+            QUIP_MODEL, params, lambda: client.chat.completions.create(**params), max_attempts=3
+        )
+
+        data = json.loads(response.choices[0].message.content or "{}")
+        return {
+            item["section_id"]: (item["name"].strip(), item["notes"].strip())
+            for item in data.get("reviewers", [])
+            if item.get("name") and item.get("notes")
+        }
+
     def generate_funny_reviewer_example(self, section_title: str) -> tuple[str, str]:
         """Generate a funny reviewer name and spicy/sarcastic comment using gpt-5-nano.
         
@@ -1117,16 +2185,19 @@ NOTES: {funny_notes}
         """
         from openai import OpenAI
 
-        client = OpenAI()
+        client = OpenAI(max_retries=0)
 
         template = load_prompt("funny_reviewer")
         prompt = template.format(section_title=section_title)
 
-        response = client.chat.completions.create(
-            model=QUIP_MODEL,
-            messages=[{"role": "user", "content": prompt}],
-            max_completion_tokens=150,
-            temperature=1.2,
+        params = {
+            "model": QUIP_MODEL,
+            "messages": [{"role": "user", "content": prompt}],
+            "max_completion_tokens": 150,
+            "temperature": 1.2,
+        }
+        response = self._scheduled(
+            QUIP_MODEL, params, lambda: client.chat.completions.create(**params), max_attempts=2
         )
 
         result = response.choices[0].message.content or ""
@@ -1146,16 +2217,19 @@ NOTES: {funny_notes}
         """Generate a funny quip about the money spent using gpt-5-nano."""
         from openai import OpenAI
 
-        client = OpenAI()
+        client = OpenAI(max_retries=0)
 
         template = load_prompt("cost_quip")
         prompt = template.format(total_cost=f"{total_cost:.2f}", section_count=section_count)
 
-        response = client.chat.completions.create(
-            model=QUIP_MODEL,
-            messages=[{"role": "user", "content": prompt}],
-            max_completion_tokens=100,
-            temperature=1.2,
+        params = {
+            "model": QUIP_MODEL,
+            "messages": [{"role": "user", "content": prompt}],
+            "max_completion_tokens": 100,
+            "temperature": 1.2,
+        }
+        response = self._scheduled(
+            QUIP_MODEL, params, lambda: client.chat.completions.create(**params), max_attempts=2
         )
 
         return response.choices[0].message.content or "Money well spent on robot helpers."
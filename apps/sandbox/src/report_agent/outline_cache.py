@@ -0,0 +1,209 @@
+"""Incremental outline parsing with a persistent per-section cache.
+
+The outline is split at heading lines into regions (heading line up to the
+next heading). Each region's bytes are hashed and stored, with its parsed
+fields, in a JSON cache. On the next load only regions whose hash is new are
+run through the parser; the rest are rebuilt from the cache. parent_id is
+always recomputed, since it depends on the surrounding headings rather than
+the region itself.
+
+The cache lives in the report project (see outline_cache_path()) and is only
+used by callers that pass it, so read-only commands never write beside the
+outline.
+"""
+
+import hashlib
+import io
+import json
+import os
+import re
+from dataclasses import asdict
+from pathlib import Path
+
+from .outline_parser import FENCE_PATTERN, HEADING_PATTERN, Section, iter_sections, parse_outline
+
+CACHE_VERSION = 3
+OUTLINE_CACHE_FILENAME = "outline.json"
+
+# Lines that might start a heading or a code fence; confirmed in Python.
+_CANDIDATE_PATTERN = re.compile(rb"^(?:#{1,6}[ \t]|[ \t]*(?:```|~~~))", re.MULTILINE)
+
+
+def outline_cache_path(output_dir: Path) -> Path:
+    """Cache file location for a report project's outline (git-ignored).
+
+    Kept in a subdirectory so the files journal backend, which treats every
+    _report_log/*.json as an entry, never sees it.
+    """
+    return output_dir / "_report_log" / "cache" / OUTLINE_CACHE_FILENAME
+
+
+def _region_bounds(data: bytes) -> list[tuple[int, int]]:
+    """Return (start, end) byte offsets of each heading region.
+
+    Mirrors the parser's boundary rules: a heading line starts a region unless
+    it sits inside a fenced code block. Text before the first heading is not
+    part of any region.
+    """
+    starts: list[int] = []
+    fence: bytes | None = None
+    for match in _CANDIDATE_PATTERN.finditer(data):
+        line_start = match.start()
+        line_end = data.find(b"\n", line_start)
+        line = data[line_start:] if line_end == -1 else data[line_start:line_end]
+        stripped = line.strip()
+        if fence is not None:
+            if stripped.startswith(fence) and not stripped.strip(fence[:1]):
+                fence = None
+            continue
+        if stripped[:3] in (b"```", b"~~~"):
+            fence_match = FENCE_PATTERN.match(line.decode("utf-8", errors="replace"))
+            if fence_match:
+                fence = fence_match.group(1).encode("utf-8")
+                continue
+        if HEADING_PATTERN.match(line.decode("utf-8", errors="replace")):
+            starts.append(line_start)
+    ends = starts[1:] + [len(data)]
+    return list(zip(starts, ends))
+
+
+def _parse_region(region: bytes) -> dict | None:
+    """Parse one region into the cached Section fields (everything but parent_id)."""
+    text = io.StringIO(region.decode("utf-8"), newline=None)
+    sections = list(iter_sections(text))
+    if len(sections) != 1:
+        return None
+    fields = asdict(sections[0])
+    del fields["parent_id"]
+    return fields
+
+
+class OutlineIndex:
+    """Parsed outline with O(1) lookups by section id.
+
+    Attributes:
+        sections: Sections in outline order.
+        reparsed: Number of regions run through the parser on this load
+            (0 when everything came from the cache).
+    """
+
+    def __init__(self, sections: list[Section], reparsed: int = 0):
+        self.sections = sections
+        self.reparsed = reparsed
+        self._by_id: dict[str, Section] = {}
+        self._index_by_id: dict[str, int] = {}
+        for i, section in enumerate(sections):
+            # First occurrence wins, matching a linear scan
+            self._by_id.setdefault(section.id, section)
+            self._index_by_id.setdefault(section.id, i)
+
+    def __len__(self) -> int:
+        return len(self.sections)
+
+    def get(self, section_id: str) -> Section | None:
+        """Get a section by ID."""
+        return self._by_id.get(section_id)
+
+    def index_of(self, section_id: str) -> int | None:
+        """0-based position of the first section with this ID."""
+        return self._index_by_id.get(section_id)
+
+    def position(self, section: Section) -> int:
+        """0-based position of a section object in outline order.
+
+        Raises:
+            ValueError: If the section is not part of this outline.
+        """
+        idx = self._index_by_id.get(section.id)
+        if idx is not None and self.sections[idx] is section:
+            return idx
+        # Duplicate IDs or a section from elsewhere: fall back to a scan
+        return self.sections.index(section)
+
+
+def _read_cache(cache_path: Path) -> dict:
+    try:
+        data = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if data.get("version") != CACHE_VERSION:
+        return {}
+    return data
+
+
+def _write_cache(cache_path: Path, payload: dict) -> None:
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(json.dumps(payload), encoding="utf-8")
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # Read-only project directory: the cache is an optimisation only
+        pass
+
+
+def load_outline(path: Path, cache_path: Path | None = None) -> OutlineIndex:
+    """Parse an outline, reusing cached sections for unchanged regions.
+
+    Args:
+        path: Outline markdown file.
+        cache_path: Cache file to reuse and update; None parses without one.
+
+    Returns:
+        OutlineIndex with sections identical to parse_outline(path).
+    """
+    path = Path(path)
+    if cache_path is None:
+        sections = parse_outline(path)
+        return OutlineIndex(sections, reparsed=len(sections))
+    data = path.read_bytes()
+    file_hash = hashlib.sha256(data).hexdigest()
+
+    cache = _read_cache(cache_path)
+    cached_regions: dict[str, dict] = {
+        region["hash"]: region["section"] for region in cache.get("regions", [])
+    }
+
+    if cache.get("file_hash") == file_hash:
+        fields_list = [region["section"] for region in cache["regions"]]
+        reparsed = 0
+    else:
+        regions = []
+        fields_list = []
+        reparsed = 0
+        for start, end in _region_bounds(data):
+            region_hash = hashlib.sha256(data[start:end]).hexdigest()
+            fields = cached_regions.get(region_hash)
+            if fields is None:
+                fields = _parse_region(data[start:end])
+                reparsed += 1
+                if fields is None:
+                    # Boundary rules disagreed with the parser; don't guess
+                    sections = parse_outline(path)
+                    return OutlineIndex(sections, reparsed=len(sections))
+            regions.append({"hash": region_hash, "section": fields})
+            fields_list.append(fields)
+        _write_cache(cache_path, {
+            "version": CACHE_VERSION,
+            "file_hash": file_hash,
+            "regions": regions,
+        })
+
+    sections: list[Section] = []
+    parent_stack: list[tuple[int, str]] = []
+    for fields in fields_list:
+        level = fields["level"]
+        while parent_stack and parent_stack[-1][0] >= level:
+            parent_stack.pop()
+        parent_id = parent_stack[-1][1] if parent_stack else None
+        parent_stack.append((level, fields["id"]))
+        sections.append(Section(
+            parent_id=parent_id,
+            **{
+                **fields,
+                "review_ratings": dict(fields["review_ratings"]),
+                "depends_on": list(fields["depends_on"]),
+            },
+        ))
+
+    return OutlineIndex(sections, reparsed=reparsed)
@@ -1,6 +1,7 @@
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Iterable, Iterator
 
 
 @dataclass
@@ -15,6 +16,7 @@ class Section:
     review_notes: str
     parent_id: str | None
     content: str
+    depends_on: list[str] = field(default_factory=list)
 
 
 def slugify(title: str) -> str:
@@ -71,63 +73,169 @@ def parse_review_block(text: str) -> tuple[str, dict, str]:
     return author, ratings, notes
 
 
-def parse_outline(path: Path) -> list[Section]:
-    content = path.read_text()
-
-    sections: list[Section] = []
-    parent_stack: list[tuple[int, str]] = []
-
-    heading_pattern = re.compile(r"^(#{1,6})\s+(.+?)\s*$", re.MULTILINE)
-    instruction_pattern = re.compile(r"<!--\s*Section instructions:\s*(.*?)\s*-->", re.DOTALL)
-    review_pattern = re.compile(r"<!--\s*Review comments:\s*(.*?)\s*-->", re.DOTALL)
-
-    headings = list(heading_pattern.finditer(content))
-
-    for idx, match in enumerate(headings):
-        level = len(match.group(1))
-        title = match.group(2).strip()
+HEADING_PATTERN = re.compile(r"^(#{1,6})\s+(.+?)\s*$")
+INSTRUCTION_PATTERN = re.compile(r"<!--\s*Section instructions:\s*(.*?)\s*-->", re.DOTALL)
+REVIEW_PATTERN = re.compile(r"<!--\s*Review comments:\s*(.*?)\s*-->", re.DOTALL)
+DEPENDS_PATTERN = re.compile(r"<!--\s*Depends on:\s*(.*?)\s*-->", re.DOTALL)
+FENCE_PATTERN = re.compile(r"^\s*(`{3,}|~{3,})")
+_FENCE_LEADS = frozenset("`~ \t")
+
+
+class _OutlineTokenizer:
+    """Line-oriented outline scanner.
+
+    Feeds one line at a time and returns a Section whenever a heading closes
+    the previous one. Only the current section's text and any open HTML
+    comment are buffered.
+    """
+
+    def __init__(self) -> None:
+        self._parent_stack: list[tuple[int, str]] = []
+        self._heading: tuple[int, str, str, str | None] | None = None
+        self._content: list[str] = []
+        self._instructions: str | None = None
+        self._review: str | None = None
+        self._depends_on: list[str] = []
+        self._comment: list[str] | None = None
+        self._fence: str | None = None
+
+    def feed(self, line: str) -> Section | None:
+        # Cheap first-character checks keep the regexes off ordinary lines
+        first = line[:1]
+        if self._comment is None and (self._fence is not None or first in _FENCE_LEADS):
+            if self._fence is not None:
+                stripped = line.strip()
+                if stripped.startswith(self._fence) and not stripped.strip(self._fence[0]):
+                    self._fence = None
+                if self._heading is not None:
+                    self._content.append(line)
+                return None
+
+            fence = FENCE_PATTERN.match(line)
+            if fence:
+                self._fence = fence.group(1)
+                if self._heading is not None:
+                    self._content.append(line)
+                return None
+
+        if first == "#":
+            heading = HEADING_PATTERN.match(line.rstrip("\n"))
+            if heading:
+                finished = self.finish()
+                self._start_section(len(heading.group(1)), heading.group(2).strip())
+                return finished
+
+        if self._heading is not None:
+            if self._comment is None and "<!--" not in line:
+                self._content.append(line)
+            else:
+                self._scan(line)
+        return None
+
+    def finish(self) -> Section | None:
+        """Close the current section (if any) and return it."""
+        if self._heading is None:
+            return None
+        if self._comment is not None:
+            # Unterminated comment: keep it as ordinary content
+            self._content.append("".join(self._comment))
+            self._comment = None
+
+        level, section_id, title, parent_id = self._heading
+        review_comments = self._review or ""
+        review_author, review_ratings, review_notes = parse_review_block(review_comments)
+        section = Section(
+            id=section_id,
+            title=title,
+            level=level,
+            instructions=self._instructions or "",
+            review_comments=review_comments,
+            review_author=review_author,
+            review_ratings=review_ratings,
+            review_notes=review_notes,
+            parent_id=parent_id,
+            content="".join(self._content).strip(),
+            depends_on=self._depends_on,
+        )
+        self._heading = None
+        self._content = []
+        self._instructions = None
+        self._review = None
+        self._depends_on = []
+        self._fence = None
+        return section
+
+    def _start_section(self, level: int, title: str) -> None:
         section_id = slugify(title)
+        while self._parent_stack and self._parent_stack[-1][0] >= level:
+            self._parent_stack.pop()
+        parent_id = self._parent_stack[-1][1] if self._parent_stack else None
+        self._parent_stack.append((level, section_id))
+        self._heading = (level, section_id, title, parent_id)
+
+    def _scan(self, text: str) -> None:
+        """Split text into content and HTML comments, tracking open comments across lines."""
+        while text:
+            if self._comment is None:
+                start = text.find("<!--")
+                if start == -1:
+                    self._content.append(text)
+                    return
+                if start:
+                    self._content.append(text[:start])
+                self._comment = ["<!--"]
+                text = text[start + 4:]
+            else:
+                end = text.find("-->")
+                if end == -1:
+                    self._comment.append(text)
+                    return
+                self._comment.append(text[:end + 3])
+                text = text[end + 3:]
+                self._close_comment("".join(self._comment))
+                self._comment = None
+
+    def _close_comment(self, comment: str) -> None:
+        match = INSTRUCTION_PATTERN.fullmatch(comment)
+        if match:
+            if self._instructions is None:
+                self._instructions = match.group(1).strip()
+            return
+        match = REVIEW_PATTERN.fullmatch(comment)
+        if match:
+            if self._review is None:
+                self._review = match.group(1).strip()
+            return
+        match = DEPENDS_PATTERN.fullmatch(comment)
+        if match:
+            for dep in re.split(r"[,\s]+", match.group(1)):
+                if dep and dep not in self._depends_on:
+                    self._depends_on.append(dep)
+            return
+        self._content.append(comment)
+
+
+def iter_sections(lines: Iterable[str]) -> Iterator[Section]:
+    """Parse outline lines in a single pass, yielding each Section as it completes.
+
+    Lines should keep their trailing newlines (as from iterating a file).
+    Headings inside fenced code blocks are treated as content.
+    """
+    tokenizer = _OutlineTokenizer()
+    for line in lines:
+        section = tokenizer.feed(line)
+        if section is not None:
+            yield section
+    section = tokenizer.finish()
+    if section is not None:
+        yield section
 
-        while parent_stack and parent_stack[-1][0] >= level:
-            parent_stack.pop()
-
-        parent_id = parent_stack[-1][1] if parent_stack else None
-        parent_stack.append((level, section_id))
-
-        start = match.end()
-        end = headings[idx + 1].start() if idx + 1 < len(headings) else len(content)
-        section_text = content[start:end]
-
-        instructions = ""
-        instruction_match = instruction_pattern.search(section_text)
-        if instruction_match:
-            instructions = instruction_match.group(1).strip()
 
-        review_comments = ""
-        review_match = review_pattern.search(section_text)
-        if review_match:
-            review_comments = review_match.group(1).strip()
+def iter_outline(path: Path) -> Iterator[Section]:
+    """Stream sections from an outline file without reading it into memory."""
+    with open(path) as f:
+        yield from iter_sections(f)
 
-        review_author, review_ratings, review_notes = parse_review_block(review_comments)
 
-        section_content = section_text
-        section_content = instruction_pattern.sub("", section_content)
-        section_content = review_pattern.sub("", section_content)
-        section_content = section_content.strip()
-
-        sections.append(
-            Section(
-                id=section_id,
-                title=title,
-                level=level,
-                instructions=instructions,
-                review_comments=review_comments,
-                review_author=review_author,
-                review_ratings=review_ratings,
-                review_notes=review_notes,
-                parent_id=parent_id,
-                content=section_content,
-            )
-        )
-
-    return sections
+def parse_outline(path: Path) -> list[Section]:
+    return list(iter_outline(path))
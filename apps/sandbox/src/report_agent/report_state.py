@@ -3,12 +3,22 @@
 This module provides data structures for tracking canonical figures, tables,
 and other artifacts across report sections, enabling the integration pass
 to deduplicate content and add cross-references.
+
+Persistence is a JSON snapshot (report_state.json) plus an optional
+append-only write-ahead log (report_state.json.wal). With a WAL attached,
+each mutation is appended as one compact JSON line and fsync'd; save()
+checkpoints by atomically replacing the snapshot and resetting the log.
+The WAL's header names the checkpoint it follows, so a log left over from
+an interrupted checkpoint is never replayed onto the wrong snapshot. A
+state file is assumed to have a single writer at a time.
 """
 
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass, field, asdict
+import os
+import uuid
+from dataclasses import dataclass, field, asdict, replace
 from datetime import datetime
 from pathlib import Path
 
@@ -61,12 +71,214 @@ class SectionStateMeta:
     last_integrated_version: int = 0
 
 
+def _id_number(artifact_id: str, prefix: str) -> int:
+    """Numeric part of an ID like 'F12', or 0 if it doesn't follow the scheme."""
+    if artifact_id.startswith(prefix):
+        try:
+            return int(artifact_id[len(prefix):])
+        except ValueError:
+            pass
+    return 0
+
+
+class _VersionedList(list):
+    """A list that counts its mutations.
+    
+    ReportState keeps figures and tables in these so its indexes can tell
+    when the list was changed directly, including same-length changes such
+    as ``state.figures[i] = fig``.
+    """
+    
+    def __init__(self, iterable=()):
+        super().__init__(iterable)
+        self.version = 0
+
+
+def _counting(name: str):
+    method = getattr(list, name)
+    
+    def mutator(self, *args, **kwargs):
+        self.version += 1
+        return method(self, *args, **kwargs)
+    
+    mutator.__name__ = name
+    return mutator
+
+
+for _name in (
+    "__setitem__", "__delitem__", "__iadd__", "__imul__",
+    "append", "extend", "insert", "pop", "remove", "clear", "sort", "reverse",
+):
+    setattr(_VersionedList, _name, _counting(_name))
+
+
+class _ArtifactIndex:
+    """Secondary indexes over a list of figures or tables.
+    
+    The index remembers which list object it was built from and that list's
+    mutation count, so replacing the list (``state.figures = [...]``) or
+    changing it directly triggers a rebuild on the next lookup. Entries
+    edited in place (``fig.owner_section = ...``) need an explicit
+    ReportState.reindex().
+    """
+    
+    def __init__(self, prefix: str, keys: tuple[str, ...]):
+        self.prefix = prefix
+        self.keys = keys
+        self.by_key: dict[str, dict[str, list]] = {key: {} for key in keys}
+        # Position of the first item with each ID
+        self.positions: dict[str, int] = {}
+        self.max_number = 0
+        self._source: _VersionedList | None = None
+        self._version = 0
+    
+    def sync(self, items: _VersionedList) -> None:
+        """Rebuild if the underlying list was replaced or changed."""
+        if items is self._source and items.version == self._version:
+            return
+        self.by_key = {key: {} for key in self.keys}
+        self.positions = {}
+        self.max_number = 0
+        self._source = items
+        for position, item in enumerate(items):
+            self._index(item, position)
+        self._version = items.version
+    
+    def add(self, item) -> None:
+        """Index an item that has just been appended to the synced source list."""
+        self._index(item, len(self._source) - 1)
+        self._version = self._source.version
+    
+    def replace(self, old, new) -> None:
+        """Re-index after the synced source list swapped new in for old (same ID).
+        
+        Lookup lists stay in source-list order, as after a rebuild.
+        """
+        position = self.positions[new.id]
+        for key in self.keys:
+            old_value, new_value = getattr(old, key), getattr(new, key)
+            if old_value is not None:
+                matches = self.by_key[key][old_value]
+                del matches[next(i for i, m in enumerate(matches) if m is old)]
+                if not matches:
+                    del self.by_key[key][old_value]
+            if new_value is not None:
+                matches = self.by_key[key].setdefault(new_value, [])
+                at = next(
+                    (i for i, m in enumerate(matches) if self.positions.get(m.id, -1) > position),
+                    len(matches),
+                )
+                matches.insert(at, new)
+        self._version = self._source.version
+    
+    def _index(self, item, position: int) -> None:
+        for key in self.keys:
+            value = getattr(item, key)
+            if value is not None:
+                self.by_key[key].setdefault(value, []).append(item)
+        self.positions.setdefault(item.id, position)
+        self.max_number = max(self.max_number, _id_number(item.id, self.prefix))
+    
+    def first(self, key: str, value: str):
+        matches = self.by_key[key].get(value)
+        return matches[0] if matches else None
+    
+    def all(self, key: str, value: str) -> list:
+        return list(self.by_key[key].get(value, ()))
+    
+    def invalidate(self) -> None:
+        self._source = None
+
+
+WAL_SUFFIX = ".wal"
+DEFAULT_CHECKPOINT_EVERY = 500
+
+
+def wal_path_for(state_path: Path) -> Path:
+    """Location of the write-ahead log for a report_state.json snapshot."""
+    return state_path.with_name(state_path.name + WAL_SUFFIX)
+
+
+def _fsync_write(path: Path, text: str) -> None:
+    """Write text to path atomically: temp file, fsync, rename."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "w") as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+class _WriteAheadLog:
+    """Append-only JSON-lines mutation log following a given checkpoint."""
+    
+    def __init__(self, path: Path, checkpoint_id: str, fsync: bool = True):
+        self.path = path
+        self.fsync = fsync
+        self.records_since_checkpoint = 0
+        if _read_wal_header(path) != checkpoint_id:
+            self._write_header(checkpoint_id)
+        else:
+            self.records_since_checkpoint = sum(1 for _ in _read_wal_records(path))
+        self._file = open(path, "a")
+    
+    def _write_header(self, checkpoint_id: str) -> None:
+        with open(self.path, "w") as f:
+            f.write(json.dumps({"checkpoint": checkpoint_id}) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+    
+    def append(self, record: dict) -> None:
+        self._file.write(json.dumps(record, separators=(",", ":")) + "\n")
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+        self.records_since_checkpoint += 1
+    
+    def reset(self, checkpoint_id: str) -> None:
+        """Start a fresh log after a checkpoint."""
+        self._file.close()
+        self._write_header(checkpoint_id)
+        self._file = open(self.path, "a")
+        self.records_since_checkpoint = 0
+    
+    def close(self) -> None:
+        self._file.close()
+
+
+def _read_wal_header(path: Path) -> str | None:
+    try:
+        with open(path) as f:
+            return json.loads(f.readline()).get("checkpoint")
+    except (OSError, json.JSONDecodeError, AttributeError):
+        return None
+
+
+def _read_wal_records(path: Path):
+    """Yield WAL records after the header, stopping at the first torn line."""
+    with open(path) as f:
+        f.readline()
+        for line in f:
+            if not line.endswith("\n"):
+                return
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                return
+
+
 @dataclass
 class ReportState:
     """Global state for report integration.
     
     Tracks all canonical figures, tables, and section metadata to enable
     the integration pass to deduplicate content and maintain cross-references.
+    
+    Lookups by semantic key, chart ID and owner section go through indexes
+    that are kept in sync with ``figures``/``tables``. ``figure_counter`` and
+    ``table_counter`` record the highest number ever allocated, so IDs are
+    never reused even after an entry is dropped. Lists assigned to
+    ``figures``/``tables`` are copied into mutation-counting lists.
     """
     report_id: str
     figures: list[CanonicalFigure] = field(default_factory=list)
@@ -74,6 +286,47 @@ class ReportState:
     section_meta: dict[str, SectionStateMeta] = field(default_factory=dict)
     created_at: str = ""
     updated_at: str = ""
+    figure_counter: int = 0
+    table_counter: int = 0
+    
+    def __post_init__(self) -> None:
+        self._figure_index = _ArtifactIndex("F", ("semantic_key", "chart_id", "owner_section"))
+        self._table_index = _ArtifactIndex("T", ("semantic_key", "owner_section"))
+        self._checkpoint_id = ""
+        self._wal: _WriteAheadLog | None = None
+        self._wal_state_path: Path | None = None
+        self._checkpoint_every = DEFAULT_CHECKPOINT_EVERY
+    
+    def __setattr__(self, name: str, value) -> None:
+        if name in ("figures", "tables") and not isinstance(value, _VersionedList):
+            value = _VersionedList(value)
+        super().__setattr__(name, value)
+    
+    def _figures_indexed(self) -> _ArtifactIndex:
+        self._figure_index.sync(self.figures)
+        return self._figure_index
+    
+    def _tables_indexed(self) -> _ArtifactIndex:
+        self._table_index.sync(self.tables)
+        return self._table_index
+    
+    def reindex(self) -> None:
+        """Rebuild lookup indexes after editing figures or tables in place."""
+        self._figure_index.invalidate()
+        self._table_index.invalidate()
+    
+    def inherit_counters(self, other: ReportState) -> None:
+        """Carry ID counters over from a previous state so IDs are not reused.
+        
+        Args:
+            other: The state this one replaces
+        """
+        self.figure_counter = max(
+            self.figure_counter, other.figure_counter, other._figures_indexed().max_number
+        )
+        self.table_counter = max(
+            self.table_counter, other.table_counter, other._tables_indexed().max_number
+        )
     
     @classmethod
     def new(cls, report_id: str) -> ReportState:
@@ -90,7 +343,7 @@ class ReportState:
     
     @classmethod
     def load(cls, path: Path) -> ReportState:
-        """Load report state from a JSON file.
+        """Load report state from a JSON snapshot, replaying its WAL if present.
         
         Args:
             path: Path to report_state.json file
@@ -115,22 +368,88 @@ class ReportState:
             k: SectionStateMeta(**v) for k, v in data.get("section_meta", {}).items()
         }
         
-        return cls(
+        state = cls(
             report_id=data["report_id"],
             figures=figures,
             tables=tables,
             section_meta=section_meta,
             created_at=data.get("created_at", ""),
             updated_at=data.get("updated_at", ""),
+            figure_counter=data.get("figure_counter", 0),
+            table_counter=data.get("table_counter", 0),
         )
+        state._checkpoint_id = data.get("checkpoint_id", "")
+        
+        wal_path = wal_path_for(Path(path))
+        if state._checkpoint_id and _read_wal_header(wal_path) == state._checkpoint_id:
+            for record in _read_wal_records(wal_path):
+                state._apply(record)
+        return state
+    
+    @classmethod
+    def open_with_wal(
+        cls,
+        path: Path,
+        report_id: str,
+        checkpoint_every: int = DEFAULT_CHECKPOINT_EVERY,
+        fsync: bool = True,
+    ) -> ReportState:
+        """Load (or create) report state and attach a write-ahead log.
+        
+        Args:
+            path: Path to report_state.json
+            report_id: Report ID to use if no state exists yet
+            checkpoint_every: Checkpoint after this many logged mutations
+            fsync: fsync each WAL append (disable only for tests/bulk imports)
+            
+        Returns:
+            ReportState that persists each mutation as it happens
+        """
+        path = Path(path)
+        state = cls.load(path) if path.exists() else cls.new(report_id)
+        state.attach_wal(path, checkpoint_every=checkpoint_every, fsync=fsync)
+        return state
+    
+    def attach_wal(
+        self,
+        path: Path,
+        checkpoint_every: int = DEFAULT_CHECKPOINT_EVERY,
+        fsync: bool = True,
+    ) -> None:
+        """Log subsequent mutations to the WAL next to the snapshot at path.
+        
+        Writes an initial snapshot if none exists, so the log always has a
+        checkpoint to follow.
+        """
+        path = Path(path)
+        if not path.exists() or not self._checkpoint_id:
+            self.save(path)
+        self._wal_state_path = path
+        self._checkpoint_every = checkpoint_every
+        self._wal = _WriteAheadLog(wal_path_for(path), self._checkpoint_id, fsync=fsync)
+    
+    def close(self) -> None:
+        """Checkpoint and detach the WAL, if one is attached."""
+        if self._wal is None:
+            return
+        if self._wal.records_since_checkpoint:
+            self.save(self._wal_state_path)
+        self._wal.close()
+        self._wal = None
+        self._wal_state_path = None
     
     def save(self, path: Path) -> None:
-        """Save report state to a JSON file.
+        """Checkpoint report state to a JSON snapshot.
+        
+        The snapshot is replaced atomically. Any WAL next to it is reset, since
+        its records are now part of the snapshot.
         
         Args:
             path: Path to save report_state.json
         """
+        path = Path(path)
         self.updated_at = datetime.now().isoformat()
+        checkpoint_id = uuid.uuid4().hex
         
         data = {
             "report_id": self.report_id,
@@ -139,43 +458,72 @@ class ReportState:
             "section_meta": {k: asdict(v) for k, v in self.section_meta.items()},
             "created_at": self.created_at,
             "updated_at": self.updated_at,
+            "figure_counter": self.figure_counter,
+            "table_counter": self.table_counter,
+            "checkpoint_id": checkpoint_id,
         }
         
         path.parent.mkdir(parents=True, exist_ok=True)
-        with open(path, "w") as f:
-            json.dump(data, f, indent=2)
+        _fsync_write(path, json.dumps(data, indent=2))
+        self._checkpoint_id = checkpoint_id
+        
+        if self._wal is not None and self._wal_state_path == path:
+            self._wal.reset(checkpoint_id)
+        elif wal_path_for(path).exists():
+            # A log from another writer now refers to a stale checkpoint
+            wal_path_for(path).unlink()
+    
+    def _log(self, op: str, **fields) -> None:
+        if self._wal is None:
+            return
+        self._wal.append({"op": op, **fields})
+        if self._wal.records_since_checkpoint >= self._checkpoint_every:
+            self.save(self._wal_state_path)
+    
+    def _apply(self, record: dict) -> None:
+        """Re-apply a logged mutation during replay."""
+        op = record.get("op")
+        if op == "register_figure":
+            self._append_figure(CanonicalFigure(**record["figure"]))
+        elif op == "register_table":
+            self._append_table(CanonicalTable(**record["table"]))
+        elif op == "increment_section_version":
+            self.get_section_meta(record["section_id"]).version += 1
+        elif op == "mark_section_integrated":
+            meta = self.get_section_meta(record["section_id"])
+            meta.last_integrated_version = meta.version
+        elif op == "upsert_figure":
+            self.upsert_figure(CanonicalFigure(**record["figure"]))
+        elif op == "upsert_table":
+            self.upsert_table(CanonicalTable(**record["table"]))
+        elif op == "remove_figure":
+            self.remove_figure(record["id"])
+        elif op == "remove_table":
+            self.remove_table(record["id"])
+        elif op == "set_section_meta":
+            self.set_section_meta(SectionStateMeta(**record["meta"]))
+    
+    def _append_figure(self, figure: CanonicalFigure) -> None:
+        index = self._figures_indexed()
+        self.figures.append(figure)
+        index.add(figure)
+        self.figure_counter = max(self.figure_counter, index.max_number)
+    
+    def _append_table(self, table: CanonicalTable) -> None:
+        index = self._tables_indexed()
+        self.tables.append(table)
+        index.add(table)
+        self.table_counter = max(self.table_counter, index.max_number)
     
     def get_next_figure_id(self) -> str:
         """Return the next available figure ID (F1, F2, ...)."""
-        if not self.figures:
-            return "F1"
-        
-        max_num = 0
-        for fig in self.figures:
-            if fig.id.startswith("F"):
-                try:
-                    num = int(fig.id[1:])
-                    max_num = max(max_num, num)
-                except ValueError:
-                    pass
-        
-        return f"F{max_num + 1}"
+        highest = max(self.figure_counter, self._figures_indexed().max_number)
+        return f"F{highest + 1}"
     
     def get_next_table_id(self) -> str:
         """Return the next available table ID (T1, T2, ...)."""
-        if not self.tables:
-            return "T1"
-        
-        max_num = 0
-        for tbl in self.tables:
-            if tbl.id.startswith("T"):
-                try:
-                    num = int(tbl.id[1:])
-                    max_num = max(max_num, num)
-                except ValueError:
-                    pass
-        
-        return f"T{max_num + 1}"
+        highest = max(self.table_counter, self._tables_indexed().max_number)
+        return f"T{highest + 1}"
     
     def register_figure(
         self,
@@ -202,7 +550,8 @@ class ReportState:
             caption=caption,
             chart_id=chart_id,
         )
-        self.figures.append(figure)
+        self._append_figure(figure)
+        self._log("register_figure", figure=asdict(figure))
         return figure
     
     def register_table(
@@ -227,9 +576,113 @@ class ReportState:
             owner_section=owner_section,
             caption=caption,
         )
-        self.tables.append(table)
+        self._append_table(table)
+        self._log("register_table", table=asdict(table))
         return table
     
+    def upsert_figure(self, figure: CanonicalFigure) -> None:
+        """Add a figure, or replace the figure with the same ID.
+        
+        Args:
+            figure: Figure to store (a copy is kept)
+        """
+        index = self._figures_indexed()
+        position = index.positions.get(figure.id)
+        if position is None:
+            self._append_figure(replace(figure))
+        else:
+            existing = self.figures[position]
+            if existing == figure:
+                return
+            self.figures[position] = replace(figure)
+            index.replace(existing, self.figures[position])
+        self.figure_counter = max(self.figure_counter, _id_number(figure.id, "F"))
+        self._log("upsert_figure", figure=asdict(figure))
+    
+    def upsert_table(self, table: CanonicalTable) -> None:
+        """Add a table, or replace the table with the same ID.
+        
+        Args:
+            table: Table to store (a copy is kept)
+        """
+        index = self._tables_indexed()
+        position = index.positions.get(table.id)
+        if position is None:
+            self._append_table(replace(table))
+        else:
+            existing = self.tables[position]
+            if existing == table:
+                return
+            self.tables[position] = replace(table)
+            index.replace(existing, self.tables[position])
+        self.table_counter = max(self.table_counter, _id_number(table.id, "T"))
+        self._log("upsert_table", table=asdict(table))
+    
+    def remove_figure(self, figure_id: str) -> None:
+        """Drop a figure by ID; its number is not reused."""
+        position = self._figures_indexed().positions.get(figure_id)
+        if position is not None:
+            self._remove_figures_at({position})
+    
+    def _remove_figures_at(self, drop: set[int]) -> None:
+        """Drop the figures at these positions in one pass, logging each removal."""
+        if not drop:
+            return
+        removed = [self.figures[position].id for position in sorted(drop)]
+        self.figures[:] = [item for position, item in enumerate(self.figures) if position not in drop]
+        for figure_id in removed:
+            self._log("remove_figure", id=figure_id)
+    
+    def remove_table(self, table_id: str) -> None:
+        """Drop a table by ID; its number is not reused."""
+        position = self._tables_indexed().positions.get(table_id)
+        if position is not None:
+            self._remove_tables_at({position})
+    
+    def _remove_tables_at(self, drop: set[int]) -> None:
+        """Drop the tables at these positions in one pass, logging each removal."""
+        if not drop:
+            return
+        removed = [self.tables[position].id for position in sorted(drop)]
+        self.tables[:] = [item for position, item in enumerate(self.tables) if position not in drop]
+        for table_id in removed:
+            self._log("remove_table", id=table_id)
+    
+    def set_section_meta(self, meta: SectionStateMeta) -> None:
+        """Replace a section's metadata.
+        
+        Args:
+            meta: New metadata (a copy is kept)
+        """
+        if self.section_meta.get(meta.section_id) == meta:
+            return
+        self.section_meta[meta.section_id] = replace(meta)
+        self._log("set_section_meta", meta=asdict(meta))
+    
+    def apply_update(self, other: ReportState) -> None:
+        """Bring figures, tables and section metadata in line with another state.
+        
+        Only the differences are applied, one entry at a time through the
+        mutators above, so with a WAL attached each change is one appended
+        record. Metadata for sections missing from other is kept, and ID
+        counters never go down.
+        
+        Args:
+            other: State to match, e.g. one parsed from an integration pass
+        """
+        if other is self:
+            return
+        figure_ids = {fig.id for fig in other.figures}
+        self._remove_figures_at({i for i, f in enumerate(self.figures) if f.id not in figure_ids})
+        for fig in other.figures:
+            self.upsert_figure(fig)
+        table_ids = {tbl.id for tbl in other.tables}
+        self._remove_tables_at({i for i, t in enumerate(self.tables) if t.id not in table_ids})
+        for tbl in other.tables:
+            self.upsert_table(tbl)
+        for meta in other.section_meta.values():
+            self.set_section_meta(meta)
+    
     def find_figure_by_semantic_key(self, key: str) -> CanonicalFigure | None:
         """Find an existing figure by its semantic key.
         
@@ -239,10 +692,7 @@ class ReportState:
         Returns:
             The matching CanonicalFigure or None if not found
         """
-        for fig in self.figures:
-            if fig.semantic_key == key:
-                return fig
-        return None
+        return self._figures_indexed().first("semantic_key", key)
     
     def find_figure_by_chart_id(self, chart_id: str) -> CanonicalFigure | None:
         """Find an existing figure by its source chart ID.
@@ -253,10 +703,7 @@ class ReportState:
         Returns:
             The matching CanonicalFigure or None if not found
         """
-        for fig in self.figures:
-            if fig.chart_id == chart_id:
-                return fig
-        return None
+        return self._figures_indexed().first("chart_id", chart_id)
     
     def find_table_by_semantic_key(self, key: str) -> CanonicalTable | None:
         """Find an existing table by its semantic key.
@@ -267,10 +714,7 @@ class ReportState:
         Returns:
             The matching CanonicalTable or None if not found
         """
-        for tbl in self.tables:
-            if tbl.semantic_key == key:
-                return tbl
-        return None
+        return self._tables_indexed().first("semantic_key", key)
     
     def get_section_meta(self, section_id: str) -> SectionStateMeta:
         """Get or create section metadata.
@@ -296,6 +740,7 @@ class ReportState:
         """
         meta = self.get_section_meta(section_id)
         meta.version += 1
+        self._log("increment_section_version", section_id=section_id)
         return meta.version
     
     def mark_section_integrated(self, section_id: str) -> None:
@@ -306,6 +751,7 @@ class ReportState:
         """
         meta = self.get_section_meta(section_id)
         meta.last_integrated_version = meta.version
+        self._log("mark_section_integrated", section_id=section_id)
     
     def is_section_stale(self, section_id: str) -> bool:
         """Check if a section's integration hints may be stale.
@@ -331,7 +777,7 @@ class ReportState:
         Returns:
             List of CanonicalFigure objects owned by this section
         """
-        return [fig for fig in self.figures if fig.owner_section == section_id]
+        return self._figures_indexed().all("owner_section", section_id)
     
     def get_figures_not_owned_by(self, section_id: str) -> list[CanonicalFigure]:
         """Get all figures NOT owned by a section.
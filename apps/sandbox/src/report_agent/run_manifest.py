@@ -0,0 +1,165 @@
+"""Run manifests for resumable generate-report runs.
+
+Each generate-report run keeps a manifest at
+``_report_log/runs/<run_id>.json``, next to its journal entries. For every
+section it records whether the section completed, a hash of the prompt
+inputs it was generated from and a hash of the section file it wrote.
+``generate-report --resume <run_id>`` loads the manifest and skips sections
+that completed, whose prompt hash still matches and whose file on disk is
+the one the run wrote; everything else is generated again. A resumed run
+updates the same manifest, so it can be resumed again.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+
+MANIFEST_VERSION = 1
+RUNS_DIRNAME = "runs"
+
+STATUS_PENDING = "pending"
+STATUS_COMPLETED = "completed"
+STATUS_FAILED = "failed"
+
+
+def content_hash(text: str) -> str:
+    """SHA-256 of text, as stored in manifests."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def get_runs_dir(output_root: Path) -> Path:
+    """Directory holding run manifests (not created)."""
+    return output_root / "_report_log" / RUNS_DIRNAME
+
+
+@dataclass
+class SectionRecord:
+    """Completion state of one section within a run."""
+
+    status: str = STATUS_PENDING
+    prompt_hash: str | None = None
+    output_hash: str | None = None
+    cost_usd: float = 0.0
+    completed_at: str | None = None
+    error: str | None = None
+
+
+@dataclass
+class RunManifest:
+    """Per-section progress of one generate-report run.
+
+    Updates are thread-safe and saved immediately, so the manifest on disk
+    reflects every section that finished before an interruption.
+    """
+
+    run_id: str
+    command: str
+    model: str
+    created_at: str
+    path: Path
+    journal_entries: list[str] = field(default_factory=list)
+    sections: dict[str, SectionRecord] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        self._lock = threading.Lock()
+
+    @classmethod
+    def create(cls, output_root: Path, run_id: str, command: str, model: str) -> "RunManifest":
+        """New, unsaved manifest for a run."""
+        return cls(
+            run_id=run_id,
+            command=command,
+            model=model,
+            created_at=datetime.now(timezone.utc).isoformat(),
+            path=get_runs_dir(output_root) / f"{run_id}.json",
+        )
+
+    @classmethod
+    def load(cls, output_root: Path, run_id: str) -> "RunManifest":
+        """Load the manifest of an earlier run.
+
+        Raises:
+            FileNotFoundError: If the run has no manifest
+            ValueError: If the manifest is unreadable or from another version
+        """
+        path = get_runs_dir(output_root) / f"{run_id}.json"
+        if not path.exists():
+            raise FileNotFoundError(f"No run manifest for run '{run_id}' in {path.parent}")
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Unreadable run manifest {path}: {e}") from e
+        if data.get("version") != MANIFEST_VERSION:
+            raise ValueError(f"Unsupported run manifest version in {path}: {data.get('version')}")
+        return cls(
+            run_id=data["run_id"],
+            command=data["command"],
+            model=data["model"],
+            created_at=data["created_at"],
+            path=path,
+            journal_entries=list(data.get("journal_entries", [])),
+            sections={
+                section_id: SectionRecord(**record)
+                for section_id, record in data.get("sections", {}).items()
+            },
+        )
+
+    def save(self) -> None:
+        """Write the manifest atomically."""
+        with self._lock:
+            self._save()
+
+    def _save(self) -> None:
+        payload = {
+            "version": MANIFEST_VERSION,
+            "run_id": self.run_id,
+            "command": self.command,
+            "model": self.model,
+            "created_at": self.created_at,
+            "journal_entries": self.journal_entries,
+            "sections": {section_id: asdict(r) for section_id, r in self.sections.items()},
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        tmp_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        os.replace(tmp_path, self.path)
+
+    def is_complete(self, section_id: str, prompt_hash: str, section_path: Path) -> bool:
+        """Whether a section can be skipped: completed, same inputs, output intact."""
+        record = self.sections.get(section_id)
+        if record is None or record.status != STATUS_COMPLETED or record.prompt_hash != prompt_hash:
+            return False
+        try:
+            return content_hash(section_path.read_text()) == record.output_hash
+        except OSError:
+            return False
+
+    def mark_completed(self, section_id: str, prompt_hash: str, content: str, cost_usd: float) -> None:
+        """Record a section written with the given content, and save."""
+        with self._lock:
+            self.sections[section_id] = SectionRecord(
+                status=STATUS_COMPLETED,
+                prompt_hash=prompt_hash,
+                output_hash=content_hash(content),
+                cost_usd=cost_usd,
+                completed_at=datetime.now(timezone.utc).isoformat(),
+            )
+            self._save()
+
+    def mark_failed(self, section_id: str, prompt_hash: str, error: str) -> None:
+        """Record a section that failed, and save."""
+        with self._lock:
+            self.sections[section_id] = SectionRecord(
+                status=STATUS_FAILED,
+                prompt_hash=prompt_hash,
+                error=error,
+            )
+            self._save()
+
+    def completed_ids(self) -> list[str]:
+        """IDs of sections recorded as completed."""
+        return [sid for sid, r in self.sections.items() if r.status == STATUS_COMPLETED]
@@ -0,0 +1,223 @@
+"""Dependency-aware scheduling of report sections.
+
+Sections form a DAG: an edge a -> b means b is written from a's output and
+must wait for it. Edges come from:
+
+- ``<!-- Depends on: id, id -->`` comments in the outline (Section.depends_on)
+- ``"depends_on"`` lists in section_chart_map.json
+- summary sections (overview, summary, conclusions, key findings) with
+  children, which wait for their direct children by default
+
+run_dag() starts every section whose inputs are done on a thread pool, and
+each dependent is submitted the moment its last input finishes, so
+independent leaves run side by side while dependents still see their
+inputs' final text. dependency_waves() groups the same DAG into levels for
+batch jobs, which can only be submitted whole.
+"""
+
+import re
+from collections.abc import Callable, Iterable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+
+from .outline_parser import Section
+
+SUMMARY_TITLE_PATTERN = re.compile(
+    r"\b(?:summary|overview|conclusions?|synthesis|key findings|highlights)\b",
+    re.IGNORECASE,
+)
+
+
+def is_summary_section(section: Section) -> bool:
+    """Whether a section's title marks it as summarising other sections."""
+    return bool(SUMMARY_TITLE_PATTERN.search(section.title))
+
+
+def build_dependencies(
+    sections: list[Section],
+    declared: dict[str, list[str]] | None = None,
+) -> dict[str, list[str]]:
+    """Map each section ID to the section IDs it waits for.
+
+    Args:
+        sections: Sections in outline order
+        declared: Extra depends_on lists by section ID (e.g. from the mapping file)
+
+    Raises:
+        ValueError: If a dependency names an unknown section or the
+            dependencies form a cycle.
+    """
+    known = {s.id for s in sections}
+    children: dict[str, list[str]] = {}
+    for section in sections:
+        if section.parent_id:
+            children.setdefault(section.parent_id, []).append(section.id)
+
+    dependencies: dict[str, list[str]] = {}
+    for section in sections:
+        if section.id in dependencies:
+            continue  # Duplicate ID: the first occurrence wins, as in OutlineIndex
+        deps = list(section.depends_on)
+        deps.extend((declared or {}).get(section.id, []))
+        if is_summary_section(section):
+            deps.extend(children.get(section.id, []))
+        for dep in deps:
+            if dep not in known:
+                raise ValueError(f"Section '{section.id}' depends on unknown section '{dep}'")
+        dependencies[section.id] = list(dict.fromkeys(deps))
+
+    _check_acyclic(dependencies)
+    return dependencies
+
+
+def _check_acyclic(dependencies: dict[str, list[str]]) -> None:
+    """Raise ValueError naming the first cycle found."""
+    visiting: list[str] = []
+    done: set[str] = set()
+
+    def visit(section_id: str) -> None:
+        if section_id in done:
+            return
+        if section_id in visiting:
+            cycle = visiting[visiting.index(section_id):] + [section_id]
+            raise ValueError("Section dependency cycle: " + " -> ".join(cycle))
+        visiting.append(section_id)
+        for dep in dependencies.get(section_id, []):
+            visit(dep)
+        visiting.pop()
+        done.add(section_id)
+
+    for section_id in dependencies:
+        visit(section_id)
+
+
+def dependents_of(dependencies: dict[str, list[str]], section_ids: Iterable[str]) -> set[str]:
+    """Every section that transitively waits on any of section_ids."""
+    reverse: dict[str, list[str]] = {}
+    for section_id, deps in dependencies.items():
+        for dep in deps:
+            reverse.setdefault(dep, []).append(section_id)
+    found: set[str] = set()
+    stack = list(section_ids)
+    while stack:
+        for dependent in reverse.get(stack.pop(), []):
+            if dependent not in found:
+                found.add(dependent)
+                stack.append(dependent)
+    return found
+
+
+def dependency_waves(
+    sections: list[Section],
+    dependencies: dict[str, list[str]],
+) -> list[list[Section]]:
+    """Group sections into waves that only depend on earlier waves.
+
+    A section's wave is one past the last wave of any section it depends on.
+    As in run_dag(), dependencies on sections outside `sections` count as
+    already satisfied and a duplicate ID keeps its first occurrence. Each
+    wave is in outline order.
+    """
+    by_id = {s.id: s for s in reversed(sections)}
+    levels: dict[str, int] = {}
+
+    def level(section_id: str) -> int:
+        if section_id not in levels:
+            deps = [d for d in dependencies.get(section_id, []) if d in by_id and d != section_id]
+            levels[section_id] = 1 + max((level(d) for d in deps), default=-1)
+        return levels[section_id]
+
+    waves: list[list[Section]] = []
+    for section in sections:
+        if by_id[section.id] is not section:
+            continue
+        wave = level(section.id)
+        while len(waves) <= wave:
+            waves.append([])
+        waves[wave].append(section)
+    return waves
+
+
+def run_dag(
+    sections: list[Section],
+    dependencies: dict[str, list[str]],
+    process: Callable[[Section], None],
+    max_workers: int = 1,
+    should_abort: Callable[[BaseException], bool] = lambda error: True,
+) -> tuple[dict[str, BaseException], dict[str, str]]:
+    """Run process(section) for each section once all its inputs have finished.
+
+    Dependencies on sections outside `sections` count as already satisfied,
+    so a resumed subset can be run against the full dependency map. Ready
+    sections are started in outline order.
+
+    Args:
+        sections: Sections to run, in outline order
+        dependencies: Output of build_dependencies()
+        process: Work for one section; raises on failure
+        max_workers: Sections in flight at once (1 runs them one at a time)
+        should_abort: Whether an error stops the run. Other errors are
+            recorded and only block the failed section's dependents.
+
+    Returns:
+        (failed, blocked): errors by section ID, and for each section that
+        never started because an input failed, the ID of that input.
+
+    Raises:
+        The first aborting error, once sections already in flight finish.
+    """
+    ids = {s.id for s in sections}
+    order = {s.id: i for i, s in reversed(list(enumerate(sections)))}
+    waiting = {
+        s.id: {d for d in dependencies.get(s.id, []) if d in ids and d != s.id}
+        for s in sections
+    }
+    reverse: dict[str, list[str]] = {}
+    for section_id, deps in waiting.items():
+        for dep in deps:
+            reverse.setdefault(dep, []).append(section_id)
+    by_id = {s.id: s for s in reversed(sections)}
+
+    failed: dict[str, BaseException] = {}
+    blocked: dict[str, str] = {}
+    abort: BaseException | None = None
+
+    max_workers = max(1, max_workers)
+    # Only max_workers sections are handed to the pool at a time, so an
+    # aborting error stops everything that has not started yet
+    ready = sorted((sid for sid, deps in waiting.items() if not deps), key=order.__getitem__)
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        running: dict[Future, str] = {}
+
+        def start(section_ids: Iterable[str]) -> None:
+            ready.extend(section_ids)
+            ready.sort(key=order.__getitem__)
+            while ready and len(running) < max_workers:
+                section_id = ready.pop(0)
+                running[pool.submit(process, by_id[section_id])] = section_id
+
+        start([])
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in sorted(done, key=lambda f: order[running[f]]):
+                section_id = running.pop(future)
+                error = future.exception()
+                if error is None:
+                    ready_now = []
+                    for dependent in reverse.get(section_id, []):
+                        waiting[dependent].discard(section_id)
+                        if not waiting[dependent] and dependent not in blocked:
+                            ready_now.append(dependent)
+                    if abort is None:
+                        start(ready_now)
+                elif should_abort(error):
+                    abort = abort or error
+                else:
+                    failed[section_id] = error
+                    for dependent in dependents_of(waiting, [section_id]):
+                        blocked.setdefault(dependent, section_id)
+                    if abort is None:
+                        start([])
+
+    if abort is not None:
+        raise abort
+    return failed, blocked
@@ -0,0 +1,116 @@
+"""Input fingerprints for skipping unchanged sections in update-report.
+
+A section's fingerprint hashes everything a revision of it depends on: its
+instructions, review block and declared dependencies, the content of its
+mapped charts, the text of the sections it builds on, the prompt templates
+and the model settings. The fingerprint used for each section's last
+write is kept in ``_section_fingerprints.json`` in the report project. When
+update-report finds a section whose fingerprint is unchanged, nothing new
+has arrived for it (no new review, instructions or data), so it is skipped
+instead of being sent to the LLM again.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+
+from .data_catalog import ChartMeta
+from .outline_parser import Section
+
+FINGERPRINTS_FILENAME = "_section_fingerprints.json"
+FINGERPRINT_VERSION = 1
+
+# (path, size, mtime_ns) -> sha256; data files rarely change between runs
+_digest_cache: dict[tuple[str, int, int], str] = {}
+_digest_lock = threading.Lock()
+
+
+def file_digest(path: Path) -> str:
+    """SHA-256 of a file's bytes, memoized on its size and mtime."""
+    stat = path.stat()
+    key = (str(path), stat.st_size, stat.st_mtime_ns)
+    with _digest_lock:
+        cached = _digest_cache.get(key)
+    if cached is not None:
+        return cached
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    value = digest.hexdigest()
+    with _digest_lock:
+        _digest_cache[key] = value
+    return value
+
+
+def chart_digest(chart: ChartMeta) -> str:
+    """Digest of a chart's data, figure and spec files."""
+    parts = [chart.id]
+    for path in (chart.path_csv, chart.path_png, chart.path_json):
+        parts.append(file_digest(path) if path is not None and path.exists() else "-")
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+
+def section_fingerprint(
+    section: Section,
+    charts: list[ChartMeta],
+    dependency_texts: dict[str, str],
+    template_version: str,
+    model: str,
+    thinking_level: str,
+) -> str:
+    """Fingerprint of a section's revision inputs."""
+    payload = json.dumps({
+        "version": FINGERPRINT_VERSION,
+        "title": section.title,
+        "level": section.level,
+        "instructions": section.instructions,
+        "review": section.review_comments,
+        "depends_on": section.depends_on,
+        "charts": [chart_digest(c) for c in charts],
+        "dependencies": {
+            dep_id: hashlib.sha256(text.encode("utf-8")).hexdigest()
+            for dep_id, text in dependency_texts.items()
+        },
+        "template": template_version,
+        "model": model,
+        "thinking_level": thinking_level,
+    }, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class FingerprintStore:
+    """Last-written fingerprint per section, persisted as JSON."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._fingerprints: dict[str, str] | None = None
+
+    def _load(self) -> dict[str, str]:
+        if self._fingerprints is None:
+            self._fingerprints = {}
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+            except (OSError, json.JSONDecodeError):
+                data = {}
+            if data.get("version") == FINGERPRINT_VERSION:
+                self._fingerprints = dict(data.get("sections", {}))
+        return self._fingerprints
+
+    def get(self, section_id: str) -> str | None:
+        with self._lock:
+            return self._load().get(section_id)
+
+    def set(self, section_id: str, fingerprint: str) -> None:
+        """Record a section's fingerprint and save the store."""
+        with self._lock:
+            fingerprints = self._load()
+            fingerprints[section_id] = fingerprint
+            payload = {"version": FINGERPRINT_VERSION, "sections": dict(sorted(fingerprints.items()))}
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(self.path.name + ".tmp")
+            tmp_path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+            os.replace(tmp_path, self.path)
@@ -44,6 +44,7 @@ class SectionMapping:
     selectors: list[ChartSelector] = field(default_factory=list)
     description: str = ""
     max_charts: int | None = None
+    depends_on: list[str] = field(default_factory=list)
 
     @property
     def charts(self) -> list[str]:
@@ -105,12 +106,14 @@ class SectionMapper:
                 raw_charts = mapping_data.get("charts", [])
                 description = mapping_data.get("description", "")
                 max_charts = mapping_data.get("max_charts")
+                depends_on = mapping_data.get("depends_on", [])
 
                 selectors = self._parse_selectors(raw_charts)
                 self._static_mappings[section_id] = SectionMapping(
                     selectors=selectors,
                     description=description,
                     max_charts=max_charts,
+                    depends_on=list(depends_on),
                 )
         except (json.JSONDecodeError, KeyError) as e:
             logger.warning(f"Failed to load static mappings: {e}")
@@ -141,6 +144,14 @@ class SectionMapper:
 
         return selectors
 
+    def get_declared_dependencies(self) -> dict[str, list[str]]:
+        """Section IDs each mapped section waits for ("depends_on" entries)."""
+        return {
+            section_id: mapping.depends_on
+            for section_id, mapping in self._static_mappings.items()
+            if mapping.depends_on
+        }
+
     def get_charts_for_section(self, section_id: str) -> list[ChartMeta]:
         """Get relevant charts for a section."""
         if section_id in self._static_mappings:
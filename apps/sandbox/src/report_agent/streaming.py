@@ -0,0 +1,102 @@
+"""Incremental output for streamed section generation.
+
+SectionStream receives text deltas as the provider streams them. Each delta
+is appended to ``_sections/NN_id.md.partial`` and flushed, so an interrupted
+run leaves everything that had arrived on disk, and is forwarded to an
+optional callback for console echo.
+
+The finished section is written with write_atomic(): the full content goes
+to the .partial file, which is then renamed over the section file, so
+readers see either the previous file or the complete new one.
+"""
+
+import os
+from pathlib import Path
+from typing import Callable, TextIO
+
+PARTIAL_SUFFIX = ".partial"
+
+# (section_id, text); an empty text marks the end of that section's stream
+StreamCallback = Callable[[str, str], None]
+
+
+def partial_path(path: Path) -> Path:
+    """In-progress file for a section file: ``NN_id.md.partial``."""
+    return path.with_name(path.name + PARTIAL_SUFFIX)
+
+
+def write_atomic(path: Path, content: str) -> None:
+    """Write content to path via its .partial file and an atomic rename."""
+    tmp_path = partial_path(path)
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(content)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+class SectionStream:
+    """Sink for one section's streamed response.
+
+    Args:
+        section_id: Section being generated (passed to on_text)
+        path: Final section file; deltas go to its .partial file. None
+            disables the file (e.g. no output directory).
+        on_text: Called with (section_id, delta) for every delta, and with
+            an empty delta once the stream closes
+        header: Written at the top of the .partial file (the section heading)
+    """
+
+    def __init__(
+        self,
+        section_id: str,
+        path: Path | None = None,
+        on_text: StreamCallback | None = None,
+        header: str = "",
+    ):
+        self.section_id = section_id
+        self.path = partial_path(path) if path is not None else None
+        self._on_text = on_text
+        self._header = header
+        self._file: TextIO | None = None
+        self._chunks: list[str] = []
+
+    @property
+    def text(self) -> str:
+        """Everything received since the last start()."""
+        return "".join(self._chunks)
+
+    def start(self) -> None:
+        """Begin (or, after a retried request, restart) the stream."""
+        self._chunks = []
+        if self.path is not None:
+            if self._file is not None:
+                self._file.close()
+            self._file = open(self.path, "w", encoding="utf-8")
+            self._file.write(self._header)
+            self._file.flush()
+
+    def write(self, delta: str) -> None:
+        """Record one streamed delta."""
+        if not delta:
+            return
+        self._chunks.append(delta)
+        if self._file is not None:
+            self._file.write(delta)
+            self._file.flush()
+        if self._on_text:
+            self._on_text(self.section_id, delta)
+
+    def close(self) -> None:
+        """Stop writing. The .partial file stays until the section is written."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self._on_text:
+            self._on_text(self.section_id, "")
+
+    def __enter__(self) -> "SectionStream":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,269 @@
+"""Persistent store of chart summaries and their rendered prompt fragments.
+
+Computing a ChartSummary means parsing the chart's CSV with pandas, and the
+same chart is often mapped to several sections. The store keeps, per chart,
+the summary and the markdown fragment rendered from it for the "Available
+Data" prompt block, in memory and as ``<data_root>/.chart_summaries/<id>.json``.
+Entries are keyed by a digest of the chart's files, so a changed export
+invalidates them; fragments are also keyed by FRAGMENT_VERSION and the chart
+metadata they show.
+
+index_charts() fills the store for a whole export ahead of a report run
+(``report-agent index-data``), computing summaries in a process pool.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .data_catalog import ChartMeta, DataCatalog
+from .section_fingerprint import chart_digest
+
+if TYPE_CHECKING:
+    from .chart_reader import ChartReader, ChartSummary
+
+SUMMARY_STORE_DIRNAME = ".chart_summaries"
+# Bump when ChartReader computes summaries differently
+STORE_VERSION = 2
+# Bump when render_chart_fragment() output changes
+FRAGMENT_VERSION = 1
+
+
+def summary_store_dir(data_root: Path) -> Path:
+    """Directory holding stored summaries for a data export (not created)."""
+    return data_root / SUMMARY_STORE_DIRNAME
+
+
+def fragment_key(chart: ChartMeta) -> str:
+    """Key of a chart's rendered fragment: template version plus shown metadata."""
+    payload = json.dumps([
+        FRAGMENT_VERSION, chart.title, chart.category, chart.units, chart.dimensions,
+    ])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def render_chart_fragment(chart: ChartMeta, summary: "ChartSummary | None") -> str:
+    """Markdown describing one chart in a section prompt's data block."""
+    lines = [
+        f"### {chart.title}",
+        f"- **ID**: {chart.id}",
+        f"- **Category**: {chart.category}",
+    ]
+    if chart.path_png and chart.path_png.exists():
+        lines.append(f"- **Figure Path**: `figures/{chart.id}.png`")
+    if chart.units:
+        lines.append(f"- **Units**: {chart.units}")
+    if chart.dimensions:
+        lines.append(f"- **Dimensions**: {', '.join(chart.dimensions)}")
+
+    if summary:
+        lines.append(f"- **Scenarios**: {', '.join(summary.scenarios)}")
+        if summary.years:
+            lines.append(f"- **Years**: {summary.years[0]} to {summary.years[-1]}")
+        lines.append(f"- **Rows**: {summary.row_count}")
+
+        if summary.key_insights:
+            lines.append("- **Key Insights**:")
+            for insight in summary.key_insights[:5]:
+                lines.append(f"  - {insight}")
+
+        if summary.by_scenario:
+            lines.append("- **Scenario Summaries**:")
+            for scen, stats in list(summary.by_scenario.items())[:3]:
+                lines.append(f"  - {scen}: {json.dumps(stats)}")
+    return "\n".join(lines)
+
+
+def _json_default(value: object) -> object:
+    """Store NumPy scalars that end up in summaries as plain numbers."""
+    if hasattr(value, "item"):
+        return value.item()
+    return str(value)
+
+
+class ChartSummaryStore:
+    """Chart summaries and rendered fragments, cached in memory and on disk.
+
+    Disk writes are best effort: a read-only data export still gets the
+    in-memory cache.
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+        self._lock = threading.Lock()
+        # chart_id -> (digest, entry)
+        self._entries: dict[str, tuple[str, dict]] = {}
+
+    def _path(self, chart_id: str) -> Path:
+        return self.directory / f"{chart_id}.json"
+
+    def _entry(self, chart: ChartMeta, digest: str) -> dict:
+        """The chart's entry for its current files (empty if none is stored)."""
+        cached = self._entries.get(chart.id)
+        if cached is not None and cached[0] == digest:
+            return cached[1]
+        try:
+            data = json.loads(self._path(chart.id).read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            data = {}
+        if data.get("version") != STORE_VERSION or data.get("digest") != digest:
+            data = {"version": STORE_VERSION, "digest": digest, "summary": None, "fragments": {}}
+        self._entries[chart.id] = (digest, data)
+        return data
+
+    def _save(self, chart_id: str, entry: dict) -> None:
+        path = self._path(chart_id)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(entry, sort_keys=True, default=_json_default), encoding="utf-8")
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+
+    def get_summary(self, chart: ChartMeta) -> "ChartSummary | None":
+        """Stored summary for the chart's current files, if any."""
+        digest = chart_digest(chart)
+        with self._lock:
+            data = self._entry(chart, digest).get("summary")
+        if data is None:
+            return None
+        from .chart_reader import ChartSummary
+
+        return ChartSummary(**data)
+
+    def put_summary(self, chart: ChartMeta, summary: "ChartSummary") -> None:
+        digest = chart_digest(chart)
+        with self._lock:
+            entry = self._entry(chart, digest)
+            entry["summary"] = asdict(summary)
+            self._save(chart.id, entry)
+
+    def get_fragment(self, chart: ChartMeta) -> str | None:
+        """Stored prompt fragment for the chart's current files and metadata."""
+        digest = chart_digest(chart)
+        with self._lock:
+            return self._entry(chart, digest)["fragments"].get(fragment_key(chart))
+
+    def put_fragment(self, chart: ChartMeta, fragment: str) -> None:
+        digest = chart_digest(chart)
+        with self._lock:
+            entry = self._entry(chart, digest)
+            entry["fragments"][fragment_key(chart)] = fragment
+            self._save(chart.id, entry)
+
+
+@dataclass
+class IndexStats:
+    """Outcome of index_charts()."""
+
+    charts: int = 0
+    computed: int = 0
+    current: int = 0
+    no_data: int = 0
+    failed: dict[str, str] = field(default_factory=dict)
+    seconds: float = 0.0
+
+    @property
+    def skipped(self) -> int:
+        """Charts that needed no work (already current, or without a CSV)."""
+        return self.current + self.no_data
+
+    @property
+    def charts_per_second(self) -> float:
+        """Summaries computed per second; skipped charts don't count."""
+        return self.computed / self.seconds if self.seconds > 0 else 0.0
+
+
+# Per-process reader for index workers, built once by _init_worker
+_worker_reader: "ChartReader | None" = None
+
+
+def _init_worker(data_root: str) -> None:
+    global _worker_reader
+    from .chart_reader import ChartReader
+
+    _worker_reader = ChartReader(DataCatalog(Path(data_root)))
+
+
+def _summarize(chart_id: str) -> tuple[str, dict | None, str | None]:
+    """Summary of one chart as a dict (picklable), or the error it raised."""
+    try:
+        summary = _worker_reader.get_summary(chart_id)
+    except Exception as e:
+        return chart_id, None, f"{type(e).__name__}: {e}"
+    finally:
+        # Each chart is summarized once; don't keep its DataFrame around
+        _worker_reader._df_cache.pop(chart_id, None)
+    return chart_id, asdict(summary), None
+
+
+def index_charts(
+    catalog: DataCatalog,
+    workers: int = 1,
+    force: bool = False,
+    on_progress: Callable[[int, int], None] | None = None,
+) -> IndexStats:
+    """Compute and store the summary and prompt fragment of every chart.
+
+    Args:
+        catalog: Catalog of the export to index
+        workers: Processes computing summaries (1 computes in this process)
+        force: Recompute charts whose stored summary is already current
+        on_progress: Called with (done, total) as charts are computed
+
+    Returns:
+        IndexStats; charts without a CSV count as no_data, and charts whose
+        CSV could not be summarized are listed in failed.
+    """
+    from .chart_reader import ChartSummary
+
+    started = time.perf_counter()
+    store = ChartSummaryStore(summary_store_dir(catalog.data_root))
+    charts = catalog.list_charts()
+    stats = IndexStats(charts=len(charts))
+
+    pending: dict[str, ChartMeta] = {}
+    for chart in charts:
+        if chart.path_csv is None:
+            stats.no_data += 1
+        elif not force and store.get_summary(chart) is not None and store.get_fragment(chart) is not None:
+            stats.current += 1
+        else:
+            pending[chart.id] = chart
+
+    def store_result(chart_id: str, data: dict | None, error: str | None) -> None:
+        if error is not None:
+            stats.failed[chart_id] = error
+        else:
+            chart = pending[chart_id]
+            summary = ChartSummary(**data)
+            store.put_summary(chart, summary)
+            store.put_fragment(chart, render_chart_fragment(chart, summary))
+            stats.computed += 1
+        if on_progress:
+            on_progress(stats.computed + len(stats.failed), len(pending))
+
+    if workers <= 1 or len(pending) <= 1:
+        _init_worker(str(catalog.data_root))
+        for chart_id in pending:
+            store_result(*_summarize(chart_id))
+    elif pending:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(str(catalog.data_root),),
+        ) as pool:
+            futures = [pool.submit(_summarize, chart_id) for chart_id in pending]
+            for future in as_completed(futures):
+                store_result(*future.result())
+
+    stats.seconds = time.perf_counter() - started
+    return stats
@@ -0,0 +1,229 @@
+"""Vectorized engine for wide-format (year-column) chart data.
+
+Timeseries chart CSVs arrive in wide format, one column per year::
+
+    scen,process_sector1,unit,2025,2030,...,2050
+
+WideTimeseries converts such a frame once into a float array of shape
+(scenario, dimension, year), with index maps from labels to positions, so
+totals, percent changes, CAGR, peak years and cross-scenario gaps are all
+NumPy reductions instead of per-scenario pandas filtering.
+"""
+
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+YEAR_MIN = 2000
+YEAR_MAX = 2100
+SCENARIO_COLUMN = "scen"
+# Label of the single scenario of a chart without a scenario column
+ALL_SCENARIOS = "all"
+# Label of the single dimension of a chart without dimension columns
+TOTAL_DIMENSION = "total"
+NON_DIMENSION_COLUMNS = {SCENARIO_COLUMN, "year", "val", "unit", "units", "measure"}
+
+
+def year_columns(columns: Iterable) -> list[str]:
+    """Columns labelled with a plausible year, in year order."""
+    years = [c for c in columns if str(c).isdigit() and YEAR_MIN <= int(c) <= YEAR_MAX]
+    return sorted(years, key=int)
+
+
+def _dimension_codes(keys: pd.DataFrame) -> tuple[np.ndarray, list[str]]:
+    """Code per row and " | "-joined labels, in order of first appearance.
+
+    Rows are grouped on the raw column values; labels are only built for the
+    first row of each group. Groups whose labels coincide as strings (1 and
+    "1") share a dimension, as if every row had been joined.
+    """
+    group_codes = keys.groupby(list(keys.columns), sort=False, dropna=False).ngroup().to_numpy()
+    _, first_rows = np.unique(group_codes, return_index=True)
+    first_rows.sort()
+    labels = [" | ".join(map(str, row)) for row in keys.iloc[first_rows].itertuples(index=False)]
+    label_codes, dimensions = pd.factorize(pd.Series(labels, dtype=object))
+    remap = np.empty(len(first_rows), dtype=np.intp)
+    remap[group_codes[first_rows]] = label_codes
+    return remap[group_codes], list(dimensions)
+
+
+@dataclass
+class WideTimeseries:
+    """Chart values as an array of shape (scenario, dimension, year).
+
+    Rows sharing a scenario and dimension are summed; combinations with no
+    row are zero, matching pandas sum() over an empty selection.
+    """
+
+    values: np.ndarray
+    scenarios: list[str]
+    dimensions: list[str]
+    years: list[int]
+    dimension_columns: list[str] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        self.scenario_index = {s: i for i, s in enumerate(self.scenarios)}
+        self.dimension_index = {d: i for i, d in enumerate(self.dimensions)}
+        self.year_index = {y: i for i, y in enumerate(self.years)}
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "WideTimeseries | None":
+        """Build from a wide-format frame; None if it has no year columns."""
+        year_cols = year_columns(df.columns)
+        if not year_cols:
+            return None
+
+        if SCENARIO_COLUMN in df.columns:
+            df = df[df[SCENARIO_COLUMN].notna()]
+            scenario_codes, scenarios = pd.factorize(df[SCENARIO_COLUMN], sort=True)
+            scenarios = [str(s) for s in scenarios]
+        else:
+            scenario_codes = np.zeros(len(df), dtype=np.intp)
+            scenarios = [ALL_SCENARIOS]
+
+        dimension_columns = [
+            c for c in df.columns if c not in NON_DIMENSION_COLUMNS and c not in year_cols
+        ]
+        if dimension_columns:
+            dimension_codes, dimensions = _dimension_codes(df[dimension_columns])
+        else:
+            dimension_codes = np.zeros(len(df), dtype=np.intp)
+            dimensions = [TOTAL_DIMENSION]
+
+        rows = df[year_cols].apply(pd.to_numeric, errors="coerce").to_numpy(dtype=float)
+        values = np.zeros((len(scenarios), len(dimensions), len(year_cols)))
+        np.add.at(values, (scenario_codes, dimension_codes), np.nan_to_num(rows, nan=0.0))
+        return cls(
+            values=values,
+            scenarios=scenarios,
+            dimensions=dimensions,
+            years=[int(y) for y in year_cols],
+            dimension_columns=dimension_columns,
+        )
+
+    def subset(
+        self,
+        scenarios: list[str] | None = None,
+        dimensions: list[str] | None = None,
+        start_year: int | None = None,
+        end_year: int | None = None,
+    ) -> "WideTimeseries":
+        """Select scenarios, dimensions and a year range (labels not found are ignored)."""
+        s_idx = (
+            [self.scenario_index[s] for s in scenarios if s in self.scenario_index]
+            if scenarios else list(range(len(self.scenarios)))
+        )
+        d_idx = (
+            [self.dimension_index[d] for d in dimensions if d in self.dimension_index]
+            if dimensions else list(range(len(self.dimensions)))
+        )
+        y_idx = [
+            i for i, y in enumerate(self.years)
+            if (start_year is None or y >= start_year) and (end_year is None or y <= end_year)
+        ]
+        return WideTimeseries(
+            values=self.values[np.ix_(s_idx, d_idx, y_idx)],
+            scenarios=[self.scenarios[i] for i in s_idx],
+            dimensions=[self.dimensions[i] for i in d_idx],
+            years=[self.years[i] for i in y_idx],
+            dimension_columns=self.dimension_columns,
+        )
+
+    def totals(self) -> np.ndarray:
+        """Totals over dimensions, shape (scenario, year)."""
+        return self.values.sum(axis=1)
+
+    def start_totals(self) -> np.ndarray:
+        return self.totals()[:, 0]
+
+    def end_totals(self) -> np.ndarray:
+        return self.totals()[:, -1]
+
+    def percent_change(self) -> np.ndarray:
+        """Change from first to last year as % of |start|; NaN where start is 0."""
+        start, end = self.start_totals(), self.end_totals()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(start != 0, (end - start) / np.abs(start) * 100, np.nan)
+
+    def cagr(self) -> np.ndarray:
+        """Compound annual growth rate in %, NaN unless start and end are positive."""
+        start, end = self.start_totals(), self.end_totals()
+        span = self.years[-1] - self.years[0]
+        if span <= 0:
+            return np.full(len(self.scenarios), np.nan)
+        valid = (start > 0) & (end > 0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratio = np.where(valid, end / np.where(valid, start, 1.0), np.nan)
+        return (np.power(ratio, 1.0 / span) - 1) * 100
+
+    def peak_years(self) -> list[int]:
+        """Year of the highest total per scenario (first if tied)."""
+        return [self.years[i] for i in self.totals().argmax(axis=1)]
+
+    def dimension_change(self) -> np.ndarray:
+        """Last-year minus first-year value, shape (scenario, dimension)."""
+        return self.values[:, :, -1] - self.values[:, :, 0]
+
+    def scenario_gap(self, year: int | None = None) -> tuple[str, str, float] | None:
+        """(highest, lowest, difference) of scenario totals in a year (default: last).
+
+        None when there is a single scenario or the year is not in the data.
+        """
+        if len(self.scenarios) < 2:
+            return None
+        y = len(self.years) - 1 if year is None else self.year_index.get(year)
+        if y is None:
+            return None
+        totals = self.totals()[:, y]
+        high, low = int(totals.argmax()), int(totals.argmin())
+        return self.scenarios[high], self.scenarios[low], float(totals[high] - totals[low])
+
+    def scenario_stats(self) -> dict[str, dict]:
+        """Per-scenario start/end totals, % change, CAGR and peak year."""
+        start, end = self.start_totals(), self.end_totals()
+        pct, cagr, peaks = self.percent_change(), self.cagr(), self.peak_years()
+        stats = {}
+        for i, scenario in enumerate(self.scenarios):
+            result = {
+                "start_year": self.years[0],
+                "end_year": self.years[-1],
+                "start_value": round(float(start[i]), 2),
+                "end_value": round(float(end[i]), 2),
+            }
+            if not np.isnan(pct[i]):
+                result["percent_change"] = round(float(pct[i]), 1)
+            if not np.isnan(cagr[i]):
+                result["cagr_percent"] = round(float(cagr[i]), 2)
+            result["peak_year"] = peaks[i]
+            stats[scenario] = result
+        return stats
+
+    def query(self, top_dimensions: int = 3) -> dict:
+        """Compact JSON-ready analysis: totals by year, scenario stats, gap and top movers."""
+        totals = self.totals()
+        changes = self.dimension_change()
+        result: dict = {
+            "years": self.years,
+            "dimension_columns": self.dimension_columns,
+            "scenarios": {},
+        }
+        stats = self.scenario_stats()
+        for i, scenario in enumerate(self.scenarios):
+            entry = dict(stats[scenario])
+            entry["totals"] = [round(float(v), 2) for v in totals[i]]
+            if top_dimensions > 0 and len(self.dimensions) > 1:
+                order = np.argsort(-np.abs(changes[i]), kind="stable")[:top_dimensions]
+                entry["largest_changes"] = [
+                    {"dimension": self.dimensions[d], "change": round(float(changes[i, d]), 2)}
+                    for d in order
+                ]
+            result["scenarios"][scenario] = entry
+        gap = self.scenario_gap()
+        if gap is not None:
+            high, low, diff = gap
+            result["scenario_gap"] = {
+                "year": self.years[-1], "highest": high, "lowest": low, "difference": round(diff, 2),
+            }
+        return result
@@ -0,0 +1,303 @@
+"""Provider-neutral tool-calling loop for section generation.
+
+Instead of preloading every mapped chart's summary and figure into one
+prompt, the model gets a short chart index and the ReportAgentTools data
+tools, and fetches what it needs over several turns. Each turn's tool calls
+run as one parallel batch (ReportAgentTools.execute_tools).
+
+The loop is bounded per section by a ToolLoopBudget: once the step or token
+budget is spent, the next turn is sent with tools disabled so the model has
+to answer with the section text. Every step records its LLM and tool time.
+
+Provider message formats live in the ToolConversation implementations
+below; the orchestrator supplies the SDK client and its request scheduler.
+"""
+
+import json
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any, Protocol
+
+# Read-only data tools offered to the model while writing a section
+SECTION_TOOLS = (
+    "list_chart_categories",
+    "list_charts",
+    "get_chart_metadata",
+    "get_chart_data",
+    "query_timeseries",
+)
+
+STOP_FINAL = "final"
+STOP_STEP_BUDGET = "step_budget"
+STOP_TOKEN_BUDGET = "token_budget"
+
+
+@dataclass
+class ToolLoopBudget:
+    """Per-section limits for the tool loop.
+
+    max_steps counts model turns, including the final one; max_tokens counts
+    input plus output tokens over all turns. max_result_chars caps each tool
+    result sent back to the model.
+    """
+
+    max_steps: int = 8
+    max_tokens: int = 150_000
+    max_result_chars: int = 20_000
+
+
+@dataclass
+class ToolCall:
+    """One tool call requested by the model."""
+
+    id: str
+    name: str
+    arguments: dict[str, Any]
+
+
+@dataclass
+class ModelTurn:
+    """The model's reply in one step: text and/or tool calls."""
+
+    text: str
+    tool_calls: list[ToolCall]
+    input_tokens: int = 0
+    output_tokens: int = 0
+    reasoning_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
+
+
+@dataclass
+class ToolStep:
+    """Timing and token accounting for one step of the loop."""
+
+    step: int
+    tool_calls: list[str]
+    llm_seconds: float
+    tool_seconds: float
+    input_tokens: int
+    output_tokens: int
+
+
+@dataclass
+class ToolLoopResult:
+    """Outcome of run_tool_loop()."""
+
+    text: str
+    stop_reason: str
+    steps: list[ToolStep] = field(default_factory=list)
+    turns: list[ModelTurn] = field(default_factory=list)
+
+    @property
+    def llm_seconds(self) -> float:
+        return sum(s.llm_seconds for s in self.steps)
+
+    @property
+    def tool_seconds(self) -> float:
+        return sum(s.tool_seconds for s in self.steps)
+
+
+class ToolConversation(Protocol):
+    """A provider conversation the loop can drive."""
+
+    def send(self, allow_tools: bool) -> ModelTurn:
+        """Send the conversation so far and append the model's reply."""
+
+    def add_tool_results(self, calls: list[ToolCall], results: list[str]) -> None:
+        """Append tool results (JSON text, in call order) for the last reply."""
+
+
+# (params, fn) -> fn(), run through the orchestrator's LLM scheduler
+Schedule = Callable[[dict[str, Any], Callable[[], Any]], Any]
+
+
+def _parse_arguments(raw: str | None) -> dict[str, Any]:
+    """Tool arguments from the model's JSON; malformed JSON becomes no arguments."""
+    try:
+        arguments = json.loads(raw or "{}")
+    except json.JSONDecodeError:
+        return {}
+    return arguments if isinstance(arguments, dict) else {}
+
+
+def anthropic_tool(schema: dict) -> dict:
+    """Convert an OpenAI function schema to Anthropic's tool format."""
+    function = schema["function"]
+    return {
+        "name": function["name"],
+        "description": function["description"],
+        "input_schema": function["parameters"],
+    }
+
+
+class OpenAIToolConversation:
+    """Chat Completions conversation with function tools."""
+
+    def __init__(self, client: Any, params: dict[str, Any], tools: list[dict], schedule: Schedule):
+        self._client = client
+        self._params = {**params, "messages": list(params["messages"])}
+        self._tools = tools
+        self._schedule = schedule
+
+    @property
+    def messages(self) -> list[dict]:
+        return self._params["messages"]
+
+    def send(self, allow_tools: bool) -> ModelTurn:
+        params = {**self._params, "tools": self._tools, "tool_choice": "auto" if allow_tools else "none"}
+        response = self._schedule(params, lambda: self._client.chat.completions.create(**params))
+        if not response.choices:
+            raise RuntimeError("OpenAI returned no choices")
+
+        message = response.choices[0].message
+        raw_calls = getattr(message, "tool_calls", None) or []
+        assistant: dict[str, Any] = {"role": "assistant", "content": message.content or ""}
+        if raw_calls:
+            assistant["tool_calls"] = [
+                {
+                    "id": call.id,
+                    "type": "function",
+                    "function": {"name": call.function.name, "arguments": call.function.arguments},
+                }
+                for call in raw_calls
+            ]
+        self.messages.append(assistant)
+
+        usage = response.usage
+        details = getattr(usage, "completion_tokens_details", None)
+        prompt_details = getattr(usage, "prompt_tokens_details", None)
+        return ModelTurn(
+            text=message.content or "",
+            tool_calls=[
+                ToolCall(call.id, call.function.name, _parse_arguments(call.function.arguments))
+                for call in raw_calls
+            ],
+            input_tokens=usage.prompt_tokens if usage else 0,
+            output_tokens=usage.completion_tokens if usage else 0,
+            reasoning_tokens=(getattr(details, "reasoning_tokens", 0) or 0) if details else 0,
+            cache_read_tokens=(getattr(prompt_details, "cached_tokens", 0) or 0) if prompt_details else 0,
+        )
+
+    def add_tool_results(self, calls: list[ToolCall], results: list[str]) -> None:
+        for call, result in zip(calls, results):
+            self.messages.append({"role": "tool", "tool_call_id": call.id, "content": result})
+
+
+class AnthropicToolConversation:
+    """Messages API conversation with tool_use / tool_result blocks."""
+
+    def __init__(self, client: Any, params: dict[str, Any], tools: list[dict], schedule: Schedule):
+        self._client = client
+        self._params = {**params, "messages": list(params["messages"])}
+        self._tools = [anthropic_tool(t) for t in tools]
+        self._schedule = schedule
+
+    @property
+    def messages(self) -> list[dict]:
+        return self._params["messages"]
+
+    def send(self, allow_tools: bool) -> ModelTurn:
+        params = {
+            **self._params,
+            "tools": self._tools,
+            "tool_choice": {"type": "auto" if allow_tools else "none"},
+        }
+        response = self._schedule(params, lambda: self._client.messages.create(**params))
+        # Thinking blocks must be sent back unchanged with the tool results
+        self.messages.append({"role": "assistant", "content": response.content})
+
+        blocks = response.content
+        usage = response.usage
+        cache_read = (getattr(usage, "cache_read_input_tokens", 0) or 0) if usage else 0
+        cache_write = (getattr(usage, "cache_creation_input_tokens", 0) or 0) if usage else 0
+        return ModelTurn(
+            text="".join(b.text for b in blocks if getattr(b, "type", "") == "text"),
+            tool_calls=[
+                ToolCall(b.id, b.name, dict(b.input or {}))
+                for b in blocks if getattr(b, "type", "") == "tool_use"
+            ],
+            input_tokens=(usage.input_tokens if usage else 0) + cache_read + cache_write,
+            output_tokens=usage.output_tokens if usage else 0,
+            cache_read_tokens=cache_read,
+            cache_write_tokens=cache_write,
+        )
+
+    def add_tool_results(self, calls: list[ToolCall], results: list[str]) -> None:
+        self.messages.append({
+            "role": "user",
+            "content": [
+                {"type": "tool_result", "tool_use_id": call.id, "content": result}
+                for call, result in zip(calls, results)
+            ],
+        })
+
+
+def encode_result(result: Any, max_chars: int) -> str:
+    """JSON text of a tool result, truncated to max_chars."""
+    text = json.dumps(result, default=str)
+    if len(text) > max_chars:
+        text = text[:max_chars] + f"... [truncated {len(text) - max_chars} chars; narrow the query]"
+    return text
+
+
+def run_tool_loop(
+    conversation: ToolConversation,
+    execute_tools: Callable[[list[tuple[str, dict]]], list[Any]],
+    budget: ToolLoopBudget,
+    on_step: Callable[[ToolStep], None] | None = None,
+) -> ToolLoopResult:
+    """Drive a conversation until the model answers without tool calls.
+
+    Args:
+        conversation: Provider conversation holding the section prompt
+        execute_tools: Runs a batch of (tool_name, arguments) calls
+        budget: Step and token limits
+        on_step: Called after each step with its timing
+
+    Returns:
+        The final text, why the loop stopped, and per-step timings.
+    """
+    steps: list[ToolStep] = []
+    turns: list[ModelTurn] = []
+    tokens_used = 0
+    stop_reason = STOP_FINAL
+    step = 0
+
+    while True:
+        step += 1
+        allow_tools = True
+        if step >= budget.max_steps:
+            allow_tools, stop_reason = False, STOP_STEP_BUDGET
+        elif tokens_used >= budget.max_tokens:
+            allow_tools, stop_reason = False, STOP_TOKEN_BUDGET
+
+        started = time.perf_counter()
+        turn = conversation.send(allow_tools)
+        llm_seconds = time.perf_counter() - started
+        turns.append(turn)
+        tokens_used += turn.input_tokens + turn.output_tokens
+        calls = turn.tool_calls if allow_tools else []
+
+        tool_seconds = 0.0
+        if calls:
+            started = time.perf_counter()
+            results = execute_tools([(c.name, c.arguments) for c in calls])
+            conversation.add_tool_results(calls, [encode_result(r, budget.max_result_chars) for r in results])
+            tool_seconds = time.perf_counter() - started
+
+        record = ToolStep(
+            step=step,
+            tool_calls=[c.name for c in calls],
+            llm_seconds=round(llm_seconds, 3),
+            tool_seconds=round(tool_seconds, 3),
+            input_tokens=turn.input_tokens,
+            output_tokens=turn.output_tokens,
+        )
+        steps.append(record)
+        if on_step:
+            on_step(record)
+
+        if not calls:
+            return ToolLoopResult(text=turn.text, stop_reason=stop_reason, steps=steps, turns=turns)
@@ -63,10 +63,14 @@ class AnthropicClient(BaseLLMClient):
         conversation_messages = [m for m in messages if m["role"] != "system"]
 
         system_content = "\n\n".join(m["content"] for m in system_messages)
+        # Cache breakpoint on the system prompt: it is identical across calls
+        system_blocks = [
+            {"type": "text", "text": system_content, "cache_control": {"type": "ephemeral"}}
+        ] if system_content else None
 
         response = await self.client.messages.create(
             model=self.model,
-            system=system_content if system_content else None,
+            system=system_blocks,
             messages=conversation_messages,
             max_tokens=4096,
         )
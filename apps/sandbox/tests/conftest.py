@@ -0,0 +1,37 @@
+"""Shared fixtures for report_agent tests."""
+
+from pathlib import Path
+
+import pytest
+
+from report_agent.orchestrator import ReportOrchestrator
+
+DEFAULT_OUTLINE = "# Intro\n\n# Methods\n\n# Results\n"
+
+
+@pytest.fixture
+def make_orchestrator(tmp_path: Path):
+    """Factory for offline ReportOrchestrators rooted in tmp_path.
+
+    The factory writes outline.md (outline_text, or DEFAULT_OUTLINE if the
+    file doesn't exist yet), creates data/ and defaults output_dir to
+    tmp_path/output. Reviewer examples are stubbed so they never reach an LLM.
+
+    Args (of the returned factory):
+        outline_text: Outline to write; None keeps an existing outline.md
+        **kwargs: Passed to ReportOrchestrator
+    """
+
+    def make(outline_text: str | None = None, **kwargs) -> ReportOrchestrator:
+        outline = tmp_path / "outline.md"
+        if outline_text is not None or not outline.exists():
+            outline.write_text(outline_text if outline_text is not None else DEFAULT_OUTLINE)
+        data_root = tmp_path / "data"
+        data_root.mkdir(exist_ok=True)
+        kwargs.setdefault("output_dir", tmp_path / "output")
+        orchestrator = ReportOrchestrator(outline_path=outline, data_root=data_root, **kwargs)
+        orchestrator.generate_funny_reviewer_examples = lambda sections: {}
+        orchestrator.generate_funny_reviewer_example = lambda title: ("Name", "Notes")
+        return orchestrator
+
+    return make
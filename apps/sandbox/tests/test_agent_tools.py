@@ -28,7 +28,7 @@ class TestToolSchemas:
     def test_get_tool_schemas_returns_list(self, tools):
         schemas = tools.get_tool_schemas()
         assert isinstance(schemas, list)
-        assert len(schemas) == 8
+        assert len(schemas) == 9
 
     def test_schema_format(self, tools):
         schemas = tools.get_tool_schemas()
@@ -53,6 +53,7 @@ class TestToolSchemas:
             "list_charts",
             "get_chart_metadata",
             "get_chart_data",
+            "query_timeseries",
             "get_chart_image",
         ]
         assert names == expected
@@ -309,9 +310,58 @@ Power,-100.00,ScenB
             "include_rows": True
         })
         
-        assert "rows" in result
-        assert len(result["rows"]) == 5
-        assert result["rows"][0]["sector"] == "Net 2025"
+        rows = result["rows"]
+        assert rows["columns"] == ["sector", "val", "scen"]
+        assert rows["total"] == 5
+        assert rows["data"][0][0] == "Net 2025"
+        assert rows["next_cursor"] is None
+
+    def test_get_chart_data_filter_and_project(self, tools):
+        result = tools.execute_tool("get_chart_data", {
+            "chart_id": "chart1",
+            "include_rows": True,
+            "scenarios": ["ScenA"],
+            "filters": {"sector": ["Power", "Industry"]},
+            "columns": ["sector", "val"],
+        })
+        
+        assert result["rows"]["columns"] == ["sector", "val"]
+        assert result["rows"]["data"] == [["Power", "Industry"], [-128.92, -109.74]]
+
+    def test_get_chart_data_aggregate(self, tools):
+        result = tools.execute_tool("get_chart_data", {
+            "chart_id": "chart1",
+            "include_rows": True,
+            "group_by": ["scen"],
+            "aggregate": "sum",
+        })
+        
+        assert result["rows"]["columns"] == ["scen", "val"]
+        assert result["rows"]["data"][0] == ["ScenA", "ScenB"]
+        assert result["rows"]["data"][1] == pytest.approx([162.39, 301.05])
+
+    def test_get_chart_data_pages_with_cursor(self, tools):
+        first = tools.execute_tool("get_chart_data", {"chart_id": "chart1", "include_rows": True, "limit": 2})
+        assert first["rows"]["data"][0] == ["Net 2025", "Power"]
+        
+        second = tools.execute_tool("get_chart_data", {
+            "chart_id": "chart1", "cursor": first["rows"]["next_cursor"], "limit": 2,
+        })
+        assert "key_insights" not in second
+        assert second["rows"]["offset"] == 2
+        assert second["rows"]["data"][0] == ["Industry", "Net 2025"]
+        
+        last = tools.execute_tool("get_chart_data", {
+            "chart_id": "chart1", "cursor": second["rows"]["next_cursor"], "limit": 2,
+        })
+        assert last["rows"]["data"][0] == ["Power"]
+        assert last["rows"]["next_cursor"] is None
+
+    def test_get_chart_data_bad_query_is_an_error(self, tools):
+        result = tools.execute_tool("get_chart_data", {
+            "chart_id": "chart1", "include_rows": True, "columns": ["nope"],
+        })
+        assert "Unknown projected column" in result["error"]
 
     def test_get_chart_data_without_rows(self, tools):
         result = tools.execute_tool("get_chart_data", {
@@ -353,6 +403,75 @@ class TestExecuteToolErrors:
         assert "error" in result
 
 
+class TestBatchedExecution:
+    @pytest.fixture
+    def tools(self, tmp_path):
+        emissions_dir = tmp_path / "data" / "emissions"
+        emissions_dir.mkdir(parents=True)
+        (emissions_dir / "chart1.csv").write_text("sector,val,scen\nPower,-10,A\nIndustry,-5,A\n")
+        (emissions_dir / "chart2.csv").write_text("scen,2025,2030\nA,100,80\n")
+        return ReportAgentTools(tmp_path / "outline.md", tmp_path / "data")
+
+    def test_results_keep_call_order(self, tools):
+        results = tools.execute_tools([
+            ("list_charts", {}),
+            ("get_chart_metadata", {"chart_id": "chart2"}),
+            ("get_chart_data", {"chart_id": "chart1"}),
+            ("unknown_tool", {}),
+        ])
+        
+        assert [c["id"] for c in results[0]] == ["chart1", "chart2"]
+        assert results[1]["id"] == "chart2"
+        assert results[2]["row_count"] == 2
+        assert "Unknown tool" in results[3]["error"]
+
+    def test_pure_results_are_memoized(self, tools):
+        first = tools.execute_tool("get_chart_data", {"chart_id": "chart1"})
+        again = tools.execute_tools([("get_chart_data", {"chart_id": "chart1"})] * 3)
+        
+        assert all(result is first for result in again)
+        assert tools.cache_info()["hits"] == 1
+
+    def test_drafts_are_not_memoized(self, tools, tmp_path):
+        (tmp_path / "outline.md").write_text("# Intro\n")
+        tools = ReportAgentTools(tmp_path / "outline.md", tmp_path / "data")
+        
+        assert tools.execute_tool("get_section_context", {"section_id": "intro"})["draft_content"] is None
+        tools.execute_tool("write_section_draft", {"section_id": "intro", "content": "Draft"})
+        assert tools.execute_tool("get_section_context", {"section_id": "intro"})["draft_content"] == "Draft"
+
+    def test_catalog_change_invalidates_cache(self, tools, tmp_path):
+        assert len(tools.execute_tool("list_charts", {})) == 2
+        
+        (tmp_path / "data" / "emissions" / "chart3.csv").write_text("scen,2025\nA,1\n")
+        
+        assert len(tools.execute_tool("list_charts", {})) == 3
+        assert tools.cache_info()["hits"] == 0
+
+    def test_result_computed_across_a_refresh_is_not_memoized(self, tools, tmp_path):
+        list_charts = tools._tool_handlers["list_charts"]
+
+        def list_charts_during_refresh():
+            result = list_charts()
+            (tmp_path / "data" / "emissions" / "chart3.csv").write_text("scen,2025\nA,1\n")
+            assert tools.refresh_catalog()
+            return result
+
+        tools._tool_handlers["list_charts"] = list_charts_during_refresh
+        assert len(tools.execute_tool("list_charts", {})) == 2
+        tools._tool_handlers["list_charts"] = list_charts
+        
+        assert len(tools.execute_tool("list_charts", {})) == 3
+        assert tools.cache_info()["hits"] == 0
+
+    def test_rewritten_csv_invalidates_summary(self, tools, tmp_path):
+        assert tools.execute_tool("get_chart_data", {"chart_id": "chart1"})["row_count"] == 2
+        
+        (tmp_path / "data" / "emissions" / "chart1.csv").write_text("sector,val,scen\nPower,-10,A\n")
+        
+        assert tools.execute_tool("get_chart_data", {"chart_id": "chart1"})["row_count"] == 1
+
+
 class TestRealDataIntegration:
     def test_with_real_data(self):
         data_path = (
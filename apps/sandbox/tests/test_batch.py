@@ -0,0 +1,192 @@
+"""Tests for provider batch mode."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from report_agent.batch import (
+    BATCH_COST_FACTOR,
+    BatchRequest,
+    BatchResult,
+    LocalBatchBackend,
+    OpenAIBatchBackend,
+    wait_for_batch,
+)
+
+
+def _echo(request: BatchRequest) -> BatchResult:
+    prompt = request.params["messages"][-1]["content"][0]["text"]
+    return BatchResult(
+        custom_id=request.custom_id,
+        text=f"Body for request {request.custom_id} ({len(prompt)} chars)",
+        input_tokens=1_000_000,
+        output_tokens=0,
+    )
+
+
+class TestLocalBackend:
+    def test_waits_for_results_file(self, tmp_path: Path):
+        backend = LocalBatchBackend(tmp_path)
+        batch_id = backend.submit([BatchRequest(custom_id="a", params={"x": 1})])
+        assert json.loads((tmp_path / batch_id / "requests.jsonl").read_text())["custom_id"] == "a"
+
+        sleeps = []
+
+        def fake_sleep(seconds: float) -> None:
+            sleeps.append(seconds)
+            (tmp_path / batch_id / "results.jsonl").write_text(
+                json.dumps({"custom_id": "a", "text": "done"}) + "\n"
+            )
+
+        results = wait_for_batch(backend, batch_id, poll_interval=5, sleep=fake_sleep)
+
+        assert sleeps == [5]
+        assert results["a"].text == "done"
+
+    def test_timeout(self, tmp_path: Path):
+        backend = LocalBatchBackend(tmp_path)
+        batch_id = backend.submit([])
+
+        with pytest.raises(TimeoutError):
+            wait_for_batch(backend, batch_id, poll_interval=0, timeout=0, sleep=lambda s: None)
+
+    def test_unknown_batch_fails(self, tmp_path: Path):
+        with pytest.raises(RuntimeError, match="failed"):
+            wait_for_batch(LocalBatchBackend(tmp_path), "missing", sleep=lambda s: None)
+
+
+class TestOpenAIResultParsing:
+    def test_success_line(self):
+        result = OpenAIBatchBackend._parse_line({
+            "custom_id": "section-0000",
+            "response": {
+                "status_code": 200,
+                "body": {
+                    "choices": [{"message": {"content": "Hello"}, "finish_reason": "stop"}],
+                    "usage": {
+                        "prompt_tokens": 10,
+                        "completion_tokens": 5,
+                        "completion_tokens_details": {"reasoning_tokens": 3},
+                    },
+                },
+            },
+            "error": None,
+        })
+        assert (result.text, result.input_tokens, result.output_tokens, result.reasoning_tokens) == (
+            "Hello", 10, 5, 3,
+        )
+        assert result.error is None
+
+    def test_error_line(self):
+        result = OpenAIBatchBackend._parse_line({
+            "custom_id": "section-0001",
+            "response": {"status_code": 400, "body": {"error": {"message": "bad"}}},
+            "error": None,
+        })
+        assert result.error and "bad" in result.error
+
+
+class TestOrchestratorBatch:
+    @pytest.fixture
+    def batch_orchestrator(self, make_orchestrator):
+        def make(backend, **kwargs):
+            orchestrator = make_orchestrator(batch_backend=backend, batch_poll_interval=0, **kwargs)
+            orchestrator._call_llm = lambda *a, **k: pytest.fail("synchronous LLM call in batch mode")
+            return orchestrator
+
+        return make
+
+    def test_generate_report_batch_writes_and_commits_in_order(self, tmp_path: Path, batch_orchestrator):
+        completed = []
+        backend = LocalBatchBackend(tmp_path / "batches", responder=_echo)
+        orchestrator = batch_orchestrator(
+            backend,
+            on_section_complete=lambda result, action: completed.append((result.section_id, action)),
+        )
+
+        report, usage = orchestrator.generate_report(batch=True)
+
+        assert completed == [("intro", "generated"), ("methods", "generated"), ("results", "generated")]
+        sections_dir = tmp_path / "output" / "_sections"
+        assert "Body for request section-0001" in (sections_dir / "02_methods.md").read_text()
+        assert "<!-- BEGIN SECTION: results" in report
+        assert usage.cost_usd == pytest.approx(3 * 2.50 * BATCH_COST_FACTOR)
+
+        batch_dirs = list((tmp_path / "batches").iterdir())
+        assert len(batch_dirs) == 1
+        assert len((batch_dirs[0] / "requests.jsonl").read_text().splitlines()) == 3
+
+    def test_update_report_batch_revises_existing_sections(self, tmp_path: Path, batch_orchestrator):
+        prompts = {}
+
+        def respond(request: BatchRequest) -> BatchResult:
+            prompts[request.custom_id] = request.params["messages"][-1]["content"][0]["text"]
+            return _echo(request)
+
+        orchestrator = batch_orchestrator(LocalBatchBackend(tmp_path / "batches", respond))
+        sections_dir = tmp_path / "output" / "_sections"
+        sections_dir.mkdir(parents=True)
+        (sections_dir / "01_intro.md").write_text("# Intro\n\nExisting intro text.\n")
+
+        _, _, action_map = orchestrator.update_report("Tighten wording", batch=True)
+
+        assert action_map == {"intro": "updated", "methods": "generated", "results": "generated"}
+        assert "Existing intro text." in prompts["section-0000"]
+        assert "Tighten wording" in prompts["section-0000"]
+        assert "Body for request section-0000" in (sections_dir / "01_intro.md").read_text()
+
+    def test_failed_requests_raise_after_writing_the_rest(self, tmp_path: Path, batch_orchestrator):
+        def respond(request: BatchRequest) -> BatchResult:
+            if request.custom_id == "section-0001":
+                return BatchResult(custom_id=request.custom_id, error="overloaded")
+            return _echo(request)
+
+        completed = []
+        orchestrator = batch_orchestrator(
+            LocalBatchBackend(tmp_path / "batches", respond),
+            on_section_complete=lambda result, action: completed.append(result.section_id),
+        )
+
+        with pytest.raises(RuntimeError, match="methods: overloaded"):
+            orchestrator.generate_report(batch=True)
+        assert completed == ["intro", "results"]
+
+    def test_summary_sections_are_batched_after_their_inputs(self, tmp_path: Path, batch_orchestrator):
+        prompts = []
+
+        def respond(request: BatchRequest) -> BatchResult:
+            prompts.append(request.params["messages"][-1]["content"][0]["text"])
+            return _echo(request)
+
+        orchestrator = batch_orchestrator(
+            LocalBatchBackend(tmp_path / "batches", respond),
+            outline_text="# Overview\n\n## Alpha\n\n## Beta\n",
+        )
+
+        orchestrator.generate_report(batch=True)
+
+        assert len(list((tmp_path / "batches").iterdir())) == 2
+        assert "Sections This Builds On" not in prompts[0]
+        assert "Sections This Builds On" in prompts[2]
+        assert "### Alpha\nBody for request section-0000" in prompts[2]
+        assert "### Beta\nBody for request section-0001" in prompts[2]
+
+    def test_sections_waiting_on_a_failed_section_are_not_submitted(self, tmp_path: Path, batch_orchestrator):
+        submitted = []
+
+        def respond(request: BatchRequest) -> BatchResult:
+            submitted.append(request.custom_id)
+            if len(submitted) == 1:
+                return BatchResult(custom_id=request.custom_id, error="overloaded")
+            return _echo(request)
+
+        orchestrator = batch_orchestrator(
+            LocalBatchBackend(tmp_path / "batches", respond),
+            outline_text="# Overview\n\n## Alpha\n\n## Beta\n",
+        )
+
+        with pytest.raises(RuntimeError, match="alpha: overloaded; overview: waiting on alpha"):
+            orchestrator.update_report(batch=True)
+        assert len(submitted) == 2
+        assert (tmp_path / "output" / "_sections" / "03_beta.md").exists()
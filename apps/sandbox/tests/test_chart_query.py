@@ -0,0 +1,72 @@
+"""Tests for chart row selection and paging."""
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from report_agent.chart_query import MAX_PAGE_SIZE, encode_page, select_rows
+
+
+@pytest.fixture
+def long_df() -> pd.DataFrame:
+    return pd.DataFrame({
+        "scen": ["A", "A", "A", "B", "B", "B"],
+        "sector": ["Power", "Power", "Transport", "Power", "Power", "Transport"],
+        "year": [2025, 2030, 2030, 2025, 2030, 2030],
+        "val": [10.0, 8.0, 5.0, 10.0, 4.0, np.nan],
+    })
+
+
+@pytest.fixture
+def wide_df() -> pd.DataFrame:
+    return pd.DataFrame({
+        "scen": ["A", "B"],
+        "sector": ["Power", "Power"],
+        "2025": [10, 10],
+        "2030": [8, 4],
+        "2050": [2, 0],
+    })
+
+
+class TestSelectRows:
+    def test_year_range_filters_long_rows(self, long_df):
+        assert select_rows(long_df, start_year=2030)["year"].unique().tolist() == [2030]
+
+    def test_year_range_drops_wide_columns(self, wide_df):
+        assert select_rows(wide_df, end_year=2030).columns.tolist() == ["scen", "sector", "2025", "2030"]
+
+    def test_mean_by_dimension(self, long_df):
+        result = select_rows(long_df, start_year=2030, group_by=["sector"], aggregate="mean")
+
+        assert result.to_dict(orient="list") == {"sector": ["Power", "Transport"], "val": [6.0, 5.0]}
+
+    def test_aggregate_without_group_by(self, long_df):
+        assert select_rows(long_df, aggregate="sum")["val"].tolist() == [37.0]
+
+    def test_unknown_aggregate(self, long_df):
+        with pytest.raises(ValueError, match="aggregate"):
+            select_rows(long_df, group_by=["sector"], aggregate="median")
+
+
+class TestEncodePage:
+    def test_nan_becomes_null_and_output_is_json(self, long_df):
+        page = encode_page(long_df, cursor="5")
+
+        assert page["data"][3] == [None]
+        assert page["next_cursor"] is None
+        json.dumps(page)
+
+    def test_large_frame_returns_one_bounded_page(self):
+        df = pd.DataFrame({"scen": ["A"] * 100_000, "val": np.arange(100_000, dtype=float)})
+
+        page = encode_page(df, limit=5000)
+
+        assert len(page["data"][1]) == MAX_PAGE_SIZE
+        assert page["total"] == 100_000
+        assert page["next_cursor"] == str(MAX_PAGE_SIZE)
+
+    def test_bad_cursor(self, long_df):
+        with pytest.raises(ValueError, match="cursor"):
+            encode_page(long_df, cursor="abc")
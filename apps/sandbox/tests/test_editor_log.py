@@ -0,0 +1,151 @@
+"""Tests for the queued editorial log."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from report_agent import editor_log
+from report_agent.change_journal import create_entry
+from report_agent.editor_log import (
+    EDITORIAL_END,
+    EDITORIAL_START,
+    append_notes_to_readme,
+    flush_editorial_queue,
+    get_editorial_queue_dir,
+    queue_editor_note,
+)
+
+
+def _entry(command: str, ts: str):
+    entry = create_entry(command, {}, sections_affected=["intro"])
+    entry.timestamp = ts
+    return entry
+
+
+@pytest.fixture
+def llm_calls(monkeypatch):
+    calls = []
+
+    def fake_call_llm(prompt: str, max_completion_tokens: int = 100) -> str:
+        calls.append(prompt)
+        count = prompt.count("Operation ")
+        if count:
+            return json.dumps([f"Batched note {i}." for i in range(1, count + 1)])
+        return "Single note."
+
+    monkeypatch.setattr(editor_log, "_call_llm", fake_call_llm)
+    return calls
+
+
+class TestQueue:
+    def test_queue_does_not_call_llm(self, tmp_path: Path, llm_calls):
+        path = queue_editor_note(
+            tmp_path, _entry("update-section", "2026-01-01T10:00:00+00:00"), {"k": 1}, background=False
+        )
+
+        assert path.parent == get_editorial_queue_dir(tmp_path)
+        assert json.loads(path.read_text())["extra_context"] == {"k": 1}
+        assert llm_calls == []
+        assert not (tmp_path / "README.md").exists()
+
+    def test_flush_batches_into_one_call_and_one_write(self, tmp_path: Path, llm_calls):
+        for i in range(3):
+            queue_editor_note(
+                tmp_path, _entry("update-section", f"2026-01-0{i + 1}T10:00:00+00:00"), background=False
+            )
+
+        notes = flush_editorial_queue(tmp_path)
+
+        assert notes == ["Batched note 1.", "Batched note 2.", "Batched note 3."]
+        assert len(llm_calls) == 1
+        readme = (tmp_path / "README.md").read_text()
+        log = readme[readme.index(EDITORIAL_START):readme.index(EDITORIAL_END)]
+        # Most recent first
+        assert log.index("2026-01-03") < log.index("2026-01-02") < log.index("2026-01-01")
+        assert list(get_editorial_queue_dir(tmp_path).glob("*.json")) == []
+
+    def test_single_item_uses_single_note_prompt(self, tmp_path: Path, llm_calls):
+        queue_editor_note(tmp_path, _entry("generate-report", "2026-01-01T10:00:00+00:00"), background=False)
+
+        assert flush_editorial_queue(tmp_path) == ["Single note."]
+
+    def test_mismatched_batch_falls_back_to_per_item(self, tmp_path: Path, monkeypatch):
+        replies = iter(["not json", "Note A.", "Note B."])
+        monkeypatch.setattr(editor_log, "_call_llm", lambda prompt, max_completion_tokens=100: next(replies))
+        queue_editor_note(tmp_path, _entry("a", "2026-01-01T10:00:00+00:00"), background=False)
+        queue_editor_note(tmp_path, _entry("b", "2026-01-02T10:00:00+00:00"), background=False)
+
+        assert flush_editorial_queue(tmp_path) == ["Note A.", "Note B."]
+
+    def test_failed_flush_keeps_queue(self, tmp_path: Path, monkeypatch):
+        def boom(prompt, max_completion_tokens=100):
+            raise RuntimeError("no network")
+
+        monkeypatch.setattr(editor_log, "_call_llm", boom)
+        queue_editor_note(tmp_path, _entry("a", "2026-01-01T10:00:00+00:00"), background=False)
+
+        assert flush_editorial_queue(tmp_path) == []
+
+        queue_dir = get_editorial_queue_dir(tmp_path)
+        [path] = queue_dir.glob("*.json")
+        assert json.loads(path.read_text())["attempts"] == 1
+        assert not (queue_dir / ".lock").exists()
+        assert not (tmp_path / "README.md").exists()
+
+    def test_repeatedly_failing_items_get_static_note(self, tmp_path: Path, monkeypatch):
+        calls = []
+
+        def boom(prompt, max_completion_tokens=100):
+            calls.append(prompt)
+            raise RuntimeError("no API key")
+
+        monkeypatch.setattr(editor_log, "_call_llm", boom)
+        queue_editor_note(tmp_path, _entry("update-section", "2026-01-01T10:00:00+00:00"), background=False)
+
+        for _ in range(editor_log.MAX_NOTE_ATTEMPTS):
+            assert flush_editorial_queue(tmp_path) == []
+        notes = flush_editorial_queue(tmp_path)
+
+        assert notes == ["`update-section` completed for intro."]
+        assert len(calls) == editor_log.MAX_NOTE_ATTEMPTS
+        assert list(get_editorial_queue_dir(tmp_path).glob("*.json")) == []
+        assert notes[0] in (tmp_path / "README.md").read_text()
+
+    def test_flush_takes_a_bounded_batch(self, tmp_path: Path, monkeypatch):
+        budgets = []
+
+        def fake_call_llm(prompt, max_completion_tokens=100):
+            budgets.append(max_completion_tokens)
+            return json.dumps(["Note."] * prompt.count("Operation "))
+
+        monkeypatch.setattr(editor_log, "_call_llm", fake_call_llm)
+        for i in range(5):
+            queue_editor_note(tmp_path, _entry("a", f"2026-01-0{i + 1}T10:00:00+00:00"), background=False)
+
+        assert len(flush_editorial_queue(tmp_path, max_items=3)) == 3
+        assert budgets == [300]
+        remaining = sorted(p.name for p in get_editorial_queue_dir(tmp_path).glob("*.json"))
+        assert [name[:8] for name in remaining] == ["20260104", "20260105"]
+
+    def test_concurrent_flush_skipped_while_locked(self, tmp_path: Path, llm_calls):
+        queue_editor_note(tmp_path, _entry("a", "2026-01-01T10:00:00+00:00"), background=False)
+        (get_editorial_queue_dir(tmp_path) / ".lock").write_text("123")
+
+        assert flush_editorial_queue(tmp_path) == []
+        assert llm_calls == []
+
+    def test_empty_queue(self, tmp_path: Path, llm_calls):
+        assert flush_editorial_queue(tmp_path) == []
+
+
+class TestAppendNotes:
+    def test_existing_readme_keeps_older_notes_below(self, tmp_path: Path):
+        append_notes_to_readme(tmp_path, [("Old.", _entry("a", "2026-01-01T10:00:00+00:00"))])
+        append_notes_to_readme(tmp_path, [("New.", _entry("b", "2026-01-02T10:00:00+00:00"))])
+
+        readme = (tmp_path / "README.md").read_text()
+
+        assert readme.index("New.") < readme.index("Old.")
+        assert "<!-- Entries" not in readme
+        assert readme.count(EDITORIAL_START) == 1
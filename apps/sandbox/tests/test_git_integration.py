@@ -15,7 +15,11 @@ from report_agent.git_integration import (
     load_report_meta,
     ensure_report_project,
     auto_commit,
+    stage_paths,
     init_repo,
+    combine_commit_messages,
+    CommitScheduler,
+    PushQueue,
     REPORT_META_FILENAME,
     GITHUB_ORG,
 )
@@ -28,6 +32,12 @@ from report_agent.change_journal import (
     load_entry,
     list_entries,
     format_entry_for_commit,
+    JournalDB,
+    get_journal_db_path,
+    get_journal_export_path,
+    uses_sqlite_journal,
+    import_json_entries,
+    export_json_entries,
 )
 from report_agent.cli import app
 
@@ -95,6 +105,262 @@ class TestEnsureReportProject:
             ensure_report_project(missing_path)
 
 
+def _init_local_report_repo(root: Path) -> None:
+    """Create a real git repo with report metadata (no remote)."""
+    root.mkdir(parents=True, exist_ok=True)
+    subprocess.run(["git", "init", "-q", "-b", "main"], cwd=root, check=True)
+    subprocess.run(["git", "config", "user.email", "test@example.com"], cwd=root, check=True)
+    subprocess.run(["git", "config", "user.name", "Test"], cwd=root, check=True)
+    (root / REPORT_META_FILENAME).write_text(json.dumps({"report_name": "Test"}))
+
+
+def _staged_files(root: Path) -> set[str]:
+    out = subprocess.run(
+        ["git", "diff", "--cached", "--name-only"], cwd=root, check=True,
+        capture_output=True, text=True,
+    ).stdout
+    return set(out.split())
+
+
+class TestTargetedStaging:
+    def test_stage_paths_only_stages_given_files(self, tmp_path: Path):
+        root = tmp_path / "report"
+        _init_local_report_repo(root)
+        (root / "_sections").mkdir()
+        (root / "_sections" / "01_intro.md").write_text("intro")
+        (root / "_llm_calls").mkdir()
+        (root / "_llm_calls" / "call.json").write_text("{}")
+        (root / "report.md").write_text("report")
+
+        staged = stage_paths(root, [root / "_sections" / "01_intro.md", Path("report.md")])
+
+        assert staged == ["_sections/01_intro.md", "report.md"]
+        assert _staged_files(root) == {"_sections/01_intro.md", "report.md"}
+
+    def test_stage_paths_skips_missing_and_literal(self, tmp_path: Path):
+        root = tmp_path / "report"
+        _init_local_report_repo(root)
+        (root / "a*.md").write_text("literal")
+        (root / "ab.md").write_text("other")
+
+        staged = stage_paths(root, [root / "a*.md", root / "gone.md"])
+
+        assert staged == ["a*.md"]
+        assert _staged_files(root) == {"a*.md"}
+
+    def test_stage_paths_stages_removal_of_tracked_files(self, tmp_path: Path):
+        root = tmp_path / "report"
+        _init_local_report_repo(root)
+        (root / "_sections").mkdir()
+        old = root / "_sections" / "01_results.md"
+        old.write_text("results")
+        auto_commit(root, "feat: results", push=False, paths=[old])
+        new = root / "_sections" / "02_results.md"
+        old.rename(new)
+
+        staged = stage_paths(root, [new, old])
+
+        assert staged == ["_sections/01_results.md", "_sections/02_results.md"]
+        status = subprocess.run(
+            ["git", "status", "--porcelain"], cwd=root, check=True, capture_output=True, text=True
+        ).stdout
+        assert "R  _sections/01_results.md -> _sections/02_results.md" in status
+
+    def test_stage_paths_rejects_outside_project(self, tmp_path: Path):
+        root = tmp_path / "report"
+        _init_local_report_repo(root)
+        outside = tmp_path / "elsewhere.md"
+        outside.write_text("x")
+
+        with pytest.raises(RuntimeError, match="outside report project"):
+            stage_paths(root, [outside])
+
+    def test_auto_commit_with_paths(self, tmp_path: Path):
+        root = tmp_path / "report"
+        _init_local_report_repo(root)
+        (root / "keep.md").write_text("keep")
+        (root / "untouched.md").write_text("untouched")
+
+        auto_commit(root, "feat: targeted", push=False, paths=[root / "keep.md"])
+
+        tracked = subprocess.run(
+            ["git", "ls-files"], cwd=root, check=True, capture_output=True, text=True
+        ).stdout.split()
+        assert tracked == ["keep.md"]
+
+    def test_auto_commit_without_paths_stages_all(self, tmp_path: Path):
+        root = tmp_path / "report"
+        _init_local_report_repo(root)
+        (root / "keep.md").write_text("keep")
+
+        auto_commit(root, "feat: everything", push=False)
+
+        tracked = subprocess.run(
+            ["git", "ls-files"], cwd=root, check=True, capture_output=True, text=True
+        ).stdout.split()
+        assert set(tracked) == {"keep.md", REPORT_META_FILENAME}
+
+
+class TestCombineCommitMessages:
+    def test_single_message_unchanged(self):
+        assert combine_commit_messages(["feat: one\n\nbody"]) == "feat: one\n\nbody"
+
+    def test_empty(self):
+        assert combine_commit_messages([]) == ""
+
+    def test_multiple_messages_preserved(self):
+        combined = combine_commit_messages([
+            "chore: finalize\n\nCost: $1.0000",
+            "feat: generate section a - A\n\nModel: m",
+            "feat: generate section b - B\n\nModel: m",
+        ])
+        assert combined.startswith("chore: finalize (+2 more)\n")
+        assert "Cost: $1.0000" in combined
+        assert "feat: generate section a - A" in combined
+        assert "feat: generate section b - B" in combined
+
+
+class TestCommitScheduler:
+    @pytest.fixture
+    def git_calls(self):
+        calls: list[tuple[str, str]] = []
+
+        def fake_commit(output_root, message, push=True, paths=None):
+            calls.append(("commit", message))
+
+        def fake_push(output_root):
+            calls.append(("push", ""))
+
+        with patch("report_agent.git_integration.auto_commit", side_effect=fake_commit), \
+             patch("report_agent.git_integration.push_to_origin", side_effect=fake_push):
+            yield calls
+
+    def test_rejects_unknown_strategy(self, tmp_path: Path):
+        with pytest.raises(ValueError, match="Unknown commit strategy"):
+            CommitScheduler(tmp_path, "sometimes", push=False)
+
+    def test_per_section_commits_each_section(self, tmp_path: Path, git_calls):
+        scheduler = CommitScheduler(tmp_path, "per-section")
+        assert scheduler.section_complete("feat: a") is True
+        assert scheduler.section_complete("feat: b") is True
+        scheduler.finalize("chore: finalize")
+
+        commits = [msg for kind, msg in git_calls if kind == "commit"]
+        assert commits == ["feat: a", "feat: b", "chore: finalize"]
+        assert ("push", "") in git_calls
+        assert git_calls[-1] == ("push", "")
+
+    def test_per_run_single_commit(self, tmp_path: Path, git_calls):
+        scheduler = CommitScheduler(tmp_path, "per-run")
+        assert scheduler.section_complete("feat: a") is False
+        assert scheduler.section_complete("feat: b") is False
+        assert git_calls == []
+        assert scheduler.pending_messages == ["feat: a", "feat: b"]
+
+        scheduler.finalize("chore: finalize")
+
+        commits = [msg for kind, msg in git_calls if kind == "commit"]
+        assert len(commits) == 1
+        assert commits[0].startswith("chore: finalize (+2 more)")
+        assert "feat: a" in commits[0]
+        assert "feat: b" in commits[0]
+        assert git_calls.count(("push", "")) == 1
+
+    def test_interval_batches_until_elapsed(self, tmp_path: Path, git_calls):
+        now = [0.0]
+        scheduler = CommitScheduler(
+            tmp_path, "interval", interval_seconds=60, push=False, clock=lambda: now[0]
+        )
+        now[0] = 10
+        assert scheduler.section_complete("feat: a") is False
+        now[0] = 70
+        assert scheduler.section_complete("feat: b") is True
+        now[0] = 80
+        assert scheduler.section_complete("feat: c") is False
+
+        commits = [msg for kind, msg in git_calls if kind == "commit"]
+        assert len(commits) == 1
+        assert "feat: a" in commits[0] and "feat: b" in commits[0]
+        assert scheduler.pending_messages == ["feat: c"]
+
+    def test_accumulates_paths_for_batched_commit(self, tmp_path: Path):
+        with patch("report_agent.git_integration.auto_commit") as mock_commit:
+            scheduler = CommitScheduler(tmp_path, "per-run", push=False)
+            scheduler.section_complete("feat: a", paths=[Path("a.md")])
+            scheduler.section_complete("feat: b", paths=[Path("b.md")])
+            scheduler.finalize("chore: finalize", paths=[Path("report.md")])
+
+        assert mock_commit.call_args.kwargs["paths"] == [
+            Path("a.md"), Path("b.md"), Path("report.md")
+        ]
+
+    def test_none_paths_falls_back_to_stage_all(self, tmp_path: Path):
+        with patch("report_agent.git_integration.auto_commit") as mock_commit:
+            scheduler = CommitScheduler(tmp_path, "per-run", push=False)
+            scheduler.section_complete("feat: a", paths=[Path("a.md")])
+            scheduler.section_complete("feat: b")
+            scheduler.finalize("chore: finalize", paths=[Path("report.md")])
+
+        assert mock_commit.call_args.kwargs["paths"] is None
+
+    def test_abort_commits_held_back_sections(self, tmp_path: Path, git_calls):
+        scheduler = CommitScheduler(tmp_path, "per-run")
+        scheduler.section_complete("feat: a")
+        scheduler.section_complete("feat: b")
+
+        assert scheduler.abort("chore: partial generate-report") is True
+
+        commits = [msg for kind, msg in git_calls if kind == "commit"]
+        assert len(commits) == 1
+        assert commits[0].startswith("chore: partial generate-report (+2 more)")
+        assert "feat: a" in commits[0] and "feat: b" in commits[0]
+        assert scheduler.pending_messages == []
+
+    def test_abort_without_pending_sections_does_not_commit(self, tmp_path: Path, git_calls):
+        scheduler = CommitScheduler(tmp_path, "per-section")
+        scheduler.section_complete("feat: a")
+
+        assert scheduler.abort("chore: partial generate-report") is False
+        assert [msg for kind, msg in git_calls if kind == "commit"] == ["feat: a"]
+
+    def test_push_error_raised_on_finalize(self, tmp_path: Path):
+        def failing_push(output_root):
+            raise RuntimeError("remote rejected")
+
+        with patch("report_agent.git_integration.auto_commit"), \
+             patch("report_agent.git_integration.push_to_origin", side_effect=failing_push):
+            scheduler = CommitScheduler(tmp_path, "per-section")
+            scheduler.section_complete("feat: a")
+            with pytest.raises(RuntimeError, match="remote rejected"):
+                scheduler.finalize("chore: finalize")
+
+
+class TestPushQueue:
+    def test_coalesces_pending_pushes(self, tmp_path: Path):
+        import threading
+
+        release = threading.Event()
+        started = threading.Event()
+        pushes: list[int] = []
+
+        def slow_push(output_root):
+            started.set()
+            release.wait(timeout=5)
+            pushes.append(1)
+
+        with patch("report_agent.git_integration.push_to_origin", side_effect=slow_push):
+            queue = PushQueue(tmp_path)
+            queue.request_push()
+            assert started.wait(timeout=5)
+            for _ in range(5):
+                queue.request_push()
+            release.set()
+            queue.close()
+
+        assert len(pushes) == 2
+        assert queue.push_count == 2
+
+
 class TestChangeJournal:
     def test_create_entry(self):
         entry = create_entry(
@@ -195,6 +461,134 @@ class TestChangeJournal:
         assert "Duration: 15.7s" in formatted
 
 
+class TestSqliteJournal:
+    def _entry(self, ts: str, command: str, sections: list[str], cost: float | None = None) -> JournalEntry:
+        entry = create_entry(command, {"arg": 1}, sections_affected=sections)
+        entry.timestamp = ts
+        entry.cost_usd = cost
+        return entry
+
+    def _seed_json(self, output_root: Path) -> list[JournalEntry]:
+        entries = [
+            self._entry("2026-01-05T10:00:00+00:00", "generate-report", ["intro", "results"], 1.0),
+            self._entry("2026-01-07T10:00:00+00:00", "update-section", ["results"], 0.25),
+            self._entry("2026-01-13T09:00:00+00:00", "update-section", ["intro"], 0.5),
+        ]
+        for entry in entries:
+            save_entry(output_root, entry)
+        return entries
+
+    def test_import_switches_backend(self, tmp_path):
+        entries = self._seed_json(tmp_path)
+
+        count = import_json_entries(tmp_path)
+
+        assert count == 3
+        assert uses_sqlite_journal(tmp_path)
+        listed = list_entries(tmp_path)
+        assert [e.id for e in listed] == [e.id for e in reversed(entries)]
+        assert listed[-1].sections_affected == ["intro", "results"]
+        assert listed[-1].arguments == {"arg": 1}
+
+    def test_import_is_idempotent_and_can_remove_json(self, tmp_path):
+        self._seed_json(tmp_path)
+        import_json_entries(tmp_path)
+
+        assert import_json_entries(tmp_path, remove_json=True) == 3
+        assert list(get_journal_dir(tmp_path).glob("*.json")) == []
+        with JournalDB(get_journal_db_path(tmp_path)) as db:
+            assert db.count() == 3
+
+    def test_save_and_update_go_to_database(self, tmp_path):
+        import_json_entries(tmp_path)
+        entry = create_entry("generate-section", {}, sections_affected=["intro"])
+
+        path = save_entry(tmp_path, entry)
+        update_entry(tmp_path, entry, success=False, error_message="boom", cost_usd=0.1)
+
+        assert path == get_journal_export_path(tmp_path)
+        assert list(get_journal_dir(tmp_path).glob("*.json")) == []
+        with JournalDB(get_journal_db_path(tmp_path)) as db:
+            stored = db.get(entry.id)
+        assert stored.success is False
+        assert stored.error_message == "boom"
+        assert stored.cost_usd == 0.1
+        exported = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [e["id"] for e in exported] == [entry.id, entry.id]
+        assert exported[-1]["error_message"] == "boom"
+
+    def test_import_writes_jsonl_export(self, tmp_path):
+        entries = self._seed_json(tmp_path)
+
+        import_json_entries(tmp_path)
+        import_json_entries(tmp_path)
+
+        lines = get_journal_export_path(tmp_path).read_text().splitlines()
+        assert [json.loads(line)["id"] for line in lines] == [e.id for e in entries]
+
+    def test_query_by_section_command_and_time(self, tmp_path):
+        entries = self._seed_json(tmp_path)
+        import_json_entries(tmp_path)
+
+        with JournalDB(get_journal_db_path(tmp_path)) as db:
+            by_section = db.query(section="intro")
+            by_command = db.query(command="update-section")
+            since = db.query(since="2026-01-06")
+
+        assert [e.id for e in by_section] == [entries[2].id, entries[0].id]
+        assert [e.id for e in by_command] == [entries[2].id, entries[1].id]
+        assert [e.id for e in since] == [entries[2].id, entries[1].id]
+
+    def test_cost_by_week(self, tmp_path):
+        self._seed_json(tmp_path)
+        import_json_entries(tmp_path)
+
+        with JournalDB(get_journal_db_path(tmp_path)) as db:
+            weeks = db.cost_by_period("week")
+            with pytest.raises(ValueError):
+                db.cost_by_period("fortnight")
+
+        # 2026-01-05 and 01-07 fall in the week starting Monday 2026-01-05
+        assert weeks == [("2026-01-05", 1.25, 2), ("2026-01-12", 0.5, 1)]
+
+    def test_export_matches_files_backend(self, tmp_path):
+        json_root = tmp_path / "files"
+        self._seed_json(json_root)
+        originals = {p.name: p.read_text() for p in get_journal_dir(json_root).glob("*.json")}
+        import_json_entries(json_root)
+
+        paths = export_json_entries(json_root, tmp_path / "export")
+
+        assert {p.name: p.read_text() for p in paths} == originals
+
+    def test_journal_query_cli(self, tmp_path):
+        self._seed_json(tmp_path)
+        import_json_entries(tmp_path)
+
+        result = runner.invoke(app, [
+            "journal-query", "--output-root", str(tmp_path), "--section", "results", "--format", "json",
+        ])
+
+        assert result.exit_code == 0, result.output
+        assert len(json.loads(result.output)) == 2
+
+    def test_journal_query_cli_until(self, tmp_path):
+        entries = self._seed_json(tmp_path)
+        import_json_entries(tmp_path)
+
+        result = runner.invoke(app, [
+            "journal-query", "--output-root", str(tmp_path),
+            "--since", "2026-01-06", "--until", "2026-01-13", "--format", "json",
+        ])
+
+        assert result.exit_code == 0, result.output
+        assert [e["id"] for e in json.loads(result.output)] == [entries[1].id]
+
+    def test_journal_query_requires_database(self, tmp_path):
+        result = runner.invoke(app, ["journal-query", "--output-root", str(tmp_path)])
+        assert result.exit_code == 1
+
+
 class TestCLIIntegration:
     def test_init_report_help(self):
         result = runner.invoke(app, ["--help"])
@@ -0,0 +1,121 @@
+"""Tests for incremental HTML rendering."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from report_agent import html_render
+from report_agent.html_render import (
+    RENDER_MANIFEST_FILENAME,
+    adjust_figure_paths,
+    render_project,
+    strip_html_comments,
+)
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    (tmp_path / "report.md").write_text("# Report\n\n![Fig](figures/a.png)\n")
+    sections = tmp_path / "_sections"
+    sections.mkdir()
+    for i in range(1, 6):
+        (sections / f"{i:02d}_sec{i}.md").write_text(
+            f"## Section {i}\n\n<!-- note -->\n![Fig](figures/s{i}.png)\n"
+        )
+    return tmp_path
+
+
+class TestHelpers:
+    def test_adjust_figure_paths_root_unchanged(self):
+        content = '![A](figures/x.png) <img src="figures/y.png">'
+        assert adjust_figure_paths(content, 0) == content
+
+    def test_adjust_figure_paths_nested(self):
+        content = "![A](figures/x.png) <img src=\"figures/y.png\"> <img src='figures/z.png'>"
+        result = adjust_figure_paths(content, 1)
+        assert "![A](../figures/x.png)" in result
+        assert 'src="../figures/y.png"' in result
+        assert "src='../figures/z.png'" in result
+
+    def test_strip_html_comments_multiline(self):
+        assert strip_html_comments("a<!-- x\ny -->b") == "ab"
+
+
+class TestRenderProject:
+    def test_first_render_writes_all_files_and_manifest(self, project: Path):
+        summary = render_project(project, workers=1)
+
+        assert len(summary.rendered) == 6
+        assert summary.skipped == []
+        section_html = (project / "_sections" / "01_sec1.html").read_text()
+        assert "../figures/s1.png" in section_html
+        assert "note" not in section_html
+        manifest = json.loads((project / RENDER_MANIFEST_FILENAME).read_text())
+        assert set(manifest["files"]) == {
+            "report.md",
+            *(f"_sections/{i:02d}_sec{i}.md" for i in range(1, 6)),
+        }
+
+    def test_unchanged_files_are_skipped(self, project: Path):
+        render_project(project, workers=1)
+        (project / "_sections" / "03_sec3.md").write_text("## Section 3\n\nEdited\n")
+
+        summary = render_project(project, workers=1)
+
+        assert summary.rendered == [project / "_sections" / "03_sec3.html"]
+        assert len(summary.skipped) == 5
+        assert "Edited" in (project / "_sections" / "03_sec3.html").read_text()
+
+    def test_missing_output_is_rerendered(self, project: Path):
+        render_project(project, workers=1)
+        (project / "report.html").unlink()
+
+        summary = render_project(project, workers=1)
+
+        assert summary.rendered == [project / "report.html"]
+
+    def test_option_change_invalidates(self, project: Path):
+        render_project(project, workers=1)
+
+        summary = render_project(project, strip_comments=False, workers=1)
+
+        assert len(summary.rendered) == 6
+        assert "<!-- note -->" in (project / "_sections" / "01_sec1.html").read_text()
+
+    def test_force_rerenders_everything(self, project: Path):
+        render_project(project, workers=1)
+
+        summary = render_project(project, workers=1, force=True)
+
+        assert len(summary.rendered) == 6
+
+    def test_corrupt_manifest_triggers_full_render(self, project: Path):
+        render_project(project, workers=1)
+        (project / RENDER_MANIFEST_FILENAME).write_text("{not json")
+
+        summary = render_project(project, workers=1)
+
+        assert len(summary.rendered) == 6
+
+    def test_process_pool_matches_serial_output(self, project: Path, tmp_path_factory):
+        serial_root = tmp_path_factory.mktemp("serial")
+        for src in project.rglob("*.md"):
+            dest = serial_root / src.relative_to(project)
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            dest.write_text(src.read_text())
+
+        render_project(serial_root, workers=1)
+        summary = render_project(project, workers=2)
+
+        assert len(summary.rendered) == 6
+        for html in project.rglob("*.html"):
+            assert html.read_text() == (serial_root / html.relative_to(project)).read_text()
+
+    def test_template_change_invalidates(self, project: Path, monkeypatch):
+        render_project(project, workers=1)
+        monkeypatch.setattr(html_render, "_RENDER_FINGERPRINT", "changed")
+
+        summary = render_project(project, workers=1)
+
+        assert len(summary.rendered) == 6
@@ -0,0 +1,76 @@
+"""Import-time budget for the report-agent CLI.
+
+Runs `python -X importtime` in a fresh interpreter and checks that the CLI
+module loads without the heavy dependencies (pandas, markdown, LLM SDKs),
+which must only be imported by the commands that need them.
+"""
+
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+# Cumulative import time budget for report_agent.cli, in microseconds.
+# Typical is ~150ms; the budget leaves headroom for slow CI machines.
+CLI_IMPORT_BUDGET_US = 1_000_000
+
+HEAVY_MODULES = ("pandas", "numpy", "openai", "anthropic", "markdown")
+
+
+def _import_times(statement: str) -> dict[str, int]:
+    """Return {module: cumulative_us} from `python -X importtime -c statement`."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue
+        times[parts[2].strip()] = int(parts[1])
+    return times
+
+
+class TestCliImportTime:
+    def test_cli_import_skips_heavy_modules(self):
+        times = _import_times("import report_agent.cli")
+        loaded = [m for m in HEAVY_MODULES if m in times]
+        assert loaded == [], f"Heavy modules imported at CLI load: {loaded}"
+
+    def test_cli_import_within_budget(self):
+        times = _import_times("import report_agent.cli")
+        cumulative = times["report_agent.cli"]
+        assert cumulative < CLI_IMPORT_BUDGET_US, (
+            f"report_agent.cli import took {cumulative / 1000:.0f}ms "
+            f"(budget {CLI_IMPORT_BUDGET_US / 1000:.0f}ms)"
+        )
+
+    def test_inspect_sections_does_not_load_pandas(self, tmp_path: Path):
+        outline = tmp_path / "outline.md"
+        outline.write_text("# Intro\n\n## Details\n")
+        script = textwrap.dedent(
+            f"""
+            import sys
+            from typer.testing import CliRunner
+            from report_agent.cli import app
+            result = CliRunner().invoke(app, ["inspect-sections", "--outline", {str(outline)!r}])
+            assert result.exit_code == 0, result.output
+            print(",".join(m for m in {HEAVY_MODULES!r} if m in sys.modules))
+            """
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == ""
+
+    @pytest.mark.parametrize("module", ["report_agent", "report_agent.orchestrator"])
+    def test_package_modules_do_not_load_pandas(self, module: str):
+        times = _import_times(f"import {module}")
+        assert "pandas" not in times
@@ -0,0 +1,143 @@
+"""Tests for the rolling LLM call log."""
+
+import gzip
+import json
+import subprocess
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from report_agent.git_integration import stage_paths
+from report_agent.llm_log import CURRENT_SEGMENT, LLMCallLog
+
+
+class FakeClock:
+    def __init__(self, start: datetime):
+        self.now = start
+
+    def __call__(self) -> datetime:
+        return self.now
+
+    def advance(self, **kwargs) -> None:
+        self.now += timedelta(**kwargs)
+
+
+def _record(section_id: str, run_id: str = "run-1", size: int = 10) -> dict:
+    return {"run_id": run_id, "section_id": section_id, "response": "x" * size}
+
+
+class TestAppendAndRotate:
+    def test_append_writes_compact_jsonl(self, tmp_path: Path):
+        log = LLMCallLog(tmp_path / "_llm_calls")
+
+        assert log.append(_record("intro")) is False
+        assert log.append(_record("methods")) is False
+
+        lines = log.current_path.read_text().splitlines()
+        assert len(lines) == 2
+        first = json.loads(lines[0])
+        assert first["section_id"] == "intro"
+        assert "call_id" in first and "timestamp" in first
+        assert ", " not in lines[0]
+        assert (log.log_dir / ".gitignore").read_text().startswith(CURRENT_SEGMENT)
+
+    def test_rotates_on_size(self, tmp_path: Path):
+        log = LLMCallLog(tmp_path / "_llm_calls", max_segment_bytes=800)
+
+        rotated = [log.append(_record("intro", size=200)) for _ in range(3)]
+
+        assert rotated == [False, False, True]
+        assert not log.current_path.exists()
+        segments = list(log.segments_dir.glob("*.jsonl.gz"))
+        assert len(segments) == 1
+        with gzip.open(segments[0], "rt") as f:
+            assert len(f.read().splitlines()) == 3
+
+        index = json.loads(log.index_path.read_text())["segments"]
+        meta = index[segments[0].name]
+        assert meta["count"] == 3
+        assert meta["sections"] == ["intro"]
+        assert meta["runs"] == ["run-1"]
+
+    def test_rotates_on_age_across_instances(self, tmp_path: Path):
+        clock = FakeClock(datetime(2025, 1, 1, 9, 0))
+        LLMCallLog(tmp_path, clock=clock).append(_record("intro"))
+
+        clock.advance(hours=25)
+        assert LLMCallLog(tmp_path, clock=clock).append(_record("intro")) is True
+
+
+class TestRetention:
+    def test_drops_segments_past_max_age(self, tmp_path: Path):
+        clock = FakeClock(datetime(2025, 1, 1))
+        log = LLMCallLog(tmp_path, max_age=timedelta(days=30), clock=clock)
+        log.append(_record("old"))
+        log.rotate()
+
+        clock.advance(days=31)
+        log.append(_record("new"))
+        log.rotate()
+
+        index = json.loads(log.index_path.read_text())["segments"]
+        assert len(index) == 1
+        assert [meta["sections"] for meta in index.values()] == [["new"]]
+        assert len(list(log.segments_dir.glob("*.jsonl.gz"))) == 1
+
+    def test_total_size_stays_bounded(self, tmp_path: Path):
+        clock = FakeClock(datetime(2025, 1, 1))
+        log = LLMCallLog(
+            tmp_path,
+            max_segment_bytes=2_000,
+            max_total_bytes=3_000,
+            clock=clock,
+        )
+
+        for i in range(400):
+            clock.advance(seconds=1)
+            # Unique payloads so gzip can't collapse them to nothing
+            log.append({"section_id": f"s{i % 7}", "response": f"{i:08d}" * 60})
+
+        compressed = sum(p.stat().st_size for p in log.segments_dir.glob("*.jsonl.gz"))
+        assert compressed <= 3_000
+        assert log.total_bytes() <= 3_000 + 2_000 + 600
+
+
+class TestFind:
+    def test_find_by_section_and_run(self, tmp_path: Path):
+        log = LLMCallLog(tmp_path, max_segment_bytes=1)
+        log.append(_record("intro", run_id="a"))
+        log.append(_record("methods", run_id="a"))
+        log.append(_record("intro", run_id="b"))
+        log.max_segment_bytes = 10**6
+        log.append(_record("intro", run_id="c"))
+
+        assert [r["run_id"] for r in log.find(section_id="intro")] == ["a", "b", "c"]
+        assert [r["section_id"] for r in log.find(run_id="a")] == ["intro", "methods"]
+        assert list(log.find(section_id="missing")) == []
+
+    def test_missing_index_is_rebuilt(self, tmp_path: Path):
+        log = LLMCallLog(tmp_path, max_segment_bytes=1)
+        log.append(_record("intro"))
+        log.index_path.unlink()
+
+        assert [r["section_id"] for r in log.find(section_id="intro")] == ["intro"]
+
+
+class TestGitStaging:
+    def test_active_segment_is_not_staged(self, tmp_path: Path):
+        root = tmp_path / "report"
+        root.mkdir()
+        subprocess.run(["git", "init", "-q", "-b", "main"], cwd=root, check=True)
+        log = LLMCallLog(root / "_llm_calls", max_segment_bytes=1)
+        log.append(_record("intro"))
+        log.max_segment_bytes = 10**6
+        log.append(_record("methods"))
+
+        stage_paths(root, [log.log_dir])
+
+        staged = subprocess.run(
+            ["git", "diff", "--cached", "--name-only"],
+            cwd=root, capture_output=True, text=True, check=True,
+        ).stdout.split()
+        assert "_llm_calls/index.json" in staged
+        assert any(p.startswith("_llm_calls/segments/") for p in staged)
+        assert f"_llm_calls/{CURRENT_SEGMENT}" not in staged
@@ -0,0 +1,209 @@
+"""Tests for LLM call rate limiting, retries and section resume."""
+
+import random
+import types
+
+import pytest
+
+from report_agent.llm_scheduler import (
+    LLMScheduler,
+    RateLimits,
+    RetryPolicy,
+    TokenBucket,
+    estimate_tokens,
+    is_retryable,
+    retry_after_seconds,
+)
+from report_agent.orchestrator import UsageCost
+
+
+class FakeTime:
+    """Clock whose sleep() advances time instead of blocking."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def clock(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class APIStatusError(Exception):
+    def __init__(self, status_code: int, headers: dict | None = None):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+        self.response = types.SimpleNamespace(status_code=status_code, headers=headers or {})
+
+
+def _scheduler(fake: FakeTime, **kwargs) -> LLMScheduler:
+    return LLMScheduler(
+        limits={"openai": RateLimits(requests_per_minute=60, tokens_per_minute=6_000)},
+        clock=fake.clock,
+        sleep=fake.sleep,
+        rng=random.Random(0),
+        **kwargs,
+    )
+
+
+class TestTokenBucket:
+    def test_waits_for_refill_once_empty(self):
+        fake = FakeTime()
+        bucket = TokenBucket(60, fake.clock, fake.sleep)
+
+        for _ in range(60):
+            assert bucket.acquire() == 0
+        assert bucket.acquire() == pytest.approx(1.0)
+
+    def test_oversized_request_goes_into_debt(self):
+        fake = FakeTime()
+        bucket = TokenBucket(600, fake.clock, fake.sleep)
+
+        assert bucket.acquire(1_000) == 0
+        # 400 tokens of debt plus 1 more at 10 tokens/s
+        assert bucket.acquire(1) == pytest.approx(40.1)
+
+    def test_pause_holds_acquirers(self):
+        fake = FakeTime()
+        bucket = TokenBucket(60, fake.clock, fake.sleep)
+        bucket.pause(5)
+        assert bucket.acquire() == pytest.approx(5)
+
+
+class TestRetries:
+    def test_honours_retry_after(self):
+        fake = FakeTime()
+        calls = iter([APIStatusError(429, {"retry-after": "7"}), "ok"])
+
+        def flaky():
+            value = next(calls)
+            if isinstance(value, Exception):
+                raise value
+            return value
+
+        retries = []
+        result = _scheduler(fake).call(
+            "gpt-5.1-2025-11-13", flaky, on_retry=lambda n, e, d: retries.append((n, d))
+        )
+
+        assert result == "ok"
+        assert retries == [(1, 7.0)]
+        assert sum(fake.sleeps) >= 7.0
+
+    def test_backoff_is_capped_exponential_with_jitter(self):
+        fake = FakeTime()
+        scheduler = _scheduler(fake, policy=RetryPolicy(base_delay=1.0, max_delay=4.0))
+        error = TimeoutError()
+        for attempt in range(6):
+            delay = scheduler.backoff_delay(attempt, error)
+            assert 0 <= delay <= min(4.0, 2 ** attempt)
+
+    def test_non_retryable_error_raises_immediately(self):
+        fake = FakeTime()
+        attempts = []
+
+        def bad_request():
+            attempts.append(1)
+            raise APIStatusError(400)
+
+        with pytest.raises(APIStatusError):
+            _scheduler(fake).call("gpt-5.1-2025-11-13", bad_request)
+        assert len(attempts) == 1
+
+    def test_gives_up_after_max_attempts(self):
+        fake = FakeTime()
+        attempts = []
+
+        def overloaded():
+            attempts.append(1)
+            raise APIStatusError(529)
+
+        with pytest.raises(APIStatusError):
+            _scheduler(fake, policy=RetryPolicy(max_attempts=3)).call("claude-x", overloaded)
+        assert len(attempts) == 3
+
+    def test_token_limit_spaces_out_large_requests(self):
+        fake = FakeTime()
+        scheduler = _scheduler(fake)
+        for _ in range(3):
+            scheduler.call("gpt-5.1-2025-11-13", lambda: None, estimated_tokens=3_000)
+        # 6,000 tokens/min: the third 3,000-token request waits ~30s
+        assert fake.now == pytest.approx(30.0)
+
+
+class TestHelpers:
+    def test_is_retryable(self):
+        assert is_retryable(APIStatusError(429))
+        assert is_retryable(APIStatusError(503))
+        assert is_retryable(ConnectionError())
+        assert not is_retryable(APIStatusError(401))
+        assert not is_retryable(ValueError("bad prompt"))
+
+    def test_retry_after_ms(self):
+        assert retry_after_seconds(APIStatusError(429, {"retry-after-ms": "1500"})) == 1.5
+        assert retry_after_seconds(APIStatusError(429)) is None
+
+    def test_estimate_tokens_counts_text_images_and_output(self):
+        params = {
+            "system": [{"type": "text", "text": "x" * 400}],
+            "messages": [{"role": "user", "content": [
+                {"type": "image", "source": {"data": "y" * 10_000}},
+                {"type": "text", "text": "z" * 40},
+            ]}],
+            "max_tokens": 500,
+        }
+        assert estimate_tokens(params) == 110 + 1_000 + 500
+
+
+class TestSectionResume:
+    def test_transient_failure_is_resumed_after_other_sections(self, make_orchestrator):
+        completed = []
+        orchestrator = make_orchestrator(
+            on_section_complete=lambda result, action: completed.append(result.section_id)
+        )
+        failures = {"methods": 1}
+
+        def fake_call(prompt, charts=None):
+            section_id = orchestrator._current_section_id
+            if failures.get(section_id):
+                failures[section_id] -= 1
+                raise APIStatusError(429)
+            return f"Body of {section_id}", UsageCost()
+
+        orchestrator._call_llm = fake_call
+        orchestrator.generate_report()
+
+        assert completed == ["intro", "results", "methods"]
+
+    def test_persistent_failure_raises_after_writing_the_rest(self, make_orchestrator):
+        completed = []
+        orchestrator = make_orchestrator(
+            on_section_complete=lambda result, action: completed.append(result.section_id)
+        )
+
+        def fake_call(prompt, charts=None):
+            if orchestrator._current_section_id == "intro":
+                raise TimeoutError("read timed out")
+            return "Body", UsageCost()
+
+        orchestrator._call_llm = fake_call
+        with pytest.raises(RuntimeError, match="intro: TimeoutError"):
+            orchestrator.generate_report()
+        assert completed == ["methods", "results"]
+
+    def test_non_transient_errors_still_abort(self, make_orchestrator):
+        completed = []
+        orchestrator = make_orchestrator(
+            on_section_complete=lambda result, action: completed.append(result.section_id)
+        )
+
+        def fake_call(prompt, charts=None):
+            raise ValueError("Unsupported model")
+
+        orchestrator._call_llm = fake_call
+        with pytest.raises(ValueError):
+            orchestrator.generate_report()
+        assert completed == []
@@ -0,0 +1,172 @@
+"""Tests for the incremental outline cache."""
+
+import json
+from dataclasses import asdict
+from pathlib import Path
+
+import pytest
+
+from report_agent.outline_cache import OutlineIndex, load_outline, outline_cache_path
+from report_agent.outline_parser import parse_outline
+
+
+def _outline_text(n: int, edited: int | None = None) -> str:
+    parts = []
+    for i in range(n):
+        level = 1 if i % 5 == 0 else 2
+        body = "Edited body." if i == edited else f"Body of section {i}."
+        parts.append(
+            f"{'#' * level} Section {i}\n"
+            f"<!-- Section instructions: Write section {i} -->\n"
+            f"<!-- Review comments: RATING: clarity={i % 5} -->\n"
+            f"\n{body}\n\n"
+        )
+    return "".join(parts)
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> Path:
+    return outline_cache_path(tmp_path / "output")
+
+
+@pytest.fixture
+def outline(tmp_path: Path) -> Path:
+    path = tmp_path / "outline.md"
+    path.write_text(_outline_text(100))
+    return path
+
+
+def _as_dicts(sections):
+    return [asdict(s) for s in sections]
+
+
+class TestLoadOutline:
+    def test_matches_full_parse(self, outline: Path, cache: Path):
+        index = load_outline(outline, cache)
+
+        assert _as_dicts(index.sections) == _as_dicts(parse_outline(outline))
+        assert index.reparsed == 100
+        assert cache.exists()
+
+    def test_unchanged_file_served_from_cache(self, outline: Path, cache: Path):
+        load_outline(outline, cache)
+
+        index = load_outline(outline, cache)
+
+        assert index.reparsed == 0
+        assert _as_dicts(index.sections) == _as_dicts(parse_outline(outline))
+
+    def test_only_edited_region_reparsed(self, outline: Path, cache: Path):
+        load_outline(outline, cache)
+        outline.write_text(_outline_text(100, edited=42))
+
+        index = load_outline(outline, cache)
+
+        assert index.reparsed == 1
+        assert index.get("section-42").content == "Edited body."
+        assert _as_dicts(index.sections) == _as_dicts(parse_outline(outline))
+
+    def test_parent_ids_recomputed_when_hierarchy_changes(self, outline: Path, cache: Path):
+        load_outline(outline, cache)
+        # Promote section 3 to level 1: sections 4 now hangs off it
+        outline.write_text(_outline_text(100).replace("## Section 3\n", "# Section 3\n"))
+
+        index = load_outline(outline, cache)
+
+        assert index.reparsed == 1
+        assert index.get("section-4").parent_id == "section-3"
+        assert _as_dicts(index.sections) == _as_dicts(parse_outline(outline))
+
+    def test_fenced_headings_do_not_split_regions(self, tmp_path: Path, cache: Path):
+        path = tmp_path / "outline.md"
+        path.write_text("# A\n```\n# not a heading\n```\n## B\ntext\n")
+
+        index = load_outline(path, cache)
+
+        assert [s.id for s in index.sections] == ["a", "b"]
+        assert _as_dicts(index.sections) == _as_dicts(parse_outline(path))
+
+    def test_corrupt_cache_ignored(self, outline: Path, cache: Path):
+        load_outline(outline, cache)
+        cache.write_text("{broken")
+
+        index = load_outline(outline, cache)
+
+        assert index.reparsed == 100
+        assert len(index) == 100
+
+    def test_cached_sections_are_independent_objects(self, outline: Path, cache: Path):
+        load_outline(outline, cache)
+        first = load_outline(outline, cache)
+        first.sections[0].review_ratings["clarity"] = 99
+
+        second = load_outline(outline, cache)
+
+        assert second.sections[0].review_ratings == {"clarity": 0}
+
+    def test_without_cache_path_nothing_is_written(self, outline: Path, tmp_path: Path):
+        index = load_outline(outline)
+
+        assert index.reparsed == 100
+        assert _as_dicts(index.sections) == _as_dicts(parse_outline(outline))
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["outline.md"]
+
+    def test_cache_stores_region_hashes_only(self, outline: Path, cache: Path):
+        load_outline(outline, cache)
+
+        region = json.loads(cache.read_text())["regions"][0]
+
+        assert set(region) == {"hash", "section"}
+
+
+class TestOutlineIndex:
+    def test_lookup_maps(self, outline: Path):
+        index = load_outline(outline)
+
+        assert index.get("section-7").title == "Section 7"
+        assert index.get("missing") is None
+        assert index.index_of("section-7") == 7
+        assert index.position(index.sections[99]) == 99
+
+    def test_duplicate_ids_keep_first_and_position_by_identity(self, tmp_path: Path):
+        path = tmp_path / "outline.md"
+        path.write_text("# Notes\none\n# Notes\ntwo\n")
+
+        index = load_outline(path)
+
+        assert index.get("notes").content == "one"
+        assert index.position(index.sections[1]) == 1
+
+    def test_empty_index(self):
+        index = OutlineIndex([])
+        assert index.get("x") is None
+        assert len(index) == 0
+
+
+class TestOrchestratorOutlineCache:
+    def test_cache_kept_in_project_only_for_writing_runs(self, outline: Path, tmp_path: Path):
+        from report_agent.orchestrator import ReportOrchestrator
+
+        (tmp_path / "data").mkdir()
+        output = tmp_path / "output"
+
+        ReportOrchestrator(outline_path=outline, data_root=tmp_path / "data", output_dir=output, dry_run=True)
+        assert not outline_cache_path(output).exists()
+
+        ReportOrchestrator(outline_path=outline, data_root=tmp_path / "data", output_dir=output)
+        rerun = ReportOrchestrator(outline_path=outline, data_root=tmp_path / "data", output_dir=output)
+
+        assert rerun._outline.reparsed == 0
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["data", "outline.md", "output"]
+
+    def test_cache_is_not_read_as_a_journal_entry(self, outline: Path, tmp_path: Path):
+        from report_agent.change_journal import create_entry, list_entries, save_entry
+        from report_agent.orchestrator import ReportOrchestrator
+
+        (tmp_path / "data").mkdir()
+        output = tmp_path / "output"
+        ReportOrchestrator(outline_path=outline, data_root=tmp_path / "data", output_dir=output)
+        save_entry(output, create_entry("generate-report", {}))
+
+        assert outline_cache_path(output).exists()
+        assert [e.command for e in list_entries(output, limit=1)] == ["generate-report"]
@@ -1,6 +1,6 @@
 import pytest
 from pathlib import Path
-from report_agent.outline_parser import Section, parse_outline, slugify, parse_review_block
+from report_agent.outline_parser import Section, iter_sections, parse_outline, slugify, parse_review_block
 
 
 class TestSlugify:
@@ -141,6 +141,72 @@ class TestParseOutline:
         assert "It has multiple lines." in sections[0].content
 
 
+class TestStreamingParser:
+    def test_headings_in_fenced_code_are_content(self):
+        sections = list(iter_sections([
+            "# Intro\n",
+            "```bash\n",
+            "# not a heading\n",
+            "```\n",
+            "## Next\n",
+        ]))
+
+        assert [s.id for s in sections] == ["intro", "next"]
+        assert "# not a heading" in sections[0].content
+
+    def test_tilde_fence(self):
+        sections = list(iter_sections(["# A\n", "~~~\n", "## B\n", "~~~\n"]))
+        assert len(sections) == 1
+
+    def test_yields_lazily(self):
+        def lines():
+            yield "# One\n"
+            yield "body\n"
+            yield "# Two\n"
+            raise AssertionError("read past the second heading")
+
+        first = next(iter_sections(lines()))
+        assert first.id == "one"
+        assert first.content == "body"
+
+    def test_multiline_comments_and_inline_text(self):
+        sections = list(iter_sections([
+            "# A\n",
+            "Before <!-- Section instructions:\n",
+            "  Write it\n",
+            "--> after\n",
+            "<!-- other comment -->\n",
+            "<!-- Review comments: AUTHOR: Bo\n",
+            "RATING: clarity=3 -->\n",
+        ]))
+
+        section = sections[0]
+        assert section.instructions == "Write it"
+        assert section.review_author == "Bo"
+        assert section.review_ratings == {"clarity": 3}
+        assert section.content == "Before  after\n<!-- other comment -->"
+
+    def test_only_first_instruction_comment_used(self):
+        sections = list(iter_sections([
+            "# A\n",
+            "<!-- Section instructions: first -->\n",
+            "<!-- Section instructions: second -->\n",
+        ]))
+        assert sections[0].instructions == "first"
+        assert sections[0].content == ""
+
+    def test_unterminated_comment_kept_as_content(self):
+        sections = list(iter_sections(["# A\n", "<!-- Section instructions: x\n", "# B\n"]))
+        assert sections[0].instructions == ""
+        assert sections[0].content == "<!-- Section instructions: x"
+        assert sections[1].id == "b"
+
+    def test_text_before_first_heading_ignored(self):
+        sections = list(iter_sections(["preamble\n", "<!-- x -->\n", "# A\n"]))
+        assert len(sections) == 1
+        assert sections[0].content == ""
+
+
 class TestIntegrationWithRealFile:
     def test_parse_real_outline(self):
         outline_path = Path(__file__).parent.parent.parent.parent.parent / "data" / "example-outputs" / "ampol2025" / "report-outline.md"
@@ -0,0 +1,116 @@
+"""Tests for prompt-prefix caching of section prompts."""
+
+import os
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+from report_agent.orchestrator import UsageCost
+from report_agent.report_state import CanonicalFigure, ReportState
+
+MODEL = "claude-sonnet-4-20250514"
+OUTLINE = "# Intro\n\n# Methods\n\n## Data Sources\n\n# Results\n"
+
+
+def _save_state(tmp_path: Path, *figures: CanonicalFigure) -> Path:
+    state = ReportState.new("demo")
+    state.figures.extend(figures)
+    path = tmp_path / "output" / "report_state.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    state.save(path)
+    return path
+
+
+class TestReportContext:
+    def test_lists_outline_and_figure_registry(self, tmp_path: Path, make_orchestrator):
+        _save_state(tmp_path, CanonicalFigure("F1", "emissions_trend", "results", "Emissions over time"))
+        context = make_orchestrator(OUTLINE, model=MODEL).build_report_context()
+
+        assert "- Intro (`intro`)" in context
+        assert "  - Data Sources (`data-sources`)" in context
+        assert "**F1** (emissions_trend)" in context
+
+    def test_rebuilt_when_report_state_changes(self, tmp_path: Path, make_orchestrator):
+        orchestrator = make_orchestrator(OUTLINE, model=MODEL)
+        assert "Canonical Figure Registry" not in orchestrator.build_report_context()
+
+        state_path = _save_state(tmp_path, CanonicalFigure("F2", "costs", "methods", "Costs"))
+        os.utime(state_path, ns=(1, 1))
+        assert "**F2** (costs)" in orchestrator.build_report_context()
+
+
+class TestCacheBreakpoints:
+    def test_anthropic_prefix_is_stable_with_breakpoint(self, make_orchestrator):
+        orchestrator = make_orchestrator(OUTLINE, model=MODEL)
+        intro, _ = orchestrator._anthropic_request(
+            orchestrator.build_section_prompt(orchestrator.get_section("intro"), []), []
+        )
+        results, _ = orchestrator._anthropic_request(
+            orchestrator.build_section_prompt(orchestrator.get_section("results"), []), []
+        )
+
+        assert intro["system"] == results["system"]
+        assert intro["system"][-1]["cache_control"] == {"type": "ephemeral"}
+        assert "Report Outline" in intro["system"][-1]["text"]
+        assert "'Intro'" in intro["messages"][0]["content"][-1]["text"]
+        assert "'Results'" in results["messages"][0]["content"][-1]["text"]
+
+    def test_openai_orders_shared_prefix_first(self, make_orchestrator):
+        orchestrator = make_orchestrator(OUTLINE, model="gpt-5.1-2025-11-13")
+        intro, _ = orchestrator._openai_request("intro prompt", [])
+        methods, _ = orchestrator._openai_request("methods prompt", [])
+
+        assert intro["messages"][:2] == methods["messages"][:2]
+        assert "Report Outline" in intro["messages"][1]["content"]
+        assert intro["messages"][-1]["content"][0]["text"] == "intro prompt"
+
+
+class TestCacheUsage:
+    def test_usage_cost_sums_cache_tokens(self):
+        total = UsageCost(input_tokens=10, cache_read_tokens=4) + UsageCost(
+            input_tokens=5, cache_read_tokens=1, cache_write_tokens=2
+        )
+        assert (total.input_tokens, total.cache_read_tokens, total.cache_write_tokens) == (15, 5, 2)
+
+    def test_cached_tokens_are_billed_at_cache_rate(self, make_orchestrator):
+        orchestrator = make_orchestrator(OUTLINE, model=MODEL)
+        full = orchestrator._calculate_cost("claude-sonnet-4-20250514", 1_000_000, 0)
+        cached = orchestrator._calculate_cost(
+            "claude-sonnet-4-20250514", 1_000_000, 0, cache_read_tokens=1_000_000
+        )
+        assert full == pytest.approx(3.00)
+        assert cached == pytest.approx(0.30)
+
+    def test_anthropic_call_records_cache_reads(self, make_orchestrator, monkeypatch):
+        captured = {}
+        usage = types.SimpleNamespace(
+            input_tokens=100,
+            output_tokens=50,
+            cache_read_input_tokens=2_000,
+            cache_creation_input_tokens=0,
+        )
+
+        class FakeMessages:
+            def create(self, **params):
+                captured.update(params)
+                return types.SimpleNamespace(
+                    content=[types.SimpleNamespace(type="text", text="Section body")],
+                    usage=usage,
+                )
+
+        class FakeAnthropic:
+            def __init__(self, **kwargs):
+                self.messages = FakeMessages()
+
+        monkeypatch.setitem(sys.modules, "anthropic", types.SimpleNamespace(Anthropic=FakeAnthropic))
+        orchestrator = make_orchestrator(OUTLINE, model=MODEL)
+
+        text, cost = orchestrator._call_anthropic("prompt", [])
+
+        assert text == "Section body"
+        assert captured["system"][-1]["cache_control"] == {"type": "ephemeral"}
+        assert cost.input_tokens == 2_100
+        assert cost.cache_read_tokens == 2_000
+        assert cost.cost_usd == pytest.approx((100 * 3.00 + 2_000 * 0.30 + 50 * 15.00) / 1_000_000)
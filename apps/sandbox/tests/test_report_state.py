@@ -11,6 +11,7 @@ from report_agent.report_state import (
     CanonicalTable,
     ReportState,
     SectionStateMeta,
+    wal_path_for,
 )
 
 
@@ -295,3 +296,278 @@ class TestSectionMetaManagement:
         state.increment_section_version("results")
         
         assert state.is_section_stale("results") is True
+
+
+class TestIndexedLookups:
+    """Tests for index consistency and monotonic ID allocation."""
+    
+    def test_direct_append_is_indexed(self):
+        state = ReportState.new("test")
+        state.register_figure("a", "sec1", "A")
+        state.figures.append(CanonicalFigure("F7", "b", "sec2", "B", "chart-b"))
+        
+        assert state.find_figure_by_semantic_key("b").id == "F7"
+        assert state.find_figure_by_chart_id("chart-b").id == "F7"
+        assert state.get_next_figure_id() == "F8"
+    
+    def test_list_replacement_is_indexed(self):
+        state = ReportState.new("test")
+        state.register_figure("old", "sec1", "Old")
+        state.figures = [CanonicalFigure("F2", "new", "sec1", "New")]
+        
+        assert state.find_figure_by_semantic_key("old") is None
+        assert state.find_figure_by_semantic_key("new").id == "F2"
+    
+    def test_same_length_replacement_is_indexed(self):
+        state = ReportState.new("test")
+        state.register_figure("old", "sec1", "Old", "chart-old")
+        state.find_figure_by_semantic_key("old")
+        state.figures[0] = CanonicalFigure("F1", "new", "sec2", "New", "chart-new")
+
+        assert state.find_figure_by_semantic_key("old") is None
+        assert state.find_figure_by_chart_id("chart-new").semantic_key == "new"
+        assert [f.id for f in state.get_figures_for_section("sec2")] == ["F1"]
+
+    def test_first_match_wins(self):
+        state = ReportState.new("test")
+        first = state.register_figure("dup", "sec1", "One", "chart-1")
+        state.register_figure("dup", "sec2", "Two", "chart-1")
+        
+        assert state.find_figure_by_semantic_key("dup") is first
+        assert state.find_figure_by_chart_id("chart-1") is first
+    
+    def test_reindex_after_in_place_edit(self):
+        state = ReportState.new("test")
+        fig = state.register_figure("a", "sec1", "A")
+        fig.owner_section = "sec2"
+        state.reindex()
+        
+        assert state.get_figures_for_section("sec1") == []
+        assert state.get_figures_for_section("sec2") == [fig]
+    
+    def test_get_figures_for_section_returns_copy(self):
+        state = ReportState.new("test")
+        state.register_figure("a", "sec1", "A")
+        state.get_figures_for_section("sec1").clear()
+        
+        assert len(state.get_figures_for_section("sec1")) == 1
+    
+    def test_ids_not_reused_after_removal(self):
+        state = ReportState.new("test")
+        state.register_figure("a", "sec1", "A")
+        state.register_figure("b", "sec1", "B")
+        state.register_table("t", "sec1", "T")
+        state.figures.pop()
+        state.tables.clear()
+        
+        assert state.get_next_figure_id() == "F3"
+        assert state.get_next_table_id() == "T2"
+    
+    def test_counters_survive_save_and_load(self, tmp_path):
+        state = ReportState.new("test")
+        for i in range(3):
+            state.register_figure(f"k{i}", "sec1", "cap")
+        state.figures = state.figures[:1]
+        path = tmp_path / "report_state.json"
+        state.save(path)
+        
+        loaded = ReportState.load(path)
+        
+        assert loaded.get_next_figure_id() == "F4"
+        assert loaded.find_figure_by_semantic_key("k0").id == "F1"
+    
+    def test_load_without_counters(self, tmp_path):
+        path = tmp_path / "report_state.json"
+        path.write_text(json.dumps({
+            "report_id": "legacy",
+            "figures": [{"id": "F2", "semantic_key": "a", "owner_section": "s", "caption": ""}],
+        }))
+        
+        loaded = ReportState.load(path)
+        
+        assert loaded.get_next_figure_id() == "F3"
+    
+    def test_inherit_counters(self):
+        old = ReportState.new("test")
+        for i in range(5):
+            old.register_figure(f"k{i}", "sec1", "cap")
+        new = ReportState(report_id="test", figures=[CanonicalFigure("F1", "k0", "sec1", "cap")])
+        new.inherit_counters(old)
+        
+        assert new.get_next_figure_id() == "F6"
+        assert new.find_figure_by_semantic_key("k0").id == "F1"
+    
+    def test_bulk_registration(self):
+        state = ReportState.new("test")
+        for i in range(5000):
+            state.register_figure(f"k{i}", f"sec{i % 50}", "cap", f"chart-{i}")
+        
+        assert state.get_next_figure_id() == "F5001"
+        assert state.find_figure_by_chart_id("chart-4321").id == "F4322"
+        assert len(state.get_figures_for_section("sec7")) == 100
+
+    
+    def test_upsert_keeps_lookups_in_list_order(self):
+        state = ReportState.new("test")
+        state.register_figure("a", "sec1", "A", "chart-a")
+        state.register_figure("b", "sec1", "B", "chart-b")
+        
+        state.upsert_figure(CanonicalFigure("F2", "a", "sec2", "B moved", "chart-b"))
+        state.upsert_figure(CanonicalFigure("F1", "c", "sec2", "A renamed", "chart-a"))
+        
+        assert state.find_figure_by_semantic_key("a").id == "F2"
+        assert state.find_figure_by_semantic_key("c").id == "F1"
+        assert [f.id for f in state.get_figures_for_section("sec2")] == ["F1", "F2"]
+        assert state.get_figures_for_section("sec1") == []
+    
+    def test_apply_update_indexes_each_entry_a_bounded_number_of_times(self, monkeypatch):
+        from report_agent import report_state
+        
+        state = ReportState.new("test")
+        for i in range(2000):
+            state.register_figure(f"k{i}", "sec1", "cap", f"chart-{i}")
+        update = ReportState(report_id="test", figures=[
+            CanonicalFigure(f"F{i}", f"k{i - 1}", "sec2", "new cap", f"chart-{i - 1}") for i in range(1, 2000, 2)
+        ])
+        indexed = []
+        original = report_state._ArtifactIndex._index
+        monkeypatch.setattr(
+            report_state._ArtifactIndex, "_index",
+            lambda self, item, position: indexed.append(item) or original(self, item, position),
+        )
+        
+        state.apply_update(update)
+        
+        # One rebuild after the bulk removal, then in-place updates
+        assert len(indexed) <= 1000
+        assert len(state.figures) == 1000
+        assert state.find_figure_by_chart_id("chart-1998").caption == "new cap"
+        assert state.find_figure_by_chart_id("chart-1999") is None
+
+class TestWriteAheadLog:
+    """Tests for WAL-backed persistence."""
+    
+    def test_mutations_survive_without_checkpoint(self, tmp_path):
+        path = tmp_path / "report_state.json"
+        state = ReportState.open_with_wal(path, "test", fsync=False)
+        state.register_figure("a", "sec1", "A", "chart-a")
+        state.register_table("t", "sec1", "T")
+        state.increment_section_version("sec1")
+        state.mark_section_integrated("sec1")
+        # Simulate a crash: no close(), no save()
+        
+        loaded = ReportState.load(path)
+        
+        assert loaded.find_figure_by_chart_id("chart-a").id == "F1"
+        assert loaded.find_table_by_semantic_key("t").id == "T1"
+        assert loaded.section_meta["sec1"].version == 2
+        assert loaded.is_section_stale("sec1") is False
+    
+    def test_wal_lines_are_compact(self, tmp_path):
+        path = tmp_path / "report_state.json"
+        state = ReportState.open_with_wal(path, "test", fsync=False)
+        state.register_figure("a", "sec1", "A")
+        
+        lines = wal_path_for(path).read_text().splitlines()
+        
+        assert len(lines) == 2
+        assert json.loads(lines[1])["op"] == "register_figure"
+        assert ": " not in lines[1]
+    
+    def test_checkpoint_after_threshold(self, tmp_path):
+        path = tmp_path / "report_state.json"
+        state = ReportState.open_with_wal(path, "test", checkpoint_every=3, fsync=False)
+        for i in range(4):
+            state.register_figure(f"k{i}", "sec1", "cap")
+        
+        snapshot = json.loads(path.read_text())
+        
+        assert len(snapshot["figures"]) == 3
+        assert len(wal_path_for(path).read_text().splitlines()) == 2
+        assert len(ReportState.load(path).figures) == 4
+    
+    def test_close_checkpoints(self, tmp_path):
+        path = tmp_path / "report_state.json"
+        state = ReportState.open_with_wal(path, "test", fsync=False)
+        state.register_figure("a", "sec1", "A")
+        state.close()
+        
+        assert len(json.loads(path.read_text())["figures"]) == 1
+        assert len(wal_path_for(path).read_text().splitlines()) == 1
+    
+    def test_torn_last_line_ignored(self, tmp_path):
+        path = tmp_path / "report_state.json"
+        state = ReportState.open_with_wal(path, "test", fsync=False)
+        state.register_figure("a", "sec1", "A")
+        with open(wal_path_for(path), "a") as f:
+            f.write('{"op":"register_figure","figure":{"id":"F2"')
+        
+        loaded = ReportState.load(path)
+        
+        assert [f.id for f in loaded.figures] == ["F1"]
+    
+    def test_stale_wal_not_replayed(self, tmp_path):
+        path = tmp_path / "report_state.json"
+        state = ReportState.open_with_wal(path, "test", fsync=False)
+        state.register_figure("a", "sec1", "A")
+        wal_text = wal_path_for(path).read_text()
+        state.save(path)
+        # Crash between snapshot replace and WAL reset: old log still on disk
+        wal_path_for(path).write_text(wal_text)
+        
+        loaded = ReportState.load(path)
+        
+        assert len(loaded.figures) == 1
+    
+    def test_reopen_continues_log(self, tmp_path):
+        path = tmp_path / "report_state.json"
+        first = ReportState.open_with_wal(path, "test", fsync=False)
+        first.register_figure("a", "sec1", "A")
+        
+        second = ReportState.open_with_wal(path, "test", fsync=False)
+        second.register_figure("b", "sec1", "B")
+        
+        assert [f.id for f in ReportState.load(path).figures] == ["F1", "F2"]
+    
+    def test_plain_save_discards_foreign_wal(self, tmp_path):
+        path = tmp_path / "report_state.json"
+        state = ReportState.open_with_wal(path, "test", fsync=False)
+        state.register_figure("a", "sec1", "A")
+        
+        replacement = ReportState.new("test")
+        replacement.save(path)
+        
+        assert not wal_path_for(path).exists()
+        assert ReportState.load(path).figures == []
+    
+    def test_save_is_atomic_rename(self, tmp_path):
+        path = tmp_path / "report_state.json"
+        ReportState.new("test").save(path)
+        
+        assert not (tmp_path / "report_state.json.tmp").exists()
+        assert json.loads(path.read_text())["report_id"] == "test"
+
+    def test_apply_update_logs_only_differences(self, tmp_path):
+        path = tmp_path / "report_state.json"
+        state = ReportState.open_with_wal(path, "test", fsync=False)
+        state.register_figure("a", "sec1", "A")
+        state.register_figure("b", "sec1", "B")
+        update = ReportState(
+            report_id="test",
+            figures=[CanonicalFigure("F1", "a", "sec1", "A"), CanonicalFigure("F3", "c", "sec2", "C")],
+            tables=[CanonicalTable("T1", "t", "sec2", "T")],
+            section_meta={"sec2": SectionStateMeta("sec2", version=2, last_integrated_version=2)},
+        )
+
+        state.apply_update(update)
+
+        ops = [json.loads(line)["op"] for line in wal_path_for(path).read_text().splitlines()[1:]]
+        assert ops == [
+            "register_figure", "register_figure",
+            "remove_figure", "upsert_figure", "upsert_table", "set_section_meta",
+        ]
+        loaded = ReportState.load(path)
+        assert [f.id for f in loaded.figures] == ["F1", "F3"]
+        assert loaded.find_figure_by_semantic_key("b") is None
+        assert loaded.section_meta["sec2"].last_integrated_version == 2
+        assert loaded.get_next_figure_id() == "F4"
@@ -0,0 +1,96 @@
+"""Tests for run manifests and resumable generate-report runs."""
+
+from pathlib import Path
+
+import pytest
+
+from report_agent.orchestrator import UsageCost
+from report_agent.run_manifest import STATUS_COMPLETED, STATUS_FAILED, RunManifest, content_hash
+
+
+def _stub_llm(orchestrator, calls: list[str], fail: frozenset[str] = frozenset()):
+    """Record each section's LLM call and answer "Body of <id>" at $0.50."""
+
+    def fake_call(prompt, charts=None):
+        section_id = orchestrator._current_section_id
+        calls.append(section_id)
+        if section_id in fail:
+            raise ValueError("model refused")
+        return f"Body of {section_id}", UsageCost(cost_usd=0.5)
+
+    orchestrator._call_llm = fake_call
+    return orchestrator
+
+
+class TestRunManifest:
+    def test_roundtrip(self, tmp_path: Path):
+        manifest = RunManifest.create(tmp_path, "run-1", "generate-report", "gpt-x")
+        manifest.mark_completed("intro", "p1", "content", 0.25)
+        manifest.mark_failed("methods", "p2", "TimeoutError: slow")
+
+        loaded = RunManifest.load(tmp_path, "run-1")
+
+        assert loaded.path == tmp_path / "_report_log" / "runs" / "run-1.json"
+        assert loaded.sections["intro"].status == STATUS_COMPLETED
+        assert loaded.sections["intro"].output_hash == content_hash("content")
+        assert loaded.sections["methods"].status == STATUS_FAILED
+        assert loaded.completed_ids() == ["intro"]
+
+    def test_missing_run(self, tmp_path: Path):
+        with pytest.raises(FileNotFoundError, match="nope"):
+            RunManifest.load(tmp_path, "nope")
+
+    def test_is_complete_checks_prompt_and_output(self, tmp_path: Path):
+        manifest = RunManifest.create(tmp_path, "run-1", "generate-report", "gpt-x")
+        section_file = tmp_path / "01_intro.md"
+        section_file.write_text("content")
+        manifest.mark_completed("intro", "p1", "content", 0.0)
+
+        assert manifest.is_complete("intro", "p1", section_file)
+        assert not manifest.is_complete("intro", "p2", section_file)
+        section_file.write_text("truncated")
+        assert not manifest.is_complete("intro", "p1", section_file)
+        assert not manifest.is_complete("methods", "p1", section_file)
+
+
+class TestResume:
+    def test_resume_skips_completed_sections(self, tmp_path: Path, make_orchestrator):
+        manifest = RunManifest.create(tmp_path / "output", "run-1", "generate-report", "gpt-x")
+        calls = []
+        with pytest.raises(ValueError):
+            _stub_llm(make_orchestrator(run_manifest=manifest), calls, fail=frozenset({"methods"})).generate_report()
+        assert calls == ["intro", "methods"]
+
+        saved = RunManifest.load(tmp_path / "output", "run-1")
+        assert saved.sections["intro"].status == STATUS_COMPLETED
+        assert saved.sections["methods"].status == STATUS_FAILED
+        assert "model refused" in saved.sections["methods"].error
+
+        calls = []
+        orchestrator = _stub_llm(make_orchestrator(run_manifest=saved), calls)
+        _, usage = orchestrator.generate_report()
+
+        assert orchestrator.run_id == "run-1"
+        assert calls == ["methods", "results"]
+        assert usage.cost_usd == pytest.approx(1.0)
+        assert RunManifest.load(tmp_path / "output", "run-1").completed_ids() == ["intro", "methods", "results"]
+
+    def test_changed_instructions_regenerate_section(self, tmp_path: Path, make_orchestrator):
+        manifest = RunManifest.create(tmp_path / "output", "run-1", "generate-report", "gpt-x")
+        _stub_llm(make_orchestrator(run_manifest=manifest), []).generate_report()
+
+        (tmp_path / "outline.md").write_text(
+            "# Intro\n\n# Methods\n<!-- Section instructions: Cover data sources -->\n\n# Results\n"
+        )
+        calls = []
+        saved = RunManifest.load(tmp_path / "output", "run-1")
+        _stub_llm(make_orchestrator(run_manifest=saved), calls).generate_report()
+
+        assert calls == ["methods"]
+
+    def test_written_manifest_is_recorded_for_staging(self, tmp_path: Path, make_orchestrator):
+        manifest = RunManifest.create(tmp_path / "output", "run-1", "generate-report", "gpt-x")
+        orchestrator = _stub_llm(make_orchestrator(run_manifest=manifest), [])
+        orchestrator.generate_report()
+
+        assert manifest.path in orchestrator.consume_written_paths()
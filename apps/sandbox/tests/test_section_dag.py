@@ -0,0 +1,215 @@
+"""Tests for dependency-aware section scheduling."""
+
+import json
+import threading
+from pathlib import Path
+
+import pytest
+
+from report_agent.orchestrator import UsageCost
+from report_agent.outline_cache import load_outline
+from report_agent.outline_parser import parse_outline
+from report_agent.section_dag import build_dependencies, dependency_waves, is_summary_section, run_dag
+
+OUTLINE = """# Overview
+
+## Emissions
+
+## Transport
+
+# Methods
+
+# Executive Summary
+<!-- Depends on: overview, methods -->
+"""
+
+
+def _sections(tmp_path: Path, text: str = OUTLINE):
+    path = tmp_path / "outline.md"
+    path.write_text(text)
+    return parse_outline(path)
+
+
+class TestDependencies:
+    def test_depends_on_comment_is_parsed_and_cached(self, tmp_path: Path):
+        sections = _sections(tmp_path)
+        assert sections[-1].depends_on == ["overview", "methods"]
+        assert "Depends on" not in sections[-1].content
+
+        path = tmp_path / "outline.md"
+        cache_path = tmp_path / "outline-cache.json"
+        load_outline(path, cache_path)  # Populates the cache
+        cached = load_outline(path, cache_path)
+        assert cached.reparsed == 0
+        assert cached.sections == sections
+
+    def test_summary_parents_wait_for_children(self, tmp_path: Path):
+        deps = build_dependencies(_sections(tmp_path))
+
+        assert deps["overview"] == ["emissions", "transport"]
+        assert deps["emissions"] == []
+        assert deps["methods"] == []
+        assert deps["executive-summary"] == ["overview", "methods"]
+
+    def test_non_summary_parent_does_not_wait(self, tmp_path: Path):
+        deps = build_dependencies(_sections(tmp_path, "# Results\n\n## Emissions\n"))
+        assert deps["results"] == []
+
+    def test_declared_dependencies_are_merged(self, tmp_path: Path):
+        deps = build_dependencies(_sections(tmp_path), {"methods": ["transport"]})
+        assert deps["methods"] == ["transport"]
+
+    def test_unknown_section_raises(self, tmp_path: Path):
+        with pytest.raises(ValueError, match="unknown section 'missing'"):
+            build_dependencies(_sections(tmp_path), {"methods": ["missing"]})
+
+    def test_cycle_raises(self, tmp_path: Path):
+        with pytest.raises(ValueError, match="cycle"):
+            build_dependencies(_sections(tmp_path), {"methods": ["executive-summary"]})
+
+    def test_summary_titles(self, tmp_path: Path):
+        sections = {s.id: s for s in _sections(tmp_path)}
+        assert is_summary_section(sections["overview"])
+        assert is_summary_section(sections["executive-summary"])
+        assert not is_summary_section(sections["methods"])
+
+
+class TestRunDag:
+    def test_dependents_start_after_their_inputs(self, tmp_path: Path):
+        sections = _sections(tmp_path)
+        order = []
+        lock = threading.Lock()
+
+        def process(section):
+            with lock:
+                order.append(section.id)
+
+        failed, blocked = run_dag(sections, build_dependencies(sections), process, max_workers=4)
+
+        assert (failed, blocked) == ({}, {})
+        assert order.index("overview") > max(order.index("emissions"), order.index("transport"))
+        assert order.index("executive-summary") == len(order) - 1
+
+    def test_leaves_run_concurrently(self, tmp_path: Path):
+        sections = _sections(tmp_path)
+        # Every leaf must be in flight at once for the barrier to release
+        barrier = threading.Barrier(3, timeout=5)
+
+        def process(section):
+            if section.id in ("emissions", "transport", "methods"):
+                barrier.wait()
+
+        run_dag(sections, build_dependencies(sections), process, max_workers=3)
+
+    def test_single_worker_runs_in_outline_order(self, tmp_path: Path):
+        sections = _sections(tmp_path)
+        order = []
+        run_dag(sections, build_dependencies(sections), lambda s: order.append(s.id))
+        assert order == ["emissions", "transport", "overview", "methods", "executive-summary"]
+
+    def test_failure_blocks_only_dependents(self, tmp_path: Path):
+        sections = _sections(tmp_path)
+        ran = []
+
+        def process(section):
+            if section.id == "transport":
+                raise TimeoutError("slow")
+            ran.append(section.id)
+
+        failed, blocked = run_dag(
+            sections, build_dependencies(sections), process, should_abort=lambda e: False
+        )
+
+        assert list(failed) == ["transport"]
+        assert blocked == {"overview": "transport", "executive-summary": "transport"}
+        assert ran == ["emissions", "methods"]
+
+    def test_aborting_error_stops_unstarted_sections(self, tmp_path: Path):
+        sections = _sections(tmp_path)
+        ran = []
+
+        def process(section):
+            ran.append(section.id)
+            raise ValueError("bad")
+
+        with pytest.raises(ValueError):
+            run_dag(sections, build_dependencies(sections), process)
+        assert ran == ["emissions"]
+
+
+class TestDependencyWaves:
+    def test_waves_follow_dependency_levels(self, tmp_path: Path):
+        sections = _sections(tmp_path)
+
+        waves = dependency_waves(sections, build_dependencies(sections))
+
+        assert [[s.id for s in wave] for wave in waves] == [
+            ["emissions", "transport", "methods"],
+            ["overview"],
+            ["executive-summary"],
+        ]
+
+    def test_dependencies_outside_the_subset_are_satisfied(self, tmp_path: Path):
+        sections = _sections(tmp_path)
+        subset = [s for s in sections if s.id in ("overview", "executive-summary")]
+
+        waves = dependency_waves(subset, build_dependencies(sections))
+
+        assert [[s.id for s in wave] for wave in waves] == [["overview"], ["executive-summary"]]
+
+
+class TestOrchestratorScheduling:
+    def test_summary_prompt_includes_children_output(self, tmp_path: Path, make_orchestrator):
+        completed = []
+        orchestrator = make_orchestrator(
+            OUTLINE,
+            on_section_complete=lambda result, action: completed.append(result.section_id),
+            max_workers=3,
+        )
+        prompts = {}
+
+        def fake_call(prompt, charts=None):
+            section_id = orchestrator._current_section_id
+            prompts[section_id] = prompt
+            return f"Findings for {section_id}.", UsageCost(input_tokens=1)
+
+        orchestrator._call_llm = fake_call
+        _, usage = orchestrator.generate_report()
+
+        assert usage.input_tokens == 5
+        assert sorted(completed) == sorted(s.id for s in orchestrator.sections)
+        assert completed.index("overview") > completed.index("emissions")
+        assert "Findings for emissions." in prompts["overview"]
+        assert "Findings for transport." in prompts["overview"]
+        assert "Findings for overview." in prompts["executive-summary"]
+        assert "Sections This Builds On" not in prompts["methods"]
+
+        summary_file = tmp_path / "output" / "_sections" / "05_executive-summary.md"
+        assert "<!-- Depends on: overview, methods -->" in summary_file.read_text()
+
+    def test_mapping_file_declares_dependencies(self, tmp_path: Path, make_orchestrator):
+        (tmp_path / "data").mkdir()
+        (tmp_path / "data" / "section_chart_map.json").write_text(
+            json.dumps({"methods": {"charts": [], "depends_on": ["transport"]}})
+        )
+        orchestrator = make_orchestrator(OUTLINE)
+        assert orchestrator.section_dependencies()["methods"] == ["transport"]
+
+    def test_transient_failure_resumes_with_dependents(self, make_orchestrator):
+        completed = []
+        orchestrator = make_orchestrator(
+            OUTLINE, on_section_complete=lambda result, action: completed.append(result.section_id)
+        )
+        failures = {"emissions": 1}
+
+        def fake_call(prompt, charts=None):
+            section_id = orchestrator._current_section_id
+            if failures.get(section_id):
+                failures[section_id] -= 1
+                raise TimeoutError("read timed out")
+            return "Body", UsageCost()
+
+        orchestrator._call_llm = fake_call
+        orchestrator.generate_report()
+
+        assert completed == ["transport", "methods", "emissions", "overview", "executive-summary"]
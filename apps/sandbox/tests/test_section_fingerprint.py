@@ -0,0 +1,137 @@
+"""Tests for skipping unchanged sections in update-report."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from report_agent.orchestrator import UsageCost
+from report_agent.section_fingerprint import FINGERPRINTS_FILENAME, FingerprintStore, file_digest
+
+OUTLINE = "# Intro\n\n# Results\n"
+
+
+def _stub_llm(orchestrator, calls: list[str]):
+    """Record each section's LLM call and answer "Body of <id>" at $0.50."""
+
+    def fake_call(prompt, charts=None):
+        section_id = orchestrator._current_section_id
+        calls.append(section_id)
+        return f"Body of {section_id}", UsageCost(cost_usd=0.5)
+
+    orchestrator._call_llm = fake_call
+    return orchestrator
+
+
+class TestFingerprintStore:
+    def test_roundtrip(self, tmp_path: Path):
+        store = FingerprintStore(tmp_path / FINGERPRINTS_FILENAME)
+        store.set("intro", "abc")
+
+        assert FingerprintStore(tmp_path / FINGERPRINTS_FILENAME).get("intro") == "abc"
+        assert FingerprintStore(tmp_path / FINGERPRINTS_FILENAME).get("results") is None
+
+    def test_unreadable_store_is_empty(self, tmp_path: Path):
+        (tmp_path / FINGERPRINTS_FILENAME).write_text("{not json")
+        assert FingerprintStore(tmp_path / FINGERPRINTS_FILENAME).get("intro") is None
+
+    def test_file_digest_tracks_content(self, tmp_path: Path):
+        path = tmp_path / "chart.csv"
+        path.write_text("a\n1\n")
+        first = file_digest(path)
+        path.write_text("a\n22\n")
+        assert file_digest(path) != first
+
+
+class TestUpdateReportSkipping:
+    @pytest.fixture(autouse=True)
+    def _project(self, tmp_path: Path):
+        (tmp_path / "outline.md").write_text(OUTLINE)
+        chart_dir = tmp_path / "data" / "transport"
+        chart_dir.mkdir(parents=True)
+        (chart_dir / "transport_emissions.csv").write_text("scen,year,val\nbase,2030,10\n")
+        (tmp_path / "data" / "section_chart_map.json").write_text(
+            json.dumps({"intro": {"charts": []}, "results": {"charts": ["transport_emissions"]}})
+        )
+
+    def test_second_run_skips_unchanged_sections(self, tmp_path: Path, make_orchestrator):
+        calls = []
+        _, _, actions = _stub_llm(make_orchestrator(), calls).update_report()
+        assert actions == {"intro": "generated", "results": "generated"}
+        assert (tmp_path / "output" / FINGERPRINTS_FILENAME).exists()
+
+        calls = []
+        _, usage, actions = _stub_llm(make_orchestrator(), calls).update_report()
+
+        assert calls == []
+        assert actions == {"intro": "skipped", "results": "skipped"}
+        assert usage.cost_usd == 0
+
+    def test_generate_report_records_fingerprints(self, make_orchestrator):
+        _stub_llm(make_orchestrator(), []).generate_report()
+
+        calls = []
+        _stub_llm(make_orchestrator(), calls).update_report()
+
+        assert calls == []
+
+    def test_new_review_comments_trigger_update(self, make_orchestrator):
+        _stub_llm(make_orchestrator(), []).update_report()
+
+        calls = []
+        outline = "# Intro\n<!-- Review comments:\nReviewer: Ann\nNotes: Shorter please\n-->\n\n# Results\n"
+        _, _, actions = _stub_llm(make_orchestrator(outline), calls).update_report()
+
+        assert calls == ["intro"]
+        assert actions == {"intro": "updated", "results": "skipped"}
+
+    def test_changed_chart_data_triggers_update(self, tmp_path: Path, make_orchestrator):
+        _stub_llm(make_orchestrator(), []).update_report()
+        (tmp_path / "data" / "transport" / "transport_emissions.csv").write_text(
+            "scen,year,val\nbase,2030,12\n"
+        )
+
+        calls = []
+        _stub_llm(make_orchestrator(), calls).update_report()
+
+        assert calls == ["results"]
+
+    def test_deleted_section_file_is_regenerated(self, tmp_path: Path, make_orchestrator):
+        _stub_llm(make_orchestrator(), []).update_report()
+        (tmp_path / "output" / "_sections" / "01_intro.md").unlink()
+
+        calls = []
+        _, _, actions = _stub_llm(make_orchestrator(), calls).update_report()
+
+        assert calls == ["intro"]
+        assert actions["intro"] == "generated"
+
+    def test_revision_notes_and_skip_unchanged_false_revise_everything(self, make_orchestrator):
+        _stub_llm(make_orchestrator(), []).update_report()
+
+        calls = []
+        _stub_llm(make_orchestrator(), calls).update_report("Tighten wording")
+        assert sorted(calls) == ["intro", "results"]
+
+        calls = []
+        _stub_llm(make_orchestrator(), calls).update_report(skip_unchanged=False)
+        assert sorted(calls) == ["intro", "results"]
+
+    def test_fingerprint_store_is_recorded_for_staging(self, tmp_path: Path, make_orchestrator):
+        orchestrator = _stub_llm(make_orchestrator(), [])
+        orchestrator.update_report()
+
+        assert tmp_path / "output" / FINGERPRINTS_FILENAME in orchestrator.consume_written_paths()
+
+    def test_single_section_commands_record_fingerprints(self, make_orchestrator):
+        # generate-section writes through _write_section_file, update-section through update_section
+        orchestrator = _stub_llm(make_orchestrator(), [])
+        orchestrator._write_section_file(orchestrator.generate_section("intro"))
+        _stub_llm(make_orchestrator(), []).update_section("intro")
+        orchestrator._write_section_file(orchestrator.generate_section("results"))
+
+        calls = []
+        _, _, actions = _stub_llm(make_orchestrator(), calls).update_report()
+
+        assert calls == []
+        assert actions == {"intro": "skipped", "results": "skipped"}
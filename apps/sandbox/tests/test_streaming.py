@@ -0,0 +1,176 @@
+"""Tests for streamed section generation."""
+
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+from report_agent.streaming import SectionStream, partial_path, write_atomic
+
+OUTLINE = "# Intro\n\n# Results\n"
+
+
+def _chunk(text: str | None = None, finish_reason: str | None = None, usage=None):
+    choices = [] if text is None and finish_reason is None else [
+        types.SimpleNamespace(delta=types.SimpleNamespace(content=text), finish_reason=finish_reason)
+    ]
+    return types.SimpleNamespace(choices=choices, usage=usage)
+
+
+def _install_openai(monkeypatch, chunks_for):
+    """Fake openai module whose create(stream=True) yields chunks_for(params)."""
+    calls = []
+
+    class FakeCompletions:
+        def create(self, **params):
+            calls.append(params)
+            return iter(chunks_for(params))
+
+    class FakeOpenAI:
+        def __init__(self, **kwargs):
+            self.chat = types.SimpleNamespace(completions=FakeCompletions())
+
+    monkeypatch.setitem(sys.modules, "openai", types.SimpleNamespace(OpenAI=FakeOpenAI))
+    return calls
+
+
+class TestSectionStream:
+    def test_deltas_are_flushed_to_partial_file(self, tmp_path: Path):
+        path = tmp_path / "01_intro.md"
+        seen = []
+        with SectionStream("intro", path, on_text=lambda sid, text: seen.append(text), header="# Intro\n\n") as stream:
+            stream.start()
+            stream.write("Hello ")
+            assert partial_path(path).read_text() == "# Intro\n\nHello "
+            stream.write("world")
+
+        assert stream.text == "Hello world"
+        assert seen == ["Hello ", "world", ""]
+        assert partial_path(path).read_text() == "# Intro\n\nHello world"
+        assert not path.exists()
+
+    def test_restart_discards_earlier_attempt(self, tmp_path: Path):
+        path = tmp_path / "01_intro.md"
+        with SectionStream("intro", path) as stream:
+            stream.start()
+            stream.write("first try")
+            stream.start()
+            stream.write("second")
+
+        assert stream.text == "second"
+        assert partial_path(path).read_text() == "second"
+
+    def test_write_atomic_replaces_partial(self, tmp_path: Path):
+        path = tmp_path / "01_intro.md"
+        partial_path(path).write_text("half a sec")
+
+        write_atomic(path, "# Intro\n\nDone.\n")
+
+        assert path.read_text() == "# Intro\n\nDone.\n"
+        assert not partial_path(path).exists()
+
+
+class TestOrchestratorStreaming:
+    def test_openai_stream_writes_partial_then_section_file(self, tmp_path: Path, make_orchestrator, monkeypatch):
+        sections_dir = tmp_path / "output" / "_sections"
+        snapshots = []
+
+        def on_stream(section_id, text):
+            if section_id == "intro" and text:
+                snapshots.append(partial_path(sections_dir / "01_intro.md").read_text())
+
+        usage = types.SimpleNamespace(
+            prompt_tokens=100, completion_tokens=20, completion_tokens_details=None, prompt_tokens_details=None
+        )
+        calls = _install_openai(monkeypatch, lambda params: [
+            _chunk("Emissions "), _chunk("fall."), _chunk("", finish_reason="stop"), _chunk(usage=usage),
+        ])
+        orchestrator = make_orchestrator(OUTLINE, model="gpt-5.1-2025-11-13", stream=True, on_stream=on_stream)
+
+        _, total = orchestrator.generate_report()
+
+        assert calls[0]["stream"] is True
+        assert calls[0]["stream_options"] == {"include_usage": True}
+        assert snapshots == ["# Intro\n\nEmissions ", "# Intro\n\nEmissions fall."]
+        assert "Emissions fall." in (sections_dir / "01_intro.md").read_text()
+        assert list(sections_dir.glob("*.partial")) == []
+        assert (total.input_tokens, total.output_tokens) == (200, 40)
+
+    def test_interrupted_stream_keeps_partial_text(self, tmp_path: Path, make_orchestrator, monkeypatch):
+        def chunks(params):
+            yield _chunk("Half a thought")
+            raise ValueError("connection reset by test")
+
+        _install_openai(monkeypatch, chunks)
+        orchestrator = make_orchestrator(OUTLINE, model="gpt-5.1-2025-11-13", stream=True)
+
+        with pytest.raises(ValueError):
+            orchestrator.generate_report()
+
+        sections_dir = tmp_path / "output" / "_sections"
+        assert partial_path(sections_dir / "01_intro.md").read_text() == "# Intro\n\nHalf a thought"
+        assert not (sections_dir / "01_intro.md").exists()
+
+    def test_anthropic_stream_uses_final_message_usage(self, tmp_path: Path, make_orchestrator, monkeypatch):
+        final = types.SimpleNamespace(
+            content=[
+                types.SimpleNamespace(type="thinking", thinking="hmm"),
+                types.SimpleNamespace(type="text", text="Streamed body"),
+            ],
+            usage=types.SimpleNamespace(
+                input_tokens=10, output_tokens=5, cache_read_input_tokens=0, cache_creation_input_tokens=0
+            ),
+        )
+
+        class FakeStream:
+            text_stream = iter(["Streamed ", "body"])
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc_info):
+                return False
+
+            def get_final_message(self):
+                return final
+
+        class FakeAnthropic:
+            def __init__(self, **kwargs):
+                self.messages = types.SimpleNamespace(stream=lambda **params: FakeStream())
+
+        monkeypatch.setitem(sys.modules, "anthropic", types.SimpleNamespace(Anthropic=FakeAnthropic))
+        orchestrator = make_orchestrator(OUTLINE, model="claude-sonnet-4-20250514", stream=True)
+        orchestrator._current_section_id = "intro"
+
+        text, usage = orchestrator._call_anthropic("prompt", [])
+
+        assert text == "Streamed body"
+        assert (usage.input_tokens, usage.output_tokens) == (10, 5)
+        assert partial_path(tmp_path / "output" / "_sections" / "01_intro.md").exists()
+
+    @pytest.mark.parametrize("method", ["generate_report", "update_report"])
+    def test_batch_mode_is_rejected(self, tmp_path: Path, make_orchestrator, method):
+        orchestrator = make_orchestrator(OUTLINE, stream=True)
+
+        with pytest.raises(ValueError, match="Streaming is not available in batch mode"):
+            getattr(orchestrator, method)(batch=True)
+        assert list((tmp_path / "output" / "_sections").glob("*.md")) == []
+
+    @pytest.mark.parametrize("command", ["generate-report", "update-report"])
+    def test_cli_rejects_stream_with_batch(self, tmp_path: Path, command):
+        from typer.testing import CliRunner
+
+        from report_agent.cli import app
+
+        (tmp_path / "outline.md").write_text(OUTLINE)
+        (tmp_path / "data").mkdir()
+        (tmp_path / "output").mkdir()
+
+        result = CliRunner().invoke(app, [
+            command, "--outline", str(tmp_path / "outline.md"), "--data-root", str(tmp_path / "data"),
+            "--output-root", str(tmp_path / "output"), "--stream", "--batch", "--dry-run",
+        ])
+
+        assert result.exit_code == 1
+        assert "--stream cannot be combined with --batch" in result.output
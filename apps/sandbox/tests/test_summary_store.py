@@ -0,0 +1,158 @@
+"""Tests for the persistent chart summary and prompt fragment store."""
+
+import json
+from pathlib import Path
+
+from report_agent.chart_reader import ChartReader, ChartSummary
+from report_agent.data_catalog import DataCatalog
+from report_agent.summary_store import (
+    SUMMARY_STORE_DIRNAME,
+    ChartSummaryStore,
+    index_charts,
+    render_chart_fragment,
+    summary_store_dir,
+)
+
+CSV = "scen,year,val\nbase,2030,10\nbase,2040,6\nnet_zero,2030,8\nnet_zero,2040,2\n"
+
+
+def _data_root(tmp_path: Path) -> Path:
+    data_root = tmp_path / "data"
+    (data_root / "transport").mkdir(parents=True)
+    (data_root / "transport" / "transport_emissions.csv").write_text(CSV)
+    (data_root / "section_chart_map.json").write_text(
+        json.dumps({"intro": {"charts": ["transport_emissions"]}, "results": {"charts": ["transport_emissions"]}})
+    )
+    return data_root
+
+
+class TestChartSummaryStore:
+    def test_summary_roundtrip_through_disk(self, tmp_path: Path):
+        catalog = DataCatalog(_data_root(tmp_path))
+        chart = catalog.get_chart("transport_emissions")
+        summary = ChartReader(catalog).get_summary(chart.id)
+
+        ChartSummaryStore(summary_store_dir(catalog.data_root)).put_summary(chart, summary)
+        loaded = ChartSummaryStore(summary_store_dir(catalog.data_root)).get_summary(chart)
+
+        assert loaded == summary
+        assert (catalog.data_root / SUMMARY_STORE_DIRNAME / "transport_emissions.json").exists()
+
+    def test_changed_csv_invalidates_entry(self, tmp_path: Path):
+        catalog = DataCatalog(_data_root(tmp_path))
+        chart = catalog.get_chart("transport_emissions")
+        store = ChartSummaryStore(tmp_path / "store")
+        store.put_fragment(chart, "### cached")
+
+        chart.path_csv.write_text(CSV + "net_zero,2050,0\n")
+
+        assert store.get_fragment(chart) is None
+        assert ChartSummaryStore(tmp_path / "store").get_fragment(chart) is None
+
+    def test_changed_metadata_misses_fragment(self, tmp_path: Path):
+        catalog = DataCatalog(_data_root(tmp_path))
+        chart = catalog.get_chart("transport_emissions")
+        store = ChartSummaryStore(tmp_path / "store")
+        store.put_fragment(chart, "### cached")
+
+        chart.units = "MtCO2e"
+
+        assert store.get_fragment(chart) is None
+
+    def test_unwritable_directory_keeps_memory_cache(self, tmp_path: Path):
+        catalog = DataCatalog(_data_root(tmp_path))
+        chart = catalog.get_chart("transport_emissions")
+        blocker = tmp_path / "blocker"
+        blocker.write_text("not a directory")
+        store = ChartSummaryStore(blocker / "store")
+
+        store.put_fragment(chart, "### cached")
+
+        assert store.get_fragment(chart) == "### cached"
+
+
+class TestPromptFragments:
+    def test_fragment_matches_uncached_rendering(self, tmp_path: Path, make_orchestrator):
+        _data_root(tmp_path)
+        orchestrator = make_orchestrator("# Intro\n\n# Results\n")
+        chart = orchestrator.catalog.get_chart("transport_emissions")
+        expected = render_chart_fragment(chart, ChartReader(orchestrator.catalog).get_summary(chart.id))
+
+        block = orchestrator._build_available_data_block([chart])
+
+        assert block.endswith(expected + "\n")
+        assert "- **Scenarios**: base, net_zero" in block
+
+    def test_later_runs_skip_csv_parsing(self, tmp_path: Path, make_orchestrator, monkeypatch):
+        _data_root(tmp_path)
+        orchestrator = make_orchestrator("# Intro\n\n# Results\n")
+        chart = orchestrator.catalog.get_chart("transport_emissions")
+        first = orchestrator._build_available_data_block([chart])
+
+        def fail(self, chart_id):
+            raise AssertionError("summary recomputed")
+
+        monkeypatch.setattr(ChartReader, "get_summary", fail)
+        fresh = make_orchestrator("# Intro\n\n# Results\n")
+
+        assert fresh._build_available_data_block([fresh.catalog.get_chart("transport_emissions")]) == first
+        assert isinstance(fresh.get_chart_summary("transport_emissions"), ChartSummary)
+
+
+class TestIndexCharts:
+    def _export(self, tmp_path: Path) -> Path:
+        data_root = _data_root(tmp_path)
+        (data_root / "power").mkdir()
+        (data_root / "power" / "power_generation.csv").write_text(CSV.replace("10", "40"))
+        (data_root / "power" / "power_capacity.png").write_bytes(b"png")
+        return data_root
+
+    def test_pool_fills_store(self, tmp_path: Path):
+        catalog = DataCatalog(self._export(tmp_path))
+
+        stats = index_charts(catalog, workers=2)
+
+        assert (stats.charts, stats.computed, stats.no_data, stats.failed) == (3, 2, 1, {})
+        store = ChartSummaryStore(summary_store_dir(catalog.data_root))
+        chart = catalog.get_chart("power_generation")
+        assert store.get_summary(chart) == ChartReader(catalog).get_summary(chart.id)
+        assert store.get_fragment(chart).startswith("### Power Generation")
+
+    def test_second_index_only_recomputes_changed_charts(self, tmp_path: Path):
+        data_root = self._export(tmp_path)
+        index_charts(DataCatalog(data_root))
+        (data_root / "power" / "power_generation.csv").write_text(CSV)
+
+        stats = index_charts(DataCatalog(data_root))
+
+        assert (stats.computed, stats.current) == (1, 1)
+        assert index_charts(DataCatalog(data_root), force=True).computed == 2
+
+    def test_unreadable_csv_is_reported(self, tmp_path: Path):
+        data_root = self._export(tmp_path)
+        (data_root / "power" / "power_generation.csv").write_bytes(b"")
+
+        stats = index_charts(DataCatalog(data_root))
+
+        assert list(stats.failed) == ["power_generation"]
+        assert stats.computed == 1
+
+    def test_cli_reports_throughput(self, tmp_path: Path):
+        from typer.testing import CliRunner
+
+        from report_agent.cli import app
+
+        args = ["index-data", "--data-root", str(self._export(tmp_path)), "-j", "2"]
+        result = CliRunner().invoke(app, args)
+
+        assert result.exit_code == 0, result.output
+        assert "charts/sec" in result.output
+        assert "Computed: 2" in result.output
+        assert "2 of 3 charts computed" in result.output
+        assert "; 1 skipped" in result.output
+
+        rerun = CliRunner().invoke(app, args)
+
+        assert "0 of 3 charts computed" in rerun.output
+        assert "(0.0 charts/sec" in rerun.output
+        assert "; 3 skipped" in rerun.output
@@ -0,0 +1,145 @@
+"""Tests for the wide-format timeseries engine."""
+
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from report_agent.agent_tools import ReportAgentTools
+from report_agent.timeseries import ALL_SCENARIOS, TOTAL_DIMENSION, WideTimeseries, year_columns
+
+CSV = """scen,process_sector1,unit,2025,2030,2050
+Base,Transport,Mt,50,60,40
+Base,Industry,Mt,50,45,20
+Base,Industry,Mt,10,5,0
+NetZero,Transport,Mt,50,30,5
+NetZero,Industry,Mt,50,20,5
+"""
+
+
+@pytest.fixture
+def frame(tmp_path) -> pd.DataFrame:
+    path = tmp_path / "emissions.csv"
+    path.write_text(CSV)
+    return pd.read_csv(path)
+
+
+class TestWideTimeseries:
+    def test_year_columns_sorted_and_bounded(self):
+        assert year_columns(["scen", "2050", "1999", "2030", "unit", "2101"]) == ["2030", "2050"]
+
+    def test_array_shape_and_index_maps(self, frame):
+        ts = WideTimeseries.from_frame(frame)
+
+        assert ts.values.shape == (2, 2, 3)
+        assert ts.scenarios == ["Base", "NetZero"]
+        assert ts.dimensions == ["Transport", "Industry"]
+        assert ts.years == [2025, 2030, 2050]
+        # Duplicate (scenario, dimension) rows are summed
+        assert ts.values[ts.scenario_index["Base"], ts.dimension_index["Industry"], ts.year_index[2025]] == 60
+
+    def test_reductions(self, frame):
+        ts = WideTimeseries.from_frame(frame)
+
+        np.testing.assert_allclose(ts.totals(), [[110, 110, 60], [100, 50, 10]])
+        np.testing.assert_allclose(ts.percent_change(), [(60 - 110) / 110 * 100, -90.0])
+        np.testing.assert_allclose(ts.cagr(), [((60 / 110) ** (1 / 25) - 1) * 100, ((10 / 100) ** (1 / 25) - 1) * 100])
+        assert ts.peak_years() == [2025, 2025]
+        assert ts.scenario_gap() == ("Base", "NetZero", 50.0)
+        assert ts.scenario_gap(2030) == ("Base", "NetZero", 60.0)
+
+    def test_undefined_change_and_cagr_are_nan(self):
+        ts = WideTimeseries.from_frame(pd.DataFrame({"scen": ["A"], "2025": [0.0], "2050": [5.0]}))
+
+        assert math.isnan(ts.percent_change()[0])
+        assert math.isnan(ts.cagr()[0])
+        assert "percent_change" not in ts.scenario_stats()["A"]
+
+    def test_subset(self, frame):
+        ts = WideTimeseries.from_frame(frame).subset(scenarios=["NetZero"], dimensions=["Transport"], end_year=2030)
+
+        assert ts.values.shape == (1, 1, 2)
+        assert ts.totals().tolist() == [[50, 30]]
+
+    def test_without_scenario_or_dimension_columns(self):
+        ts = WideTimeseries.from_frame(pd.DataFrame({"2025": [1, 2], "2030": [3, 4]}))
+
+        assert (ts.scenarios, ts.dimensions) == ([ALL_SCENARIOS], [TOTAL_DIMENSION])
+        assert ts.totals().tolist() == [[3, 7]]
+        assert ts.scenario_gap() is None
+
+    def test_long_format_has_no_timeseries(self):
+        assert WideTimeseries.from_frame(pd.DataFrame({"scen": ["A"], "year": [2025], "val": [1]})) is None
+
+    def test_query_lists_largest_changes(self, frame):
+        result = WideTimeseries.from_frame(frame).query(top_dimensions=1)
+
+        base = result["scenarios"]["Base"]
+        assert base["totals"] == [110, 110, 60]
+        assert base["largest_changes"] == [{"dimension": "Industry", "change": -40.0}]
+        assert result["scenario_gap"]["difference"] == 50.0
+
+    def test_multi_column_dimensions_keep_first_seen_order(self):
+        ts = WideTimeseries.from_frame(pd.DataFrame({
+            "sector": ["Transport", "Industry", "Transport", "Industry"],
+            "fuel": ["Oil", 1, "Oil", "1"],
+            "2025": [1, 2, 3, 4],
+        }))
+
+        # 1 and "1" read the same, so they are one dimension
+        assert ts.dimensions == ["Transport | Oil", "Industry | 1"]
+        assert ts.totals().tolist() == [[10]]
+        assert ts.values[0, :, 0].tolist() == [4, 6]
+
+    def test_large_frame_builds_labels_once_per_group(self, monkeypatch):
+        rows = 100_000
+        rng = np.random.default_rng(0)
+        frame = pd.DataFrame({
+            "scen": rng.choice(["Base", "NetZero"], rows),
+            "process_sector1": rng.choice([f"Sector {i}" for i in range(40)], rows),
+            "commodity": rng.choice([f"Fuel {i}" for i in range(25)], rows),
+            "unit": "Mt",
+            **{str(year): rng.random(rows) for year in range(2025, 2055, 5)},
+        })
+        labelled_rows = []
+        itertuples = pd.DataFrame.itertuples
+
+        def counting_itertuples(self, *args, **kwargs):
+            labelled_rows.append(len(self))
+            return itertuples(self, *args, **kwargs)
+
+        monkeypatch.setattr(pd.DataFrame, "itertuples", counting_itertuples)
+
+        ts = WideTimeseries.from_frame(frame)
+
+        assert ts.values.shape == (2, 1000, 6)
+        assert ts.totals().sum() == pytest.approx(frame[[str(y) for y in range(2025, 2055, 5)]].to_numpy().sum())
+        # Joining labels row by row took over 5s here; only group keys are joined
+        assert sum(labelled_rows) == 1000
+
+
+class TestQueryTimeseriesTool:
+    @pytest.fixture
+    def tools(self, tmp_path):
+        (tmp_path / "data" / "emissions").mkdir(parents=True)
+        (tmp_path / "data" / "emissions" / "sector_emissions.csv").write_text(CSV)
+        (tmp_path / "data" / "emissions" / "reductions.csv").write_text("sector,val,scen\nTransport,-5,Base\n")
+        return ReportAgentTools(tmp_path / "outline.md", tmp_path / "data")
+
+    def test_query_with_filters(self, tools):
+        result = tools.execute_tool("query_timeseries", {
+            "chart_id": "sector_emissions", "scenarios": ["NetZero"], "start_year": 2030,
+        })
+
+        assert list(result["scenarios"]) == ["NetZero"]
+        assert result["years"] == [2030, 2050]
+        assert result["scenarios"]["NetZero"]["percent_change"] == -80.0
+        assert "scenario_gap" not in result
+
+    def test_errors(self, tools):
+        assert "no year columns" in tools.execute_tool("query_timeseries", {"chart_id": "reductions"})["error"]
+        assert "not found" in tools.execute_tool("query_timeseries", {"chart_id": "missing"})["error"]
+        assert "No data" in tools.execute_tool(
+            "query_timeseries", {"chart_id": "sector_emissions", "scenarios": ["Nope"]}
+        )["error"]
@@ -0,0 +1,234 @@
+"""Tests for the tool-calling section loop."""
+
+import json
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+from report_agent.tool_loop import (
+    STOP_FINAL,
+    STOP_STEP_BUDGET,
+    STOP_TOKEN_BUDGET,
+    ModelTurn,
+    ToolCall,
+    ToolLoopBudget,
+    encode_result,
+    run_tool_loop,
+)
+
+CSV = "scen,sector,2025,2030,2050\nBase,Transport,50,60,40\nBase,Industry,50,45,20\n"
+
+
+class FakeConversation:
+    """Replays scripted turns and records what the loop sent."""
+
+    def __init__(self, turns: list[ModelTurn]):
+        self.turns = list(turns)
+        self.allow_tools: list[bool] = []
+        self.results: list[tuple[list[str], list[str]]] = []
+
+    def send(self, allow_tools: bool) -> ModelTurn:
+        self.allow_tools.append(allow_tools)
+        return self.turns.pop(0)
+
+    def add_tool_results(self, calls, results):
+        self.results.append(([c.id for c in calls], results))
+
+
+def _call_turn(*names: str, tokens: int = 10) -> ModelTurn:
+    return ModelTurn(
+        text="",
+        tool_calls=[ToolCall(f"call_{i}", name, {"chart_id": name}) for i, name in enumerate(names)],
+        input_tokens=tokens,
+        output_tokens=0,
+    )
+
+
+class TestRunToolLoop:
+    def test_calls_in_a_turn_run_as_one_batch(self):
+        conversation = FakeConversation([_call_turn("list_charts", "get_chart_data"), ModelTurn("Done.", [])])
+        batches = []
+
+        def execute(calls):
+            batches.append(calls)
+            return [{"ok": name} for name, _ in calls]
+
+        result = run_tool_loop(conversation, execute, ToolLoopBudget())
+
+        assert result.text == "Done."
+        assert result.stop_reason == STOP_FINAL
+        assert batches == [[("list_charts", {"chart_id": "list_charts"}), ("get_chart_data", {"chart_id": "get_chart_data"})]]
+        assert conversation.results == [(["call_0", "call_1"], ['{"ok": "list_charts"}', '{"ok": "get_chart_data"}'])]
+        assert [s.tool_calls for s in result.steps] == [["list_charts", "get_chart_data"], []]
+        assert all(s.llm_seconds >= 0 and s.tool_seconds >= 0 for s in result.steps)
+
+    def test_last_step_is_sent_without_tools(self):
+        conversation = FakeConversation([_call_turn("list_charts")] * 2 + [ModelTurn("Forced.", [])])
+
+        result = run_tool_loop(conversation, lambda calls: [{}] * len(calls), ToolLoopBudget(max_steps=3))
+
+        assert conversation.allow_tools == [True, True, False]
+        assert (result.text, result.stop_reason) == ("Forced.", STOP_STEP_BUDGET)
+
+    def test_token_budget_disables_tools(self):
+        conversation = FakeConversation([_call_turn("list_charts", tokens=500), ModelTurn("Short.", [])])
+
+        result = run_tool_loop(conversation, lambda calls: [{}] * len(calls), ToolLoopBudget(max_tokens=400))
+
+        assert conversation.allow_tools == [True, False]
+        assert result.stop_reason == STOP_TOKEN_BUDGET
+
+    def test_calls_on_a_tool_less_turn_are_ignored(self):
+        conversation = FakeConversation([_call_turn("list_charts")])
+        executed = []
+
+        result = run_tool_loop(conversation, executed.extend, ToolLoopBudget(max_steps=1))
+
+        assert executed == []
+        assert result.steps[0].tool_calls == []
+
+    def test_on_step_sees_every_step(self):
+        conversation = FakeConversation([_call_turn("list_charts"), ModelTurn("Done.", [])])
+        seen = []
+
+        run_tool_loop(conversation, lambda calls: [{}] * len(calls), ToolLoopBudget(), on_step=seen.append)
+
+        assert [s.step for s in seen] == [1, 2]
+
+    def test_long_results_are_truncated(self):
+        text = encode_result({"data": "x" * 100}, max_chars=20)
+
+        assert text.startswith('{"data": "xxxxxxxxx')
+        assert "truncated" in text
+
+
+def _tool_call(call_id: str, name: str, arguments: dict):
+    return types.SimpleNamespace(
+        id=call_id, function=types.SimpleNamespace(name=name, arguments=json.dumps(arguments))
+    )
+
+
+def _response(content: str | None, tool_calls=None, prompt_tokens: int = 100):
+    message = types.SimpleNamespace(content=content, tool_calls=tool_calls)
+    usage = types.SimpleNamespace(prompt_tokens=prompt_tokens, completion_tokens=20)
+    return types.SimpleNamespace(choices=[types.SimpleNamespace(message=message, finish_reason="stop")], usage=usage)
+
+
+def _install_openai(monkeypatch, responses):
+    """Fake openai module replaying responses; returns the recorded request params."""
+    calls = []
+
+    class FakeCompletions:
+        def create(self, **params):
+            calls.append({**params, "messages": list(params["messages"])})
+            return responses.pop(0)
+
+    class FakeOpenAI:
+        def __init__(self, **kwargs):
+            self.chat = types.SimpleNamespace(completions=FakeCompletions())
+
+    monkeypatch.setitem(sys.modules, "openai", types.SimpleNamespace(OpenAI=FakeOpenAI))
+    return calls
+
+
+def _write_charts(tmp_path: Path, chart_count: int = 12) -> None:
+    chart_dir = tmp_path / "data" / "emissions"
+    chart_dir.mkdir(parents=True, exist_ok=True)
+    chart_ids = [f"sector_emissions_{i}" for i in range(chart_count)]
+    for chart_id in chart_ids:
+        (chart_dir / f"{chart_id}.csv").write_text(CSV)
+    (tmp_path / "data" / "section_chart_map.json").write_text(json.dumps({"results": {"charts": chart_ids}}))
+
+
+class TestOrchestratorToolLoop:
+    @pytest.fixture
+    def orchestrator_for(self, tmp_path: Path, make_orchestrator):
+        _write_charts(tmp_path)
+        return lambda **kwargs: make_orchestrator("# Results\n", model="gpt-5.1-2025-11-13", **kwargs)
+
+    def test_prompt_lists_charts_instead_of_summaries(self, orchestrator_for):
+        full = orchestrator_for()
+        indexed = orchestrator_for(tool_loop=True)
+        section = full.get_section("results")
+
+        full_prompt = full.build_section_prompt(section, full.get_charts_for_section(section))
+        indexed_prompt = indexed.build_section_prompt(section, indexed.get_charts_for_section(section))
+
+        assert "- `sector_emissions_3`: " in indexed_prompt
+        assert "**Scenarios**" not in indexed_prompt
+        assert len(indexed_prompt) < len(full_prompt) * 0.75
+
+    def test_generate_section_fetches_data_through_tools(self, orchestrator_for, monkeypatch):
+        calls = _install_openai(monkeypatch, [
+            _response(None, [
+                _tool_call("a", "get_chart_data", {"chart_id": "sector_emissions_0"}),
+                _tool_call("b", "query_timeseries", {"chart_id": "sector_emissions_1"}),
+                _tool_call("c", "write_section_draft", {"section_id": "results", "content": "x"}),
+            ]),
+            _response("Transport emissions fall to 40 Mt by 2050."),
+        ])
+        orchestrator = orchestrator_for(tool_loop=True)
+
+        result = orchestrator.generate_section("results")
+
+        assert "fall to 40 Mt" in result.content
+        assert [t["function"]["name"] for t in calls[0]["tools"]] == [
+            "list_chart_categories", "list_charts", "get_chart_metadata", "get_chart_data", "query_timeseries",
+        ]
+        assert calls[0]["tool_choice"] == "auto"
+        assert not any(part["type"] == "image_url" for part in calls[0]["messages"][-1]["content"])
+        tool_messages = {m["tool_call_id"]: json.loads(m["content"]) for m in calls[1]["messages"] if m["role"] == "tool"}
+        assert tool_messages["a"]["chart_id"] == "sector_emissions_0"
+        assert tool_messages["b"]["scenarios"]["Base"]["end_value"] == 60.0
+        assert tool_messages["c"] == {"error": "Tool not available: write_section_draft"}
+        assert (result.usage.input_tokens, result.usage.output_tokens) == (200, 40)
+
+    def test_step_budget_forces_an_answer(self, orchestrator_for, monkeypatch):
+        calls = _install_openai(monkeypatch, [
+            _response(None, [_tool_call("a", "list_charts", {})]),
+            _response("Final text."),
+        ])
+        orchestrator = orchestrator_for(tool_loop=True, tool_budget=ToolLoopBudget(max_steps=2))
+
+        result = orchestrator.generate_section("results")
+
+        assert [c["tool_choice"] for c in calls] == ["auto", "none"]
+        assert "Final text." in result.content
+
+    def test_empty_final_answer_raises(self, orchestrator_for, monkeypatch):
+        _install_openai(monkeypatch, [_response("")])
+        orchestrator = orchestrator_for(tool_loop=True)
+
+        with pytest.raises(RuntimeError, match="tool loop ended without content"):
+            orchestrator.generate_section("results")
+
+    def test_batch_mode_is_rejected(self, orchestrator_for):
+        orchestrator = orchestrator_for(tool_loop=True)
+
+        with pytest.raises(ValueError, match="batch mode"):
+            orchestrator.generate_report(batch=True)
+
+    def test_streaming_is_rejected(self, orchestrator_for):
+        with pytest.raises(ValueError, match="tool-loop mode"):
+            orchestrator_for(tool_loop=True, stream=True)
+
+    @pytest.mark.parametrize("command", ["generate-section", "update-section", "generate-report", "update-report"])
+    def test_cli_rejects_stream_with_tool_loop(self, tmp_path: Path, command):
+        from typer.testing import CliRunner
+
+        from report_agent.cli import app
+
+        (tmp_path / "outline.md").write_text("# Results\n")
+        (tmp_path / "data").mkdir()
+        (tmp_path / "output").mkdir()
+        args = [command, "--outline", str(tmp_path / "outline.md"), "--data-root", str(tmp_path / "data"),
+                "--output-root", str(tmp_path / "output"), "--tool-loop", "--stream", "--dry-run"]
+        if command.endswith("section"):
+            args += ["--section", "results"]
+
+        result = CliRunner().invoke(app, args)
+
+        assert result.exit_code == 1
+        assert "--tool-loop cannot be combined with --stream" in result.output
@@ -1,5 +1,8 @@
 """Tests for update-section functionality."""
 
+import json
+import time
+
 import pytest
 from pathlib import Path
 
@@ -128,6 +131,154 @@ class TestBuildReportFromSections:
         assert "SECTION MISSING: methods" in report
 
 
+class TestWrittenPaths:
+    """Tests for tracking files written by the orchestrator."""
+
+    def test_write_section_file_records_path(self, tmp_path):
+        """Written section files should be reported once, then cleared."""
+        from report_agent.orchestrator import GenerationResult
+
+        outline = tmp_path / "outline.md"
+        outline.write_text("# Intro\n\n# Methods")
+        
+        data_root = tmp_path / "data"
+        data_root.mkdir()
+        
+        output_root = tmp_path / "output"
+        
+        orchestrator = ReportOrchestrator(
+            outline_path=outline,
+            data_root=data_root,
+            output_dir=output_root,
+        )
+        
+        result = GenerationResult(section_id="methods", section_title="Methods", content="# Methods\n")
+        orchestrator._write_section_file(result)
+        orchestrator._write_section_file(result)
+        
+        assert orchestrator.consume_written_paths() == [
+            output_root / "_sections" / "02_methods.md"
+        ]
+        assert orchestrator.consume_written_paths() == []
+
+    def test_reordered_section_removes_old_file(self, tmp_path):
+        """A section file under an outdated NN_ prefix is removed and recorded."""
+        from report_agent.orchestrator import GenerationResult
+
+        outline = tmp_path / "outline.md"
+        outline.write_text("# Intro\n\n# Methods")
+        data_root = tmp_path / "data"
+        data_root.mkdir()
+        output_root = tmp_path / "output"
+        (output_root / "_sections").mkdir(parents=True)
+        old_path = output_root / "_sections" / "01_methods.md"
+        old_path.write_text("# Methods\n\nold")
+
+        orchestrator = ReportOrchestrator(outline_path=outline, data_root=data_root, output_dir=output_root)
+        orchestrator._write_section_file(
+            GenerationResult(section_id="methods", section_title="Methods", content="# Methods\n")
+        )
+
+        assert not old_path.exists()
+        assert orchestrator.consume_written_paths() == [output_root / "_sections" / "02_methods.md", old_path]
+
+
+class TestReviewerExamples:
+    """Tests for batched, cached funny-reviewer examples."""
+
+    def _orchestrator(self, tmp_path, outline_text="# Intro\n\n# Methods\n\n# Results\n"):
+        outline = tmp_path / "outline.md"
+        outline.write_text(outline_text)
+        data_root = tmp_path / "data"
+        data_root.mkdir(exist_ok=True)
+        return ReportOrchestrator(
+            outline_path=outline,
+            data_root=data_root,
+            output_dir=tmp_path / "output",
+        )
+
+    def test_one_batched_call_then_cached(self, tmp_path):
+        batch_calls = []
+
+        def fake_batch(sections):
+            batch_calls.append([s.id for s in sections])
+            return {s.id: (f"Reviewer {s.id}", f"Notes on {s.title}") for s in sections}
+
+        orchestrator = self._orchestrator(tmp_path)
+        orchestrator.generate_funny_reviewer_examples = fake_batch
+        orchestrator.generate_funny_reviewer_example = lambda title: pytest.fail("per-section call")
+
+        assert orchestrator.prepare_reviewer_examples() == 3
+        formatted = orchestrator._format_section_output(orchestrator.get_section("methods"), "Body")
+        assert "AUTHOR: Reviewer methods" in formatted
+        assert batch_calls == [["intro", "methods", "results"]]
+
+        # A later run reuses the project cache
+        rerun = ReportOrchestrator(
+            outline_path=tmp_path / "outline.md",
+            data_root=tmp_path / "data",
+            output_dir=tmp_path / "output",
+        )
+        rerun.generate_funny_reviewer_examples = fake_batch
+        assert rerun.prepare_reviewer_examples() == 0
+        assert batch_calls == [["intro", "methods", "results"]]
+        assert (tmp_path / "output" / "_reviewer_examples.json") in orchestrator.consume_written_paths()
+
+    def test_renamed_and_reviewed_sections(self, tmp_path):
+        orchestrator = self._orchestrator(tmp_path)
+        orchestrator.generate_funny_reviewer_examples = lambda sections: {
+            s.id: ("Name", "Notes") for s in sections
+        }
+        orchestrator.prepare_reviewer_examples()
+
+        renamed = self._orchestrator(
+            tmp_path,
+            "# Intro\n<!-- Review comments: AUTHOR: Real -->\n\n# Methods\n\n# Findings\n",
+        )
+        seen = []
+        renamed.generate_funny_reviewer_examples = lambda sections: seen.extend(s.id for s in sections) or {}
+
+        renamed.prepare_reviewer_examples()
+
+        assert seen == ["findings"]
+
+    def test_batch_failure_uses_fallback_without_per_section_calls(self, tmp_path):
+        from report_agent.orchestrator import FALLBACK_REVIEWER
+
+        def failing_batch(sections):
+            raise RuntimeError("no network")
+
+        orchestrator = self._orchestrator(tmp_path)
+        orchestrator.generate_funny_reviewer_examples = failing_batch
+        orchestrator.generate_funny_reviewer_example = lambda title: pytest.fail("per-section call")
+
+        assert orchestrator.prepare_reviewer_examples() == 0
+        formatted = orchestrator._format_section_output(orchestrator.get_section("intro"), "Body")
+        assert f"AUTHOR: {FALLBACK_REVIEWER[0]}" in formatted
+
+
+    def test_concurrent_sections_share_one_consistent_cache(self, tmp_path):
+        from concurrent.futures import ThreadPoolExecutor
+
+        outline = "".join(f"# Section {i}\n\n" for i in range(16))
+        orchestrator = self._orchestrator(tmp_path, outline)
+        generated = []
+
+        def slow_example(title):
+            generated.append(title)
+            time.sleep(0.001)
+            return f"Reviewer of {title}", "Notes"
+
+        orchestrator.generate_funny_reviewer_example = slow_example
+        sections = orchestrator.sections * 2
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            names = list(pool.map(lambda s: orchestrator._get_reviewer_example(s)[0], sections))
+
+        assert names == [f"Reviewer of {s.title}" for s in sections]
+        assert sorted(generated) == sorted(s.title for s in orchestrator.sections)
+        saved = json.loads((tmp_path / "output" / "_reviewer_examples.json").read_text())
+        assert len(saved) == 16
+
 class TestLoadExistingSectionBody:
     """Tests for _load_existing_section_body."""
 
@@ -288,3 +439,54 @@ class TestOutlineResolution:
         result = resolve_outline(None, output_root, console)
         
         assert result is None
+
+
+class TestSectionVersions:
+    """Section writes bump versions through the report state WAL."""
+
+    def test_section_writes_append_to_wal_until_checkpoint(self, tmp_path):
+        from report_agent.orchestrator import GenerationResult
+        from report_agent.report_state import ReportState, wal_path_for
+
+        outline = tmp_path / "outline.md"
+        outline.write_text("# Intro\n\n# Methods")
+        data_root = tmp_path / "data"
+        data_root.mkdir()
+        output_root = tmp_path / "output"
+        orchestrator = ReportOrchestrator(outline_path=outline, data_root=data_root, output_dir=output_root)
+        state_path = output_root / "report_state.json"
+        output_root.mkdir(exist_ok=True)
+        ReportState.new("output").save(state_path)
+
+        for section_id in ("intro", "methods", "intro"):
+            orchestrator._write_section_file(
+                GenerationResult(section_id=section_id, section_title=section_id.title(), content="text\n")
+            )
+
+        assert len(wal_path_for(state_path).read_text().splitlines()) == 4
+        assert json.loads(state_path.read_text())["section_meta"] == {}
+        assert ReportState.load(state_path).section_meta["intro"].version == 3
+
+        orchestrator.checkpoint_report_state()
+
+        assert json.loads(state_path.read_text())["section_meta"]["intro"]["version"] == 3
+        assert len(wal_path_for(state_path).read_text().splitlines()) == 1
+        assert state_path in orchestrator.consume_written_paths()
+
+    def test_section_writes_without_state_file_leave_no_state(self, tmp_path):
+        from report_agent.orchestrator import GenerationResult
+        from report_agent.report_state import wal_path_for
+
+        outline = tmp_path / "outline.md"
+        outline.write_text("# Intro")
+        data_root = tmp_path / "data"
+        data_root.mkdir()
+        output_root = tmp_path / "output"
+        orchestrator = ReportOrchestrator(outline_path=outline, data_root=data_root, output_dir=output_root)
+
+        orchestrator._write_section_file(GenerationResult(section_id="intro", section_title="Intro", content="text\n"))
+
+        state_path = output_root / "report_state.json"
+        assert (output_root / "_sections" / "01_intro.md").exists()
+        assert not state_path.exists()
+        assert not wal_path_for(state_path).exists()